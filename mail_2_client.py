@@ -0,0 +1,204 @@
+#!/usr/bin/python
+# Classification (U)
+
+"""Program:  mail_2_client.py
+
+    Description:  Thin mail pipe client for the mail_2_rmq.py resident
+        daemon and server.  Drops an email message received from a pipe into
+        the mail_2_rmq.py spool directory or streams it over a Unix domain
+        socket to the mail_2_rmq.py server.  The program only imports the
+        standard modules it needs, so it starts quickly when called from a
+        mail alias.
+
+    Usage:
+        email_alias: "| /path/mail_2_client.py -s spool_dir -M"
+        email_alias: "| /path/mail_2_client.py -u sock_file -M"
+        cat email_file | /path/mail_2_client.py -s spool_dir -M
+
+    Arguments:
+        -s dir path => Spool directory of the mail_2_rmq.py daemon.  Must be
+            the same directory as the spool_dir configuration entry.
+        -u file => Unix socket of the mail_2_rmq.py server.  Must be the
+            same file as the sock_file configuration entry.
+        -M => Receive email message from a pipe.
+
+        -h => Help and usage message.
+
+        NOTE:  -s and -u are XOR options.
+
+    Exit status:
+        0 => Email message was dropped into the spool or acknowledged by
+            the server.
+        64 => Invalid command line arguments.
+        75 => Temporary failure, the mail system will retry the delivery.
+
+    Notes:
+        The email is written into the spool tmp directory and renamed into
+        the spool new directory once the whole message is on disk, so the
+        daemon never sees a partial message.
+
+        Spool files are created group readable (mode 0640).  If the daemon
+        runs as a different user than the mail system, give the spool
+        directories a group shared by both users with the setgid bit set
+        (chmod 2770), so the daemon can read and move the files.
+
+        With -u the client waits for the server acknowledgement and exits
+        with a temporary failure unless the server replies "OK".
+
+    Example:
+        alias: "| /opt/local/mail_2_client.py -s /opt/local/spool -M"
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import time
+import socket
+
+EX_OK = 0
+EX_USAGE = 64
+EX_TEMPFAIL = 75
+CHUNK_SIZE = 65536
+SOCK_TIMEOUT = 300
+# Group readable, so a daemon in the spool directory group can read the file.
+SPOOL_MODE = 0o640
+
+
+def help_message():
+
+    """Function:  help_message
+
+    Description:  Displays the program's docstring which is the help and usage
+        message when -h option is selected.
+
+    Arguments:
+
+    """
+
+    print(__doc__)
+
+
+def spool_drop(spool_dir, in_file):
+
+    """Function:  spool_drop
+
+    Description:  Write the email message into the spool tmp directory and
+        then atomically move it into the spool new directory.  The file is
+        created with SPOOL_MODE whatever the umask of the mail system.
+
+    Arguments:
+        (input) spool_dir -> Spool directory path
+        (input) in_file -> Binary file handler to read the email from
+        (output) f_name -> Name of spool file created
+
+    """
+
+    b_name = f"{time.time_ns()}.{os.getpid()}.eml"
+    t_name = os.path.join(spool_dir, "tmp", b_name)
+    f_name = os.path.join(spool_dir, "new", b_name)
+    fdr = os.open(t_name, os.O_WRONLY | os.O_CREAT | os.O_EXCL, SPOOL_MODE)
+
+    try:
+        os.fchmod(fdr, SPOOL_MODE)
+
+        with os.fdopen(fdr, "wb") as out_file:
+            for data in iter(lambda: in_file.read(CHUNK_SIZE), b""):
+                out_file.write(data)
+
+            out_file.flush()
+            os.fsync(out_file.fileno())
+
+        os.rename(t_name, f_name)
+
+    except OSError:
+        if os.path.exists(t_name):
+            os.remove(t_name)
+
+        raise
+
+    return f_name
+
+
+def sock_send(sock_file, in_file):
+
+    """Function:  sock_send
+
+    Description:  Stream the email message to the server over the Unix
+        socket and wait for the server acknowledgement.
+
+    Arguments:
+        (input) sock_file -> Unix socket file of the server
+        (input) in_file -> Binary file handler to read the email from
+        (output) True|False - Server acknowledged the email
+        (output) reply -> Acknowledgement line from the server
+
+    """
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(SOCK_TIMEOUT)
+        sock.connect(sock_file)
+
+        for data in iter(lambda: in_file.read(CHUNK_SIZE), b""):
+            sock.sendall(data)
+
+        sock.shutdown(socket.SHUT_WR)
+        reply = b"".join(iter(lambda: sock.recv(CHUNK_SIZE), b""))
+
+    reply = reply.decode("UTF-8", "replace").strip()
+
+    return reply == "OK", reply
+
+
+def main():
+
+    """Function:  main
+
+    Description:  Processes the command line arguments and drops the email
+        received from standard in into the spool directory.
+
+    Arguments:
+        (input) argv -> Arguments from the command line
+        (output) Exit status
+
+    """
+
+    argv = sys.argv[1:]
+
+    if "-h" in argv:
+        help_message()
+        return EX_OK
+
+    opts = [opt for opt in ["-s", "-u"] if opt in argv]
+
+    if "-M" not in argv or len(opts) != 1 \
+       or argv.index(opts[0]) + 1 >= len(argv):
+        print("Error:  Requires -M and one of -s spool_dir or -u sock_file.",
+              file=sys.stderr)
+        return EX_USAGE
+
+    path = argv[argv.index(opts[0]) + 1]
+
+    try:
+        if opts[0] == "-s":
+            spool_drop(path, sys.stdin.buffer)
+
+        else:
+            status, reply = sock_send(path, sys.stdin.buffer)
+
+            if not status:
+                print(f"Error:  Server did not accept email: {reply}",
+                      file=sys.stderr)
+                return EX_TEMPFAIL
+
+    except OSError as err:
+        print(f"Error:  Unable to deliver email: {err}", file=sys.stderr)
+        return EX_TEMPFAIL
+
+    return EX_OK
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,11 +8,23 @@
 
     Usage:
         -M option:
-        email_alias: "| /path/mail_2_rmq.py -c file -d path -M"
-        cat email_file | /path/mail_2_rmq.py -c file -d path -M
+        email_alias: "| /path/mail_2_rmq.py -c file -d path -M [-P]"
+        cat email_file | /path/mail_2_rmq.py -c file -d path -M [-P]
 
         -C option:
-        mail_2_rmq.py -c file -d path -C {file* file1 file2 ...}
+        mail_2_rmq.py -c file -d path -C {file* file1 file2 ...} [-j workers]
+            [-P]
+
+        -D option:
+        mail_2_rmq.py -c file -d path -D
+        email_alias: "| /path/mail_2_client.py -s spool_dir -M"
+
+        -S option:
+        mail_2_rmq.py -c file -d path -S
+        email_alias: "| /path/mail_2_client.py -u sock_file -M"
+
+        -R option:
+        mail_2_rmq.py -c file -d path -R [-j workers] [-r rate] [-x]
 
         Other options:
             mail_2_rmq.py [ -v | -h ]
@@ -22,15 +34,38 @@
         -d dir path => Directory path for -c option.
 
         -M => Receive email messages from a pipe.
+            -P => Profile the run, see the profile_dir entry.
 
         -C file(s) => Name(s) of the email files to read.  Can also use
             wildcard expansion for file names.
+            -j workers => Number of worker processes reading the files, each
+                with its own RabbitMQ connections.  Default: 1
+            -P => Profile the run, see the profile_dir entry.  Not allowed
+                with more than one -j worker or with the async_engine
+                setting.
+
+        -D => Run as a resident daemon which processes the email files
+            dropped into the spool directory (spool_dir entry).  Email files
+            are dropped into the spool by the mail_2_client.py program.
+
+        -S => Run as a resident server which receives emails over a local
+            Unix domain socket (sock_file entry).  Emails are sent to the
+            socket by the mail_2_client.py program and each email is
+            acknowledged back to the client.
+
+        -R => Replay the emails archived in the email_dir directory.  Each
+            email is published to the queue in its archive file name and is
+            then moved to the email_dir/replayed directory.
+            -j workers => Number of emails replayed at once.  Default: 4
+            -r rate => Publish rate ceiling in messages per second.
+                Default: no limit
+            -x => Delete the replayed emails in place of moving them.
 
         -v => Display version of this program.
         -h => Help and usage message.
 
         NOTE 1:  -v or -h overrides all other options.
-        NOTE 2:  -M and -C are XOR options.
+        NOTE 2:  -M, -C, -D, -S and -R are XOR options.
 
         WARNING: If sending a text attachment, it must be encoded when it is
             emailed.
@@ -45,6 +80,7 @@
             host_list = []
             exchange_name = "EXCHANGE_NAME"
             valid_queues = ["QueueName1", "QueueName2"]
+            valid_queues2 = {}
             file_queues = ["FileQueueName1", "FileQueueName2"]
             err_queue = "ERROR_QUEUE_NAME"
             err_file_queues = "ERROR_FILE_QUEUE_NAME"
@@ -52,10 +88,15 @@
             log_file = "DIRECTORY_PATH/mail_2_rmq.log"
             queue_dict = {}
             err_addr_queue = "ERROR_ADDR_QUEUE_NAME"
+            routing_rules = []
             # For Debugging use
             debug_address = "debug_name@domain"
             debug_valid_queues = ["DebugQueue"]
             debug_queue_dict = {"debug_name@domain": "DebugQueue"}
+            # For -D option
+            spool_dir = "DIRECTORY_PATH/spool"
+            # For -S option
+            sock_file = "DIRECTORY_PATH/mail_2_rmq.sock"
 
             # Only change these entries if neccessary.
             attach_types
@@ -67,6 +108,38 @@
             auto_delete
             heartbeat
             tmp_dir
+            attach_spill
+            chunk_size
+            stage_timing
+            metrics_file
+            compress
+            compress_queues
+            compress_min
+            attach_format
+            pool_idle
+            spool_interval
+            sock_mode
+            sock_timeout
+            pub_confirm
+            confirm_window
+            confirm_timeout
+            async_engine
+            async_workers
+            topology_cache
+            host_scoring
+            host_timeout
+            host_retry
+            host_state
+            wal_dir
+            wal_interval
+            rmq_backend
+            memory_latency
+            memory_fail
+            memory_connect_fail
+            memory_keep
+            profile_dir
+            profile_memory
+            profile_top
 
         Note:  If connecting to a multiple node RabbitMQ cluster, use the
             host_list entry.
@@ -75,6 +148,11 @@
         alias: "| /opt/local/mail_2_rmq.py -M -c rabbitmq -d /opt/local/config"
         cat email_file | mail_2_rmq.py -c rabbitmq -d config -M
         mail_2_rmq.py -c rabbitmq -d config -C /opt/mail/email*.eml
+        mail_2_rmq.py -c rabbitmq -d config -C /opt/mail/email*.eml -j 16
+        mail_2_rmq.py -c rabbitmq -d config -C /opt/mail/email1.eml -P
+        mail_2_rmq.py -c rabbitmq -d config -D
+        mail_2_rmq.py -c rabbitmq -d config -S
+        mail_2_rmq.py -c rabbitmq -d config -R -j 8 -r 200
 
 """
 
@@ -87,7 +165,35 @@ import datetime
 import re
 import base64
 import io
-from email.parser import Parser
+import time
+import signal
+import fcntl
+import threading
+import socketserver
+import collections
+import asyncio
+import functools
+import concurrent.futures
+import itertools
+import hashlib
+import gzip
+import zlib
+import json
+import socket
+import uuid
+import random
+import cProfile
+import tracemalloc
+import contextlib
+import ast
+import multiprocessing
+import queue
+import email.message
+import email.policy
+from email.parser import BytesFeedParser
+
+# Third-party
+import pika
 
 # Local
 try:
@@ -104,1018 +210,5585 @@ except (ValueError, ImportError) as err:
 
 __version__ = version.__version__
 
+# Exchange, queue and routing key of a message waiting on a publisher
+#   confirm, used in place of the RabbitMQ class instance when the message is
+#   archived.
+ArchiveInfo = collections.namedtuple(
+    "ArchiveInfo", "exchange queue_name routing_key")
 
-def help_message():
+# Sequence number which keeps archive file names unique within a process.
+ARCHIVE_SEQ = itertools.count(1)
 
-    """Function:  help_message
+# Size of the chunks email messages are read and parsed in.
+CHUNK_SIZE = 65536
 
-    Description:  Displays the program's docstring which is the help and usage
-        message when -h option is selected.
+# Size of the blocks attachments are base64 encoded in, a multiple of 57
+#   bytes so each block encodes to whole 76 character lines.
+ENCODE_BLOCK = 57 * 1024
 
-    Arguments:
+# Default size in bytes above which an encoded attachment spills to tmp_dir.
+ATTACH_SPILL = 16777216
 
-    """
+# Compression codecs for the compress setting:  name -> function which
+#   compresses bytes.  The name is sent in the content_encoding property.
+CODECS = {"gzip": gzip.compress, "zlib": zlib.compress}
 
-    print(__doc__)
+# Default size in bytes below which message bodies are not compressed.
+COMPRESS_MIN = 1024
 
+# Count of messages saved by save_failed in this process.
+PUBLISH_STATS = collections.Counter()
 
-def load_cfg(cfg_name, cfg_dir):
+# Messages published by the memory publisher backend in this process, see
+#   MemoryRmq.  Only the last memory_keep messages are kept.
+MEMORY_PUBLISHED = collections.deque()
 
-    """Function:  load_cfg
+# Message and byte counts of the memory publisher backend in this process.
+MEMORY_STATS = collections.Counter()
 
-    Description:  Load the RabbitMQ configuration file and validate the
-        contents of the file.
+# Message published by the memory publisher backend.
+MemoryMsg = collections.namedtuple(
+    "MemoryMsg", "exchange queue_name routing_key body properties")
 
-    Arguments:
-        (input) cfg_name -> Configuration file name
-        (input) cfg_dir -> Directory path to the configuration file
-        (output) cfg -> Configuration module handler
-        (output) status_flag -> True|False - successfully validate config file
-        (output) combined_msg -> List of error messages detected
+# Stage timer of the email being processed by the thread, see get_timer.
+STAGE_TIMER = threading.local()
 
-    """
+# Histogram buckets of the metrics_file:  attachment sizes in bytes and
+#   connect and publish latencies in seconds.
+SIZE_BUCKETS = [1024, 16384, 262144, 1048576, 4194304, 16777216, 67108864]
+LATENCY_BUCKETS = [0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 10]
 
-    status_flag = True
-    combined_msg = []
-    cfg = gen_libs.load_module(cfg_name, cfg_dir)
-    status, err_msg = gen_libs.chk_crt_dir(
-        cfg.email_dir, write=True, read=True)
+# Archive file name:  exchange-queue-YYYYMMDD-HHMMSS[.pid[.seq]].email.txt
+ARCHIVE_NAME = re.compile(
+    r"^(?P<name>.+)-(?P<stamp>\d{8}-\d{6})(?:\.(?P<pid>\d+))?"
+    r"(?:\.(?P<seq>\d+))?\.email\.txt$")
 
-    if not status:
-        status_flag = status
-        combined_msg.append(err_msg)
 
-    status, err_msg = gen_libs.chk_crt_dir(
-        os.path.dirname(cfg.log_file), write=True, read=True)
+class MailPolicy(email.policy.Compat32):
 
-    if not status:
-        status_flag = status
-        combined_msg.append(err_msg)
+    """Class:  MailPolicy
 
-    status, err_msg = gen_libs.chk_crt_dir(cfg.tmp_dir, write=True, read=True)
+    Description:  compat32 email policy which decodes raw 8-bit bytes in a
+        header as UTF-8, so headers are always returned as strings.
 
-    if not status:
-        status_flag = status
-        combined_msg.append(err_msg)
+    Methods:
+        header_fetch_parse
 
-    return cfg, status_flag, combined_msg
+    """
 
+    def header_fetch_parse(self, name, value):
 
-def archive_email(rmq, log, cfg, msg):
+        """Method:  header_fetch_parse
 
-    """Function:  archive_email
+        Description:  Return the header value, decoding any raw bytes left in
+            it by the bytes parser as UTF-8.
 
-    Description:  Save an email to file in an archive directory.
+        Arguments:
+            (input) name -> Header name
+            (input) value -> Header value
+            (output) Header value
 
-    Arguments:
-        (input) rmq -> RabbitMQ class instance
-        (input) log -> Log class instance
-        (input) cfg -> Configuration settings module for the program
-        (input) msg -> Email message instance
+        """
 
-    """
+        try:
+            value.encode("UTF-8")
 
-    e_file = rmq.exchange + "-" + rmq.queue_name + "-" \
-        + datetime.datetime.strftime(
-            datetime.datetime.now(), "%Y%m%d-%H%M%S") \
-        + f".{os.getpid()}.email.txt"
-    f_file = os.path.join(cfg.email_dir, e_file)
-    log.log_info(f"[{os.getpid()}] Saving email to: {f_file}")
-    gen_libs.write_file(f_file, "w", msg)
-    log.log_info(f"[{os.getpid()}] Email saved to: {e_file}")
+        except UnicodeEncodeError:
+            value = value.encode("UTF-8", "surrogateescape").decode(
+                "UTF-8", "replace")
 
+        return super().header_fetch_parse(name, value)
 
-def get_text(msg):
 
-    """Function:  get_text
+MAIL_POLICY = MailPolicy()
 
-    Description:  Walks the tree of a email and returns the text of the email.
 
-    Arguments:
-        (input) msg -> Email message instance
-        (output) All texts in email joined together in a single string
+class MailMessage(email.message.Message):
 
-    """
+    """Class:  MailMessage
 
-    msg_list = []
+    Description:  Email message which keeps the result of the walk done by
+        extract_mime, so the MIME tree is walked and each part decoded once
+        however many times the message is routed.
 
-    for part in msg.walk():
-        if part.get_content_maintype() == "multipart" \
-           or not part.get_payload(decode=True):
-            continue
+    Methods:
 
-        if part.get_content_type() == "text/plain":
-            data = part.get_payload(decode=True)
+    """
 
-            if not isinstance(data, str):
-                data = data.decode("UTF-8")
+    mime_parts = None
 
-            msg_list.append(data)
 
-    return "".join(msg_list)
+# Part of an email with a file name:  file name, content type and decoded
+#   payload.
+MimePart = collections.namedtuple("MimePart", "name content_type data")
 
+# Result of extract_mime:  email text, attachments of the wanted types and
+#   rejected attachments, both lists of MimePart.
+MimeParts = collections.namedtuple("MimeParts", "text attachments rejected")
 
-def connect_process(rmq, log, cfg, msg, **kwargs):
 
-    """Function:  connect_process
+class StageTimer():
 
-    Description:  Publish email message to RabbitMQ.
+    """Class:  StageTimer
 
-    Arguments:
-        (input) rmq -> RabbitMQ class instance
-        (input) log -> Log class instance
-        (input) cfg -> Configuration settings module for the program
-        (input) msg -> Email message instance
-        (input) kwargs:
-            fname -> File name of email/attachment
+    Description:  Per email stage timing with the stage_timing setting.
+        Records the time spent in each processing stage with a monotonic
+        clock, along with byte and attachment counts and the route taken, for
+        a single summary line per email.  Each stage time and observed value
+        is also kept as a sample for the metrics_file histograms.
+
+    Methods:
+        __init__
+        stage
+        count
+        observe
+        set_route
+        summary
 
     """
 
-    fname = kwargs.get("fname", None)
+    enabled = True
 
-    # Process email or file/attachment.
-    if fname:
-        log.log_info(f"[{os.getpid()}] Processing file/attachment...")
+    def __init__(self):
 
-        with open(fname, mode="r", encoding="UTF-8") as f_hldr:
-            t_msg = f_hldr.read()
+        """Method:  __init__
 
-        bname = os.path.splitext(os.path.basename(fname))[0]
-        t_msg = str({"AFilename": bname, "File": t_msg})
+        Description:  Initialization instance of the StageTimer class.
 
-    elif rmq.queue_name == cfg.err_queue:
-        log.log_info(f"[{os.getpid()}] Processing error message...")
-        t_msg = "From: " + msg["from"] + " To: " + msg["to"] \
-                + " Subject: " + msg["subject"] + " Body: " \
-                + (get_text(msg) or "")
+        Arguments:
 
-    else:
-        log.log_info(f"[{os.getpid()}] Processing email body...")
-        t_msg = get_text(msg)
+        """
 
-    if t_msg and rmq.publish_msg(t_msg):
-        log.log_info(f"[{os.getpid()}] Message ingested into RabbitMQ")
+        self.start = time.monotonic()
+        self.stages = {}
+        self.counts = collections.Counter()
+        self.samples = collections.defaultdict(list)
+        self.route = None
 
-    else:
-        log.log_err(f"[{os.getpid()}] Failed to injest message into RabbitMQ")
-        archive_email(rmq, log, cfg, msg)
+    @contextlib.contextmanager
+    def stage(self, name):
 
+        """Method:  stage
 
-def filter_subject(subj, cfg):
+        Description:  Context manager which adds the time spent in the block
+            to the stage.
 
-    """Function:  filter_subject
+        Arguments:
+            (input) name -> Stage name
 
-    Description:  Filter out strings from the message subject line.
+        """
 
-    Arguments:
-        (input) subj -> Message subject line
-        (input) cfg -> Configuration settings module for the program
-        (output) subj -> Filtered message subject line
+        start = time.monotonic()
 
-    """
+        try:
+            yield
 
-    return re.sub(cfg.subj_filter, "", subj).strip()
+        finally:
+            secs = time.monotonic() - start
+            self.stages[name] = self.stages.get(name, 0.0) + secs
+            self.samples[name].append(secs)
 
+    def count(self, name, value=1):
 
-def convert_bytes(data):
+        """Method:  count
 
-    """Function:  convert_bytes
+        Description:  Add to a count.
 
-    Description:  Converts a string to bytes.
+        Arguments:
+            (input) name -> Count name
+            (input) value -> Value to add
 
-    Arguments:
-        (input) data -> Data string
-        (output) -> Bytes or None
+        """
 
-    """
+        self.counts[name] += value
 
-    if isinstance(data, bytes):
-        return data
+    def observe(self, name, value):
 
-    if isinstance(data, str):
-        return data.encode()
+        """Method:  observe
 
-    return None
+        Description:  Keep a sample value, such as an attachment size.
 
+        Arguments:
+            (input) name -> Sample name
+            (input) value -> Sample value
 
-def process_attach(msg, log, cfg):
+        """
 
-    """Function:  process_attach
+        self.samples[name].append(value)
 
-    Description:  Locate, extract, and process attachment from email based on
-        specified attachment types.
+    def set_route(self, route):
 
-    Arguments:
-        (input) msg -> Email message instance
-        (input) log -> Log class instance
-        (input) cfg -> Configuration settings module for the program
-        (output) fname -> Name of encoded attachment file
+        """Method:  set_route
 
-    """
+        Description:  Set the route taken by the email.
 
-    fname_list = []
-    log.log_info(f"[{os.getpid()}] Locating attachments...")
+        Arguments:
+            (input) route -> Route description
 
-    if not msg.is_multipart():
-        return fname_list
+        """
 
-    for item in msg.walk():
+        self.route = route
 
-        if item.get_content_type() in cfg.attach_types \
-           and item.get_filename():
-            tname = os.path.join(cfg.tmp_dir, item.get_filename())
-            log.log_info(
-                f"[{os.getpid()}] Attachment detected: {item.get_filename()}")
-            log.log_info(
-                f"[{os.getpid()}] Attachment type: {item.get_content_type()}")
-            data = convert_bytes(item.get_payload(decode=True))
+    def summary(self):
 
-            if data is None:
-                log.log_warn(
-                    f"[{os.getpid()}] Unable to convert attach to bytes")
-                continue
-
-            with io.open(tname, mode="wb") as fhdr:
-                fhdr.write(data)
-
-            fname = tname + ".encoded"
-            fname_list.append(fname)
-            in_file = io.open(tname, mode="rb")     # pylint:disable=R1732
-            out_file = io.open(fname, mode="wb")    # pylint:disable=R1732
-            base64.encode(in_file, out_file)
-            in_file.close()
-            out_file.close()
-            err_flag, err_msg = gen_libs.rm_file(tname)
-
-            if err_flag:
-                log.log_warn(
-                    f"[{os.getpid()}] process_attach:  Message: {err_msg}")
+        """Method:  summary
 
-        elif item.get_filename():
-            log.log_warn(
-                f"[{os.getpid()}] Invalid attachment detected:"
-                f" {item.get_filename()}")
-            log.log_warn(
-                f"[{os.getpid()}] Attachment type: {item.get_content_type()}")
+        Description:  Return the timing summary as a JSON string, with the
+            durations in seconds.
 
-    return fname_list
+        Arguments:
+            (output) Timing summary
 
+        """
 
-def process_from(cfg, log, msg, from_addr):
+        return json.dumps(
+            {"route": self.route,
+             "total": round(time.monotonic() - self.start, 6),
+             "stages": {name: round(secs, 6)
+                        for name, secs in self.stages.items()},
+             "counts": dict(self.counts)})
 
-    """Function:  process_from
 
-    Description:  Process email using its From line.
+class NullTimer():
 
-    Arguments:
-        (input) cfg -> Configuration settings module for the program
-        (input) log -> Log class instance
-        (input) msg -> Email message body
-        (input) from_addr -> Email From line
+    """Class:  NullTimer
 
-    """
+    Description:  Stage timer used when stage_timing is not set, where every
+        method does nothing.
 
-    fname_list = process_attach(msg, log, cfg)
+    Methods:
+        stage
+        count
+        observe
+        set_route
+        summary
 
-    if fname_list:
-        for fname in fname_list:
-            log.log_info(
-                f"[{os.getpid()}] Valid From address:"
-                f" {from_addr} with file attachment: {fname}")
-            pub_to_rmq(
-                cfg, log, cfg.queue_dict[from_addr], cfg.queue_dict[from_addr],
-                msg, fname=fname)
+    """
 
-    else:
-        log.log_warn(
-            f"[{os.getpid()}] Missing attachment for email address:"
-            f" {from_addr}")
-        connect_rmq(cfg, log, cfg.err_addr_queue, cfg.err_addr_queue, msg)
+    enabled = False
+    null_stage = contextlib.nullcontext()
 
+    def stage(self, name):                              # pylint:disable=W0613
 
-def connect_rmq(cfg, log, qname, rkey, msg, **kwargs):
+        """Method:  stage
 
-    """Function:  connect_rmq
+        Description:  Return a context manager which does nothing.
 
-    Description:  Set up and connect to RabbitMQ, check for connection
-        problems.
+        Arguments:
+            (input) name -> Stage name
 
-    Arguments:
-        (input) cfg -> Configuration settings module for the program
-        (input) log -> Log class instance
-        (input) qname -> Queue name for RabbitMQ
-        (input) rkey -> Rkey value for RabbitMQ
-        (input) msg -> Message body
-        (input) kwargs:
-            fname -> Name of attachment file
+        """
 
-    """
+        return self.null_stage
 
-    config = {"fname": kwargs.get("fname")} if kwargs.get("fname", False) \
-        else {}
-    rmq = rabbitmq_class.create_rmqpub(cfg, qname, rkey)
-    log.log_info(
-        f"[{os.getpid()}] connect_rmq: Connection info:"
-        f" {cfg.host}->{cfg.exchange_name}")
-    connect_status, err_msg = rmq.create_connection()
+    def count(self, name, value=1):
 
-    if connect_status and rmq.channel.is_open:
-        log.log_info(
-            f"[{os.getpid()}] connect_rmq: Connected to RabbitMQ mode")
-        connect_process(rmq, log, cfg, msg, **config)
+        """Method:  count
 
-    else:
-        log.log_err(
-            f"[{os.getpid()}] connect_rmq: Failed to connect to RabbitMQ")
-        log.log_err(f"[{os.getpid()}] connect_rmq: Message:  {err_msg}")
-        archive_email(rmq, log, cfg, msg)
+        Description:  Does nothing.
 
-    if connect_status:
-        rmq.close()
+        Arguments:
+            (input) name -> Count name
+            (input) value -> Value to add
 
+        """
 
-def pub_to_rmq(cfg, log, qname, rkey, msg, **kwargs):
+    def observe(self, name, value):
 
-    """Function:  pub_to_rmq
+        """Method:  observe
 
-    Description:  Consolidate arguments for the call to RMQ and clean up file.
+        Description:  Does nothing.
 
-    Arguments:
-        (input) cfg -> Configuration settings module for the program
-        (input) log -> Log class instance
-        (input) qname -> Queue name for RabbitMQ
-        (input) rkey -> Rkey value for RabbitMQ
-        (input) msg -> Email message body
-        (input) kwargs:
-            fname -> Name of attachment file
+        Arguments:
+            (input) name -> Sample name
+            (input) value -> Sample value
 
-    """
+        """
 
-    fname = kwargs.get("fname")
-    log.log_info(f"[{os.getpid()}] pub_to_rmq: Publishing: {fname}")
-    connect_rmq(cfg, log, qname, rkey, msg, fname=fname)
-    err_flag, err_msg = gen_libs.rm_file(fname)
+    def set_route(self, route):
 
-    if err_flag:
-        log.log_warn(f"[{os.getpid()}] pub_to_rmq: Message: {err_msg}")
+        """Method:  set_route
 
+        Description:  Does nothing.
 
-def process_file(cfg, log, subj, msg):
+        Arguments:
+            (input) route -> Route description
 
-    """Function:  process_file
+        """
 
-    Description:  Process email with a file attachment or process as an invalid
-        message.
+    def summary(self):
 
-    Arguments:
-        (input) cfg -> Configuration settings module for the program
-        (input) log -> Log class instance
-        (input) subj -> Email subject line
-        (input) msg -> Email message body
+        """Method:  summary
 
-    """
+        Description:  Return no summary.
 
-    fname_list = process_attach(msg, log, cfg)
+        Arguments:
+            (output) None
 
-    if fname_list and subj in cfg.file_queues:
-        for fname in fname_list:
-            log.log_info(
-                f"[{os.getpid()}] Valid subject with file attachment: {fname}")
-            pub_to_rmq(cfg, log, subj, subj, msg, fname=fname)
+        """
 
-    elif fname_list:
-        for fname in fname_list:
-            log.log_info(
-                f"[{os.getpid()}] Invalid subject with file attached: {fname}")
-            pub_to_rmq(
-                cfg, log, cfg.err_file_queue, cfg.err_file_queue, msg,
-                fname=fname)
+        return None
 
-    else:
-        log.log_warn(f"[{os.getpid()}] Invalid email subject: {subj}")
-        connect_rmq(cfg, log, cfg.err_queue, cfg.err_queue, msg)
 
+NULL_TIMER = NullTimer()
 
-def archive_email_debug(rmq, log, cfg, msg):
 
-    """Function:  archive_email_debug
+def start_timer(cfg):
 
-    Description:  Save an email to file in an archive directory.
+    """Function:  start_timer
+
+    Description:  Start the stage timer for a new email in the thread, a
+        StageTimer with the stage_timing or metrics_file setting or else the
+        NullTimer.
 
     Arguments:
-        (input) rmq -> RabbitMQ class instance
-        (input) log -> Log class instance
         (input) cfg -> Configuration settings module for the program
-        (input) msg -> Email message instance
+        (output) timer -> StageTimer or NullTimer class instance
 
     """
 
-    log.log_debug(f"[{os.getpid()}] Start of archive_email_debug")
-    e_file = rmq.exchange + "-" + rmq.queue_name + "-" \
-        + datetime.datetime.strftime(
-            datetime.datetime.now(), "%Y%m%d-%H%M%S") \
-        + f".{os.getpid()}.email.txt"
-    log.log_debug(f"[{os.getpid()}] e_file: {e_file}")
-    f_file = os.path.join(cfg.email_dir, e_file)
-    log.log_debug(f"[{os.getpid()}] f_file: {f_file}")
-    log.log_info(f"[{os.getpid()}] Saving email to: {f_file}")
-    gen_libs.write_file(f_file, "w", msg)
-    log.log_info(f"[{os.getpid()}] Email saved to: {e_file}")
-    log.log_debug(f"[{os.getpid()}] End of archive_email_debug")
+    timer = StageTimer() if getattr(cfg, "stage_timing", False) \
+        or getattr(cfg, "metrics_file", None) else NULL_TIMER
+    STAGE_TIMER.timer = timer
 
+    return timer
 
-def get_text_debug(msg, log):
 
-    """Function:  get_text_debug
+def get_timer():
+
+    """Function:  get_timer
 
-    Description:  Walks the tree of a email and returns the text of the email.
+    Description:  Return the stage timer of the email being processed by the
+        thread.
 
     Arguments:
-        (input) msg -> Email message instance
-        (input) log -> Log class instance
-        (output) All texts in email joined together in a single string
+        (output) timer -> StageTimer or NullTimer class instance
 
     """
 
-    log.log_debug(f"[{os.getpid()}] Start of get_text_debug")
-    msg_list = []
+    return getattr(STAGE_TIMER, "timer", NULL_TIMER)
 
-    for part in msg.walk():
-        log.log_debug(f"[{os.getpid()}] get_text: Top of msg.walk loop")
 
-        if part.get_content_maintype() == "multipart" \
-           or not part.get_payload(decode=True):
-            log.log_debug(f"[{os.getpid()}] Multipart or no payload detected")
-            log.log_debug(f"[{os.getpid()}] Continue to next iteration")
-            continue
+class MetricsFile():
 
-        if part.get_content_type() == "text/plain":
-            log.log_debug(f"[{os.getpid()}] Content type is text/plain")
-            log.log_debug(f"[{os.getpid()}] Get payload")
-            data = part.get_payload(decode=True)
-            log.log_debug(f"[{os.getpid()}] Got payload")
+    """Class:  MetricsFile
 
-            if not isinstance(data, str):
-                log.log_debug(f"[{os.getpid()}] Data is not a string")
-                log.log_debug(f"[{os.getpid()}] Start decode on data")
-                data = data.decode("UTF-8")
-                log.log_debug(f"[{os.getpid()}] Finish decode on data")
+    Description:  Prometheus textfile collector metrics for the metrics_file
+        setting.  The metric values are kept in a JSON state file next to
+        the metrics file, which each process locks while it adds the stage
+        timer of an email to it.  The metrics file is then written in the
+        Prometheus text format to a temporary file and renamed over the
+        metrics file, so node_exporter never reads a partial file.
 
-            log.log_debug(f"[{os.getpid()}] Appending data to list")
-            msg_list.append(data)
+    Methods:
+        __init__
+        update
+        merge
+        render
 
-        log.log_debug(f"[{os.getpid()}] get_text: Bottom of msg.walk loop")
+    """
 
-    log.log_debug(f"[{os.getpid()}] End of get_text_debug")
-    log.log_debug(f"[{os.getpid()}] Joining msg_list together for return")
+    # Stage timer count, metric name and help text of the counters.
+    counters = [
+        ("publish_bytes", "mail_2_rmq_published_bytes_total",
+         "Bytes of message bodies published."),
+        ("attachments", "mail_2_rmq_attachments_total",
+         "Attachments extracted from emails."),
+        ("archived", "mail_2_rmq_archived_total",
+         "Messages not published and archived to email_dir."),
+        ("spooled", "mail_2_rmq_spooled_total",
+         "Messages not published and saved to the write-ahead spool.")]
 
-    return "".join(msg_list)
+    # Stage timer sample, metric name, buckets and help text of the
+    #   histograms.
+    histograms = [
+        ("attach_bytes", "mail_2_rmq_attachment_bytes", SIZE_BUCKETS,
+         "Attachment sizes in bytes."),
+        ("connect", "mail_2_rmq_connect_seconds", LATENCY_BUCKETS,
+         "RabbitMQ connect latency in seconds."),
+        ("publish", "mail_2_rmq_publish_seconds", LATENCY_BUCKETS,
+         "RabbitMQ publish latency in seconds.")]
 
+    def __init__(self, cfg, log):
 
-def connect_process_debug(rmq, log, cfg, msg, **kwargs):
+        """Method:  __init__
 
-    """Function:  connect_process_debug
+        Description:  Initialization instance of the MetricsFile class.
 
-    Description:  Publish email message to RabbitMQ.
+        Arguments:
+            (input) cfg -> Configuration settings module for the program
+            (input) log -> Log class instance
 
-    Arguments:
-        (input) rmq -> RabbitMQ class instance
-        (input) log -> Log class instance
-        (input) cfg -> Configuration settings module for the program
-        (input) msg -> Email message instance
-        (input) kwargs:
-            fname -> File name of email/attachment
+        """
 
-    """
+        self.log = log
+        self.metrics_file = cfg.metrics_file
+        self.state_file = cfg.metrics_file + ".json"
 
-    log.log_debug(f"[{os.getpid()}] Start of connect_process_debug")
-    fname = kwargs.get("fname", None)
+    def update(self, timer):
 
-    # Process email or file/attachment.
-    if fname:
+        """Method:  update
+
+        Description:  Add the stage timer of an email to the state file and
+            write the metrics file.  The state file is locked while it is
+            read and written and the metrics file is rewritten.
+
+        Arguments:
+            (input) timer -> StageTimer class instance
+
+        """
+
+        try:
+            with open(self.state_file, mode="a+", encoding="UTF-8") as fhdr:
+                fcntl.flock(fhdr, fcntl.LOCK_EX)
+                fhdr.seek(0)
+
+                try:
+                    state = json.loads(fhdr.read() or "{}")
+
+                except ValueError:
+                    state = {}
+
+                self.merge(state, timer)
+                fhdr.seek(0)
+                fhdr.truncate()
+                json.dump(state, fhdr)
+                fhdr.flush()
+                t_name = f"{self.metrics_file}.{os.getpid()}.tmp"
+
+                with open(t_name, mode="w", encoding="UTF-8") as f_hldr:
+                    f_hldr.write(self.render(state))
+
+                os.replace(t_name, self.metrics_file)
+
+        except OSError as err:
+            self.log.log_warn(
+                f"[{os.getpid()}] MetricsFile: Unable to update: {err}")
+
+    def merge(self, state, timer):
+
+        """Method:  merge
+
+        Description:  Add the route, counts and samples of a stage timer to
+            the metric values.
+
+        Arguments:
+            (input) state -> Dictionary of metric values
+            (input) timer -> StageTimer class instance
+
+        """
+
+        route = (timer.route or "none").split(":", 1)[0]
+        routes = state.setdefault("routes", {})
+        routes[route] = routes.get(route, 0) + 1
+        counts = state.setdefault("counts", {})
+
+        for name, _, _ in self.counters:
+            counts[name] = counts.get(name, 0) + timer.counts[name]
+
+        for name, _, buckets, _ in self.histograms:
+            hist = state.setdefault("histograms", {}).setdefault(
+                name, {"buckets": [0] * len(buckets), "sum": 0, "count": 0})
+
+            for value in timer.samples.get(name, []):
+                for pos, bound in enumerate(buckets):
+                    if value <= bound:
+                        hist["buckets"][pos] += 1
+
+                hist["sum"] += value
+                hist["count"] += 1
+
+    def render(self, state):
+
+        """Method:  render
+
+        Description:  Return the metric values in the Prometheus text
+            format.
+
+        Arguments:
+            (input) state -> Dictionary of metric values
+            (output) Metrics in the Prometheus text format
+
+        """
+
+        lines = ["# HELP mail_2_rmq_messages_total Emails processed by route.",
+                 "# TYPE mail_2_rmq_messages_total counter"]
+        lines.extend(
+            f'mail_2_rmq_messages_total{{route="{route}"}} {count}'
+            for route, count in sorted(state.get("routes", {}).items()))
+
+        for name, metric, text in self.counters:
+            lines.extend([f"# HELP {metric} {text}",
+                          f"# TYPE {metric} counter",
+                          f"{metric} {state.get('counts', {}).get(name, 0)}"])
+
+        for name, metric, buckets, text in self.histograms:
+            hist = state.get("histograms", {}).get(
+                name, {"buckets": [0] * len(buckets), "sum": 0, "count": 0})
+            lines.extend([f"# HELP {metric} {text}",
+                          f"# TYPE {metric} histogram"])
+            lines.extend(
+                f'{metric}_bucket{{le="{bound}"}} {count}'
+                for bound, count in zip(buckets, hist["buckets"]))
+            lines.extend([f'{metric}_bucket{{le="+Inf"}} {hist["count"]}',
+                          f"{metric}_sum {hist['sum']}",
+                          f"{metric}_count {hist['count']}"])
+
+        return "\n".join(lines) + "\n"
+
+
+def help_message():
+
+    """Function:  help_message
+
+    Description:  Displays the program's docstring which is the help and usage
+        message when -h option is selected.
+
+    Arguments:
+
+    """
+
+    print(__doc__)
+
+
+def load_cfg(cfg_name, cfg_dir):
+
+    """Function:  load_cfg
+
+    Description:  Load the RabbitMQ configuration file and validate the
+        contents of the file.
+
+    Arguments:
+        (input) cfg_name -> Configuration file name
+        (input) cfg_dir -> Directory path to the configuration file
+        (output) cfg -> Configuration module handler
+        (output) status_flag -> True|False - successfully validate config file
+        (output) combined_msg -> List of error messages detected
+
+    """
+
+    status_flag = True
+    combined_msg = []
+    cfg = gen_libs.load_module(cfg_name, cfg_dir)
+    status, err_msg = gen_libs.chk_crt_dir(
+        cfg.email_dir, write=True, read=True)
+
+    if not status:
+        status_flag = status
+        combined_msg.append(err_msg)
+
+    status, err_msg = gen_libs.chk_crt_dir(
+        os.path.dirname(cfg.log_file), write=True, read=True)
+
+    if not status:
+        status_flag = status
+        combined_msg.append(err_msg)
+
+    status, err_msg = gen_libs.chk_crt_dir(cfg.tmp_dir, write=True, read=True)
+
+    if not status:
+        status_flag = status
+        combined_msg.append(err_msg)
+
+    for spool in ["spool_dir", "wal_dir"]:
+        if not getattr(cfg, spool, None):
+            continue
+
+        for sub_dir in ["tmp", "new", "failed"]:
+            status, err_msg = gen_libs.chk_crt_dir(
+                os.path.join(getattr(cfg, spool), sub_dir), write=True,
+                read=True)
+
+            if not status:
+                status_flag = status
+                combined_msg.append(err_msg)
+
+    if getattr(cfg, "compress", None) and cfg.compress not in CODECS:
+        status_flag = False
+        combined_msg.append(
+            f"Unknown compress codec: {cfg.compress}, valid codecs:"
+            f" {', '.join(CODECS)}")
+
+    if getattr(cfg, "attach_format", "dict") not in ["dict", "binary"]:
+        status_flag = False
+        combined_msg.append(
+            f"Unknown attach_format: {cfg.attach_format}, valid formats:"
+            " dict, binary")
+
+    if getattr(cfg, "routing_rules", None):
+        try:
+            get_routes(cfg)
+
+        except ValueError as err:
+            status_flag = False
+            combined_msg.append(str(err))
+
+    return cfg, status_flag, combined_msg
+
+
+def write_email(fname, msg):
+
+    """Function:  write_email
+
+    Description:  Write an email to file.  An email message instance is
+        written as bytes, so raw 8-bit bytes in the email are kept as is.
+
+    Arguments:
+        (input) fname -> Name of email file
+        (input) msg -> Email message instance
+
+    """
+
+    if isinstance(msg, email.message.Message):
+        with open(fname, mode="wb") as f_hldr:
+            f_hldr.write(msg.as_bytes())
+
+    else:
+        gen_libs.write_file(fname, "w", msg)
+
+
+def archive_email(rmq, log, cfg, msg):
+
+    """Function:  archive_email
+
+    Description:  Save an email to file in an archive directory.
+
+    Arguments:
+        (input) rmq -> RabbitMQ class instance
+        (input) log -> Log class instance
+        (input) cfg -> Configuration settings module for the program
+        (input) msg -> Email message instance
+
+    """
+
+    e_file = rmq.exchange + "-" + rmq.queue_name + "-" \
+        + datetime.datetime.strftime(
+            datetime.datetime.now(), "%Y%m%d-%H%M%S") \
+        + f".{os.getpid()}.{next(ARCHIVE_SEQ)}.email.txt"
+    f_file = os.path.join(cfg.email_dir, e_file)
+    log.log_info(f"[{os.getpid()}] Saving email to: {f_file}")
+    write_email(f_file, msg)
+    log.log_info(f"[{os.getpid()}] Email saved to: {e_file}")
+
+
+def decode_text(data, charset):
+
+    """Function:  decode_text
+
+    Description:  Decode a text payload with the charset of the message
+        part, UTF-8 if the part has no charset or an unknown charset.  Bytes
+        which are not valid in the charset are replaced.
+
+    Arguments:
+        (input) data -> Text payload in bytes
+        (input) charset -> Charset of the message part
+        (output) Text payload
+
+    """
+
+    try:
+        return data.decode(charset or "UTF-8", "replace")
+
+    except LookupError:
+        return data.decode("UTF-8", "replace")
+
+
+def extract_mime(msg, attach_types=()):
+
+    """Function:  extract_mime
+
+    Description:  Walks the tree of a email once, decoding each part once,
+        and returns the text of the email along with the parts with a file
+        name sorted into attachments and rejected attachments.  The walk is
+        kept with a MailMessage so later calls do not walk the tree again.
+
+    Arguments:
+        (input) msg -> Email message instance
+        (input) attach_types -> Content types of attachments to extract
+        (output) MimeParts namedtuple
+
+    """
+
+    walk = msg.mime_parts if isinstance(msg, MailMessage) else None
+
+    if walk is None:
+        msg_list = []
+        files = []
+
+        with get_timer().stage("mime"):
+            for part in msg.walk():
+                if part.get_content_maintype() == "multipart":
+                    continue
+
+                data = part.get_payload(decode=True)
+
+                if data and isinstance(data, (str, bytes)) \
+                   and part.get_content_type() == "text/plain":
+                    msg_list.append(
+                        data if isinstance(data, str)
+                        else decode_text(data, part.get_content_charset()))
+
+                if part.get_filename():
+                    files.append(MimePart(
+                        part.get_filename(), part.get_content_type(), data))
+
+        walk = ("".join(msg_list), files)
+
+        if isinstance(msg, MailMessage):
+            msg.mime_parts = walk
+
+    text, files = walk
+
+    return MimeParts(
+        text, [part for part in files if part.content_type in attach_types],
+        [part for part in files if part.content_type not in attach_types])
+
+
+def get_text(msg):
+
+    """Function:  get_text
+
+    Description:  Returns the text of the email.
+
+    Arguments:
+        (input) msg -> Email message instance
+        (output) All texts in email joined together in a single string
+
+    """
+
+    return extract_mime(msg).text
+
+
+def build_body(rmq, log, cfg, msg, **kwargs):
+
+    """Function:  build_body
+
+    Description:  Build the message body to publish from the email message
+        or the file/attachment.
+
+    Arguments:
+        (input) rmq -> RabbitMQ class instance
+        (input) log -> Log class instance
+        (input) cfg -> Configuration settings module for the program
+        (input) msg -> Email message instance
+        (input) kwargs:
+            attach -> Attachment class instance
+        (output) t_msg -> Message body
+
+    """
+
+    attach = kwargs.get("attach", None)
+
+    # Process email or file/attachment.
+    if attach:
         log.log_info(f"[{os.getpid()}] Processing file/attachment...")
-        log.log_debug(f"[{os.getpid()}] Open file for reading: {fname}")
+        t_msg = str({"AFilename": attach.name, "File": attach.read()})
 
-        with open(fname, mode="r", encoding="UTF-8") as f_hldr:
-            t_msg = f_hldr.read()
+    elif rmq.queue_name == cfg.err_queue:
+        log.log_info(f"[{os.getpid()}] Processing error message...")
+        t_msg = "From: " + msg["from"] + " To: " + msg["to"] \
+                + " Subject: " + msg["subject"] + " Body: " \
+                + (get_text(msg) or "")
+
+    else:
+        log.log_info(f"[{os.getpid()}] Processing email body...")
+        t_msg = get_text(msg)
+
+    return t_msg
+
+
+def wal_write(cfg, log, rmq, body, **props):
+
+    """Function:  wal_write
+
+    Description:  Append a ready to publish record to the write-ahead spool.
+        The record is written into the wal tmp directory and renamed into
+        the wal new directory once it is on disk.  Record file names sort in
+        the order the records were written.
+
+    Arguments:
+        (input) cfg -> Configuration settings module for the program
+        (input) log -> Log class instance
+        (input) rmq -> RabbitMQ class instance or ArchiveInfo
+        (input) body -> Message body
+        (input) props -> Message properties
+        (output) f_name -> Name of record file created
+
+    """
+
+    body = body.encode("UTF-8") if isinstance(body, str) else body
+    record = {"exchange": rmq.exchange, "queue": rmq.queue_name,
+              "rkey": rmq.routing_key, "props": props,
+              "body": base64.b64encode(body).decode("ascii")}
+    b_name = f"{time.time_ns():020d}.{os.getpid()}.{next(ARCHIVE_SEQ)}.json"
+    t_name = os.path.join(cfg.wal_dir, "tmp", b_name)
+    f_name = os.path.join(cfg.wal_dir, "new", b_name)
+
+    with open(t_name, mode="w", encoding="UTF-8") as f_hldr:
+        json.dump(record, f_hldr)
+        f_hldr.flush()
+        os.fsync(f_hldr.fileno())
+
+    os.rename(t_name, f_name)
+    log.log_info(f"[{os.getpid()}] Message spooled to: {f_name}")
+
+    return f_name
+
+
+def save_failed(rmq, log, cfg, msg, **kwargs):
+
+    """Function:  save_failed
+
+    Description:  Save a message which could not be published.  With the
+        wal_dir setting the built message bodies are appended to the
+        write-ahead spool for replay, otherwise the email is archived.  An
+        attachment is spooled as the same chunked, binary and compressed
+        messages it would have been published as.
+
+    Arguments:
+        (input) rmq -> RabbitMQ class instance or ArchiveInfo
+        (input) log -> Log class instance
+        (input) cfg -> Configuration settings module for the program
+        (input) msg -> Email message instance
+        (input) kwargs:
+            body -> Message body, built from msg if not passed
+            attach -> Attachment class instance
+            props -> Message properties
+
+    """
+
+    PUBLISH_STATS["saved"] += 1
+
+    if getattr(cfg, "wal_dir", None):
+        try:
+            if kwargs.get("body"):
+                bodies = [(kwargs.get("body"), kwargs.get("props", {}))]
+
+            elif kwargs.get("attach"):
+                bodies = [
+                    (body, {**props, **encoding})
+                    for body, props in attach_bodies(
+                        rmq, log, cfg, msg, kwargs.get("attach"))
+                    for body, encoding in [compress_body(rmq, cfg, body)]]
+
+            else:
+                body, encoding = compress_body(
+                    rmq, cfg, build_body(rmq, log, cfg, msg))
+                bodies = [(body, encoding)]
+
+            if all(body for body, _ in bodies):
+                for body, props in bodies:
+                    wal_write(cfg, log, rmq, body, **props)
+
+                get_timer().count("spooled")
+                return
+
+        except OSError as err:
+            log.log_err(f"[{os.getpid()}] Unable to spool message: {err}")
+
+    archive_email(rmq, log, cfg, msg)
+    get_timer().count("archived")
+
+
+def register_codec(name, func):
+
+    """Function:  register_codec
+
+    Description:  Add a compression codec which can be used in the compress
+        setting.
+
+    Arguments:
+        (input) name -> Codec name, sent in the content_encoding property
+        (input) func -> Function which compresses bytes
+
+    """
+
+    CODECS[name] = func
+
+
+def compress_body(rmq, cfg, body):
+
+    """Function:  compress_body
+
+    Description:  Compress a message body with the codec in the compress
+        setting.  Only bodies of at least compress_min bytes are compressed
+        and, if compress_queues is set, only those published to its queues.
+
+    Arguments:
+        (input) rmq -> RabbitMQ class instance
+        (input) cfg -> Configuration settings module for the program
+        (input) body -> Message body
+        (output) body -> Message body, compressed or as passed
+        (output) props -> Message properties
+
+    """
+
+    codec = getattr(cfg, "compress", None)
+    queues = getattr(cfg, "compress_queues", None)
+
+    if not codec or not body or (queues and rmq.queue_name not in queues):
+        return body, {}
+
+    data = body.encode("UTF-8") if isinstance(body, str) else body
+
+    if len(data) < getattr(cfg, "compress_min", COMPRESS_MIN):
+        return body, {}
+
+    return CODECS[codec](data), {"content_encoding": codec}
+
+
+def publish_body(rmq, body, **props):
+
+    """Function:  publish_body
+
+    Description:  Publish a message body with message properties.  Without
+        properties the message is published by the RabbitMQ class.
+
+    Arguments:
+        (input) rmq -> RabbitMQ class instance
+        (input) body -> Message body
+        (input) props -> Message properties
+        (output) True|False - Message was published
+
+    """
+
+    if not props:
+        return rmq.publish_msg(body)
+
+    try:
+        rmq.channel.basic_publish(
+            exchange=rmq.exchange, routing_key=rmq.routing_key, body=body,
+            properties=pika.BasicProperties(**{"delivery_mode": 2, **props}))
+
+    except pika.exceptions.AMQPError:
+        return False
+
+    return True
+
+
+def connect_process(rmq, log, cfg, msg, **kwargs):
+
+    """Function:  connect_process
+
+    Description:  Publish email message to RabbitMQ.
+
+    Arguments:
+        (input) rmq -> RabbitMQ class instance
+        (input) log -> Log class instance
+        (input) cfg -> Configuration settings module for the program
+        (input) msg -> Email message instance
+        (input) kwargs:
+            attach -> Attachment class instance, published in chunks if
+                larger than the chunk_size setting
+            body -> Message body already built from the email
+            confirm -> PubConfirm class instance
+
+    """
+
+    confirm = kwargs.get("confirm", None)
+    attach = kwargs.get("attach", None)
+    bodies = attach_bodies(rmq, log, cfg, msg, attach) if attach \
+        else [(kwargs.get("body") or build_body(rmq, log, cfg, msg), {})]
+
+    timer = get_timer()
+
+    for t_msg, props in bodies:
+        with timer.stage("compress"):
+            t_msg, encoding = compress_body(rmq, cfg, t_msg)
+
+        props = {**props, **encoding}
+        timer.count("publish_bytes", len(t_msg) if t_msg else 0)
+
+        with timer.stage("publish"):
+            if t_msg and confirm:
+                status = confirm.publish(t_msg, msg, **props)
+
+            else:
+                status = t_msg and publish_body(rmq, t_msg, **props)
+
+        if status:
+            log.log_info(f"[{os.getpid()}] Message ingested into RabbitMQ")
+
+        else:
+            log.log_err(
+                f"[{os.getpid()}] Failed to injest message into RabbitMQ")
+            save_failed(rmq, log, cfg, msg, body=t_msg, props=props)
+
+            # Without the write-ahead spool the whole email is archived.
+            if not getattr(cfg, "wal_dir", None):
+                break
+
+
+def filter_subject(subj, cfg):
+
+    """Function:  filter_subject
+
+    Description:  Filter out strings from the message subject line.
+
+    Arguments:
+        (input) subj -> Message subject line
+        (input) cfg -> Configuration settings module for the program
+        (output) subj -> Filtered message subject line
+
+    """
+
+    return re.sub(cfg.subj_filter, "", subj).strip()
+
+
+def convert_bytes(data):
+
+    """Function:  convert_bytes
+
+    Description:  Converts a string to bytes.
+
+    Arguments:
+        (input) data -> Data string
+        (output) -> Bytes or None
+
+    """
+
+    if isinstance(data, bytes):
+        return data
+
+    if isinstance(data, str):
+        return data.encode()
+
+    return None
+
+
+class Attachment():
+
+    """Class:  Attachment
+
+    Description:  Email attachment ready to publish, as base64 encoded text
+        or as raw bytes with the binary attach_format setting.  The payload
+        is held in memory or, for large attachments, in a spill file in
+        tmp_dir.
+
+    Methods:
+        __init__
+        open_spill
+        read
+        size
+        chunks
+        remove
+
+    """
+
+    def __init__(self, name, **kwargs):
+
+        """Method:  __init__
+
+        Description:  Initialization of an instance of the Attachment class.
+
+        Arguments:
+            (input) name -> Attachment file name
+            (input) kwargs:
+                data -> Encoded attachment text or raw attachment bytes
+                path -> Name of spill file holding the attachment
+                binary -> True|False - Attachment is raw bytes
+                content_type -> Attachment content type
+                sha256 -> sha256 checksum of the raw attachment bytes
+
+        """
+
+        self.name = name
+        self.data = kwargs.get("data")
+        self.path = kwargs.get("path")
+        self.binary = kwargs.get("binary", False)
+        self.content_type = kwargs.get("content_type")
+        self.sha256 = kwargs.get("sha256")
+
+    def open_spill(self):
+
+        """Method:  open_spill
+
+        Description:  Open the spill file for reading.
+
+        Arguments:
+            (output) File handler
+
+        """
+
+        if self.binary:
+            return open(self.path, mode="rb")       # pylint:disable=R1732
+
+        return open(                                # pylint:disable=R1732
+            self.path, mode="r", encoding="UTF-8")
+
+    def read(self):
+
+        """Method:  read
+
+        Description:  Return the attachment payload.
+
+        Arguments:
+            (output) Encoded attachment text or raw attachment bytes
+
+        """
+
+        if self.data is not None:
+            return self.data
+
+        with self.open_spill() as f_hldr:
+            return f_hldr.read()
+
+    def size(self):
+
+        """Method:  size
+
+        Description:  Return the length of the attachment payload.
+
+        Arguments:
+            (output) Length of the attachment payload
+
+        """
+
+        if self.data is not None:
+            return len(self.data)
+
+        return os.path.getsize(self.path)
+
+    def chunks(self, size):
+
+        """Method:  chunks
+
+        Description:  Return the attachment payload in pieces.  A spill file
+            is read one piece at a time.
+
+        Arguments:
+            (input) size -> Length of each piece
+            (output) Generator of attachment payload pieces
+
+        """
+
+        if self.data is not None:
+            for pos in range(0, len(self.data), size):
+                yield self.data[pos:pos + size]
+
+            return
+
+        with self.open_spill() as f_hldr:
+            for data in iter(lambda: f_hldr.read(size),
+                             b"" if self.binary else ""):
+                yield data
+
+    def remove(self):
+
+        """Method:  remove
+
+        Description:  Release the attachment payload and remove any spill
+            file.
+
+        Arguments:
+            (output) err_flag -> True|False - Removal failed
+            (output) err_msg -> Error message
+
+        """
+
+        self.data = None
+        err_flag, err_msg = False, None
+
+        if self.path:
+            err_flag, err_msg = gen_libs.rm_file(self.path)
+            self.path = None
+
+        return err_flag, err_msg
+
+
+def encode_attach(cfg, name, data, **kwargs):
+
+    """Function:  encode_attach
+
+    Description:  Base64 encode an attachment in memory, or keep the raw
+        bytes with the binary attach_format setting.  Attachments larger than
+        the attach_spill setting are written block by block into a spill file
+        in tmp_dir instead.
+
+    Arguments:
+        (input) cfg -> Configuration settings module for the program
+        (input) name -> Attachment file name
+        (input) data -> Decoded attachment bytes
+        (input) kwargs:
+            content_type -> Attachment content type
+        (output) Attachment class instance
+
+    """
+
+    info = {"content_type": kwargs.get("content_type")}
+    binary = getattr(cfg, "attach_format", "dict") == "binary"
+
+    if binary:
+        info.update(binary=True, sha256=hashlib.sha256(data).hexdigest())
+
+    if len(data) <= getattr(cfg, "attach_spill", ATTACH_SPILL):
+        return Attachment(
+            name, data=data if binary
+            else base64.encodebytes(data).decode("ascii"), **info)
+
+    path = os.path.join(
+        cfg.tmp_dir, f"{name}.{os.getpid()}.{next(ARCHIVE_SEQ)}.spill")
+
+    with io.open(path, mode="wb") as fhdr:
+        for pos in range(0, len(data), ENCODE_BLOCK):
+            block = data[pos:pos + ENCODE_BLOCK]
+            fhdr.write(block if binary else base64.encodebytes(block))
+
+    return Attachment(name, path=path, **info)
+
+
+def chunk_bodies(attach, size):
+
+    """Function:  chunk_bodies
+
+    Description:  Split an encoded attachment into message bodies.  Each body
+        carries a piece of the encoded text along with the transfer id shared
+        by all pieces, its sequence number, the count of pieces and a sha256
+        checksum of the piece.
+
+    Arguments:
+        (input) attach -> Attachment class instance
+        (input) size -> Length of encoded text in each message
+        (output) Generator of message bodies
+
+    """
+
+    transfer_id = uuid.uuid4().hex
+    total = -(-attach.size() // size)
+
+    for seq, piece in enumerate(attach.chunks(size), 1):
+        yield str({"AFilename": attach.name, "File": piece,
+                   "TransferId": transfer_id, "Seq": seq, "Total": total,
+                   "Checksum": hashlib.sha256(piece.encode()).hexdigest()})
+
+
+def binary_bodies(attach, msg, size=0):
+
+    """Function:  binary_bodies
+
+    Description:  Return the raw attachment bytes as message bodies with the
+        attachment details in the message headers:  filename, content_type,
+        size, sha256 and the from, subject and message_id of the email.  With
+        a size the bytes are split into pieces, each with transfer_id, seq,
+        total and checksum (sha256 of the piece) headers added.
+
+    Arguments:
+        (input) attach -> Attachment class instance
+        (input) msg -> Email message instance
+        (input) size -> Length of each piece, 0 for one message
+        (output) Generator of (message body, message properties)
+
+    """
+
+    headers = {
+        "filename": attach.name, "content_type": attach.content_type,
+        "size": attach.size(), "sha256": attach.sha256,
+        "from": str(msg.get("from", "")),
+        "subject": str(msg.get("subject", "")),
+        "message_id": str(msg.get("message-id", ""))}
+    content_type = attach.content_type or "application/octet-stream"
+
+    if not size:
+        yield attach.read(), {
+            "content_type": content_type, "headers": headers}
+        return
+
+    transfer_id = uuid.uuid4().hex
+    total = -(-attach.size() // size)
+
+    for seq, piece in enumerate(attach.chunks(size), 1):
+        yield piece, {"content_type": content_type, "headers": {
+            **headers, "transfer_id": transfer_id, "seq": seq,
+            "total": total, "checksum": hashlib.sha256(piece).hexdigest()}}
+
+
+def attach_bodies(rmq, log, cfg, msg, attach):
+
+    """Function:  attach_bodies
+
+    Description:  Return the message bodies to publish for an attachment.
+        Attachments larger than the chunk_size setting are split into chunks,
+        otherwise the attachment is published as one message.
+
+    Arguments:
+        (input) rmq -> RabbitMQ class instance
+        (input) log -> Log class instance
+        (input) cfg -> Configuration settings module for the program
+        (input) msg -> Email message instance
+        (input) attach -> Attachment class instance
+        (output) List or generator of (message body, message properties)
+
+    """
+
+    chunk_size = getattr(cfg, "chunk_size", 0)
+    chunked = chunk_size and attach.size() > chunk_size
+
+    if chunked:
+        log.log_info(
+            f"[{os.getpid()}] Publishing {attach.name} in chunks of"
+            f" {chunk_size}")
+
+    if attach.binary:
+        return binary_bodies(attach, msg, chunk_size if chunked else 0)
+
+    if chunked:
+        return ((body, {}) for body in chunk_bodies(attach, chunk_size))
+
+    return [(build_body(rmq, log, cfg, msg, attach=attach), {})]
+
+
+class ChunkAssembler():
+
+    """Class:  ChunkAssembler
+
+    Description:  Consumer helper which reassembles attachments published in
+        chunks, with the chunk details in the message body or, for the binary
+        attach_format, in the message headers.  Message bodies without chunk
+        details are returned as is.
+
+    Methods:
+        __init__
+        add
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization of an instance of the ChunkAssembler
+            class.
+
+        Arguments:
+
+        """
+
+        self.transfers = {}
+
+    def add(self, body, headers=None):
+
+        """Method:  add
+
+        Description:  Add a consumed message.  Raises ValueError if the
+            checksum of the piece does not match.
+
+        Arguments:
+            (input) body -> Message body string, dictionary or bytes
+            (input) headers -> Message headers
+            (output) (file name, attachment) once the attachment is
+                complete, otherwise None
+
+        """
+
+        if headers and "filename" in headers:
+            chunk = {"AFilename": headers["filename"], "File": body,
+                     "TransferId": headers.get("transfer_id"),
+                     "Seq": headers.get("seq"), "Total": headers.get("total"),
+                     "Checksum": headers.get("checksum")}
+
+        else:
+            chunk = ast.literal_eval(body) if isinstance(body, str) else body
+
+        if not chunk.get("TransferId"):
+            return chunk["AFilename"], chunk["File"]
+
+        piece = chunk["File"]
+
+        if hashlib.sha256(piece.encode() if isinstance(piece, str)
+                          else piece).hexdigest() != chunk["Checksum"]:
+            raise ValueError(
+                f"Checksum mismatch: {chunk['TransferId']} {chunk['Seq']}")
+
+        pieces = self.transfers.setdefault(chunk["TransferId"], {})
+        pieces[chunk["Seq"]] = chunk["File"]
+
+        if len(pieces) < chunk["Total"]:
+            return None
+
+        del self.transfers[chunk["TransferId"]]
+
+        return chunk["AFilename"], piece[:0].join(
+            pieces[seq] for seq in range(1, chunk["Total"] + 1))
+
+
+def process_attach(msg, log, cfg):
+
+    """Function:  process_attach
+
+    Description:  Locate, extract, and process attachment from email based on
+        specified attachment types.
+
+    Arguments:
+        (input) msg -> Email message instance
+        (input) log -> Log class instance
+        (input) cfg -> Configuration settings module for the program
+        (output) attach_list -> List of Attachment class instances
+
+    """
+
+    attach_list = []
+    timer = get_timer()
+    log.log_info(f"[{os.getpid()}] Locating attachments...")
+
+    if not msg.is_multipart():
+        return attach_list
+
+    mime = extract_mime(msg, cfg.attach_types)
+
+    for part in mime.attachments:
+        log.log_info(f"[{os.getpid()}] Attachment detected: {part.name}")
+        log.log_info(f"[{os.getpid()}] Attachment type: {part.content_type}")
+        data = convert_bytes(part.data)
+
+        if data is None:
+            log.log_warn(f"[{os.getpid()}] Unable to convert attach to bytes")
+            continue
+
+        timer.count("attachments")
+        timer.count("attach_bytes", len(data))
+        timer.observe("attach_bytes", len(data))
+
+        with timer.stage("encode"):
+            attach_list.append(encode_attach(
+                cfg, os.path.basename(part.name), data,
+                content_type=part.content_type))
+
+    for part in mime.rejected:
+        log.log_warn(
+            f"[{os.getpid()}] Invalid attachment detected: {part.name}")
+        log.log_warn(f"[{os.getpid()}] Attachment type: {part.content_type}")
+
+    return attach_list
+
+
+class RouteRule():
+
+    """Class:  RouteRule
+
+    Description:  Routing rule compiled from a routing_rules entry.  The
+        conditions of the rule are compiled into a list of predicates over
+        the fields extracted from the email, evaluated in order until one
+        fails.  A rule without conditions matches every email.
+
+        Rule entry:
+            name => Name of the rule, defaults to the queue name.
+            queue => Queue to publish to.
+            publish => "email" for the email or "attach" for each attachment.
+            headers => Dictionary of header names and regular expressions
+                searched for in the header, without case.
+            attach_types => List of attachment content types, one of which
+                is in the email.
+            attach_min => Minimum total size in bytes of the attachments.
+            attach_max => Maximum total size in bytes of the attachments.
+
+    Methods:
+        __init__
+        matches
+
+    """
+
+    keys = {"name", "queue", "publish", "headers", "attach_types",
+            "attach_min", "attach_max"}
+
+    def __init__(self, rule):
+
+        """Method:  __init__
+
+        Description:  Initialization of an instance of the RouteRule class.
+
+        Arguments:
+            (input) rule -> Dictionary of a routing_rules entry
+
+        """
+
+        if not isinstance(rule, dict) or not rule.get("queue"):
+            raise ValueError(f"Routing rule without a queue: {rule}")
+
+        if set(rule) - self.keys:
+            raise ValueError(
+                f"Unknown routing rule keys: {sorted(set(rule) - self.keys)}")
+
+        self.queue = rule["queue"]
+        self.name = rule.get("name", self.queue)
+        self.publish = rule.get("publish", "email")
+        self.headers = set()
+        self.attach = bool(
+            {"attach_types", "attach_min", "attach_max"} & set(rule))
+        self.preds = []
+        self.hits = 0
+
+        if self.publish not in ["email", "attach"]:
+            raise ValueError(
+                f"Unknown routing rule publish: {self.publish}, valid"
+                " values: email, attach")
+
+        for name, pattern in rule.get("headers", {}).items():
+            try:
+                regex = re.compile(pattern, re.IGNORECASE)
+
+            except re.error as err:
+                raise ValueError(
+                    f"Invalid routing rule pattern: {pattern}: {err}") \
+                    from err
+
+            self.headers.add(name.lower())
+            self.preds.append(
+                lambda fields, key=name.lower(), regex=regex:
+                regex.search(fields[key]) is not None)
+
+        if rule.get("attach_types"):
+            types = frozenset(rule["attach_types"])
+            self.preds.append(
+                lambda fields: not types.isdisjoint(fields["attach_types"]))
+
+        if rule.get("attach_min") is not None:
+            self.preds.append(
+                lambda fields, size=rule["attach_min"]:
+                fields["attach_size"] >= size)
+
+        if rule.get("attach_max") is not None:
+            self.preds.append(
+                lambda fields, size=rule["attach_max"]:
+                fields["attach_size"] <= size)
+
+    def matches(self, fields):
+
+        """Method:  matches
+
+        Description:  Return True if every condition of the rule holds for
+            the email fields.
+
+        Arguments:
+            (input) fields -> Dictionary of fields extracted from the email
+            (output) True|False - Rule matches the email
+
+        """
+
+        return all(pred(fields) for pred in self.preds)
+
+
+class RouteTable():
+
+    """Class:  RouteTable
+
+    Description:  Routing table compiled once from the configuration.  Sender
+        addresses are looked up in a dictionary and domain wildcards in a
+        trie keyed on the reversed domain labels.  The valid_queues and
+        file_queues entries are kept as sets and the valid_queues2 entry as a
+        dictionary of subjects and queue lists.  The attach_queues set holds
+        every queue attachments are published to.  The routing_rules entries
+        are compiled into an ordered list of RouteRule instances, evaluated
+        before the subject and sender routing.
+
+        Domain wildcards in queue_dict:
+            *@domain => Any address in the domain.
+            *@*.domain => Any address in a sub-domain of the domain.
+
+    Methods:
+        __init__
+        add_sender
+        sender_queue
+        fields
+        match_rule
+        rule_hits
+
+    """
+
+    def __init__(self, cfg):
+
+        """Method:  __init__
+
+        Description:  Initialization of an instance of the RouteTable class.
+
+        Arguments:
+            (input) cfg -> Configuration settings module for the program
+
+        """
+
+        self.valid_queues = set(cfg.valid_queues)
+        self.fanout = {subj: list(qnames) for subj, qnames
+                       in getattr(cfg, "valid_queues2", {}).items()}
+        self.file_queues = set(getattr(cfg, "file_queues", []))
+        self.senders = {}
+        self.domains = {}
+
+        self.rules = [
+            RouteRule(rule) for rule in getattr(cfg, "routing_rules", [])]
+        self.headers = set().union(*[rule.headers for rule in self.rules])
+        self.attach = any(rule.attach for rule in self.rules)
+
+        for addr, qname in cfg.queue_dict.items():
+            self.add_sender(addr, qname)
+
+        self.attach_queues = self.file_queues | {cfg.err_file_queue} \
+            | set(cfg.queue_dict.values()) \
+            | {rule.queue for rule in self.rules if rule.publish == "attach"}
+
+    def add_sender(self, addr, qname):
+
+        """Method:  add_sender
+
+        Description:  Add a sender address or domain wildcard.
+
+        Arguments:
+            (input) addr -> Email address or domain wildcard
+            (input) qname -> Queue name for the sender
+
+        """
+
+        if not addr.startswith("*@"):
+            self.senders[addr] = qname
+            return
+
+        labels = addr[2:].lower().split(".")
+        key = ""
+
+        # The "" key holds the queue for the domain itself and the "*" key
+        #   the queue for its sub-domains.
+        if labels[0] == "*":
+            labels, key = labels[1:], "*"
+
+        node = self.domains
+
+        for label in reversed(labels):
+            node = node.setdefault(label, {})
+
+        node[key] = qname
+
+    def sender_queue(self, addr):
+
+        """Method:  sender_queue
+
+        Description:  Return the queue for a sender address.  An exact address
+            match is used first, then the most specific domain wildcard.
+
+        Arguments:
+            (input) addr -> Email address
+            (output) qname -> Queue name or None
+
+        """
+
+        qname = self.senders.get(addr)
+
+        if qname or "@" not in addr:
+            return qname
+
+        labels = addr.rsplit("@", 1)[1].lower().split(".")
+        node = self.domains
+
+        for pos, label in enumerate(reversed(labels)):
+            node = node.get(label)
+
+            if node is None:
+                break
+
+            if pos < len(labels) - 1 and "*" in node:
+                qname = node["*"]
+
+            elif pos == len(labels) - 1 and "" in node:
+                qname = node[""]
+
+        return qname
+
+    def fields(self, msg):
+
+        """Method:  fields
+
+        Description:  Extract the fields the routing rules test from the
+            email in one pass:  the headers named in any rule and, if a rule
+            tests the attachments, the attachment content types and total
+            size.
+
+        Arguments:
+            (input) msg -> Email message instance
+            (output) fields -> Dictionary of fields extracted from the email
+
+        """
+
+        fields = {
+            key: " ".join(str(val) for val in msg.get_all(key, []))
+            for key in self.headers}
+
+        if self.attach:
+            mime = extract_mime(msg)
+            parts = mime.attachments + mime.rejected
+            fields["attach_types"] = {part.content_type for part in parts}
+            fields["attach_size"] = sum(
+                len(part.data) for part in parts
+                if isinstance(part.data, (str, bytes)))
+
+        return fields
+
+    def match_rule(self, msg):
+
+        """Method:  match_rule
+
+        Description:  Return the first routing rule which matches the email
+            and count the hit against the rule.
+
+        Arguments:
+            (input) msg -> Email message instance
+            (output) rule -> RouteRule class instance or None
+
+        """
+
+        if not self.rules:
+            return None
+
+        fields = self.fields(msg)
+
+        for rule in self.rules:
+            if rule.matches(fields):
+                rule.hits += 1
+                return rule
+
+        return None
+
+    def rule_hits(self):
+
+        """Method:  rule_hits
+
+        Description:  Return the hit counts of the routing rules.
+
+        Arguments:
+            (output) Dictionary of rule names and hit counts
+
+        """
+
+        return {rule.name: rule.hits for rule in self.rules}
+
+
+def get_routes(cfg):
+
+    """Function:  get_routes
+
+    Description:  Return the routing table for the configuration, compiled on
+        first use and kept with the configuration.
+
+    Arguments:
+        (input) cfg -> Configuration settings module for the program
+        (output) RouteTable class instance
+
+    """
+
+    routes = getattr(cfg, "route_table", None)
+
+    if routes is None:
+        routes = RouteTable(cfg)
+        cfg.route_table = routes
+
+    return routes
+
+
+def process_rule(cfg, log, msg, rule, **kwargs):
+
+    """Function:  process_rule
+
+    Description:  Process email matched by a routing rule.
+
+    Arguments:
+        (input) cfg -> Configuration settings module for the program
+        (input) log -> Log class instance
+        (input) msg -> Email message body
+        (input) rule -> RouteRule class instance
+        (input) kwargs:
+            session -> RmqSession class instance
+
+    """
+
+    session = kwargs.get("session")
+    log.log_info(
+        f"[{os.getpid()}] Routing rule: {rule.name} to queue: {rule.queue}")
+
+    if rule.publish == "email":
+        connect_rmq(cfg, log, rule.queue, rule.queue, msg, session=session)
+        return
+
+    attach_list = process_attach(msg, log, cfg)
+
+    for attach in attach_list:
+        log.log_info(
+            f"[{os.getpid()}] Routing rule: {rule.name} with file attachment:"
+            f" {attach.name}")
+        pub_to_rmq(
+            cfg, log, rule.queue, rule.queue, msg, attach=attach,
+            session=session)
+
+    if not attach_list:
+        log.log_warn(
+            f"[{os.getpid()}] Missing attachment for routing rule:"
+            f" {rule.name}")
+        get_timer().set_route("err_file_queue")
+        connect_rmq(
+            cfg, log, cfg.err_file_queue, cfg.err_file_queue, msg,
+            session=session)
+
+
+def process_from(cfg, log, msg, from_addr, **kwargs):
+
+    """Function:  process_from
+
+    Description:  Process email using its From line.
+
+    Arguments:
+        (input) cfg -> Configuration settings module for the program
+        (input) log -> Log class instance
+        (input) msg -> Email message body
+        (input) from_addr -> Email From line
+        (input) kwargs:
+            qname -> Queue name for the From address
+            session -> RmqSession class instance
+
+    """
+
+    session = kwargs.get("session")
+    qname = kwargs.get("qname") or cfg.queue_dict[from_addr]
+    attach_list = process_attach(msg, log, cfg)
+
+    if attach_list:
+        for attach in attach_list:
+            log.log_info(
+                f"[{os.getpid()}] Valid From address:"
+                f" {from_addr} with file attachment: {attach.name}")
+            pub_to_rmq(
+                cfg, log, qname, qname, msg, attach=attach, session=session)
+
+    else:
+        log.log_warn(
+            f"[{os.getpid()}] Missing attachment for email address:"
+            f" {from_addr}")
+        get_timer().set_route("err_addr_queue")
+        connect_rmq(
+            cfg, log, cfg.err_addr_queue, cfg.err_addr_queue, msg,
+            session=session)
+
+
+def topology_queues(cfg):
+
+    """Function:  topology_queues
+
+    Description:  Return every queue the configuration can publish to.
+
+    Arguments:
+        (input) cfg -> Configuration settings module for the program
+        (output) queues -> Set of (queue name, routing key)
+
+    """
+
+    qnames = list(cfg.valid_queues) + list(cfg.file_queues) \
+        + list(cfg.queue_dict.values()) \
+        + [rule["queue"] for rule in getattr(cfg, "routing_rules", [])] \
+        + [qname for qlist in getattr(cfg, "valid_queues2", {}).values()
+           for qname in qlist] \
+        + list(getattr(cfg, "debug_valid_queues", [])) \
+        + list(getattr(cfg, "debug_queue_dict", {}).values()) \
+        + [qname for qlist in getattr(cfg, "debug_valid_queues2", {}).values()
+           for qname in qlist] \
+        + [getattr(cfg, name) for name in
+           ["err_queue", "err_file_queue", "err_addr_queue"]
+           if getattr(cfg, name, None)]
+
+    return {(qname, qname) for qname in qnames}
+
+
+def topology_stamp(cfg):
+
+    """Function:  topology_stamp
+
+    Description:  Return the topology cache stamp file name.  The name holds
+        a hash of the broker, exchange and queue settings, so any change to
+        them needs a new stamp.
+
+    Arguments:
+        (input) cfg -> Configuration settings module for the program
+        (output) Topology cache stamp file name
+
+    """
+
+    settings = repr([
+        getattr(cfg, "host_list", None) or [cfg.host], cfg.exchange_name,
+        getattr(cfg, "exchange_type", None), getattr(cfg, "x_durable", None),
+        getattr(cfg, "q_durable", None), getattr(cfg, "auto_delete", None),
+        sorted(topology_queues(cfg))])
+    digest = hashlib.sha256(settings.encode("UTF-8")).hexdigest()[:16]
+
+    return os.path.join(cfg.tmp_dir, f"mail_2_rmq.{digest}.topology")
+
+
+def declare_topology(cfg, log):
+
+    """Function:  declare_topology
+
+    Description:  Topology pre-flight.  Declare the exchange and every queue
+        in the configuration once and record it in the topology cache stamp.
+        Nothing is declared if the stamp for the current configuration
+        already exists.
+
+    Arguments:
+        (input) cfg -> Configuration settings module for the program
+        (input) log -> Log class instance
+        (output) queues -> Set of (queue name, routing key) declared, empty
+            if the pre-flight failed
+
+    """
+
+    stamp = topology_stamp(cfg)
+    queues = topology_queues(cfg)
+
+    if os.path.exists(stamp):
+        return queues
+
+    log.log_info(f"[{os.getpid()}] Topology pre-flight: {len(queues)} queues")
+    rmq, connect_status, err_msg = open_rmq(cfg, log, cfg.err_queue,
+                                            cfg.err_queue)
+
+    if not (connect_status and rmq.channel.is_open):
+        log.log_warn(
+            f"[{os.getpid()}] Topology pre-flight failed: {err_msg}")
+        return set()
+
+    try:
+        for qname, rkey in sorted(queues):
+            rmq.queue_name = qname
+            rmq.routing_key = rkey
+            rmq.create_queue()
+            rmq.bind_queue()
+
+    except pika.exceptions.AMQPError as err:
+        log.log_warn(f"[{os.getpid()}] Topology pre-flight failed: {err}")
+        queues = set()
+
+    else:
+        gen_libs.write_file(stamp, "w", datetime.datetime.now().isoformat())
+
+    try:
+        rmq.close()
+
+    except pika.exceptions.AMQPError as err:
+        log.log_warn(f"[{os.getpid()}] Topology pre-flight close: {err}")
+
+    return queues
+
+
+class HostCfg():                                        # pylint:disable=R0903
+
+    """Class:  HostCfg
+
+    Description:  Configuration settings with the host_list narrowed down to
+        a single RabbitMQ node.  All other settings are read from the
+        configuration module.
+
+    Methods:
+        __init__
+        __getattr__
+
+    """
+
+    def __init__(self, cfg, node):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the HostCfg class.
+
+        Arguments:
+            (input) cfg -> Configuration settings module for the program
+            (input) node -> host_list entry:  "IP:PORT"
+
+        """
+
+        self.cfg = cfg
+        self.host_list = [node]
+        self.host, _, port = node.rpartition(":") if ":" in node \
+            else (node, None, None)
+        self.port = int(port) if port else cfg.port
+
+    def __getattr__(self, name):
+
+        """Method:  __getattr__
+
+        Description:  Return the setting from the configuration module.
+
+        Arguments:
+            (input) name -> Name of setting
+            (output) Setting value
+
+        """
+
+        return getattr(self.cfg, name)
+
+
+class ExchangeCfg():                                    # pylint:disable=R0903
+
+    """Class:  ExchangeCfg
+
+    Description:  Configuration settings with the exchange_name replaced,
+        used to publish to the exchange a write-ahead spool record was
+        written for.  All other settings are read from the configuration
+        module.
+
+    Methods:
+        __init__
+        __getattr__
+
+    """
+
+    def __init__(self, cfg, exchange_name):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the ExchangeCfg class.
+
+        Arguments:
+            (input) cfg -> Configuration settings module for the program
+            (input) exchange_name -> RabbitMQ exchange name
+
+        """
+
+        self.cfg = cfg
+        self.exchange_name = exchange_name
+
+    def __getattr__(self, name):
+
+        """Method:  __getattr__
+
+        Description:  Return the setting from the configuration module.
+
+        Arguments:
+            (input) name -> Name of setting
+            (output) Setting value
+
+        """
+
+        return getattr(self.cfg, name)
+
+
+class HostScores():
+
+    """Class:  HostScores
+
+    Description:  Health scores of the host_list nodes.  The average connect
+        latency and consecutive connect failures of each node are kept in a
+        state file shared by all mail_2_rmq.py processes.  Nodes that failed
+        within the last host_retry seconds are tried last, the others are
+        tried fastest first.
+
+    Methods:
+        __init__
+        load
+        update
+        order
+        probe
+
+    """
+
+    def __init__(self, cfg, log):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the HostScores class.
+
+        Arguments:
+            (input) cfg -> Configuration settings module for the program
+            (input) log -> Log class instance
+
+        """
+
+        self.cfg = cfg
+        self.log = log
+        self.state_file = getattr(cfg, "host_state", None) \
+            or os.path.join(cfg.tmp_dir, "mail_2_rmq.hosts.json")
+        self.timeout = getattr(cfg, "host_timeout", 2)
+        self.retry = getattr(cfg, "host_retry", 60)
+
+    def load(self):
+
+        """Method:  load
+
+        Description:  Read the node scores from the state file.
+
+        Arguments:
+            (output) state -> Dictionary of node scores
+
+        """
+
+        try:
+            with open(self.state_file, mode="r", encoding="UTF-8") as fhdr:
+                fcntl.flock(fhdr, fcntl.LOCK_SH)
+                return json.load(fhdr)
+
+        except (OSError, ValueError):
+            return {}
+
+    def update(self, node, latency=None):
+
+        """Method:  update
+
+        Description:  Record the result of a connect to a node in the state
+            file.  The state file is locked while it is read and written.
+
+        Arguments:
+            (input) node -> host_list entry
+            (input) latency -> Connect time in seconds, None if it failed
+
+        """
+
+        try:
+            with open(self.state_file, mode="a+", encoding="UTF-8") as fhdr:
+                fcntl.flock(fhdr, fcntl.LOCK_EX)
+                fhdr.seek(0)
+
+                try:
+                    state = json.loads(fhdr.read() or "{}")
+
+                except ValueError:
+                    state = {}
+
+                entry = state.setdefault(node, {"latency": 0, "fails": 0})
+
+                if latency is None:
+                    entry["fails"] += 1
+                    entry["last_fail"] = time.time()
+
+                else:
+                    entry["fails"] = 0
+                    entry["latency"] = round(
+                        latency if not entry["latency"]
+                        else 0.7 * entry["latency"] + 0.3 * latency, 6)
+
+                fhdr.seek(0)
+                fhdr.truncate()
+                json.dump(state, fhdr)
+
+        except OSError as err:
+            self.log.log_warn(
+                f"[{os.getpid()}] HostScores: Unable to update: {err}")
+
+    def order(self, nodes):
+
+        """Method:  order
+
+        Description:  Return the nodes healthiest first.  Nodes with the same
+            score keep their host_list order.
+
+        Arguments:
+            (input) nodes -> List of host_list entries
+            (output) List of host_list entries in the order to try them
+
+        """
+
+        state = self.load()
+        now = time.time()
+
+        def score(node):
+            entry = state.get(node, {})
+            down = bool(entry.get("fails")) \
+                and now - entry.get("last_fail", 0) < self.retry
+
+            return down, entry.get("latency", 0)
+
+        return sorted(nodes, key=score)
+
+    def probe(self, node):
+
+        """Method:  probe
+
+        Description:  Open a TCP connection to the node with the short
+            host_timeout, so a down node is found without waiting out a full
+            RabbitMQ connection attempt.
+
+        Arguments:
+            (input) node -> host_list entry
+            (output) latency -> Connect time in seconds, None if it failed
+
+        """
+
+        host_cfg = HostCfg(self.cfg, node)
+        start = time.monotonic()
+
+        try:
+            socket.create_connection(
+                (host_cfg.host, host_cfg.port), timeout=self.timeout).close()
+
+        except OSError as err:
+            self.log.log_warn(
+                f"[{os.getpid()}] HostScores: {node} unreachable: {err}")
+            return None
+
+        return time.monotonic() - start
+
+
+def select_host(cfg, log, qname, rkey, **kwargs):
+
+    """Function:  select_host
+
+    Description:  Connect to the healthiest host_list node, falling back to
+        the other nodes in score order.  Each node is probed with a short
+        timeout before the RabbitMQ connection is made and the result is
+        recorded in the node scores.
+
+    Arguments:
+        (input) cfg -> Configuration settings module for the program
+        (input) log -> Log class instance
+        (input) qname -> Queue name for RabbitMQ
+        (input) rkey -> Rkey value for RabbitMQ
+        (input) kwargs:
+            topology -> Set of (queue name, routing key) already declared
+        (output) rmq -> RabbitMQ class instance
+        (output) connect_status -> True|False - Connection was made
+        (output) err_msg -> Error message from the connection attempt
+
+    """
+
+    scores = HostScores(cfg, log)
+    rmq, connect_status, err_msg = None, False, "No RabbitMQ node reachable"
+
+    for node in scores.order(cfg.host_list):
+        latency = scores.probe(node)
+
+        if latency is not None:
+            rmq, connect_status, err_msg = open_rmq(
+                HostCfg(cfg, node), log, qname, rkey, **kwargs)
+
+        if connect_status:
+            scores.update(node, latency)
+            break
+
+        scores.update(node)
+
+    if rmq is None:
+        rmq = create_rmqpub(cfg, qname, rkey)
+
+    return rmq, connect_status, err_msg
+
+
+class MemoryChannel():
+
+    """Class:  MemoryChannel
+
+    Description:  In-memory connection and channel of the MemoryRmq class.
+        Records each publish with its properties and, in confirm mode, acks
+        or nacks the publishes when events are processed.
+
+    Methods:
+        __init__
+        open
+        confirm_delivery
+        basic_publish
+        process_data_events
+        close
+
+    """
+
+    def __init__(self, rmq, cfg):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the MemoryChannel class.
+
+        Arguments:
+            (input) rmq -> MemoryRmq class instance
+            (input) cfg -> Configuration settings module for the program
+
+        """
+
+        self.rmq = rmq
+        self.is_open = True
+        self.is_closed = False
+        self.latency = getattr(cfg, "memory_latency", 0)
+        self.fail_rate = getattr(cfg, "memory_fail", 0)
+        self.keep = getattr(cfg, "memory_keep", 1000)
+        self.callback = None
+        self.tag = 0
+        self.acks = []
+        self._impl = self
+
+    def open(self):
+
+        """Method:  open
+
+        Description:  Open the channel, which is not in confirm mode.
+
+        Arguments:
+
+        """
+
+        self.is_open = True
+        self.is_closed = False
+        self.callback = None
+        self.acks = []
+
+    def confirm_delivery(self, ack_nack_callback=None):
+
+        """Method:  confirm_delivery
+
+        Description:  Put the channel into confirm mode.
+
+        Arguments:
+            (input) ack_nack_callback -> Called with each ack or nack frame
+
+        """
+
+        self.callback = ack_nack_callback
+        self.tag = 0
+
+    def basic_publish(self, exchange, routing_key, body, properties=None):
+
+        """Method:  basic_publish
+
+        Description:  Record a published message.  A failed publish raises
+            an AMQP error, or is nacked in confirm mode.
+
+        Arguments:
+            (input) exchange -> Exchange name
+            (input) routing_key -> Routing key
+            (input) body -> Message body
+            (input) properties -> pika.BasicProperties instance
+
+        """
+
+        if not self.is_open:
+            raise pika.exceptions.ChannelWrongStateError("Channel is closed")
+
+        if self.latency:
+            time.sleep(self.latency)
+
+        failed = self.fail_rate and random.random() < self.fail_rate
+
+        if failed and not self.callback:
+            raise pika.exceptions.UnroutableError([])
+
+        if self.callback:
+            self.tag += 1
+            self.acks.append((self.tag, failed))
+
+        if not failed:
+            props = {key: val for key, val in vars(properties).items()
+                     if val is not None} if properties else {}
+            MEMORY_PUBLISHED.append(
+                MemoryMsg(exchange, self.rmq.queue_name, routing_key, body,
+                          props))
+            MEMORY_STATS["messages"] += 1
+            MEMORY_STATS["bytes"] += len(body)
+
+            while len(MEMORY_PUBLISHED) > self.keep:
+                MEMORY_PUBLISHED.popleft()
+
+    def process_data_events(self, time_limit=0):  # pylint:disable=W0613
+
+        """Method:  process_data_events
+
+        Description:  Deliver the acks and nacks of the publishes in confirm
+            mode.
+
+        Arguments:
+            (input) time_limit -> Not used, the events are always ready
+
+        """
+
+        acks, self.acks = self.acks, []
+
+        for tag, failed in acks:
+            method = pika.spec.Basic.Nack(delivery_tag=tag) if failed \
+                else pika.spec.Basic.Ack(delivery_tag=tag)
+            self.callback(pika.frame.Method(1, method))
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Close the channel.
+
+        Arguments:
+
+        """
+
+        self.is_open = False
+        self.is_closed = True
+
+
+class MemoryRmq():
+
+    """Class:  MemoryRmq
+
+    Description:  In-memory RabbitMQ publisher for the rmq_backend = "memory"
+        setting.  Keeps the rabbitmq_class.RabbitMQPub contract without a
+        broker, so the program can be tested and benchmarked offline.  Each
+        published message is recorded in MEMORY_PUBLISHED with its queue and
+        properties.  The memory_latency, memory_fail and memory_connect_fail
+        settings simulate a slow or failing broker.
+
+    Methods:
+        __init__
+        connect
+        open_channel
+        create_connection
+        create_queue
+        bind_queue
+        publish_msg
+        close
+
+    """
+
+    def __init__(self, cfg, qname, rkey):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the MemoryRmq class.
+
+        Arguments:
+            (input) cfg -> Configuration settings module for the program
+            (input) qname -> Queue name
+            (input) rkey -> Routing key
+
+        """
+
+        self.cfg = cfg
+        self.host = cfg.host
+        self.exchange = cfg.exchange_name
+        self.queue_name = qname
+        self.routing_key = rkey
+        self.connection = None
+        self.channel = None
+        self.queues = set()
+
+    def connect(self):
+
+        """Method:  connect
+
+        Description:  Open the in-memory connection.
+
+        Arguments:
+            (output) True|False - Connection was made
+            (output) err_msg -> Error message from the connection attempt
+
+        """
+
+        if getattr(self.cfg, "memory_connect_fail", False):
+            return False, "Memory backend: Connection refused"
+
+        self.connection = MemoryChannel(self, self.cfg)
+
+        return True, None
+
+    def open_channel(self):
+
+        """Method:  open_channel
+
+        Description:  Open the in-memory channel on the connection.
+
+        Arguments:
+
+        """
+
+        self.channel = self.connection
+        self.channel.open()
+
+    def create_connection(self):
+
+        """Method:  create_connection
+
+        Description:  Connect, open the channel and declare the queue.
+
+        Arguments:
+            (output) True|False - Connection was made
+            (output) err_msg -> Error message from the connection attempt
+
+        """
+
+        connect_status, err_msg = self.connect()
+
+        if connect_status:
+            self.open_channel()
+            self.create_queue()
+            self.bind_queue()
+
+        return connect_status, err_msg
+
+    def create_queue(self):
+
+        """Method:  create_queue
+
+        Description:  Declare the queue.
+
+        Arguments:
+
+        """
+
+        self.queues.add(self.queue_name)
+
+    def bind_queue(self):
+
+        """Method:  bind_queue
+
+        Description:  Bind the queue to the exchange, nothing to do in
+            memory.
+
+        Arguments:
+
+        """
+
+    def publish_msg(self, body):
+
+        """Method:  publish_msg
+
+        Description:  Publish a persistent message.
+
+        Arguments:
+            (input) body -> Message body
+            (output) True|False - Message was published
+
+        """
+
+        try:
+            self.channel.basic_publish(
+                exchange=self.exchange, routing_key=self.routing_key,
+                body=body, properties=pika.BasicProperties(delivery_mode=2))
+
+        except pika.exceptions.AMQPError:
+            return False
+
+        return True
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Close the channel and connection.
+
+        Arguments:
+
+        """
+
+        if self.connection:
+            self.connection.close()
+
+
+# Publisher backends for the rmq_backend setting:  name -> function or class
+#   which takes the cfg, queue name and routing key.
+BACKENDS = {"pika": None, "memory": MemoryRmq}
+
+
+def register_backend(name, func):
+
+    """Function:  register_backend
+
+    Description:  Add a publisher backend which can be used in the
+        rmq_backend setting.
+
+    Arguments:
+        (input) name -> Backend name
+        (input) func -> Function or class which takes the cfg, queue name and
+            routing key and returns a RabbitMQ publisher instance
+
+    """
+
+    BACKENDS[name] = func
+
+
+def create_rmqpub(cfg, qname, rkey):
+
+    """Function:  create_rmqpub
+
+    Description:  Create a RabbitMQ publisher instance from the publisher
+        backend in the rmq_backend setting.  The default "pika" backend is
+        the rabbitmq_class publisher.
+
+    Arguments:
+        (input) cfg -> Configuration settings module for the program
+        (input) qname -> Queue name for RabbitMQ
+        (input) rkey -> Rkey value for RabbitMQ
+        (output) rmq -> RabbitMQ class instance
+
+    """
+
+    backend = BACKENDS.get(getattr(cfg, "rmq_backend", "pika"))
+
+    if backend is None:
+        return rabbitmq_class.create_rmqpub(cfg, qname, rkey)
+
+    return backend(cfg, qname, rkey)
+
+
+def open_rmq(cfg, log, qname, rkey, **kwargs):
+
+    """Function:  open_rmq
+
+    Description:  Create a RabbitMQ publisher instance and connect it to
+        RabbitMQ.  The exchange and queue are not declared if they are in
+        the declared topology.  With the host_scoring setting the host_list
+        nodes are tried healthiest first.
+
+    Arguments:
+        (input) cfg -> Configuration settings module for the program
+        (input) log -> Log class instance
+        (input) qname -> Queue name for RabbitMQ
+        (input) rkey -> Rkey value for RabbitMQ
+        (input) kwargs:
+            topology -> Set of (queue name, routing key) already declared
+        (output) rmq -> RabbitMQ class instance
+        (output) connect_status -> True|False - Connection was made
+        (output) err_msg -> Error message from the connection attempt
+
+    """
+
+    if getattr(cfg, "host_scoring", False) \
+       and getattr(cfg, "rmq_backend", "pika") == "pika" \
+       and len(getattr(cfg, "host_list", None) or []) > 1:
+        return select_host(cfg, log, qname, rkey, **kwargs)
+
+    rmq = create_rmqpub(cfg, qname, rkey)
+    log.log_info(
+        f"[{os.getpid()}] open_rmq: Connection info:"
+        f" {cfg.host}->{cfg.exchange_name}")
+
+    if (qname, rkey) not in kwargs.get("topology", set()):
+        connect_status, err_msg = rmq.create_connection()
+
+    else:
+        connect_status, err_msg = rmq.connect()
+
+        if connect_status and rmq.connection.is_open:
+            rmq.open_channel()
+
+    return rmq, connect_status, err_msg
+
+
+class PubConfirm():
+
+    """Class:  PubConfirm
+
+    Description:  Publisher confirms for a RabbitMQ channel.  Publishes do not
+        wait on the broker, up to confirm_window messages can be unconfirmed
+        at once.  Broker acks and nacks are matched to the messages by
+        delivery tag and only nacked or timed out messages are archived.  The
+        ack and nack callback is registered on the pika.channel.Channel under
+        the BlockingChannel, as BlockingChannel.confirm_delivery only offers
+        a confirm wait on each publish.
+
+    Methods:
+        __init__
+        select
+        publish
+        on_confirm
+        archive
+        expire
+        flush
+        release
+
+    """
+
+    def __init__(self, rmq, cfg, log):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the PubConfirm class.
+
+        Arguments:
+            (input) rmq -> RabbitMQ class instance
+            (input) cfg -> Configuration settings module for the program
+            (input) log -> Log class instance
+
+        """
+
+        self.rmq = rmq
+        self.cfg = cfg
+        self.log = log
+        self.window = getattr(cfg, "confirm_window", 100)
+        self.timeout = getattr(cfg, "confirm_timeout", 30)
+        self.pending = collections.OrderedDict()
+        self.channel = None
+        self.tag = 0
+        self.select()
+
+    def select(self):
+
+        """Method:  select
+
+        Description:  Put the current channel into confirm mode.  Delivery
+            tags restart at one on each channel.
+
+        Arguments:
+
+        """
+
+        self.channel = self.rmq.channel
+        self.tag = 0
+        self.channel._impl.confirm_delivery(      # pylint:disable=W0212
+            ack_nack_callback=self.on_confirm)
+
+    def publish(self, body, msg, done=None, **props):
+
+        """Method:  publish
+
+        Description:  Publish a message and track it until it is confirmed.
+            Waits on the outstanding confirms once the window is full.
+
+        Arguments:
+            (input) body -> Message body to publish
+            (input) msg -> Email message instance, archived if not confirmed
+            (input) done -> Called with True|False once the message is
+                confirmed or not, in place of archiving the message
+            (input) props -> Message properties
+            (output) True|False - Message was sent to RabbitMQ
+
+        """
+
+        if self.rmq.channel is not self.channel:
+            self.log.log_warn(
+                f"[{os.getpid()}] PubConfirm: Channel was re-opened")
+
+            for tag in list(self.pending):
+                self.archive(self.pending.pop(tag), "channel closed")
+
+            self.select()
+
+        if not publish_body(self.rmq, body, **props):
+            return False
+
+        self.tag += 1
+        self.pending[self.tag] = (
+            ArchiveInfo(self.rmq.exchange, self.rmq.queue_name,
+                        self.rmq.routing_key), msg, time.monotonic(), body,
+            props, done)
+
+        if len(self.pending) >= self.window:
+            self.flush()
+
+        return True
+
+    def on_confirm(self, frame):
+
+        """Method:  on_confirm
+
+        Description:  Callback for a broker Basic.Ack or Basic.Nack.  Nacked
+            messages are archived.
+
+        Arguments:
+            (input) frame -> pika.frame.Method instance
+
+        """
+
+        method = frame.method
+        nacked = isinstance(method, pika.spec.Basic.Nack)
+        tags = [tag for tag in self.pending if tag <= method.delivery_tag] \
+            if method.multiple else [method.delivery_tag]
+
+        for tag in tags:
+            item = self.pending.pop(tag, None)
+
+            if item and nacked:
+                self.archive(item, "nacked by broker")
+
+            elif item and item[5]:
+                item[5](True)
+
+    def archive(self, item, reason):
+
+        """Method:  archive
+
+        Description:  Archive a message that was not confirmed, or pass it
+            back to its done callback.
+
+        Arguments:
+            (input) item -> Pending entry:
+                (ArchiveInfo, msg, publish time, body, props, done)
+            (input) reason -> Reason the message was not confirmed
+
+        """
+
+        self.log.log_err(
+            f"[{os.getpid()}] PubConfirm: Message {reason}:"
+            f" {item[0].exchange}->{item[0].queue_name}")
+
+        if item[5]:
+            item[5](False)
+
+        else:
+            save_failed(
+                item[0], self.log, self.cfg, item[1], body=item[3],
+                props=item[4])
+
+    def expire(self):
+
+        """Method:  expire
+
+        Description:  Archive messages unconfirmed for longer than the
+            confirm timeout, without waiting on the broker.
+
+        Arguments:
+
+        """
+
+        limit = time.monotonic() - self.timeout
+
+        for tag in [tag for tag, item in self.pending.items()
+                    if item[2] < limit]:
+            self.archive(self.pending.pop(tag), "confirm timed out")
+
+    def flush(self):
+
+        """Method:  flush
+
+        Description:  Wait on the broker until all messages are confirmed or
+            the confirm timeout is reached.  Messages still unconfirmed are
+            archived.
+
+        Arguments:
+
+        """
+
+        deadline = time.monotonic() + self.timeout
+
+        try:
+            while self.pending and self.channel.is_open \
+                    and time.monotonic() < deadline:
+                self.rmq.connection.process_data_events(
+                    time_limit=min(0.05, max(deadline - time.monotonic(), 0)))
+
+        except pika.exceptions.AMQPError as err:
+            self.log.log_warn(f"[{os.getpid()}] PubConfirm: Flush: {err}")
+
+        for tag in list(self.pending):
+            self.archive(self.pending.pop(tag), "confirm timed out")
+
+    def release(self):
+
+        """Method:  release
+
+        Description:  Wait on the outstanding confirms and take the
+            connection out of confirm mode.  A channel can not leave confirm
+            mode, so it is replaced by a new channel.
+
+        Arguments:
+
+        """
+
+        self.flush()
+        self.rmq.pub_confirm = None
+
+        try:
+            reopen = self.rmq.connection.is_open
+
+            if self.channel.is_open:
+                self.channel.close()
+
+            if reopen:
+                self.rmq.open_channel()
+
+        except pika.exceptions.AMQPError as err:
+            self.log.log_warn(f"[{os.getpid()}] PubConfirm: Release: {err}")
+
+
+def get_confirm(rmq, cfg, log):
+
+    """Function:  get_confirm
+
+    Description:  Return the PubConfirm instance of the RabbitMQ connection,
+        putting the channel into confirm mode on first use.  The instance is
+        kept with the connection, so pooled connections keep their unconfirmed
+        messages between emails.
+
+    Arguments:
+        (input) rmq -> RabbitMQ class instance
+        (input) cfg -> Configuration settings module for the program
+        (input) log -> Log class instance
+        (output) PubConfirm class instance
+
+    """
+
+    if getattr(rmq, "pub_confirm", None) is None:
+        rmq.pub_confirm = PubConfirm(rmq, cfg, log)
+
+    return rmq.pub_confirm
+
+
+class RmqPool():
+
+    """Class:  RmqPool
+
+    Description:  Pool of RabbitMQ publisher connections kept for the life of
+        a program run.  Connections are keyed on host and exchange and are
+        shared by every queue, each connection keeps the set of queues
+        declared on it.  The queue and routing key are only arguments to a
+        publish on the exchange, so one channel serves every queue and a
+        fan-out or multi-queue email goes over a single connection instead
+        of one connection per queue.  Connections are checked for health
+        before each reuse and closed once they have been idle longer than the
+        pool_idle setting.  With the topology_cache setting the topology
+        pre-flight is run once and the queues in the topology are not
+        declared again.
+
+    Methods:
+        __init__
+        acquire
+        is_healthy
+        evict
+        sweep
+        close
+
+    """
+
+    def __init__(self, cfg, log):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the RmqPool class.
+
+        Arguments:
+            (input) cfg -> Configuration settings module for the program
+            (input) log -> Log class instance
+
+        """
+
+        self.cfg = cfg
+        self.log = log
+        self.idle = getattr(cfg, "pool_idle", 300)
+        self.host = ",".join(getattr(cfg, "host_list", None) or [cfg.host])
+        self.conns = {}
+        self.topology = declare_topology(cfg, log) \
+            if getattr(cfg, "topology_cache", False) else set()
+
+    def acquire(self, qname, rkey):
+
+        """Method:  acquire
+
+        Description:  Return a healthy pooled connection set to the queue, or
+            open and pool a new connection.  The queue is declared when the
+            new connection is opened.  A reused connection is not declared
+            here, see the declared_queues set of the connection.
+
+        Arguments:
+            (input) qname -> Queue name for RabbitMQ
+            (input) rkey -> Rkey value for RabbitMQ
+            (output) rmq -> RabbitMQ class instance
+            (output) connect_status -> True|False - Connection was made
+            (output) err_msg -> Error message from the connection attempt
+
+        """
+
+        self.sweep()
+
+        # Not keyed on the queue, the channel is shared by every queue.
+        key = (self.host, self.cfg.exchange_name)
+
+        if key in self.conns and self.is_healthy(self.conns[key][0]):
+            self.conns[key][1] = time.monotonic()
+            rmq = self.conns[key][0]
+            rmq.queue_name = qname
+            rmq.routing_key = rkey
+
+            return rmq, True, None
+
+        if key in self.conns:
+            self.log.log_warn(
+                f"[{os.getpid()}] RmqPool: Unhealthy connection: {key}")
+            self.evict(key)
+
+        # Only a new connection is timed, reuse is not a connect.
+        with get_timer().stage("connect"):
+            rmq, connect_status, err_msg = open_rmq(
+                self.cfg, self.log, qname, rkey, topology=self.topology)
+
+        if connect_status and rmq.channel.is_open:
+            rmq.declared_queues = self.topology | {(qname, rkey)}
+            self.conns[key] = [rmq, time.monotonic()]
+
+        elif connect_status:
+            rmq.close()
+
+        return rmq, connect_status, err_msg
+
+    def is_healthy(self, rmq):
+
+        """Method:  is_healthy
+
+        Description:  Check the connection and channel are still open.  Any
+            pending events are processed which services heartbeats and
+            detects connections closed by the broker.
+
+        Arguments:
+            (input) rmq -> RabbitMQ class instance
+            (output) True|False - Connection is usable
+
+        """
+
+        try:
+            if rmq.connection.is_open and rmq.channel.is_open:
+                rmq.connection.process_data_events(time_limit=0)
+
+                return rmq.connection.is_open and rmq.channel.is_open
+
+        except pika.exceptions.AMQPError as err:
+            self.log.log_warn(
+                f"[{os.getpid()}] RmqPool: Health check failed: {err}")
+
+        return False
+
+    def evict(self, key):
+
+        """Method:  evict
+
+        Description:  Remove a connection from the pool and close it, once
+            any unconfirmed messages have been confirmed or archived.
+
+        Arguments:
+            (input) key -> Pool key of the connection
+
+        """
+
+        rmq = self.conns.pop(key)[0]
+
+        if getattr(rmq, "pub_confirm", None):
+            rmq.pub_confirm.flush()
+
+        try:
+            rmq.close()
+
+        except pika.exceptions.AMQPError as err:
+            self.log.log_warn(
+                f"[{os.getpid()}] RmqPool: Close failed: {key}: {err}")
+
+    def sweep(self):
+
+        """Method:  sweep
+
+        Description:  Close connections which have been idle for longer than
+            the idle timeout or are no longer healthy.  The health check
+            keeps the heartbeats of the remaining connections serviced and
+            receives any publisher confirms, unconfirmed messages past the
+            confirm timeout are archived.
+
+        Arguments:
+
+        """
+
+        now = time.monotonic()
+
+        for key in [key for key, (_, last) in self.conns.items()
+                    if now - last > self.idle]:
+            self.log.log_info(
+                f"[{os.getpid()}] RmqPool: Evicting idle connection: {key}")
+            self.evict(key)
+
+        for key in [key for key, (rmq, _) in self.conns.items()
+                    if not self.is_healthy(rmq)]:
+            self.log.log_warn(
+                f"[{os.getpid()}] RmqPool: Evicting unhealthy connection:"
+                f" {key}")
+            self.evict(key)
+
+        for rmq, _ in self.conns.values():
+            if getattr(rmq, "pub_confirm", None):
+                rmq.pub_confirm.expire()
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Close all of the pooled connections.
+
+        Arguments:
+
+        """
+
+        for key in list(self.conns):
+            self.evict(key)
+
+
+class RmqSession():
+
+    """Class:  RmqSession
+
+    Description:  Publisher session for a single email message.  A RabbitMQ
+        connection is opened, or taken from the connection pool, on the first
+        request for a queue and is then shared by every publish made while
+        processing the email.  Queues are declared and bound the first time
+        they are used on the connection.  Pooled connections are left open
+        when the session is closed.  With the pub_confirm setting, publishes
+        are tracked by the connection's PubConfirm.
+
+    Methods:
+        __init__
+        get_rmq
+        is_open
+        close
+
+    """
+
+    def __init__(self, cfg, log, **kwargs):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the RmqSession class.
+
+        Arguments:
+            (input) cfg -> Configuration settings module for the program
+            (input) log -> Log class instance
+            (input) kwargs:
+                pool -> RmqPool class instance
+
+        """
+
+        self.cfg = cfg
+        self.log = log
+        self.pool = kwargs.get("pool")
+        self.rmq = None
+        self.connect_status = False
+        self.err_msg = None
+        self.confirm = None
+        self.queues = set()
+
+    def get_rmq(self, qname, rkey):
+
+        """Method:  get_rmq
+
+        Description:  Return the RabbitMQ publisher set to the queue and
+            routing key, connecting to RabbitMQ on the first call.
+
+        Arguments:
+            (input) qname -> Queue name for RabbitMQ
+            (input) rkey -> Rkey value for RabbitMQ
+            (output) self.rmq -> RabbitMQ class instance
+
+        """
+
+        if self.rmq is None:
+
+            # The pool times the connect, only when it opens a connection.
+            if self.pool:
+                self.rmq, self.connect_status, self.err_msg = \
+                    self.pool.acquire(qname, rkey)
+
+            else:
+                with get_timer().stage("connect"):
+                    self.rmq, self.connect_status, self.err_msg = open_rmq(
+                        self.cfg, self.log, qname, rkey)
+
+            self.queues.add((qname, rkey))
+
+        self.rmq.queue_name = qname
+        self.rmq.routing_key = rkey
+
+        # Pooled connections keep the queues declared on them across
+        #   sessions.
+        declared = getattr(self.rmq, "declared_queues", self.queues)
+
+        if self.is_open() and (qname, rkey) not in declared:
+            self.rmq.create_queue()
+            self.rmq.bind_queue()
+            declared.add((qname, rkey))
+
+        if self.is_open() and getattr(self.cfg, "pub_confirm", False):
+            self.confirm = get_confirm(self.rmq, self.cfg, self.log)
+
+        return self.rmq
+
+    def is_open(self):
+
+        """Method:  is_open
+
+        Description:  Check to see if the session has an open channel.
+
+        Arguments:
+            (output) True|False - Connection and channel are open
+
+        """
+
+        return bool(self.rmq and self.connect_status
+                    and self.rmq.channel.is_open)
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Close the RabbitMQ connection if one was opened, once
+            any unconfirmed messages have been confirmed or archived.  Pooled
+            connections are left open for reuse, their unconfirmed messages
+            are confirmed by the connection pool.
+
+        Arguments:
+
+        """
+
+        if self.rmq and self.connect_status and not self.pool:
+            if self.confirm:
+                with get_timer().stage("confirm"):
+                    self.confirm.flush()
+
+            self.rmq.close()
+
+        self.rmq = None
+        self.connect_status = False
+        self.confirm = None
+        self.queues = set()
+
+
+def connect_rmq(cfg, log, qname, rkey, msg, **kwargs):
+
+    """Function:  connect_rmq
+
+    Description:  Set up and connect to RabbitMQ, check for connection
+        problems.
+
+    Arguments:
+        (input) cfg -> Configuration settings module for the program
+        (input) log -> Log class instance
+        (input) qname -> Queue name for RabbitMQ
+        (input) rkey -> Rkey value for RabbitMQ
+        (input) msg -> Message body
+        (input) kwargs:
+            attach -> Attachment class instance
+            session -> RmqSession class instance
+
+    """
+
+    config = {"attach": kwargs.get("attach")} if kwargs.get("attach") \
+        else {}
+    session = kwargs.get("session") or RmqSession(cfg, log)
+    rmq = session.get_rmq(qname, rkey)
+
+    if session.is_open():
+        log.log_info(
+            f"[{os.getpid()}] connect_rmq: Connected to RabbitMQ mode")
+        connect_process(
+            rmq, log, cfg, msg, confirm=session.confirm, **config)
+
+    else:
+        log.log_err(
+            f"[{os.getpid()}] connect_rmq: Failed to connect to RabbitMQ")
+        log.log_err(
+            f"[{os.getpid()}] connect_rmq: Message:  {session.err_msg}")
+        save_failed(rmq, log, cfg, msg, **config)
+
+    if not kwargs.get("session"):
+        session.close()
+
+
+def fanout_rmq(cfg, log, qnames, msg, **kwargs):
+
+    """Function:  fanout_rmq
+
+    Description:  Publish an email to several queues.  The message body is
+        built from the email once and published to each queue over the one
+        session channel, with publisher confirms.  A publish which fails or
+        is not confirmed is saved for its own queue, the other queues are
+        not affected.  Without the pub_confirm setting the confirms only
+        last for the call.
+
+    Arguments:
+        (input) cfg -> Configuration settings module for the program
+        (input) log -> Log class instance
+        (input) qnames -> List of queue names
+        (input) msg -> Email message instance
+        (input) kwargs:
+            session -> RmqSession class instance
+
+    """
+
+    session = kwargs.get("session") or RmqSession(cfg, log)
+    body = None
+    own = None
+
+    for qname in qnames:
+        log.log_info(f"[{os.getpid()}] fanout_rmq: Publishing to: {qname}")
+        rmq = session.get_rmq(qname, qname)
+
+        # Confirms taken for this call only are released once it is done,
+        #   so later publishes on the channel are not in confirm mode.
+        if session.is_open() and not session.confirm:
+            session.confirm = own = get_confirm(rmq, cfg, log)
+
+        if not session.is_open():
+            log.log_err(
+                f"[{os.getpid()}] fanout_rmq: Failed to connect to RabbitMQ")
+            log.log_err(
+                f"[{os.getpid()}] fanout_rmq: Message:  {session.err_msg}")
+            save_failed(rmq, log, cfg, msg)
+            continue
+
+        if body is None:
+            body = build_body(rmq, log, cfg, msg)
+
+        connect_process(
+            rmq, log, cfg, msg, body=body, confirm=session.confirm)
+
+    if own:
+        with get_timer().stage("confirm"):
+            own.release()
+
+        session.confirm = None
+
+    if not kwargs.get("session"):
+        session.close()
+
+
+class WalReplayer():
+
+    """Class:  WalReplayer
+
+    Description:  Replays the write-ahead spool (wal_dir entry) once RabbitMQ
+        is reachable again.  Records are published in the order they were
+        written, each to the exchange it was written for, and replay stops at
+        the first record which can not be published, so the order is kept
+        for the next pass.  Only one process replays the spool at a time.
+
+    Methods:
+        __init__
+        replay
+        confirmed
+        run_once
+        run
+        start
+        stop
+
+    """
+
+    def __init__(self, cfg, log):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the WalReplayer class.
+
+        Arguments:
+            (input) cfg -> Configuration settings module for the program
+            (input) log -> Log class instance
+
+        """
+
+        self.cfg = cfg
+        self.log = log
+        self.interval = getattr(cfg, "wal_interval", 30)
+        self.event = threading.Event()
+        self.thread = None
+        self.count = 0
+
+    def replay(self):
+
+        """Method:  replay
+
+        Description:  Publish the records in the write-ahead spool and remove
+            each record once it is published, with publisher confirms only
+            once the broker has acked it.  A nacked or timed out record is
+            kept for the next pass.  Records which can not be read are moved
+            to the wal failed directory.
+
+        Arguments:
+            (output) self.count -> Number of records replayed
+
+        """
+
+        new_dir = os.path.join(self.cfg.wal_dir, "new")
+        fnames = sorted(os.listdir(new_dir))
+        self.count = 0
+
+        if not fnames:
+            return self.count
+
+        with open(os.path.join(self.cfg.wal_dir, ".lock"), mode="a",
+                  encoding="UTF-8") as lock_file:
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+            except OSError:
+                return self.count
+
+            sessions = {}
+
+            try:
+                for cnt, fname in enumerate(fnames):
+                    f_name = os.path.join(new_dir, fname)
+
+                    try:
+                        with open(f_name, mode="r",
+                                  encoding="UTF-8") as f_hldr:
+                            record = json.load(f_hldr)
+
+                        body = base64.b64decode(record["body"])
+
+                    except FileNotFoundError:
+                        continue
+
+                    except (OSError, ValueError, KeyError, TypeError) as err:
+                        self.log.log_err(
+                            f"[{os.getpid()}] WalReplayer: Bad record:"
+                            f" {fname}: {err}")
+                        os.rename(f_name, os.path.join(
+                            self.cfg.wal_dir, "failed", fname))
+                        continue
+
+                    exchange = record.get("exchange") \
+                        or self.cfg.exchange_name
+
+                    if exchange not in sessions:
+                        sessions[exchange] = RmqSession(
+                            self.cfg if exchange == self.cfg.exchange_name
+                            else ExchangeCfg(self.cfg, exchange), self.log)
+
+                    session = sessions[exchange]
+                    rmq = session.get_rmq(record["queue"], record["rkey"])
+                    props = record.get("props") or {}
+
+                    if not session.is_open() or not (
+                            session.confirm.publish(
+                                body, None, done=functools.partial(
+                                    self.confirmed, f_name), **props)
+                            if session.confirm
+                            else publish_body(rmq, body, **props)):
+                        self.log.log_warn(
+                            f"[{os.getpid()}] WalReplayer: RabbitMQ not"
+                            f" available, {len(fnames) - cnt} records left")
+                        break
+
+                    if not session.confirm:
+                        self.confirmed(f_name, True)
+
+            finally:
+                # Closing the sessions waits on the outstanding confirms.
+                for session in sessions.values():
+                    session.close()
+
+        self.log.log_info(
+            f"[{os.getpid()}] WalReplayer: Replayed {self.count}")
+
+        return self.count
+
+    def confirmed(self, f_name, status):
+
+        """Method:  confirmed
+
+        Description:  Remove a record once it is published or acked by the
+            broker.  A nacked or timed out record is kept for the next pass.
+
+        Arguments:
+            (input) f_name -> Name of record file
+            (input) status -> True|False - Record was confirmed
+
+        """
+
+        if status:
+            os.remove(f_name)
+            self.count += 1
+
+    def run_once(self):
+
+        """Method:  run_once
+
+        Description:  Replay the write-ahead spool once, logging any error.
+
+        Arguments:
+            (output) Number of records left in the spool
+
+        """
+
+        try:
+            self.replay()
+
+            return len(os.listdir(os.path.join(self.cfg.wal_dir, "new")))
+
+        except Exception as err:                    # pylint:disable=W0718
+            self.log.log_err(f"[{os.getpid()}] WalReplayer: {err}")
+
+            return 0
+
+    def run(self):
+
+        """Method:  run
+
+        Description:  Replay the write-ahead spool every wal_interval seconds
+            until stopped.
+
+        Arguments:
+
+        """
+
+        while True:
+            self.run_once()
+
+            if self.event.wait(self.interval):
+                break
+
+    def start(self):
+
+        """Method:  start
+
+        Description:  Start replaying the write-ahead spool in a background
+            thread.
+
+        Arguments:
+
+        """
+
+        self.thread = threading.Thread(
+            target=self.run, name="WalReplayer", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+
+        """Method:  stop
+
+        Description:  Stop the background thread, waiting on a replay pass
+            that is in progress.
+
+        Arguments:
+
+        """
+
+        self.event.set()
+
+        if self.thread:
+            self.thread.join()
+            self.thread = None
+
+
+def pub_to_rmq(cfg, log, qname, rkey, msg, **kwargs):
+
+    """Function:  pub_to_rmq
+
+    Description:  Consolidate arguments for the call to RMQ and clean up the
+        attachment.
+
+    Arguments:
+        (input) cfg -> Configuration settings module for the program
+        (input) log -> Log class instance
+        (input) qname -> Queue name for RabbitMQ
+        (input) rkey -> Rkey value for RabbitMQ
+        (input) msg -> Email message body
+        (input) kwargs:
+            attach -> Attachment class instance
+            session -> RmqSession class instance
+
+    """
+
+    attach = kwargs.get("attach")
+    log.log_info(f"[{os.getpid()}] pub_to_rmq: Publishing: {attach.name}")
+    connect_rmq(
+        cfg, log, qname, rkey, msg, attach=attach,
+        session=kwargs.get("session"))
+    err_flag, err_msg = attach.remove()
+
+    if err_flag:
+        log.log_warn(f"[{os.getpid()}] pub_to_rmq: Message: {err_msg}")
+
+
+def process_file(cfg, log, subj, msg, **kwargs):
+
+    """Function:  process_file
+
+    Description:  Process email with a file attachment or process as an invalid
+        message.
+
+    Arguments:
+        (input) cfg -> Configuration settings module for the program
+        (input) log -> Log class instance
+        (input) subj -> Email subject line
+        (input) msg -> Email message body
+        (input) kwargs:
+            session -> RmqSession class instance
+
+    """
+
+    session = kwargs.get("session")
+    attach_list = process_attach(msg, log, cfg)
+
+    if attach_list and subj in get_routes(cfg).file_queues:
+        get_timer().set_route(f"file:{subj}")
+
+        for attach in attach_list:
+            log.log_info(
+                f"[{os.getpid()}] Valid subject with file attachment:"
+                f" {attach.name}")
+            pub_to_rmq(
+                cfg, log, subj, subj, msg, attach=attach, session=session)
+
+    elif attach_list:
+        get_timer().set_route("err_file_queue")
+
+        for attach in attach_list:
+            log.log_info(
+                f"[{os.getpid()}] Invalid subject with file attached:"
+                f" {attach.name}")
+            pub_to_rmq(
+                cfg, log, cfg.err_file_queue, cfg.err_file_queue, msg,
+                attach=attach, session=session)
+
+    else:
+        log.log_warn(f"[{os.getpid()}] Invalid email subject: {subj}")
+        get_timer().set_route("err_queue")
+        connect_rmq(
+            cfg, log, cfg.err_queue, cfg.err_queue, msg, session=session)
+
+
+def archive_email_debug(rmq, log, cfg, msg):
+
+    """Function:  archive_email_debug
+
+    Description:  Save an email to file in an archive directory.
+
+    Arguments:
+        (input) rmq -> RabbitMQ class instance
+        (input) log -> Log class instance
+        (input) cfg -> Configuration settings module for the program
+        (input) msg -> Email message instance
+
+    """
+
+    log.log_debug(f"[{os.getpid()}] Start of archive_email_debug")
+    e_file = rmq.exchange + "-" + rmq.queue_name + "-" \
+        + datetime.datetime.strftime(
+            datetime.datetime.now(), "%Y%m%d-%H%M%S") \
+        + f".{os.getpid()}.{next(ARCHIVE_SEQ)}.email.txt"
+    log.log_debug(f"[{os.getpid()}] e_file: {e_file}")
+    f_file = os.path.join(cfg.email_dir, e_file)
+    log.log_debug(f"[{os.getpid()}] f_file: {f_file}")
+    log.log_info(f"[{os.getpid()}] Saving email to: {f_file}")
+    write_email(f_file, msg)
+    log.log_info(f"[{os.getpid()}] Email saved to: {e_file}")
+    log.log_debug(f"[{os.getpid()}] End of archive_email_debug")
+
+
+def get_text_debug(msg, log):
+
+    """Function:  get_text_debug
+
+    Description:  Returns the text of the email.
+
+    Arguments:
+        (input) msg -> Email message instance
+        (input) log -> Log class instance
+        (output) All texts in email joined together in a single string
+
+    """
+
+    log.log_debug(f"[{os.getpid()}] Start of get_text_debug")
+    log.log_debug(f"[{os.getpid()}] Calling extract_mime")
+    text = extract_mime(msg).text
+    log.log_debug(f"[{os.getpid()}] Finished extract_mime")
+    log.log_debug(f"[{os.getpid()}] End of get_text_debug")
+
+    return text
+
+
+def connect_process_debug(rmq, log, cfg, msg, **kwargs):
+
+    """Function:  connect_process_debug
+
+    Description:  Publish email message to RabbitMQ.
+
+    Arguments:
+        (input) rmq -> RabbitMQ class instance
+        (input) log -> Log class instance
+        (input) cfg -> Configuration settings module for the program
+        (input) msg -> Email message instance
+        (input) kwargs:
+            fname -> File name of email/attachment
+            confirm -> PubConfirm class instance
+
+    """
+
+    log.log_debug(f"[{os.getpid()}] Start of connect_process_debug")
+    fname = kwargs.get("fname", None)
+    confirm = kwargs.get("confirm", None)
+
+    # Process email or file/attachment.
+    if fname:
+        log.log_info(f"[{os.getpid()}] Processing file/attachment...")
+        log.log_debug(f"[{os.getpid()}] Open file for reading: {fname}")
+
+        with open(fname, mode="r", encoding="UTF-8") as f_hldr:
+            t_msg = f_hldr.read()
+
+        log.log_debug(f"[{os.getpid()}] Finished reading file: {fname}")
+        bname = os.path.splitext(os.path.basename(fname))[0]
+        log.log_debug(f"[{os.getpid()}] Basename: {bname}")
+        t_msg = str({"AFilename": bname, "File": t_msg})
+        log.log_debug(f"[{os.getpid()}] Created t_msg for queue")
+
+    elif rmq.queue_name == cfg.err_queue:
+        log.log_debug(f"[{os.getpid()}] Queue name detected is error queue")
+        log.log_debug(f"[{os.getpid()}] RMQ Queue: {rmq.queue_name}")
+        log.log_debug(f"[{os.getpid()}] CFG Queue: {cfg.err_queue}")
+        log.log_info(f"[{os.getpid()}] Processing error message...")
+        log.log_debug(f"[{os.getpid()}] Calling get_text_debug")
+        t_msg = "From: " + msg["from"] + " To: " + msg["to"] \
+                + " Subject: " + msg["subject"] + " Body: " \
+                + (get_text_debug(msg, log) or "")
+        log.log_debug(f"[{os.getpid()}] Finished get_text_debug")
+
+    else:
+        log.log_info(f"[{os.getpid()}] Processing email body...")
+        log.log_debug(f"[{os.getpid()}] Calling get_text_debug2")
+        t_msg = get_text_debug(msg, log)
+        log.log_debug(f"[{os.getpid()}] Finished get_text_debug2")
+
+    log.log_debug(f"[{os.getpid()}] Process message if t_msg is detected")
+
+    if t_msg and confirm:
+        log.log_debug(f"[{os.getpid()}] Publishing with publisher confirms")
+        status = confirm.publish(t_msg, msg)
+
+    else:
+        status = t_msg and rmq.publish_msg(t_msg)
+
+    if status:
+        log.log_info(f"[{os.getpid()}] Message ingested into RabbitMQ")
+
+    else:
+        log.log_debug(f"[{os.getpid()}] t_msg not detected or publish failed")
+        log.log_err(f"[{os.getpid()}] Failed to injest message into RabbitMQ")
+        log.log_debug(
+            f"[{os.getpid()}] connect_process: Calling archive_email_debug")
+        archive_email_debug(rmq, log, cfg, msg)
+        log.log_debug(
+            f"[{os.getpid()}] connect_process: Finished archive_email_debug")
+
+    log.log_debug(f"[{os.getpid()}] End of connect_process_debug")
+
+
+def connect_rmq_debug(cfg, log, qname, rkey, msg, **kwargs):
+
+    """Function:  connect_rmq_debug
+
+    Description:  Set up and connect to RabbitMQ, check for connection
+        problems.
+
+    Arguments:
+        (input) cfg -> Configuration settings module for the program
+        (input) log -> Log class instance
+        (input) qname -> Queue name for RabbitMQ
+        (input) rkey -> Rkey value for RabbitMQ
+        (input) msg -> Message body
+        (input) kwargs:
+            fname -> Name of attachment file
+            session -> RmqSession class instance
+
+    """
+
+    log.log_debug(f"[{os.getpid()}] Start of connect_rmq_debug")
+    config = {"fname": kwargs.get("fname")} if kwargs.get("fname", False) \
+        else {}
+    log.log_debug(f"[{os.getpid()}] Value for config: {config}")
+    session = kwargs.get("session") or RmqSession(cfg, log)
+    log.log_info(
+        f"[{os.getpid()}] connect_rmq: Connection info:"
+        f" {cfg.host}->{cfg.exchange_name}")
+    log.log_debug(f"[{os.getpid()}] Getting RMQ connection from session")
+    rmq = session.get_rmq(qname, rkey)
+    log.log_debug(f"[{os.getpid()}] Got RMQ connection from session")
+
+    if session.is_open():
+        log.log_info(
+            f"[{os.getpid()}] connect_rmq: Connected to RabbitMQ mode")
+        log.log_debug(f"[{os.getpid()}] Calling connect_process_debug")
+        connect_process_debug(
+            rmq, log, cfg, msg, confirm=session.confirm, **config)
+        log.log_debug(f"[{os.getpid()}] Finished connect_process_debug")
+
+    else:
+        log.log_err(
+            f"[{os.getpid()}] connect_rmq: Failed to connect to RabbitMQ")
+        log.log_err(
+            f"[{os.getpid()}] connect_rmq: Message:  {session.err_msg}")
+        log.log_debug(
+            f"[{os.getpid()}] connect_rmq: Calling archive_email_debug")
+        archive_email_debug(rmq, log, cfg, msg)
+        log.log_debug(
+            f"[{os.getpid()}] connect_rmq: Finished archive_email_debug")
+
+    if not kwargs.get("session"):
+        log.log_debug(f"[{os.getpid()}] Closing RMQ connection")
+        session.close()
+
+    log.log_debug(f"[{os.getpid()}] End of connect_rmq_debug")
+
+
+def process_attach_debug(msg, log, cfg):                # pylint:disable=R0915
+
+    """Function:  process_attach_debug
+
+    Description:  Locate, extract, and process attachment from email based on
+        specified attachment types.
+
+    Arguments:
+        (input) msg -> Email message instance
+        (input) log -> Log class instance
+        (input) cfg -> Configuration settings module for the program
+        (output) fname -> Name of encoded attachment file
+
+    """
+
+    log.log_debug(f"[{os.getpid()}] Start of process_attach_debug")
+    fname_list = []
+    log.log_info(f"[{os.getpid()}] Locating attachments...")
+
+    if not msg.is_multipart():
+        log.log_debug(f"[{os.getpid()}] Multipart not detected")
+        log.log_debug(f"[{os.getpid()}] End of process_attach_debug")
+        return fname_list
+
+    log.log_debug(f"[{os.getpid()}] Multipart is detected")
+    log.log_debug(f"[{os.getpid()}] Calling extract_mime")
+    mime = extract_mime(msg, cfg.attach_types)
+    log.log_debug(f"[{os.getpid()}] Finished extract_mime")
+
+    for part in mime.attachments:
+        log.log_debug(
+            f"[{os.getpid()}] process_attach: Top of attachments loop")
+        tname = os.path.join(cfg.tmp_dir, part.name)
+        log.log_info(f"[{os.getpid()}] Attachment detected: {part.name}")
+        log.log_info(f"[{os.getpid()}] Attachment type: {part.content_type}")
+
+        # Change 2253.
+        ####################
+        log.log_debug(f"[{os.getpid()}] Calling gen_libs.convert_bytes")
+        data = gen_libs.convert_bytes(part.data)
+        log.log_debug(f"[{os.getpid()}] Finished gen_libs.convert_bytes")
+        ####################
+
+        log.log_debug(f"[{os.getpid()}] Check if data was converted")
+        if data is None:
+            log.log_warn(
+                f"[{os.getpid()}] Unable to convert attach to bytes")
+            log.log_debug(f"[{os.getpid()}] Continue to next loop")
+            continue
+
+        log.log_debug(f"[{os.getpid()}] Start writing to: {tname}")
+        with io.open(tname, mode="wb") as fhdr:
+            fhdr.write(data)
+        log.log_debug(f"[{os.getpid()}] Closed writing to: {tname}")
+
+        log.log_debug(f"[{os.getpid()}] Creating fname variable")
+        fname = tname + ".encoded"
+        fname_list.append(fname)
+        log.log_debug(f"[{os.getpid()}] Added {fname} to {fname_list}")
+
+        log.log_debug(f"[{os.getpid()}] Start of reading from {tname}")
+        in_file = io.open(tname, mode="rb")         # pylint:disable=R1732
+        log.log_debug(f"[{os.getpid()}] Start writing to 2: {fname}")
+        out_file = io.open(fname, mode="wb")        # pylint:disable=R1732
+
+        log.log_debug(f"[{os.getpid()}] Base64 encoding data to file")
+        base64.encode(in_file, out_file)
+
+        in_file.close()
+        log.log_debug(f"[{os.getpid()}] Closed reading from {tname}")
+        out_file.close()
+        log.log_debug(f"[{os.getpid()}] Closed writing to 2: {fname}")
+
+        log.log_debug(
+            f"[{os.getpid()}] process_attach: Removing file: {tname}")
+        err_flag, err_msg = gen_libs.rm_file(tname)
+        log.log_debug(
+            f"[{os.getpid()}] process_attach: Removed file {tname}")
+
+        if err_flag:
+            log.log_debug(
+                f"[{os.getpid()}] process_attach: File {tname}, Perms:"
+                f" {oct(os.stat(tname).st_mode)[-3:]}")
+            log.log_debug(
+                f"[{os.getpid()}] File Owner: {os.stat(tname).st_uid}")
+            log.log_warn(
+                f"[{os.getpid()}] process_attach:  Message: {err_msg}")
+
+    for part in mime.rejected:
+        log.log_warn(
+            f"[{os.getpid()}] Invalid attachment detected: {part.name}")
+        log.log_warn(f"[{os.getpid()}] Attachment type: {part.content_type}")
+
+    log.log_debug(f"[{os.getpid()}] End of process_attach_debug")
+
+    return fname_list
+
+
+def process_from_debug(cfg, log, msg, from_addr, **kwargs):
+
+    """Function:  process_from_debug
+
+    Description:  Process email using its From line.
+
+    Arguments:
+        (input) cfg -> Configuration settings module for the program
+        (input) log -> Log class instance
+        (input) msg -> Email message body
+        (input) from_addr -> Email From line
+        (input) kwargs:
+            session -> RmqSession class instance
+
+    """
+
+    log.log_debug(f"[{os.getpid()}] Start of process_from_debug")
+    session = kwargs.get("session")
+    log.log_debug(
+        f"[{os.getpid()}] process_from: Calling process_attach_debug")
+    fname_list = process_attach_debug(msg, log, cfg)
+    log.log_debug(
+        f"[{os.getpid()}] process_from: Finished process_attach_debug")
+
+    if fname_list:
+        log.log_debug(f"[{os.getpid()}] Detected fname_list: {fname_list}")
+
+        for fname in fname_list:
+            log.log_debug(
+                f"[{os.getpid()}] process_from: Top of fname_list loop")
+            log.log_info(
+                f"[{os.getpid()}] Valid From address:"
+                f" {from_addr} with file attachment: {fname}")
+            log.log_debug(
+                f"[{os.getpid()}] process_from: Calling pub_to_rmq_debug")
+            pub_to_rmq_debug(
+                cfg, log, cfg.debug_queue_dict[from_addr],
+                cfg.debug_queue_dict[from_addr], msg, fname, session=session)
+            log.log_debug(
+                f"[{os.getpid()}] process_from: Finished pub_to_rmq_debug")
+            log.log_debug(
+                f"[{os.getpid()}] process_from: Bottom of fname_list loop")
+
+    else:
+        log.log_debug(f"[{os.getpid()}] No fname_list detected")
+        log.log_warn(
+            f"[{os.getpid()}] Missing attachment for email address:"
+            f" {from_addr}")
+        log.log_debug(
+            f"[{os.getpid()}] process_from: Calling connect_rmq_debug: error")
+        connect_rmq_debug(
+            cfg, log, cfg.err_addr_queue, cfg.err_addr_queue, msg,
+            session=session)
+        log.log_debug(
+            f"[{os.getpid()}] process_from: Finished connect_rmq_debug: error")
+
+    log.log_debug(f"[{os.getpid()}] End of process_from_debug")
+
+
+def pub_to_rmq_debug(                           # pylint:disable=R0913,R0917
+        cfg, log, qname, rkey, msg, fname, **kwargs):
+
+    """Function:  pub_to_rmq_debug
+
+    Description:  Consolidate arguments for the call to RMQ and clean up file.
+
+    Arguments:
+        (input) cfg -> Configuration settings module for the program
+        (input) log -> Log class instance
+        (input) qname -> Queue name for RabbitMQ
+        (input) rkey -> Rkey value for RabbitMQ
+        (input) msg -> Email message body
+        (input) fname -> Name of attachment file
+        (input) kwargs:
+            session -> RmqSession class instance
+
+    """
+
+    log.log_debug(f"[{os.getpid()}] pub_to_rmq: Calling connect_rmq_debug")
+    connect_rmq_debug(
+        cfg, log, qname, rkey, msg, fname=fname, session=kwargs.get("session"))
+    log.log_debug(f"[{os.getpid()}] pub_to_rmq: Finished connect_rmq_debug")
+    log.log_debug(f"[{os.getpid()}] pub_to_rmq: Removing file: {fname}")
+    err_flag, err_msg = gen_libs.rm_file(fname)
+    log.log_debug(f"[{os.getpid()}] pub_to_rmq: Removed file {fname}")
+
+    if err_flag:
+        log.log_debug(
+            f"[{os.getpid()}] pub_to_rmq: File {fname}, Perms:"
+            f" {oct(os.stat(fname).st_mode)[-3:]}")
+        log.log_debug(
+            f"[{os.getpid()}] pub_to_rmq: File Owner:"
+            f" {os.stat(fname).st_uid}")
+        log.log_warn(f"[{os.getpid()}] pub_to_rmq: Message: {err_msg}")
+
+
+def process_file_debug(cfg, log, subj, msg, **kwargs):
+
+    """Function:  process_file_debug
+
+    Description:  Process email with a file attachment or process as an invalid
+        message.
+
+    Arguments:
+        (input) cfg -> Configuration settings module for the program
+        (input) log -> Log class instance
+        (input) subj -> Email subject line
+        (input) msg -> Email message body
+        (input) kwargs:
+            session -> RmqSession class instance
+
+    """
+
+    log.log_debug(f"[{os.getpid()}] Start of process_file_debug")
+    session = kwargs.get("session")
+    log.log_debug(
+        f"[{os.getpid()}] process_file: Calling process_attach_debug")
+    fname_list = process_attach_debug(msg, log, cfg)
+    log.log_debug(
+        f"[{os.getpid()}] process_file: Finished process_attach_debug")
+
+    if fname_list and subj in cfg.file_queues:
+        log.log_debug(f"[{os.getpid()}] Found {subj} in {cfg.file_queues}")
+        log.log_debug(f"[{os.getpid()}] Detected list: {fname_list}")
+
+        for fname in fname_list:
+            log.log_debug(
+                f"[{os.getpid()}] process_file: Top of fname_list loop")
+            log.log_info(
+                f"[{os.getpid()}] Valid subject with file attachment: {fname}")
+            log.log_debug(
+                f"[{os.getpid()}] process_file: Calling pub_to_rmq_debug")
+            pub_to_rmq_debug(
+                cfg, log, subj, subj, msg, fname, session=session)
+            log.log_debug(
+                f"[{os.getpid()}] process_file: Finished pub_to_rmq_debug")
+            log.log_debug(
+                f"[{os.getpid()}] process_file: Bottom of fname_list loop")
+
+    elif fname_list:
+        log.log_debug(f"[{os.getpid()}] Only detected fname_list")
+        log.log_debug(f"[{os.getpid()}] Detected list 2: {fname_list}")
+
+        for fname in fname_list:
+            log.log_debug(f"[{os.getpid()}] Top of fname_list second loop")
+            log.log_info(
+                f"[{os.getpid()}] Invalid subject with file attached: {fname}")
+            log.log_debug(
+                f"[{os.getpid()}] process_file 2: Calling pub_to_rmq_debug")
+            pub_to_rmq_debug(
+                cfg, log, cfg.err_file_queue, cfg.err_file_queue, msg, fname,
+                session=session)
+            log.log_debug(
+                f"[{os.getpid()}] process_file 2: Finished pub_to_rmq_debug")
+            log.log_debug(f"[{os.getpid()}] Bottom of fname_list second loop")
+
+    else:
+        log.log_debug(f"[{os.getpid()}] No fname_list or subject detected")
+        log.log_warn(f"[{os.getpid()}] Invalid email subject: {subj}")
+        log.log_debug(
+            f"[{os.getpid()}] process_file: Calling connect_rmq_debug: error")
+        connect_rmq_debug(
+            cfg, log, cfg.err_queue, cfg.err_queue, msg, session=session)
+        log.log_debug(
+            f"[{os.getpid()}] process_file: Finished connect_rmq_debug: error")
+
+    log.log_debug(f"[{os.getpid()}] End of process_file_debug")
+
+
+def process_debug(cfg, subj, msg, from_addr, **kwargs):
+
+    """Function:  process_debug
+
+    Description:  Process for debugging.  Will determine whether to process on
+        subject, from address or attachment.
+
+    Note: A new log instance will be initiated and all debugging entries will
+        be sent to this debug log.
+
+    Arguments:
+        (input) cfg -> Configuration settings module for the program
+        (input) subj -> Email subject line
+        (input) msg -> Email message body
+        (input) from_addr -> Email From line
+        (input) kwargs:
+            session -> RmqSession class instance
+
+    """
+
+    session = kwargs.get("session")
+    log_file = os.path.join(
+        os.path.dirname(cfg.log_file),
+        "debug_" + os.path.basename(cfg.log_file))
+    date = "." + datetime.datetime.strftime(datetime.datetime.now(), "%Y%m%d")
+    log = gen_class.Logger(
+        log_file, log_file + date, "DEBUG",
+        "%(asctime)s %(levelname)s %(message)s", "%Y-%m-%dT%H:%M:%SZ")
+    log.log_info(f"[{os.getpid()}] {'=' * 80}")
+    log.log_info(
+        f"[{os.getpid()}] {cfg.host}:{cfg.exchange_name} Initialized")
+    log.log_debug(f"[{os.getpid()}] Start of debugging")
+
+    if subj in cfg.debug_valid_queues:
+        log.log_debug(f"[{os.getpid()}] Detected valid subject: {subj}")
+        log.log_info(f"[{os.getpid()}] Valid email subject: {subj}")
+        log.log_debug(f"[{os.getpid()}] process: Calling connect_rmq_debug")
+        connect_rmq_debug(cfg, log, subj, subj, msg, session=session)
+        log.log_debug(f"[{os.getpid()}] process: Finished connect_rmq_debug")
+
+    # Change 2242.
+    ####################
+    elif subj in cfg.debug_valid_queues2:
+        log.log_debug(f"[{os.getpid()}] Detected valid subject2: {subj}")
+        log.log_info(f"[{os.getpid()}] Valid email subject2: {subj}")
+        log.log_info(
+            f"[{os.getpid()}] Looping on: {cfg.debug_valid_queues2[subj]}")
+
+        for qname in cfg.debug_valid_queues2[subj]:
+            log.log_info(f"[{os.getpid()}] Publishing to: {qname}")
+            log.log_debug(
+                f"[{os.getpid()}] process: Calling connect_rmq_debug")
+            connect_rmq_debug(cfg, log, qname, qname, msg, session=session)
+            log.log_debug(
+                f"[{os.getpid()}] process: Finished connect_rmq_debug")
+    ####################
+
+    elif from_addr and from_addr in cfg.debug_queue_dict:
+        log.log_debug(f"[{os.getpid()}] Detected valid from addr: {from_addr}")
+        log.log_debug(f"[{os.getpid()}] Calling process_from_debug")
+        process_from_debug(cfg, log, msg, from_addr, session=session)
+        log.log_debug(f"[{os.getpid()}] Finished process_from_debug")
+
+    else:
+        log.log_debug(f"[{os.getpid()}] Processing as all others")
+        log.log_debug(f"[{os.getpid()}] Calling process_file_debug")
+        process_file_debug(cfg, log, subj, msg, session=session)
+        log.log_debug(f"[{os.getpid()}] Finished process_file_debug")
+
+    log.log_debug(f"[{os.getpid()}] End of debugging")
+
+    log.log_close()
+
+
+def parse_stream(in_file):
+
+    """Function:  parse_stream
+
+    Description:  Parse an email message from a binary file handler, which is
+        read in fixed size chunks.
+
+    Arguments:
+        (input) in_file -> Binary file handler to read the email from
+        (output) msg -> Email message instance
+
+    """
+
+    parser = BytesFeedParser(MailMessage, policy=MAIL_POLICY)
+    timer = get_timer()
+
+    while True:
+        data = in_file.read(CHUNK_SIZE)
+
+        if not data:
+            break
+
+        timer.count("email_bytes", len(data))
+        parser.feed(data)
+
+    return parser.close()
+
+
+def parse_file(fname):
+
+    """Function:  parse_file
+
+    Description:  Read an email file and parse it into an email message.
+
+    Arguments:
+        (input) fname -> Name of email file
+        (output) msg -> Email message instance
+
+    """
+
+    with open(fname, mode="rb") as fhdr:
+        return parse_stream(fhdr)
+
+
+def parse_data(data):
+
+    """Function:  parse_data
+
+    Description:  Parse a raw email received as bytes into an email message.
+
+    Arguments:
+        (input) data -> Raw email message in bytes
+        (output) msg -> Email message instance
+
+    """
+
+    parser = BytesFeedParser(MailMessage, policy=MAIL_POLICY)
+    get_timer().count("email_bytes", len(data))
+    parser.feed(data)
+
+    return parser.close()
+
+
+def close_feed(feed):
+
+    """Function:  close_feed
+
+    Description:  Finish parsing an email which was fed to a parser in
+        chunks as it was received.
+
+    Arguments:
+        (input) feed -> (BytesFeedParser instance, number of bytes fed)
+        (output) msg -> Email message instance
+
+    """
+
+    parser, size = feed
+    get_timer().count("email_bytes", size)
+
+    return parser.close()
+
+
+def read_email(cfg, log, **kwargs):
+
+    """Function:  read_email
+
+    Description:  Reads files and parses the email messages, then sends emails
+        for further processing.  With the -j option the files are processed
+        by a pool of worker processes.
+
+    Arguments:
+        (input) cfg -> Configuration settings module for the program
+        (input) log -> Log class instance
+        (input) kwargs:
+            args -> ArgParser class instance
+            pool -> RmqPool class instance
+
+    """
+
+    log.log_info(f"[{os.getpid()}] Reading and parsing email...")
+    args = kwargs.get("args")
+    fnames = args.get_val("-C")
+
+    try:
+        jobs = int(args.get_val("-j") or 1)
+
+    except ValueError as err:
+        log.log_err(f"[{os.getpid()}] read_email: Invalid -j value: {err}")
+        return
+
+    if jobs > 1 and len(fnames) > 1:
+        read_email_pool(cfg, log, args, fnames, jobs)
+        return
+
+    for fname in fnames:
+        timer = start_timer(cfg)
+
+        with timer.stage("parse"):
+            msg = parse_file(fname)
+
+        process_message(
+            cfg, log, msg=msg, pool=kwargs.get("pool"), timer=timer)
+
+
+def file_size(fname):
+
+    """Function:  file_size
+
+    Description:  Return the size of a file, zero if it can not be read.
+
+    Arguments:
+        (input) fname -> File name
+        (output) Size of file in bytes
+
+    """
+
+    try:
+        return os.path.getsize(fname)
+
+    except OSError:
+        return 0
+
+
+def read_worker(cfg_name, cfg_dir, tasks, results):
+
+    """Function:  read_worker
+
+    Description:  Worker process for read_email -j.  Loads the configuration
+        and processes the email files taken from the tasks queue over its own
+        RabbitMQ connection pool, until a None is taken.  The worker's totals
+        are put on the results queue when it finishes.
+
+    Arguments:
+        (input) cfg_name -> Configuration file name
+        (input) cfg_dir -> Directory path to the configuration file
+        (input) tasks -> Queue of email file names
+        (input) results -> Queue for the worker totals:  (pid, totals)
+
+    """
+
+    cfg = gen_libs.load_module(cfg_name, cfg_dir)
+    log = open_log(cfg)
+    pool = RmqPool(cfg, log)
+    totals = collections.Counter()
+
+    try:
+        for fname in iter(tasks.get, None):
+            start = time.monotonic()
+            saved = PUBLISH_STATS["saved"]
+
+            try:
+                timer = start_timer(cfg)
+
+                with timer.stage("parse"):
+                    msg = parse_file(fname)
+
+                process_message(cfg, log, msg=msg, pool=pool, timer=timer)
+
+            except Exception as err:                # pylint:disable=W0718
+                log.log_err(f"[{os.getpid()}] read_worker: {fname}: {err}")
+                totals["errors"] += 1
+
+            totals["files"] += 1
+            totals["bytes"] += file_size(fname)
+            totals["saved"] += PUBLISH_STATS["saved"] - saved
+            totals["secs"] += time.monotonic() - start
+
+    finally:
+        pool.close()
+        log.log_close()
+        results.put((os.getpid(), dict(totals)))
+
+
+def read_email_pool(cfg, log, args, fnames, jobs):
+
+    """Function:  read_email_pool
+
+    Description:  Process the email files with a pool of worker processes.
+        The largest files are handed out first so the workers finish close
+        together.  Workers are started with the spawn method so they do not
+        inherit the RabbitMQ connections and threads of this process.  Logs
+        the throughput and failures of each worker.
+
+    Arguments:
+        (input) cfg -> Configuration settings module for the program
+        (input) log -> Log class instance
+        (input) args -> ArgParser class instance
+        (input) fnames -> List of email file names
+        (input) jobs -> Number of worker processes
+
+    """
+
+    ctx = multiprocessing.get_context("spawn")
+    tasks = ctx.Queue()
+    results = ctx.Queue()
+
+    for fname in sorted(fnames, key=file_size, reverse=True):
+        tasks.put(fname)
+
+    workers = [
+        ctx.Process(target=read_worker, args=(
+            args.get_val("-c"), args.get_val("-d"), tasks, results))
+        for _ in range(min(jobs, len(fnames)))]
+
+    for worker in workers:
+        tasks.put(None)
+        worker.start()
+
+    log.log_info(
+        f"[{os.getpid()}] read_email: {len(fnames)} files, {len(workers)}"
+        f" workers")
+    summary = []
+
+    while len(summary) < len(workers):
+        try:
+            summary.append(results.get(timeout=1))
+
+        except queue.Empty:
+            if not any(worker.is_alive() for worker in workers):
+                break
+
+    for worker in workers:
+        worker.join()
+
+    for pid, totals in sorted(summary):
+        secs = totals.get("secs", 0) or 1e-9
+        log.log_info(
+            f"[{os.getpid()}] read_email: Worker {pid}:"
+            f" {totals.get('files', 0)} files,"
+            f" {totals.get('files', 0) / secs:.1f} files/s,"
+            f" {totals.get('bytes', 0) / secs / 1048576:.2f} MB/s,"
+            f" {totals.get('errors', 0)} errors,"
+            f" {totals.get('saved', 0)} not published")
+
+    if len(summary) < len(workers):
+        log.log_err(
+            f"[{os.getpid()}] read_email: {len(workers) - len(summary)}"
+            f" workers exited without a summary")
+
+
+def capture_email(cfg, log, **kwargs):                  # pylint:disable=W0613
+
+    """Function:  capture_email
+
+    Description:  Captures the email from standard in and parses the email
+        message, before sending the email for further processing.
+
+    Arguments:
+        (input) cfg -> Configuration settings module for the program
+        (input) log -> Log class instance
+        (input) kwargs:
+            args -> ArgParser class instance
+            pool -> RmqPool class instance
+
+    """
+
+    log.log_info(f"[{os.getpid()}] Capturing and parsing email...")
+    timer = start_timer(cfg)
+
+    with timer.stage("parse"):
+        msg = parse_stream(sys.stdin.buffer)
+
+    process_message(cfg, log, msg=msg, pool=kwargs.get("pool"), timer=timer)
+
+
+def process_spool(cfg, log, fname, **kwargs):
+
+    """Function:  process_spool
+
+    Description:  Parse and process an email file from the spool directory,
+        then remove the file.  Files which cannot be parsed or processed are
+        moved to the spool failed directory.
+
+    Arguments:
+        (input) cfg -> Configuration settings module for the program
+        (input) log -> Log class instance
+        (input) fname -> Name of spooled email file
+        (input) kwargs:
+            pool -> RmqPool class instance
+
+    """
+
+    log.log_info(f"[{os.getpid()}] Processing spool file: {fname}")
+
+    try:
+        timer = start_timer(cfg)
+
+        with timer.stage("parse"):
+            msg = parse_file(fname)
+
+        process_message(
+            cfg, log, msg=msg, pool=kwargs.get("pool"), timer=timer)
+
+    except Exception as err:                            # pylint:disable=W0718
+        f_file = os.path.join(
+            cfg.spool_dir, "failed", os.path.basename(fname))
+        log.log_err(f"[{os.getpid()}] Spool file failed: {fname}: {err}")
+        log.log_err(f"[{os.getpid()}] Moving spool file to: {f_file}")
+        os.replace(fname, f_file)
+
+        return
+
+    err_flag, err_msg = gen_libs.rm_file(fname)
+
+    if err_flag:
+        log.log_warn(f"[{os.getpid()}] process_spool: Message: {err_msg}")
+
+
+def lock_spool(cfg, log):
+
+    """Function:  lock_spool
+
+    Description:  Lock the spool directory, so only one daemon drains it.
+        The lock is held until the returned file is closed.
+
+    Arguments:
+        (input) cfg -> Configuration settings module for the program
+        (input) log -> Log class instance
+        (output) lock_file -> Open lock file or None if already locked
+
+    """
+
+    lock_file = open(                                   # pylint:disable=R1732
+        os.path.join(cfg.spool_dir, ".lock"), mode="w", encoding="UTF-8")
+
+    try:
+        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+    except OSError:
+        lock_file.close()
+        log.log_err(
+            f"[{os.getpid()}] Spool daemon already running on:"
+            f" {cfg.spool_dir}")
+        return None
+
+    return lock_file
+
+
+def spool_daemon(cfg, log, **kwargs):
+
+    """Function:  spool_daemon
+
+    Description:  Run as a resident daemon which drains the spool directory.
+        Email files dropped into the spool new directory are processed in
+        arrival order over pooled RabbitMQ connections.  Runs until a SIGTERM
+        or SIGINT is received.
+
+    Arguments:
+        (input) cfg -> Configuration settings module for the program
+        (input) log -> Log class instance
+        (input) kwargs:
+            args -> ArgParser class instance
+            pool -> RmqPool class instance
+
+    """
+
+    pool = kwargs.get("pool")
+    new_dir = os.path.join(cfg.spool_dir, "new")
+    interval = getattr(cfg, "spool_interval", 1)
+    stop = threading.Event()
+    lock_file = lock_spool(cfg, log)
+
+    if not lock_file:
+        return
+
+    with lock_file:
+        signal.signal(signal.SIGTERM, lambda signum, frame: stop.set())
+        signal.signal(signal.SIGINT, lambda signum, frame: stop.set())
+        log.log_info(f"[{os.getpid()}] Spool daemon started on: {new_dir}")
+
+        while not stop.is_set():
+            fnames = sorted(os.listdir(new_dir))
+
+            for fname in fnames:
+                process_spool(
+                    cfg, log, os.path.join(new_dir, fname), pool=pool)
+
+                if stop.is_set():
+                    break
+
+            if not fnames:
+                pool.sweep()
+                stop.wait(interval)
+
+        log.log_info(f"[{os.getpid()}] Spool daemon stopped")
+
+
+class MailHandler(socketserver.StreamRequestHandler):
+
+    """Class:  MailHandler
+
+    Description:  Request handler for the Unix socket server.  Reads a raw
+        email from the client until end of file, processes the email and
+        sends an acknowledgement line back to the client:  "OK" once the
+        email has been processed or "ERR reason" if it could not be.
+
+    Methods:
+        handle
+
+    """
+
+    def handle(self):
+
+        """Method:  handle
 
-        log.log_debug(f"[{os.getpid()}] Finished reading file: {fname}")
-        bname = os.path.splitext(os.path.basename(fname))[0]
-        log.log_debug(f"[{os.getpid()}] Basename: {bname}")
-        t_msg = str({"AFilename": bname, "File": t_msg})
-        log.log_debug(f"[{os.getpid()}] Created t_msg for queue")
+        Description:  Process a single email received from a client.
 
-    elif rmq.queue_name == cfg.err_queue:
-        log.log_debug(f"[{os.getpid()}] Queue name detected is error queue")
-        log.log_debug(f"[{os.getpid()}] RMQ Queue: {rmq.queue_name}")
-        log.log_debug(f"[{os.getpid()}] CFG Queue: {cfg.err_queue}")
-        log.log_info(f"[{os.getpid()}] Processing error message...")
-        log.log_debug(f"[{os.getpid()}] Calling get_text_debug")
-        t_msg = "From: " + msg["from"] + " To: " + msg["to"] \
-                + " Subject: " + msg["subject"] + " Body: " \
-                + (get_text_debug(msg, log) or "")
-        log.log_debug(f"[{os.getpid()}] Finished get_text_debug")
+        Arguments:
 
-    else:
-        log.log_info(f"[{os.getpid()}] Processing email body...")
-        log.log_debug(f"[{os.getpid()}] Calling get_text_debug2")
-        t_msg = get_text_debug(msg, log)
-        log.log_debug(f"[{os.getpid()}] Finished get_text_debug2")
+        """
 
-    log.log_debug(f"[{os.getpid()}] Process message if t_msg is detected")
+        cfg = self.server.cfg
+        log = self.server.log
+        self.connection.settimeout(getattr(cfg, "sock_timeout", 300))
+        log.log_info(f"[{os.getpid()}] Receiving email from socket client")
 
-    if t_msg and rmq.publish_msg(t_msg):
-        log.log_info(f"[{os.getpid()}] Message ingested into RabbitMQ")
+        try:
+            timer = start_timer(cfg)
 
-    else:
-        log.log_debug(f"[{os.getpid()}] t_msg not detected or publish failed")
-        log.log_err(f"[{os.getpid()}] Failed to injest message into RabbitMQ")
-        log.log_debug(
-            f"[{os.getpid()}] connect_process: Calling archive_email_debug")
-        archive_email_debug(rmq, log, cfg, msg)
-        log.log_debug(
-            f"[{os.getpid()}] connect_process: Finished archive_email_debug")
+            with timer.stage("parse"):
+                msg = parse_stream(self.rfile)
 
-    log.log_debug(f"[{os.getpid()}] End of connect_process_debug")
+            process_message(
+                cfg, log, msg=msg, pool=self.server.pool, timer=timer)
+            self.wfile.write(b"OK\n")
 
+        except Exception as err:                        # pylint:disable=W0718
+            log.log_err(f"[{os.getpid()}] Socket email failed: {err}")
+            self.wfile.write(f"ERR {err}\n".encode("UTF-8", "replace"))
 
-def connect_rmq_debug(cfg, log, qname, rkey, msg, **kwargs):
 
-    """Function:  connect_rmq_debug
+def socket_server(cfg, log, **kwargs):
 
-    Description:  Set up and connect to RabbitMQ, check for connection
-        problems.
+    """Function:  socket_server
+
+    Description:  Run as a resident server which receives emails from the
+        mail_2_client.py program over a local Unix domain socket.  Emails are
+        processed one at a time over pooled RabbitMQ connections.  Runs until
+        a SIGTERM or SIGINT is received.
 
     Arguments:
         (input) cfg -> Configuration settings module for the program
         (input) log -> Log class instance
-        (input) qname -> Queue name for RabbitMQ
-        (input) rkey -> Rkey value for RabbitMQ
-        (input) msg -> Message body
         (input) kwargs:
-            fname -> Name of attachment file
+            args -> ArgParser class instance
+            pool -> RmqPool class instance
 
     """
 
-    log.log_debug(f"[{os.getpid()}] Start of connect_rmq_debug")
-    config = {"fname": kwargs.get("fname")} if kwargs.get("fname", False) \
-        else {}
-    log.log_debug(f"[{os.getpid()}] Value for config: {config}")
-    log.log_debug(f"[{os.getpid()}] Creating RMQ Pub instance")
-    rmq = rabbitmq_class.create_rmqpub(cfg, qname, rkey)
-    log.log_info(
-        f"[{os.getpid()}] connect_rmq: Connection info:"
-        f" {cfg.host}->{cfg.exchange_name}")
-    log.log_debug(f"[{os.getpid()}] Creating RMQ connection")
-    connect_status, err_msg = rmq.create_connection()
-    log.log_debug(f"[{os.getpid()}] Created RMQ connection")
+    stop = threading.Event()
 
-    if connect_status and rmq.channel.is_open:
+    if os.path.exists(cfg.sock_file):
+        os.remove(cfg.sock_file)
+
+    with socketserver.UnixStreamServer(cfg.sock_file, MailHandler) as server:
+        os.chmod(cfg.sock_file, getattr(cfg, "sock_mode", 0o660))
+        server.cfg = cfg
+        server.log = log
+        server.pool = kwargs.get("pool")
+        server.timeout = getattr(cfg, "spool_interval", 1)
+        signal.signal(signal.SIGTERM, lambda signum, frame: stop.set())
+        signal.signal(signal.SIGINT, lambda signum, frame: stop.set())
         log.log_info(
-            f"[{os.getpid()}] connect_rmq: Connected to RabbitMQ mode")
-        log.log_debug(f"[{os.getpid()}] Calling connect_process_debug")
-        connect_process_debug(rmq, log, cfg, msg, **config)
-        log.log_debug(f"[{os.getpid()}] Finished connect_process_debug")
+            f"[{os.getpid()}] Socket server started on: {cfg.sock_file}")
+
+        while not stop.is_set():
+            server.handle_request()
+            server.pool.sweep()
+
+    os.remove(cfg.sock_file)
+    log.log_info(f"[{os.getpid()}] Socket server stopped")
+
+
+class AsyncEngine():
+
+    """Class:  AsyncEngine
+
+    Description:  asyncio ingestion engine.  Emails from the spool directory,
+        the Unix socket and -C files are taken in at the same time and handed
+        to a small set of worker lanes.  Each lane is a single worker thread
+        with its own RabbitMQ connection pool, as pika connections cannot be
+        shared between threads.  Parsing and publishing run in the lanes, so
+        at most async_workers emails are processed at once.  Socket emails
+        are fed to the parser in chunks as they arrive.  Emails are routed by
+        process_message, the same as the blocking functions.
+
+    Methods:
+        __init__
+        submit
+        work
+        wait_stop
+        file_source
+        spool_source
+        socket_source
+        read_client
+        handle_client
+        sweep_source
+        run
+        close
 
-    else:
-        log.log_err(
-            f"[{os.getpid()}] connect_rmq: Failed to connect to RabbitMQ")
-        log.log_err(f"[{os.getpid()}] connect_rmq: Message:  {err_msg}")
-        log.log_debug(
-            f"[{os.getpid()}] connect_rmq: Calling archive_email_debug")
-        archive_email_debug(rmq, log, cfg, msg)
-        log.log_debug(
-            f"[{os.getpid()}] connect_rmq: Finished archive_email_debug")
+    """
 
-    if connect_status:
-        log.log_debug(f"[{os.getpid()}] Closing RMQ connection")
-        rmq.close()
+    def __init__(self, cfg, log, **kwargs):
 
-    log.log_debug(f"[{os.getpid()}] End of connect_rmq_debug")
+        """Method:  __init__
 
+        Description:  Initialization instance of the AsyncEngine class.
 
-def process_attach_debug(msg, log, cfg):                # pylint:disable=R0915
+        Arguments:
+            (input) cfg -> Configuration settings module for the program
+            (input) log -> Log class instance
+            (input) kwargs:
+                pool -> RmqPool class instance, used by the first lane
 
-    """Function:  process_attach_debug
+        """
 
-    Description:  Locate, extract, and process attachment from email based on
-        specified attachment types.
+        self.cfg = cfg
+        self.log = log
+        self.interval = getattr(cfg, "spool_interval", 1)
+        self.lanes = [
+            (concurrent.futures.ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix=f"lane{cnt}"),
+             kwargs.get("pool") if cnt == 0 and kwargs.get("pool")
+             else RmqPool(cfg, log))
+            for cnt in range(getattr(cfg, "async_workers", 4))]
+        self.clients = set()
+        self.free = None
+        self.stop = None
+
+    async def submit(self, func, *args):
+
+        """Method:  submit
+
+        Description:  Wait for a free lane and run the function in it with
+            the lane's connection pool.
+
+        Arguments:
+            (input) func -> Function to run
+            (input) args -> Arguments to the function
+            (output) Return value of the function
+
+        """
+
+        executor, pool = await self.free.get()
+
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                executor, functools.partial(func, *args, pool=pool))
+
+        finally:
+            self.free.put_nowait((executor, pool))
+
+    def work(self, parse, data, **kwargs):
+
+        """Method:  work
+
+        Description:  Parse and process an email.  Runs in a lane.
+
+        Arguments:
+            (input) parse -> Function to parse the email data
+            (input) data -> Email file name or fed email parser
+            (input) kwargs:
+                pool -> RmqPool class instance
+
+        """
+
+        timer = start_timer(self.cfg)
+
+        with timer.stage("parse"):
+            msg = parse(data)
+
+        process_message(
+            self.cfg, self.log, msg=msg, pool=kwargs.get("pool"), timer=timer)
+
+    async def wait_stop(self, timeout):
+
+        """Method:  wait_stop
+
+        Description:  Wait for a stop signal or the timeout.
+
+        Arguments:
+            (input) timeout -> Time in seconds to wait
+            (output) True|False - Stop signal was received
+
+        """
+
+        try:
+            await asyncio.wait_for(self.stop.wait(), timeout)
+
+        except asyncio.TimeoutError:
+            pass
+
+        return self.stop.is_set()
+
+    async def file_source(self, fnames):
+
+        """Method:  file_source
+
+        Description:  Process a list of email files.
+
+        Arguments:
+            (input) fnames -> List of email file names
+
+        """
+
+        results = await asyncio.gather(
+            *[self.submit(self.work, parse_file, fname) for fname in fnames],
+            return_exceptions=True)
+
+        for fname, result in zip(fnames, results):
+            if isinstance(result, Exception):
+                self.log.log_err(
+                    f"[{os.getpid()}] Failed to process: {fname}: {result}")
+
+    async def spool_source(self):
+
+        """Method:  spool_source
+
+        Description:  Drain the spool directory until stopped.  Files are
+            handed to the lanes in arrival order and are not handed out again
+            while being processed.
+
+        Arguments:
+
+        """
+
+        new_dir = os.path.join(self.cfg.spool_dir, "new")
+        tasks = {}
+        lock_file = lock_spool(self.cfg, self.log)
+
+        if not lock_file:
+            return
+
+        with lock_file:
+            self.log.log_info(
+                f"[{os.getpid()}] Async spool started on: {new_dir}")
+
+            while not self.stop.is_set():
+                for fname in sorted(os.listdir(new_dir)):
+                    f_name = os.path.join(new_dir, fname)
+
+                    if f_name not in tasks:
+                        tasks[f_name] = asyncio.ensure_future(self.submit(
+                            process_spool, self.cfg, self.log, f_name))
+                        tasks[f_name].add_done_callback(
+                            lambda task, name=f_name: tasks.pop(name, None))
+
+                await self.wait_stop(self.interval)
+
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+
+    async def socket_source(self):
+
+        """Method:  socket_source
+
+        Description:  Receive emails from mail_2_client.py over the Unix
+            socket until stopped.
+
+        Arguments:
+
+        """
+
+        if os.path.exists(self.cfg.sock_file):
+            os.remove(self.cfg.sock_file)
+
+        server = await asyncio.start_unix_server(
+            self.handle_client, path=self.cfg.sock_file)
+        os.chmod(self.cfg.sock_file, getattr(self.cfg, "sock_mode", 0o660))
+        self.log.log_info(
+            f"[{os.getpid()}] Async socket started on: {self.cfg.sock_file}")
+
+        async with server:
+            await self.stop.wait()
+
+        await asyncio.gather(*self.clients, return_exceptions=True)
+        os.remove(self.cfg.sock_file)
+
+    async def read_client(self, reader):
+
+        """Method:  read_client
+
+        Description:  Read an email from a client in fixed size chunks,
+            feeding each chunk to the email parser as it arrives.
+
+        Arguments:
+            (input) reader -> asyncio.StreamReader instance
+            (output) feed -> (BytesFeedParser instance, number of bytes fed)
+
+        """
+
+        parser = BytesFeedParser(MailMessage, policy=MAIL_POLICY)
+        size = 0
+
+        while True:
+            data = await reader.read(CHUNK_SIZE)
+
+            if not data:
+                break
+
+            size += len(data)
+            parser.feed(data)
+
+        return parser, size
+
+    async def handle_client(self, reader, writer):
+
+        """Method:  handle_client
+
+        Description:  Process a single email received from a client and send
+            back an acknowledgement line:  "OK" or "ERR reason".
+
+        Arguments:
+            (input) reader -> asyncio.StreamReader instance
+            (input) writer -> asyncio.StreamWriter instance
+
+        """
+
+        self.clients.add(asyncio.current_task())
+
+        try:
+            feed = await asyncio.wait_for(
+                self.read_client(reader),
+                getattr(self.cfg, "sock_timeout", 300))
+            await self.submit(self.work, close_feed, feed)
+            writer.write(b"OK\n")
+
+        except Exception as err:                        # pylint:disable=W0718
+            self.log.log_err(f"[{os.getpid()}] Socket email failed: {err}")
+            writer.write(f"ERR {err}\n".encode("UTF-8", "replace"))
+
+        try:
+            await writer.drain()
+            writer.close()
+
+        except OSError as err:
+            self.log.log_warn(f"[{os.getpid()}] Socket reply failed: {err}")
+
+        self.clients.discard(asyncio.current_task())
+
+    async def sweep_source(self):
+
+        """Method:  sweep_source
+
+        Description:  Sweep the connection pools of idle lanes each interval,
+            which keeps their heartbeats and publisher confirms serviced.
+
+        Arguments:
+
+        """
+
+        loop = asyncio.get_running_loop()
+
+        while not await self.wait_stop(self.interval):
+            lanes = []
+
+            while not self.free.empty():
+                lanes.append(self.free.get_nowait())
+
+            try:
+                await asyncio.gather(
+                    *[loop.run_in_executor(executor, pool.sweep)
+                      for executor, pool in lanes])
+
+            finally:
+                for lane in lanes:
+                    self.free.put_nowait(lane)
+
+    async def run(self, fnames=None):
+
+        """Method:  run
+
+        Description:  Run the engine.  With a list of files the files are
+            processed and the engine returns, otherwise the spool directory
+            and Unix socket are served, if configured, until a SIGTERM or
+            SIGINT is received.
+
+        Arguments:
+            (input) fnames -> List of email file names
+
+        """
+
+        self.free = asyncio.Queue()
+        self.stop = asyncio.Event()
+
+        for lane in self.lanes:
+            self.free.put_nowait(lane)
+
+        if fnames is not None:
+            await self.file_source(fnames)
+            return
+
+        loop = asyncio.get_running_loop()
+        loop.add_signal_handler(signal.SIGTERM, self.stop.set)
+        loop.add_signal_handler(signal.SIGINT, self.stop.set)
+        sources = [self.sweep_source()]
+
+        if getattr(self.cfg, "spool_dir", None):
+            sources.append(self.spool_source())
+
+        if getattr(self.cfg, "sock_file", None):
+            sources.append(self.socket_source())
+
+        await asyncio.gather(*sources)
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Close the lane connection pools and stop the lanes.
+
+        Arguments:
+
+        """
+
+        for executor, pool in self.lanes:
+            executor.submit(pool.close).result()
+            executor.shutdown()
+
+
+class RateLimit():                                      # pylint:disable=R0903
+
+    """Class:  RateLimit
+
+    Description:  Publish rate ceiling shared by a set of threads.  Each call
+        to wait takes the next free time slot, so the combined rate of all
+        threads stays at or below the limit.
+
+    Methods:
+        __init__
+        wait
+
+    """
+
+    def __init__(self, rate):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the RateLimit class.
+
+        Arguments:
+            (input) rate -> Messages per second, 0 is no limit
+
+        """
+
+        self.interval = 1.0 / rate if rate else 0
+        self.lock = threading.Lock()
+        self.next_slot = time.monotonic()
+
+    def wait(self):
+
+        """Method:  wait
+
+        Description:  Wait until the next message may be published.
+
+        Arguments:
+
+        """
+
+        if not self.interval:
+            return
+
+        with self.lock:
+            now = time.monotonic()
+            slot = max(self.next_slot, now)
+            self.next_slot = slot + self.interval
+
+        time.sleep(max(slot - now, 0))
+
+
+def archive_files(cfg, log):
+
+    """Function:  archive_files
+
+    Description:  Return the archived emails in the email_dir directory which
+        can be replayed, oldest first, with the queue each email was archived
+        for.  Archives for another exchange are skipped.
 
     Arguments:
-        (input) msg -> Email message instance
-        (input) log -> Log class instance
         (input) cfg -> Configuration settings module for the program
-        (output) fname -> Name of encoded attachment file
+        (input) log -> Log class instance
+        (output) List of (file name, queue name)
 
     """
 
-    log.log_debug(f"[{os.getpid()}] Start of process_attach_debug")
-    fname_list = []
-    log.log_info(f"[{os.getpid()}] Locating attachments...")
+    archives = []
+    prefix = cfg.exchange_name + "-"
 
-    if not msg.is_multipart():
-        log.log_debug(f"[{os.getpid()}] Multipart not detected")
-        log.log_debug(f"[{os.getpid()}] End of process_attach_debug")
-        return fname_list
+    for fname in os.listdir(cfg.email_dir):
+        match = ARCHIVE_NAME.match(fname)
 
-    log.log_debug(f"[{os.getpid()}] Multipart is detected")
+        if not match:
+            continue
 
-    for item in msg.walk():
-        log.log_debug(
-            f"[{os.getpid()}] process_attach: Top of msg.walk loop")
+        if not match.group("name").startswith(prefix):
+            log.log_warn(
+                f"[{os.getpid()}] archive_files: Not exchange"
+                f" {cfg.exchange_name}, skipping: {fname}")
+            continue
+
+        archives.append(
+            ((match.group("stamp"), int(match.group("pid") or 0),
+              int(match.group("seq") or 0)),
+             os.path.join(cfg.email_dir, fname),
+             match.group("name")[len(prefix):]))
+
+    return [(fname, qname) for _, fname, qname in sorted(archives)]
+
+
+class ArchiveReplay():
+
+    """Class:  ArchiveReplay
+
+    Description:  Replays the emails archived in the email_dir directory to
+        the queue encoded in each archive file name.  The files are shared
+        out to a set of worker threads, each with its own RabbitMQ
+        connection, under a common publish rate ceiling.  Replayed files are
+        moved to the email_dir replayed directory or deleted.
+
+    Methods:
+        __init__
+        run
+        worker
+        replay_file
+        done
+
+    """
+
+    def __init__(self, cfg, log, **kwargs):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the ArchiveReplay class.
+
+        Arguments:
+            (input) cfg -> Configuration settings module for the program
+            (input) log -> Log class instance
+            (input) kwargs:
+                workers -> Number of worker threads
+                rate -> Publish rate ceiling in messages per second
+                delete -> True|False - Delete replayed files
+
+        """
+
+        self.cfg = cfg
+        self.log = log
+        self.workers = kwargs.get("workers", 4)
+        self.limit = RateLimit(kwargs.get("rate", 0))
+        self.delete = kwargs.get("delete", False)
+        self.replay_dir = os.path.join(cfg.email_dir, "replayed")
+        self.lock = threading.Lock()
+        self.archives = iter([])
+        self.counts = collections.Counter()
+
+    def run(self, archives):
+
+        """Method:  run
+
+        Description:  Replay the archived emails.
+
+        Arguments:
+            (input) archives -> List of (file name, queue name)
+            (output) self.counts -> Counter of replayed and failed files
+
+        """
+
+        if not self.delete:
+            os.makedirs(self.replay_dir, exist_ok=True)
+
+        self.archives = iter(archives)
+        threads = [threading.Thread(target=self.worker, name=f"Replay{cnt}")
+                   for cnt in range(max(1, min(self.workers, len(archives))))]
+
+        for thr in threads:
+            thr.start()
+
+        for thr in threads:
+            thr.join()
+
+        self.counts["left"] = len(archives) - self.counts["replayed"] \
+            - self.counts["failed"]
+
+        return self.counts
+
+    def worker(self):
+
+        """Method:  worker
+
+        Description:  Replay archived emails until none are left or RabbitMQ
+            is not available.
+
+        Arguments:
+
+        """
+
+        session = RmqSession(self.cfg, self.log)
+
+        try:
+            while True:
+                with self.lock:
+                    fname, qname = next(self.archives, (None, None))
+
+                if not fname:
+                    break
+
+                try:
+                    status = self.replay_file(session, fname, qname)
+
+                except (OSError, ValueError) as err:
+                    self.log.log_err(
+                        f"[{os.getpid()}] ArchiveReplay: {fname}: {err}")
+                    status = False
+
+                if status:
+                    self.done(fname)
+
+                with self.lock:
+                    self.counts["replayed" if status else "failed"] += 1
+
+                if not session.is_open():
+                    self.log.log_err(
+                        f"[{os.getpid()}] ArchiveReplay: RabbitMQ not"
+                        f" available: {session.err_msg}")
+                    break
+
+        finally:
+            session.close()
+
+    def replay_file(self, session, fname, qname):
+
+        """Method:  replay_file
+
+        Description:  Publish an archived email to its queue.  For the
+            queues attachments are published to (file queues, sender queues
+            and attachment routing rules) the attachments are extracted from
+            the email again.
+
+        Arguments:
+            (input) session -> RmqSession class instance
+            (input) fname -> Name of archive file
+            (input) qname -> Queue name for RabbitMQ
+            (output) True|False - Email was published
+
+        """
+
+        msg = parse_file(fname)
+        rmq = session.get_rmq(qname, qname)
 
-        if item.get_content_type() in cfg.attach_types \
-           and item.get_filename():
+        if not session.is_open():
+            return False
 
-            log.log_debug(f"[{os.getpid()}] Detected attachment and file")
-            tname = os.path.join(cfg.tmp_dir, item.get_filename())
-            log.log_info(
-                f"[{os.getpid()}] Attachment detected: {item.get_filename()}")
-            log.log_info(
-                f"[{os.getpid()}] Attachment type: {item.get_content_type()}")
+        if qname in get_routes(self.cfg).attach_queues:
+            bodies = []
 
-            # Change 2253.
-            ####################
-            log.log_debug(f"[{os.getpid()}] Calling gen_libs.convert_bytes")
-            data = gen_libs.convert_bytes(item.get_payload(decode=True))
-            log.log_debug(f"[{os.getpid()}] Finished gen_libs.convert_bytes")
-            ####################
+            for attach in process_attach(msg, self.log, self.cfg):
+                bodies.extend(attach_bodies(
+                    rmq, self.log, self.cfg, msg, attach))
+                attach.remove()
 
-            log.log_debug(f"[{os.getpid()}] Check if data was converted")
-            if data is None:
-                log.log_warn(
-                    f"[{os.getpid()}] Unable to convert attach to bytes")
-                log.log_debug(f"[{os.getpid()}] Continue to next loop")
-                continue
+        else:
+            bodies = [(build_body(rmq, self.log, self.cfg, msg), {})]
 
-            log.log_debug(f"[{os.getpid()}] Start writing to: {tname}")
-            with io.open(tname, mode="wb") as fhdr:
-                fhdr.write(data)
-            log.log_debug(f"[{os.getpid()}] Closed writing to: {tname}")
+        status = bool(bodies)
 
-            log.log_debug(f"[{os.getpid()}] Creating fname variable")
-            fname = tname + ".encoded"
-            fname_list.append(fname)
-            log.log_debug(f"[{os.getpid()}] Added {fname} to {fname_list}")
+        for body, props in [item for item in bodies if item[0]]:
+            body, encoding = compress_body(rmq, self.cfg, body)
+            props = {**props, **encoding}
+            self.limit.wait()
+            status = (session.confirm.publish(body, msg, **props)
+                      if session.confirm
+                      else publish_body(rmq, body, **props)) and status
 
-            log.log_debug(f"[{os.getpid()}] Start of reading from {tname}")
-            in_file = io.open(tname, mode="rb")         # pylint:disable=R1732
-            log.log_debug(f"[{os.getpid()}] Start writing to 2: {fname}")
-            out_file = io.open(fname, mode="wb")        # pylint:disable=R1732
+        return status
 
-            log.log_debug(f"[{os.getpid()}] Base64 encoding data to file")
-            base64.encode(in_file, out_file)
+    def done(self, fname):
 
-            in_file.close()
-            log.log_debug(f"[{os.getpid()}] Closed reading from {tname}")
-            out_file.close()
-            log.log_debug(f"[{os.getpid()}] Closed writing to 2: {fname}")
+        """Method:  done
 
-            log.log_debug(
-                f"[{os.getpid()}] process_attach: Removing file: {tname}")
-            err_flag, err_msg = gen_libs.rm_file(tname)
-            log.log_debug(
-                f"[{os.getpid()}] process_attach: Removed file {tname}")
-
-            if err_flag:
-                log.log_debug(
-                    f"[{os.getpid()}] process_attach: File {tname}, Perms:"
-                    f" {oct(os.stat(tname).st_mode)[-3:]}")
-                log.log_debug(
-                    f"[{os.getpid()}] File Owner: {os.stat(tname).st_uid}")
-                log.log_warn(
-                    f"[{os.getpid()}] process_attach:  Message: {err_msg}")
+        Description:  Move a replayed file to the replayed directory or
+            delete it.
 
-        elif item.get_filename():
-            log.log_debug(f"[{os.getpid()}] Detected filename in msg only")
-            log.log_warn(
-                f"[{os.getpid()}] Invalid attachment detected:"
-                f" {item.get_filename()}")
-            log.log_warn(
-                f"[{os.getpid()}] Attachment type: {item.get_content_type()}")
+        Arguments:
+            (input) fname -> Name of archive file
 
-        log.log_debug(
-            f"[{os.getpid()}] process_attach: Bottom of msg.walk loop")
+        """
 
-    log.log_debug(f"[{os.getpid()}] End of process_attach_debug")
+        if self.delete:
+            os.remove(fname)
 
-    return fname_list
+        else:
+            os.rename(fname, os.path.join(
+                self.replay_dir, os.path.basename(fname)))
 
 
-def process_from_debug(cfg, log, msg, from_addr):
+def replay_archive(cfg, log, **kwargs):
 
-    """Function:  process_from_debug
+    """Function:  replay_archive
 
-    Description:  Process email using its From line.
+    Description:  Replay the emails archived in the email_dir directory (-R
+        option).
 
     Arguments:
         (input) cfg -> Configuration settings module for the program
         (input) log -> Log class instance
-        (input) msg -> Email message body
-        (input) from_addr -> Email From line
+        (input) kwargs:
+            args -> ArgParser class instance
 
     """
 
-    log.log_debug(f"[{os.getpid()}] Start of process_from_debug")
-    log.log_debug(
-        f"[{os.getpid()}] process_from: Calling process_attach_debug")
-    fname_list = process_attach_debug(msg, log, cfg)
-    log.log_debug(
-        f"[{os.getpid()}] process_from: Finished process_attach_debug")
+    args = kwargs.get("args")
 
-    if fname_list:
-        log.log_debug(f"[{os.getpid()}] Detected fname_list: {fname_list}")
+    try:
+        workers = int(args.get_val("-j")) if args.arg_exist("-j") else 4
+        rate = float(args.get_val("-r")) if args.arg_exist("-r") else 0
 
-        for fname in fname_list:
-            log.log_debug(
-                f"[{os.getpid()}] process_from: Top of fname_list loop")
-            log.log_info(
-                f"[{os.getpid()}] Valid From address:"
-                f" {from_addr} with file attachment: {fname}")
-            log.log_debug(
-                f"[{os.getpid()}] process_from: Calling pub_to_rmq_debug")
-            pub_to_rmq_debug(
-                cfg, log, cfg.debug_queue_dict[from_addr],
-                cfg.debug_queue_dict[from_addr], msg, fname)
-            log.log_debug(
-                f"[{os.getpid()}] process_from: Finished pub_to_rmq_debug")
-            log.log_debug(
-                f"[{os.getpid()}] process_from: Bottom of fname_list loop")
+    except ValueError as err:
+        log.log_err(f"[{os.getpid()}] replay_archive: Invalid value: {err}")
+        return
 
-    else:
-        log.log_debug(f"[{os.getpid()}] No fname_list detected")
-        log.log_warn(
-            f"[{os.getpid()}] Missing attachment for email address:"
-            f" {from_addr}")
-        log.log_debug(
-            f"[{os.getpid()}] process_from: Calling connect_rmq_debug: error")
-        connect_rmq_debug(
-            cfg, log, cfg.err_addr_queue, cfg.err_addr_queue, msg)
-        log.log_debug(
-            f"[{os.getpid()}] process_from: Finished connect_rmq_debug: error")
+    archives = archive_files(cfg, log)
+    log.log_info(
+        f"[{os.getpid()}] replay_archive: {len(archives)} archived emails")
 
-    log.log_debug(f"[{os.getpid()}] End of process_from_debug")
+    if archives:
+        counts = ArchiveReplay(
+            cfg, log, workers=workers, rate=rate,
+            delete=args.arg_exist("-x")).run(archives)
+        log.log_info(
+            f"[{os.getpid()}] replay_archive: Replayed {counts['replayed']},"
+            f" failed {counts['failed']}, left {counts['left']}")
 
 
-def pub_to_rmq_debug(                           # pylint:disable=R0913,R0917
-        cfg, log, qname, rkey, msg, fname):
+def run_async_engine(cfg, log, **kwargs):
 
-    """Function:  pub_to_rmq_debug
+    """Function:  run_async_engine
 
-    Description:  Consolidate arguments for the call to RMQ and clean up file.
+    Description:  Run the -C, -D or -S option on the asyncio engine.  -C
+        processes the email files at the same time.  -D and -S serve both the
+        spool directory and the Unix socket, whichever are configured, until
+        a SIGTERM or SIGINT is received.  The connection pool of the run is
+        used by the first lane.
 
     Arguments:
         (input) cfg -> Configuration settings module for the program
         (input) log -> Log class instance
-        (input) qname -> Queue name for RabbitMQ
-        (input) rkey -> Rkey value for RabbitMQ
-        (input) msg -> Email message body
-        (input) fname -> Name of attachment file
+        (input) kwargs:
+            args -> ArgParser class instance
+            pool -> RmqPool class instance
 
     """
 
-    log.log_debug(f"[{os.getpid()}] pub_to_rmq: Calling connect_rmq_debug")
-    connect_rmq_debug(cfg, log, qname, rkey, msg, fname=fname)
-    log.log_debug(f"[{os.getpid()}] pub_to_rmq: Finished connect_rmq_debug")
-    log.log_debug(f"[{os.getpid()}] pub_to_rmq: Removing file: {fname}")
-    err_flag, err_msg = gen_libs.rm_file(fname)
-    log.log_debug(f"[{os.getpid()}] pub_to_rmq: Removed file {fname}")
+    args = kwargs.get("args")
+    engine = AsyncEngine(cfg, log, pool=kwargs.get("pool"))
+    log.log_info(
+        f"[{os.getpid()}] Async engine started with"
+        f" {len(engine.lanes)} workers")
 
-    if err_flag:
-        log.log_debug(
-            f"[{os.getpid()}] pub_to_rmq: File {fname}, Perms:"
-            f" {oct(os.stat(fname).st_mode)[-3:]}")
-        log.log_debug(
-            f"[{os.getpid()}] pub_to_rmq: File Owner:"
-            f" {os.stat(fname).st_uid}")
-        log.log_warn(f"[{os.getpid()}] pub_to_rmq: Message: {err_msg}")
+    try:
+        asyncio.run(engine.run(
+            args.get_val("-C") if args.arg_exist("-C") else None))
 
+    finally:
+        engine.close()
+        log.log_info(f"[{os.getpid()}] Async engine stopped")
 
-def process_file_debug(cfg, log, subj, msg):
 
-    """Function:  process_file_debug
+def process_message(cfg, log, **kwargs):
 
-    Description:  Process email with a file attachment or process as an invalid
-        message.
+    """Function:  process_message
+
+    Description:  Parses email message, processes email body or attachment and
+        based on subject, from address and/or attachment, send the data to
+        queue in RabbitMQ.  All publishes for the email share a single
+        RabbitMQ connection, which is closed and the stage timer reset even
+        if processing fails.  With the stage_timing setting a summary of the
+        time spent in each stage is logged once the email is processed.
 
     Arguments:
         (input) cfg -> Configuration settings module for the program
         (input) log -> Log class instance
-        (input) subj -> Email subject line
-        (input) msg -> Email message body
+        (input) kwargs:
+            msg -> Email Parser class instance
+            pool -> RmqPool class instance
+            timer -> Stage timer started before the email was parsed
 
     """
 
-    log.log_debug(f"[{os.getpid()}] Start of process_file_debug")
-    log.log_debug(
-        f"[{os.getpid()}] process_file: Calling process_attach_debug")
-    fname_list = process_attach_debug(msg, log, cfg)
-    log.log_debug(
-        f"[{os.getpid()}] process_file: Finished process_attach_debug")
-
-    if fname_list and subj in cfg.file_queues:
-        log.log_debug(f"[{os.getpid()}] Found {subj} in {cfg.file_queues}")
-        log.log_debug(f"[{os.getpid()}] Detected list: {fname_list}")
-
-        for fname in fname_list:
-            log.log_debug(
-                f"[{os.getpid()}] process_file: Top of fname_list loop")
+    timer = kwargs.get("timer") or start_timer(cfg)
+    session = RmqSession(cfg, log, pool=kwargs.get("pool"))
+
+    try:
+        log.log_info(f"[{os.getpid()}] Get email metadata")
+        msg = kwargs.get("msg")
+
+        if Profiler.active:
+            Profiler.active.add_msg(msg)
+
+        with timer.stage("route"):
+            subj = gen_libs.pascalize(filter_subject(msg["subject"], cfg))
+            email_list = gen_libs.find_email_addr(msg["from"])
+            from_addr = email_list[0] if email_list else None
+            routes = get_routes(cfg)
+            rule = routes.match_rule(msg)
+            qname = routes.sender_queue(from_addr) if from_addr else None
+
+        if rule:
+            log.log_info(f"[{os.getpid()}] Process routing rule")
+            timer.set_route(f"rule:{rule.name}")
+            process_rule(cfg, log, msg, rule, session=session)
+
+        elif subj in routes.valid_queues:
+            log.log_info(f"[{os.getpid()}] Process subject")
+            log.log_info(f"[{os.getpid()}] Valid email subject: {subj}")
+            timer.set_route(f"subject:{subj}")
+            connect_rmq(cfg, log, subj, subj, msg, session=session)
+
+        elif subj in routes.fanout:
+            timer.set_route(f"fanout:{subj}")
+            log.log_info(f"[{os.getpid()}] Process subject")
             log.log_info(
-                f"[{os.getpid()}] Valid subject with file attachment: {fname}")
-            log.log_debug(
-                f"[{os.getpid()}] process_file: Calling pub_to_rmq_debug")
-            pub_to_rmq_debug(cfg, log, subj, subj, msg, fname)
-            log.log_debug(
-                f"[{os.getpid()}] process_file: Finished pub_to_rmq_debug")
-            log.log_debug(
-                f"[{os.getpid()}] process_file: Bottom of fname_list loop")
+                f"[{os.getpid()}] Valid email subject: {subj}, queues:"
+                f" {routes.fanout[subj]}")
+            fanout_rmq(cfg, log, routes.fanout[subj], msg, session=session)
 
-    elif fname_list:
-        log.log_debug(f"[{os.getpid()}] Only detected fname_list")
-        log.log_debug(f"[{os.getpid()}] Detected list 2: {fname_list}")
+        elif qname:
+            log.log_info(f"[{os.getpid()}] Process from address")
+            timer.set_route(f"sender:{qname}")
+            process_from(
+                cfg, log, msg, from_addr, qname=qname, session=session)
 
-        for fname in fname_list:
-            log.log_debug(f"[{os.getpid()}] Top of fname_list second loop")
-            log.log_info(
-                f"[{os.getpid()}] Invalid subject with file attached: {fname}")
-            log.log_debug(
-                f"[{os.getpid()}] process_file 2: Calling pub_to_rmq_debug")
-            pub_to_rmq_debug(
-                cfg, log, cfg.err_file_queue, cfg.err_file_queue, msg, fname)
-            log.log_debug(
-                f"[{os.getpid()}] process_file 2: Finished pub_to_rmq_debug")
-            log.log_debug(f"[{os.getpid()}] Bottom of fname_list second loop")
+        elif from_addr and hasattr(
+           cfg, "debug_address") and from_addr == cfg.debug_address:
+            log.log_info(f"[{os.getpid()}] Process debug")
+            timer.set_route("debug")
+            log.log_info(f"[{os.getpid()}] Starting seperate debug log")
+            process_debug(cfg, subj, msg, from_addr, session=session)
+            log.log_info(f"[{os.getpid()}] Closed seperate debug log")
 
-    else:
-        log.log_debug(f"[{os.getpid()}] No fname_list or subject detected")
-        log.log_warn(f"[{os.getpid()}] Invalid email subject: {subj}")
-        log.log_debug(
-            f"[{os.getpid()}] process_file: Calling connect_rmq_debug: error")
-        connect_rmq_debug(cfg, log, cfg.err_queue, cfg.err_queue, msg)
-        log.log_debug(
-            f"[{os.getpid()}] process_file: Finished connect_rmq_debug: error")
+        else:
+            log.log_info(f"[{os.getpid()}] Process attachment")
+            process_file(cfg, log, subj, msg, session=session)
 
-    log.log_debug(f"[{os.getpid()}] End of process_file_debug")
+    finally:
+        session.close()
+        STAGE_TIMER.timer = NULL_TIMER
 
+    if getattr(cfg, "stage_timing", False):
+        log.log_info(f"[{os.getpid()}] Stage timing: {timer.summary()}")
 
-def process_debug(cfg, subj, msg, from_addr):
+    if getattr(cfg, "metrics_file", None):
+        MetricsFile(cfg, log).update(timer)
 
-    """Function:  process_debug
 
-    Description:  Process for debugging.  Will determine whether to process on
-        subject, from address or attachment.
+class Profiler():
 
-    Note: A new log instance will be initiated and all debugging entries will
-        be sent to this debug log.
+    """Class:  Profiler
 
-    Arguments:
-        (input) cfg -> Configuration settings module for the program
-        (input) subj -> Email subject line
-        (input) msg -> Email message body
-        (input) from_addr -> Email From line
+    Description:  Profile of a program run with the -P option.  The run is
+        profiled with cProfile and, with the profile_memory setting, traced
+        with tracemalloc.  The .pstats file and the top allocations report
+        are written to the profile_dir directory, tagged with the process id
+        and the Message-ID of the first email processed.
+
+    Methods:
+        __init__
+        start
+        add_msg
+        tag
+        stop
+        write_memory
 
     """
 
-    log_file = os.path.join(
-        os.path.dirname(cfg.log_file),
-        "debug_" + os.path.basename(cfg.log_file))
-    date = "." + datetime.datetime.strftime(datetime.datetime.now(), "%Y%m%d")
-    log = gen_class.Logger(
-        log_file, log_file + date, "DEBUG",
-        "%(asctime)s %(levelname)s %(message)s", "%Y-%m-%dT%H:%M:%SZ")
-    log.log_info(f"[{os.getpid()}] {'=' * 80}")
-    log.log_info(
-        f"[{os.getpid()}] {cfg.host}:{cfg.exchange_name} Initialized")
-    log.log_debug(f"[{os.getpid()}] Start of debugging")
+    # Profiler of the run in progress, emails are added to it by
+    #   process_message.
+    active = None
 
-    if subj in cfg.debug_valid_queues:
-        log.log_debug(f"[{os.getpid()}] Detected valid subject: {subj}")
-        log.log_info(f"[{os.getpid()}] Valid email subject: {subj}")
-        log.log_debug(f"[{os.getpid()}] process: Calling connect_rmq_debug")
-        connect_rmq_debug(cfg, log, subj, subj, msg)
-        log.log_debug(f"[{os.getpid()}] process: Finished connect_rmq_debug")
+    def __init__(self, cfg, log):
 
-    # Change 2242.
-    ####################
-    elif subj in cfg.debug_valid_queues2:
-        log.log_debug(f"[{os.getpid()}] Detected valid subject2: {subj}")
-        log.log_info(f"[{os.getpid()}] Valid email subject2: {subj}")
-        log.log_info(
-            f"[{os.getpid()}] Looping on: {cfg.debug_valid_queues2[subj]}")
+        """Method:  __init__
 
-        for qname in cfg.debug_valid_queues2[subj]:
-            log.log_info(f"[{os.getpid()}] Publishing to: {qname}")
-            log.log_debug(
-                f"[{os.getpid()}] process: Calling connect_rmq_debug")
-            connect_rmq_debug(cfg, log, qname, qname, msg)
-            log.log_debug(
-                f"[{os.getpid()}] process: Finished connect_rmq_debug")
-    ####################
+        Description:  Initialization instance of the Profiler class.
 
-    elif from_addr and from_addr in list(cfg.debug_queue_dict.keys()):
-        log.log_debug(f"[{os.getpid()}] Detected valid from addr: {from_addr}")
-        log.log_debug(f"[{os.getpid()}] Calling process_from_debug")
-        process_from_debug(cfg, log, msg, from_addr)
-        log.log_debug(f"[{os.getpid()}] Finished process_from_debug")
+        Arguments:
+            (input) cfg -> Configuration settings module for the program
+            (input) log -> Log class instance
 
-    else:
-        log.log_debug(f"[{os.getpid()}] Processing as all others")
-        log.log_debug(f"[{os.getpid()}] Calling process_file_debug")
-        process_file_debug(cfg, log, subj, msg)
-        log.log_debug(f"[{os.getpid()}] Finished process_file_debug")
+        """
 
-    log.log_debug(f"[{os.getpid()}] End of debugging")
+        self.log = log
+        self.profile_dir = getattr(cfg, "profile_dir", None) or cfg.tmp_dir
+        self.memory = getattr(cfg, "profile_memory", False)
+        self.top = getattr(cfg, "profile_top", 25)
+        self.profile = cProfile.Profile()
+        self.snapshot = None
+        self.msg_ids = []
 
-    log.log_close()
+    def start(self):
 
+        """Method:  start
 
-def read_email(cfg, log, **kwargs):
+        Description:  Start profiling, and tracing memory allocations with
+            the profile_memory setting.
 
-    """Function:  read_email
+        Arguments:
 
-    Description:  Reads files and parses the email messages, then sends emails
-        for further processing.
+        """
 
-    Arguments:
-        (input) cfg -> Configuration settings module for the program
-        (input) log -> Log class instance
-        (input) kwargs:
-            args -> ArgParser class instance
+        Profiler.active = self
 
-    """
+        if self.memory:
+            tracemalloc.start()
+            self.snapshot = tracemalloc.take_snapshot()
 
-    log.log_info(f"[{os.getpid()}] Reading and parsing email...")
-    args = kwargs.get("args")
-    parser = Parser()
+        self.profile.enable()
 
-    for fname in args.get_val("-C"):
-        with open(fname, mode="r", encoding="UTF-8") as fhdr:
-            msg = parser.parsestr("".join(fhdr.readlines()))
-            process_message(cfg, log, msg=msg)
+    def add_msg(self, msg):
 
+        """Method:  add_msg
 
-def capture_email(cfg, log, **kwargs):                  # pylint:disable=W0613
+        Description:  Add an email processed during the profile.
 
-    """Function:  capture_email
+        Arguments:
+            (input) msg -> Email message instance
 
-    Description:  Captures the email from standard in and parses the email
-        message, before sending the email for further processing.
+        """
 
-    Arguments:
-        (input) cfg -> Configuration settings module for the program
-        (input) log -> Log class instance
-        (input) kwargs:
-            args -> ArgParser class instance
+        self.msg_ids.append(msg.get("Message-ID"))
 
-    """
+    def tag(self):
 
-    log.log_info(f"[{os.getpid()}] Capturing and parsing email...")
-    parser = Parser()
-    msg = parser.parsestr("".join(sys.stdin.readlines()))
-    process_message(cfg, log, msg=msg)
+        """Method:  tag
 
+        Description:  Return the file name tag of the profile:  the
+            Message-ID of the first email, followed by the count of the other
+            emails, or the start time if no email had a Message-ID.
 
-def process_message(cfg, log, **kwargs):
+        Arguments:
+            (output) Tag for the profile file names
 
-    """Function:  process_message
+        """
 
-    Description:  Parses email message, processes email body or attachment and
-        based on subject, from address and/or attachment, send the data to
-        queue in RabbitMQ.
+        msg_ids = [str(msg_id) for msg_id in self.msg_ids if msg_id]
 
-    Arguments:
-        (input) cfg -> Configuration settings module for the program
-        (input) log -> Log class instance
-        (input) kwargs:
-            msg -> Email Parser class instance
+        if not msg_ids:
+            return datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
 
-    """
+        tag = re.sub(r"[^\w.@-]", "_", msg_ids[0].strip().strip("<>"))[:100]
 
-    log.log_info(f"[{os.getpid()}] Get email metadata")
-    msg = kwargs.get("msg")
-    subj = gen_libs.pascalize(filter_subject(msg["subject"], cfg))
-    email_list = gen_libs.find_email_addr(msg["from"])
-    from_addr = email_list[0] if email_list else None
+        return f"{tag}+{len(self.msg_ids) - 1}" if len(self.msg_ids) > 1 \
+            else tag
 
-    if subj in cfg.valid_queues:
-        log.log_info(f"[{os.getpid()}] Process subject")
-        log.log_info(f"[{os.getpid()}] Valid email subject: {subj}")
-        connect_rmq(cfg, log, subj, subj, msg)
+    def stop(self):
 
-    elif from_addr and from_addr in list(cfg.queue_dict.keys()):
-        log.log_info(f"[{os.getpid()}] Process from address")
-        process_from(cfg, log, msg, from_addr)
+        """Method:  stop
 
-    elif from_addr and hasattr(
-       cfg, "debug_address") and from_addr == cfg.debug_address:
-        log.log_info(f"[{os.getpid()}] Process debug")
-        log.log_info(f"[{os.getpid()}] Starting seperate debug log")
-        process_debug(cfg, subj, msg, from_addr)
-        log.log_info(f"[{os.getpid()}] Closed seperate debug log")
+        Description:  Stop profiling and write the profile files.
 
-    else:
-        log.log_info(f"[{os.getpid()}] Process attachment")
-        process_file(cfg, log, subj, msg)
+        Arguments:
+
+        """
+
+        self.profile.disable()
+        Profiler.active = None
+        base = os.path.join(
+            self.profile_dir, f"mail_2_rmq.{os.getpid()}.{self.tag()}")
+        fnames = [base + ".pstats"]
+
+        try:
+            self.profile.dump_stats(fnames[0])
+
+            if self.memory:
+                fnames.append(base + ".mem.txt")
+                self.write_memory(fnames[1])
+
+        except OSError as err:
+            self.log.log_err(
+                f"[{os.getpid()}] Unable to write profile: {err}")
+
+        else:
+            self.log.log_info(
+                f"[{os.getpid()}] Profile written: {', '.join(fnames)}")
+
+        finally:
+            if tracemalloc.is_tracing():
+                tracemalloc.stop()
+
+    def write_memory(self, fname):
+
+        """Method:  write_memory
+
+        Description:  Write the current and peak traced memory and the top
+            allocations made since the profile was started.
+
+        Arguments:
+            (input) fname -> Name of the report file
+
+        """
+
+        current, peak = tracemalloc.get_traced_memory()
+        exclude = (tracemalloc.Filter(False, tracemalloc.__file__),)
+        stats = tracemalloc.take_snapshot().filter_traces(exclude).compare_to(
+            self.snapshot.filter_traces(exclude), "lineno")[:self.top]
+        lines = [f"Current: {current} bytes", f"Peak: {peak} bytes",
+                 f"Top {len(stats)} allocations:"]
+        lines.extend(str(stat) for stat in stats)
+
+        with open(fname, mode="w", encoding="UTF-8") as f_hldr:
+            f_hldr.write("\n".join(lines) + "\n")
+
+
+def open_log(cfg):
+
+    """Function:  open_log
+
+    Description:  Open the program log file.
+
+    Arguments:
+        (input) cfg -> Configuration settings module for the program
+        (output) log -> Log class instance
+
+    """
+
+    date = "." + datetime.datetime.strftime(datetime.datetime.now(), "%Y%m%d")
+
+    return gen_class.Logger(
+        cfg.log_file, cfg.log_file + date, "INFO",
+        "%(asctime)s %(levelname)s %(message)s", "%Y-%m-%dT%H:%M:%SZ")
 
 
 def run_program(args, func_dict):
@@ -1124,6 +5797,12 @@ def run_program(args, func_dict):
 
     Description:  Creates class instance and controls flow of the program.
         Create a program lock to prevent other instantiations from running.
+        A RabbitMQ connection pool is shared by all emails processed in the
+        run.  With the async_engine setting the -C, -D and -S options are run
+        on the asyncio engine.  With the wal_dir setting the write-ahead
+        spool is replayed in the background while the -D or -S option runs.
+        With the -P option the run is profiled, which is not supported on
+        the asyncio engine or with -R as their work runs in other threads.
 
     Arguments:
         (input) args -> ArgParser class instance
@@ -1134,20 +5813,70 @@ def run_program(args, func_dict):
     func_dict = dict(func_dict)
     cfg, status_flag, err_msgs = load_cfg(
         args.get_val("-c"), args.get_val("-d"))
-    date = "." + datetime.datetime.strftime(datetime.datetime.now(), "%Y%m%d")
 
-    if status_flag:
-        log = gen_class.Logger(
-            cfg.log_file, cfg.log_file + date, "INFO",
-            "%(asctime)s %(levelname)s %(message)s", "%Y-%m-%dT%H:%M:%SZ")
+    # cProfile only profiles the thread it is started in, the -R replay
+    #   threads, the -j worker processes and the asyncio engine lanes would
+    #   not be in the profile.
+    threaded = {"-R", "-C", "-D", "-S"} \
+        if getattr(cfg, "async_engine", False) else {"-R"}
+
+    if args.get_val("-j") not in (None, "1"):
+        threaded.add("-C")
+
+    if status_flag and "-P" in args.get_args_keys() \
+            and threaded & set(args.get_args_keys()):
+        print("Error:  -P can not be used with -R, -j or on the asyncio"
+              " engine, only the main thread would be profiled.")
+
+    elif status_flag:
+        log = open_log(cfg)
         log.log_info(f"[{os.getpid()}] {'=' * 80}")
         log.log_info(
             f"[{os.getpid()}] {cfg.host}:{cfg.exchange_name} Initialized")
 
-        # Intersect args_array & func_dict to find which functions to call
-        for opt in set(args.get_args_keys()) & set(func_dict.keys()):
-            func_dict[opt](cfg, log, args=args)
+        pool = RmqPool(cfg, log)
+        replayer = WalReplayer(cfg, log) if getattr(cfg, "wal_dir", None) \
+            else None
+
+        # The write-ahead spool is replayed before any new email is
+        #   published, so new emails do not overtake the spooled records.
+        #   Only the resident modes keep replaying it while they run.
+        if replayer:
+            left = replayer.run_once()
+
+            if {"-D", "-S"} & set(args.get_args_keys()):
+                replayer.start()
+
+            elif left:
+                log.log_warn(
+                    f"[{os.getpid()}] run_program: {left} records left in"
+                    f" the write-ahead spool, replayed by the next run or a"
+                    f" -D or -S process")
+
+        if getattr(cfg, "async_engine", False):
+            func_dict.update(
+                {opt: run_async_engine for opt in ["-C", "-D", "-S"]
+                 if opt in func_dict})
+
+        profiler = Profiler(cfg, log) if "-P" in args.get_args_keys() \
+            else None
+
+        if profiler:
+            profiler.start()
+
+        try:
+            # Intersect args_array & func_dict to find which functions to call
+            for opt in set(args.get_args_keys()) & set(func_dict.keys()):
+                func_dict[opt](cfg, log, args=args, pool=pool)
+
+        finally:
+            if profiler:
+                profiler.stop()
+
+        if replayer:
+            replayer.stop()
 
+        pool.close()
         log.log_close()
 
     else:
@@ -1180,11 +5909,16 @@ def main():
 
     dir_perms_chk = {"-d": 5}
     file_perm = {"-C": 4}
-    func_dict = {"-M": capture_email, "-C": read_email}
+    func_dict = {"-M": capture_email, "-C": read_email, "-D": spool_daemon,
+                 "-S": socket_server, "-R": replay_archive}
     multi_val = ["-C"]
     opt_req_list = ["-c", "-d"]
-    opt_val_list = ["-c", "-d"]
-    opt_xor_dict = {"-M": ["-C"], "-C": ["-M"]}
+    opt_val_list = ["-c", "-d", "-j", "-r"]
+    opt_xor_dict = {"-M": ["-C", "-D", "-S", "-R"],
+                    "-C": ["-M", "-D", "-S", "-R"],
+                    "-D": ["-M", "-C", "-S", "-R"],
+                    "-S": ["-M", "-C", "-D", "-R"],
+                    "-R": ["-M", "-C", "-D", "-S"]}
 
     # Process argument list from command line
     args = gen_class.ArgParser(
@@ -0,0 +1,592 @@
+#!/usr/bin/python
+# Classification (U)
+
+"""Program:  mail_2_rmq_benchmark.py
+
+    Description:  End-to-end benchmark of the mail_2_rmq.py program.
+        Generates a reproducible corpus of emails for each scenario on disk
+        and streams them through process_message, read_email and
+        capture_email against the memory publisher backend (rmq_backend =
+        "memory").  Reports messages per second over the wall clock time of
+        the run, p50 and p99 latency and peak RSS for each scenario and
+        driver, and writes the results to a JSON file to compare releases.
+
+    Usage:
+        test/benchmark/mail_2_rmq/mail_2_rmq_benchmark.py
+            [-n count] [-s seed] [-a attachments] [-l large_size]
+            [-k scenario [scenario ...]] [-o file] [-b baseline_file]
+
+    Arguments:
+        -n count => Number of emails per scenario.  Default:  100
+        -s seed => Seed of the corpus generator.  Default:  1
+        -a attachments => Number of attachments in the multipart emails.
+            Default:  3
+        -l large_size => Size in bytes of the large attachment.
+            Default:  8388608
+        -k scenario => Scenarios to run:  plain, multipart, large,
+            unroutable.  Default:  all scenarios
+        -o file => JSON results file.
+            Default:  mail_2_rmq_benchmark_{version}.json
+        -b baseline_file => JSON results file of an earlier run to compare
+            the messages per second against.
+
+        -h => Help and usage message.
+
+    Notes:
+        Run from the base directory of the program, so mail_2_rmq.py and the
+        lib and rabbit_lib libraries are found.
+
+        Each scenario and driver is run in its own process and the emails
+        are read from disk one at a time, so the peak RSS is for that run
+        only and not the size of the corpus.  The peak RSS is reported as
+        the growth over the RSS of the process once it is set up
+        (baseline_rss_kb).
+
+    Example:
+        test/benchmark/mail_2_rmq/mail_2_rmq_benchmark.py -n 500 -o new.json
+            -b old.json
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import io
+import json
+import time
+import random
+import shutil
+import datetime
+import tempfile
+import resource
+import platform
+import multiprocessing
+import email.message
+
+# Local
+sys.path.append(os.getcwd())
+import mail_2_rmq                # noqa: E402 # pylint:disable=E0401,C0413
+import version                   # noqa: E402 # pylint:disable=C0413,E0401
+
+__version__ = version.__version__
+
+SCENARIOS = ["plain", "multipart", "large", "unroutable"]
+DRIVERS = ["process_message", "read_email", "capture_email"]
+
+
+def help_message():
+
+    """Function:  help_message
+
+    Description:  Displays the program's docstring which is the help and usage
+        message when -h option is selected.
+
+    Arguments:
+
+    """
+
+    print(__doc__)
+
+
+class NullLog():
+
+    """Class:  NullLog
+
+    Description:  Log class which drops all entries, so the benchmark times
+        the email processing and not the log file.
+
+    Methods:
+        log_info
+        log_warn
+        log_err
+        log_debug
+        log_close
+
+    """
+
+    def log_info(self, data):
+
+        """Method:  log_info
+
+        Description:  Drops the entry.
+
+        Arguments:
+            (input) data -> Log entry
+
+        """
+
+    def log_warn(self, data):
+
+        """Method:  log_warn
+
+        Description:  Drops the entry.
+
+        Arguments:
+            (input) data -> Log entry
+
+        """
+
+    def log_err(self, data):
+
+        """Method:  log_err
+
+        Description:  Drops the entry.
+
+        Arguments:
+            (input) data -> Log entry
+
+        """
+
+    def log_debug(self, data):
+
+        """Method:  log_debug
+
+        Description:  Drops the entry.
+
+        Arguments:
+            (input) data -> Log entry
+
+        """
+
+    def log_close(self):
+
+        """Method:  log_close
+
+        Description:  Does nothing.
+
+        Arguments:
+
+        """
+
+
+class BenchCfg():                                       # pylint:disable=R0903
+
+    """Class:  BenchCfg
+
+    Description:  Configuration settings of the benchmark.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self, base_dir):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the BenchCfg class.
+
+        Arguments:
+            (input) base_dir -> Directory for the benchmark files
+
+        """
+
+        self.user = "BENCH"
+        self.japd = "BENCH"
+        self.host = "localhost"
+        self.port = 5672
+        self.exchange_name = "Bench"
+        self.exchange_type = "direct"
+        self.x_durable = True
+        self.q_durable = True
+        self.auto_delete = False
+        self.valid_queues = ["BenchText"]
+        self.file_queues = ["BenchFiles"]
+        self.queue_dict = {}
+        self.err_queue = "BenchErr"
+        self.err_file_queue = "BenchErrFile"
+        self.err_addr_queue = "BenchErrAddr"
+        self.subj_filter = r"\[.*\]"
+        self.attach_types = ["text/csv", "application/pdf"]
+        self.tmp_dir = os.path.join(base_dir, "tmp")
+        self.email_dir = os.path.join(base_dir, "email_dir")
+        self.log_file = os.path.join(base_dir, "mail_2_rmq.log")
+        self.rmq_backend = "memory"
+        self.memory_keep = 0
+
+
+class FileArgs():                                       # pylint:disable=R0903
+
+    """Class:  FileArgs
+
+    Description:  Arguments passed to read_email, as gen_class.ArgParser.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self, fname):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the FileArgs class.
+
+        Arguments:
+            (input) fname -> Email file name
+
+        """
+
+        self.args_array = {"-C": [fname]}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Return the value of an option.
+
+        Arguments:
+            (input) skey -> Option name
+            (input) def_val -> Default value
+            (output) Option value
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+def make_email(rand, scenario, seq, **kwargs):
+
+    """Function:  make_email
+
+    Description:  Generate one email of a scenario.
+
+    Arguments:
+        (input) rand -> random.Random instance
+        (input) scenario -> Scenario name
+        (input) seq -> Sequence number of the email
+        (input) kwargs:
+            attachments -> Number of attachments in multipart emails
+            large_size -> Size in bytes of the large attachment
+        (output) Email in bytes
+
+    """
+
+    subjects = {"plain": "BenchText", "multipart": "BenchFiles",
+                "large": "BenchFiles", "unroutable": "No Such Subject"}
+    msg = email.message.EmailMessage()
+    msg["From"] = f"sender{seq}@bench.example"
+    msg["To"] = "mailrabbit@bench.example"
+    msg["Subject"] = subjects[scenario]
+    msg["Message-ID"] = f"<{seq}.{scenario}@bench.example>"
+    msg.set_content(" ".join(
+        rand.choice(["alpha", "bravo", "charlie", "delta", "echo"])
+        for _ in range(rand.randint(50, 500))))
+
+    if scenario == "multipart":
+        for cnt in range(kwargs.get("attachments", 3)):
+            if cnt % 2:
+                msg.add_attachment(
+                    b"%PDF-1.4\n" + rand.randbytes(rand.randint(4096, 65536)),
+                    maintype="application", subtype="pdf",
+                    filename=f"file{seq}_{cnt}.pdf")
+
+            else:
+                msg.add_attachment(
+                    "\n".join(",".join(str(rand.randint(0, 99999))
+                                       for _ in range(8))
+                              for _ in range(rand.randint(100, 1000))),
+                    subtype="csv", filename=f"file{seq}_{cnt}.csv")
+
+    elif scenario == "large":
+        msg.add_attachment(
+            b"%PDF-1.4\n" + rand.randbytes(kwargs.get("large_size", 8388608)),
+            maintype="application", subtype="pdf", filename=f"large{seq}.pdf")
+
+    return msg.as_bytes()
+
+
+def make_corpus(seed, scenario, count, **kwargs):
+
+    """Function:  make_corpus
+
+    Description:  Generate the emails of a scenario one at a time.  The same
+        seed always generates the same corpus.
+
+    Arguments:
+        (input) seed -> Seed of the generator
+        (input) scenario -> Scenario name
+        (input) count -> Number of emails
+        (input) kwargs:
+            attachments -> Number of attachments in multipart emails
+            large_size -> Size in bytes of the large attachment
+        (output) Generator of emails in bytes
+
+    """
+
+    rand = random.Random(f"{seed}-{scenario}")
+
+    for seq in range(count):
+        yield make_email(rand, scenario, seq, **kwargs)
+
+
+def write_corpus(opts, scenario, corpus_dir):
+
+    """Function:  write_corpus
+
+    Description:  Write the emails of a scenario to the corpus directory, one
+        file per email, so only one email is in memory at a time.
+
+    Arguments:
+        (input) opts -> Dictionary of benchmark options
+        (input) scenario -> Scenario name
+        (input) corpus_dir -> Directory for the email files
+        (output) fnames -> List of email file names in corpus order
+
+    """
+
+    fnames = []
+
+    for seq, data in enumerate(make_corpus(
+            opts["seed"], scenario, opts["count"],
+            attachments=opts["attachments"], large_size=opts["large_size"])):
+        fname = os.path.join(corpus_dir, f"{seq:08d}.eml")
+
+        with open(fname, mode="wb") as fhdr:
+            fhdr.write(data)
+
+        fnames.append(fname)
+
+    return fnames
+
+
+def drive(cfg, log, driver, fname):
+
+    """Function:  drive
+
+    Description:  Process one email file with a driver and return the
+        seconds it took.  Only the call into mail_2_rmq.py is timed.
+
+    Arguments:
+        (input) cfg -> Configuration settings
+        (input) log -> Log class instance
+        (input) driver -> Driver name
+        (input) fname -> Email file name
+        (output) Seconds to process the email
+
+    """
+
+    if driver == "read_email":
+        start = time.perf_counter()
+        mail_2_rmq.read_email(cfg, log, args=FileArgs(fname))
+
+        return time.perf_counter() - start
+
+    with open(fname, mode="rb") as fhdr:
+        data = fhdr.read()
+
+    if driver == "process_message":
+        msg = mail_2_rmq.parse_data(data)
+        start = time.perf_counter()
+        mail_2_rmq.process_message(cfg, log, msg=msg)
+
+    else:
+        stdin = sys.stdin
+        sys.stdin = io.TextIOWrapper(io.BytesIO(data))
+        start = time.perf_counter()
+
+        try:
+            mail_2_rmq.capture_email(cfg, log)
+
+        finally:
+            sys.stdin = stdin
+
+    return time.perf_counter() - start
+
+
+def percentile(values, pct):
+
+    """Function:  percentile
+
+    Description:  Return a percentile of sorted values.
+
+    Arguments:
+        (input) values -> Sorted list of values
+        (input) pct -> Percentile from 0 to 100
+        (output) Value at the percentile
+
+    """
+
+    return values[round(pct / 100 * (len(values) - 1))] if values else 0
+
+
+def run_scenario(opts, scenario, driver, fnames, results):
+
+    """Function:  run_scenario
+
+    Description:  Run a scenario with a driver and put its results on the
+        results queue.  Runs in its own process.
+
+    Arguments:
+        (input) opts -> Dictionary of benchmark options
+        (input) scenario -> Scenario name
+        (input) driver -> Driver name
+        (input) fnames -> List of email file names of the corpus
+        (input) results -> multiprocessing.Queue for the results
+
+    """
+
+    base_dir = tempfile.mkdtemp(prefix="mail_2_rmq_bench.")
+    result = {"scenario": scenario, "driver": driver}
+
+    try:
+        cfg = BenchCfg(base_dir)
+        os.makedirs(cfg.tmp_dir)
+        os.makedirs(cfg.email_dir)
+        log = NullLog()
+        mail_2_rmq.MEMORY_STATS.clear()
+        baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        start = time.perf_counter()
+        latency = sorted(
+            drive(cfg, log, driver, fname) for fname in fnames)
+        elapsed = time.perf_counter() - start
+        result.update({
+            "messages": len(fnames),
+            "email_bytes": sum(os.path.getsize(fname) for fname in fnames),
+            "seconds": round(elapsed, 6),
+            "msgs_per_sec": round(len(fnames) / elapsed, 2)
+            if elapsed else 0,
+            "p50_ms": round(percentile(latency, 50) * 1000, 3),
+            "p99_ms": round(percentile(latency, 99) * 1000, 3),
+            "baseline_rss_kb": baseline,
+            "peak_rss_kb": resource.getrusage(
+                resource.RUSAGE_SELF).ru_maxrss - baseline,
+            "published": mail_2_rmq.MEMORY_STATS["messages"],
+            "published_bytes": mail_2_rmq.MEMORY_STATS["bytes"]})
+
+    except Exception as err:                            # pylint:disable=W0718
+        result["error"] = f"{type(err).__name__}: {err}"
+
+    finally:
+        shutil.rmtree(base_dir, ignore_errors=True)
+        results.put(result)
+
+
+def run_benchmark(opts):
+
+    """Function:  run_benchmark
+
+    Description:  Write the corpus of each scenario to disk and run the
+        scenario with each driver in its own process.
+
+    Arguments:
+        (input) opts -> Dictionary of benchmark options
+        (output) report -> Dictionary of the benchmark results
+
+    """
+
+    ctx = multiprocessing.get_context("fork")
+    report = {"version": __version__, "python": platform.python_version(),
+              "platform": platform.platform(),
+              "date": datetime.datetime.now().isoformat(timespec="seconds"),
+              "options": opts, "results": []}
+
+    for scenario in opts["scenarios"]:
+        corpus_dir = tempfile.mkdtemp(prefix="mail_2_rmq_corpus.")
+
+        try:
+            fnames = write_corpus(opts, scenario, corpus_dir)
+
+            for driver in DRIVERS:
+                results = ctx.Queue()
+                proc = ctx.Process(
+                    target=run_scenario,
+                    args=(opts, scenario, driver, fnames, results))
+                proc.start()
+                result = results.get()
+                proc.join()
+                report["results"].append(result)
+
+                if "error" in result:
+                    print(f"{scenario:<12} {driver:<16}"
+                          f" Error: {result['error']}")
+                    continue
+
+                print(f"{scenario:<12} {driver:<16}"
+                      f" {result['msgs_per_sec']:>10.2f} msg/s"
+                      f" p50 {result['p50_ms']:>9.3f} ms"
+                      f" p99 {result['p99_ms']:>9.3f} ms"
+                      f" rss +{result['peak_rss_kb']:>9} KB")
+
+        finally:
+            shutil.rmtree(corpus_dir, ignore_errors=True)
+
+    return report
+
+
+def compare(report, baseline):
+
+    """Function:  compare
+
+    Description:  Print the messages per second of each scenario and driver
+        against an earlier run.
+
+    Arguments:
+        (input) report -> Dictionary of the benchmark results
+        (input) baseline -> Dictionary of the earlier benchmark results
+
+    """
+
+    old = {(item["scenario"], item["driver"]): item
+           for item in baseline.get("results", [])}
+    print(f"Compared to version {baseline.get('version')}:")
+
+    for item in report["results"]:
+        base = old.get((item["scenario"], item["driver"]))
+
+        if base and base.get("msgs_per_sec") and "error" not in item:
+            print(f"{item['scenario']:<12} {item['driver']:<16}"
+                  f" {item['msgs_per_sec'] / base['msgs_per_sec']:>6.2f}x")
+
+
+def main():
+
+    """Function:  main
+
+    Description:  Process the command line arguments, run the benchmark and
+        write the results file.
+
+    Variables:
+        multi_val -> List of options that will have multiple values
+        opt_val_list -> contains options which require values
+
+    Arguments:
+        (input) argv -> Arguments from the command line
+
+    """
+
+    multi_val = ["-k"]
+    opt_val_list = ["-n", "-s", "-a", "-l", "-k", "-o", "-b"]
+    args = mail_2_rmq.gen_class.ArgParser(
+        sys.argv, opt_val=opt_val_list, multi_val=multi_val)
+
+    if not args.arg_parse2() \
+       or mail_2_rmq.gen_libs.help_func(args, __version__, help_message):
+        return
+
+    opts = {"count": int(args.get_val("-n", def_val=100)),
+            "seed": int(args.get_val("-s", def_val=1)),
+            "attachments": int(args.get_val("-a", def_val=3)),
+            "large_size": int(args.get_val("-l", def_val=8388608)),
+            "scenarios": [item for item in
+                          args.get_val("-k", def_val=SCENARIOS)
+                          if item in SCENARIOS]}
+    out_file = args.get_val(
+        "-o", def_val=f"mail_2_rmq_benchmark_{__version__}.json")
+    report = run_benchmark(opts)
+
+    with open(out_file, mode="w", encoding="UTF-8") as fhdr:
+        json.dump(report, fhdr, indent=4)
+
+    print(f"Results written to: {out_file}")
+
+    if args.get_val("-b"):
+        with open(args.get_val("-b"), mode="r", encoding="UTF-8") as fhdr:
+            compare(report, json.load(fhdr))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,18 @@
+#!/bin/bash
+# Unit test code coverage for mail_2_client module.
+# This will run the Python code coverage module against all unit test modules.
+# This will show the amount of code that was tested and which lines of code
+#	that was skipped during the test.
+
+coverage erase
+
+echo ""
+echo "Running unit test modules in conjunction with coverage"
+coverage run -a --source=mail_2_client test/unit/mail_2_client/main.py
+coverage run -a --source=mail_2_client test/unit/mail_2_client/spool_drop.py
+coverage run -a --source=mail_2_client test/unit/mail_2_client/sock_send.py
+
+echo ""
+echo "Producing code coverage report"
+coverage combine
+coverage report -m
@@ -0,0 +1,213 @@
+# Classification (U)
+
+"""Program:  main.py
+
+    Description:  Unit testing of main in mail_2_client.py.
+
+    Usage:
+        test/unit/mail_2_client/main.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mail_2_client                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=C0413,E0401
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_help
+        test_missing_spool
+        test_missing_pipe
+        test_spooled
+        test_spool_failed
+        test_both_modes
+        test_sock_sent
+        test_sock_rejected
+        test_sock_failed
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.argv = ["mail_2_client.py", "-s", "/spool", "-M"]
+        self.argv2 = ["mail_2_client.py", "-u", "/path/sock", "-M"]
+
+    @mock.patch("mail_2_client.help_message", mock.Mock(return_value=True))
+    def test_help(self):
+
+        """Function:  test_help
+
+        Description:  Test with help option.
+
+        Arguments:
+
+        """
+
+        with mock.patch.object(sys, "argv", ["mail_2_client.py", "-h"]):
+            self.assertEqual(mail_2_client.main(), mail_2_client.EX_OK)
+
+    @mock.patch("mail_2_client.sys.stderr", mock.Mock())
+    def test_missing_spool(self):
+
+        """Function:  test_missing_spool
+
+        Description:  Test with missing spool directory value.
+
+        Arguments:
+
+        """
+
+        with mock.patch.object(sys, "argv", ["mail_2_client.py", "-M", "-s"]):
+            self.assertEqual(mail_2_client.main(), mail_2_client.EX_USAGE)
+
+    @mock.patch("mail_2_client.sys.stderr", mock.Mock())
+    def test_missing_pipe(self):
+
+        """Function:  test_missing_pipe
+
+        Description:  Test with missing -M option.
+
+        Arguments:
+
+        """
+
+        with mock.patch.object(sys, "argv", self.argv[:3]):
+            self.assertEqual(mail_2_client.main(), mail_2_client.EX_USAGE)
+
+    @mock.patch("mail_2_client.sys.stdin", mock.Mock())
+    @mock.patch("mail_2_client.spool_drop")
+    def test_spooled(self, mock_drop):
+
+        """Function:  test_spooled
+
+        Description:  Test with email spooled.
+
+        Arguments:
+
+        """
+
+        mock_drop.return_value = "/spool/new/1.1.eml"
+
+        with mock.patch.object(sys, "argv", self.argv):
+            self.assertEqual(mail_2_client.main(), mail_2_client.EX_OK)
+
+    @mock.patch("mail_2_client.sys.stderr", mock.Mock())
+    @mock.patch("mail_2_client.sys.stdin", mock.Mock())
+    @mock.patch("mail_2_client.spool_drop")
+    def test_spool_failed(self, mock_drop):
+
+        """Function:  test_spool_failed
+
+        Description:  Test with spool failure, so mail system will retry.
+
+        Arguments:
+
+        """
+
+        mock_drop.side_effect = OSError("Disk full")
+
+        with mock.patch.object(sys, "argv", self.argv):
+            self.assertEqual(
+                mail_2_client.main(), mail_2_client.EX_TEMPFAIL)
+
+    @mock.patch("mail_2_client.sys.stderr", mock.Mock())
+    def test_both_modes(self):
+
+        """Function:  test_both_modes
+
+        Description:  Test with both -s and -u options.
+
+        Arguments:
+
+        """
+
+        with mock.patch.object(sys, "argv", self.argv + ["-u", "/path/sock"]):
+            self.assertEqual(mail_2_client.main(), mail_2_client.EX_USAGE)
+
+    @mock.patch("mail_2_client.sys.stdin", mock.Mock())
+    @mock.patch("mail_2_client.sock_send")
+    def test_sock_sent(self, mock_send):
+
+        """Function:  test_sock_sent
+
+        Description:  Test with email acknowledged by the server.
+
+        Arguments:
+
+        """
+
+        mock_send.return_value = (True, "OK")
+
+        with mock.patch.object(sys, "argv", self.argv2):
+            self.assertEqual(mail_2_client.main(), mail_2_client.EX_OK)
+
+    @mock.patch("mail_2_client.sys.stderr", mock.Mock())
+    @mock.patch("mail_2_client.sys.stdin", mock.Mock())
+    @mock.patch("mail_2_client.sock_send")
+    def test_sock_rejected(self, mock_send):
+
+        """Function:  test_sock_rejected
+
+        Description:  Test with email not accepted by the server.
+
+        Arguments:
+
+        """
+
+        mock_send.return_value = (False, "ERR Error Message")
+
+        with mock.patch.object(sys, "argv", self.argv2):
+            self.assertEqual(
+                mail_2_client.main(), mail_2_client.EX_TEMPFAIL)
+
+    @mock.patch("mail_2_client.sys.stderr", mock.Mock())
+    @mock.patch("mail_2_client.sys.stdin", mock.Mock())
+    @mock.patch("mail_2_client.sock_send")
+    def test_sock_failed(self, mock_send):
+
+        """Function:  test_sock_failed
+
+        Description:  Test with server not running, so mail system will
+            retry.
+
+        Arguments:
+
+        """
+
+        mock_send.side_effect = ConnectionRefusedError("Connection refused")
+
+        with mock.patch.object(sys, "argv", self.argv2):
+            self.assertEqual(
+                mail_2_client.main(), mail_2_client.EX_TEMPFAIL)
+
+
+if __name__ == "__main__":
+    unittest.main()
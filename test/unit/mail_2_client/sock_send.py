@@ -0,0 +1,156 @@
+# Classification (U)
+
+"""Program:  sock_send.py
+
+    Description:  Unit testing of sock_send in mail_2_client.py.
+
+    Usage:
+        test/unit/mail_2_client/sock_send.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import io
+import shutil
+import socket
+import tempfile
+import threading
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mail_2_client                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=C0413,E0401
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        serve
+        test_sock_send
+        test_sock_rejected
+        test_no_server
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.mkdtemp()
+        self.sock_file = os.path.join(self.tmp_dir, "mail_2_rmq.sock")
+        self.raw_msg = b"From: name@domain\nSubject: Queue1\n\nBody \xff\n"
+        self.received = []
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.tmp_dir)
+
+    def serve(self, reply):
+
+        """Function:  serve
+
+        Description:  Start a one request socket server in a thread.
+
+        Arguments:
+
+        """
+
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(self.sock_file)
+        server.listen(1)
+
+        def handle():
+            conn, _ = server.accept()
+
+            with conn:
+                self.received.append(
+                    b"".join(iter(lambda: conn.recv(1024), b"")))
+                conn.sendall(reply)
+
+            server.close()
+
+        thr = threading.Thread(target=handle)
+        thr.start()
+
+        return thr
+
+    def test_sock_send(self):
+
+        """Function:  test_sock_send
+
+        Description:  Test email is streamed and acknowledged.
+
+        Arguments:
+
+        """
+
+        thr = self.serve(b"OK\n")
+        status = mail_2_client.sock_send(
+            self.sock_file, io.BytesIO(self.raw_msg))
+        thr.join()
+
+        self.assertEqual(
+            (status, self.received), ((True, "OK"), [self.raw_msg]))
+
+    def test_sock_rejected(self):
+
+        """Function:  test_sock_rejected
+
+        Description:  Test email not accepted by the server.
+
+        Arguments:
+
+        """
+
+        thr = self.serve(b"ERR Error Message\n")
+        status = mail_2_client.sock_send(
+            self.sock_file, io.BytesIO(self.raw_msg))
+        thr.join()
+
+        self.assertEqual(status, (False, "ERR Error Message"))
+
+    def test_no_server(self):
+
+        """Function:  test_no_server
+
+        Description:  Test with no server listening on the socket.
+
+        Arguments:
+
+        """
+
+        with self.assertRaises(OSError):
+            mail_2_client.sock_send(self.sock_file, io.BytesIO(self.raw_msg))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,155 @@
+# Classification (U)
+
+"""Program:  spool_drop.py
+
+    Description:  Unit testing of spool_drop in mail_2_client.py.
+
+    Usage:
+        test/unit/mail_2_client/spool_drop.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import io
+import shutil
+import tempfile
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mail_2_client                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=C0413,E0401
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_spool_drop
+        test_tmp_cleared
+        test_rename_failed
+        test_file_mode
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.spool_dir = tempfile.mkdtemp()
+        os.mkdir(os.path.join(self.spool_dir, "tmp"))
+        os.mkdir(os.path.join(self.spool_dir, "new"))
+        self.raw_msg = b"From: name@domain\nSubject: Queue1\n\nBody \xff\n"
+
+    def test_spool_drop(self):
+
+        """Function:  test_spool_drop
+
+        Description:  Test email is dropped into the spool new directory.
+
+        Arguments:
+
+        """
+
+        f_name = mail_2_client.spool_drop(
+            self.spool_dir, io.BytesIO(self.raw_msg))
+
+        with open(f_name, mode="rb") as f_hdlr:
+            data = f_hdlr.read()
+
+        self.assertEqual(
+            (os.path.dirname(f_name), data),
+            (os.path.join(self.spool_dir, "new"), self.raw_msg))
+
+    def test_tmp_cleared(self):
+
+        """Function:  test_tmp_cleared
+
+        Description:  Test nothing is left in the spool tmp directory.
+
+        Arguments:
+
+        """
+
+        mail_2_client.spool_drop(self.spool_dir, io.BytesIO(self.raw_msg))
+
+        self.assertEqual(
+            os.listdir(os.path.join(self.spool_dir, "tmp")), [])
+
+    @mock.patch("mail_2_client.os.rename")
+    def test_rename_failed(self, mock_rename):
+
+        """Function:  test_rename_failed
+
+        Description:  Test partial file is removed if the rename fails.
+
+        Arguments:
+
+        """
+
+        mock_rename.side_effect = OSError("Rename failed")
+
+        with self.assertRaises(OSError):
+            mail_2_client.spool_drop(
+                self.spool_dir, io.BytesIO(self.raw_msg))
+
+        self.assertEqual(
+            os.listdir(os.path.join(self.spool_dir, "tmp")), [])
+
+    def test_file_mode(self):
+
+        """Function:  test_file_mode
+
+        Description:  Test the spool file is group readable with a
+            restrictive umask.
+
+        Arguments:
+
+        """
+
+        umask = os.umask(0o077)
+
+        try:
+            f_name = mail_2_client.spool_drop(
+                self.spool_dir, io.BytesIO(self.raw_msg))
+
+        finally:
+            os.umask(umask)
+
+        self.assertEqual(os.stat(f_name).st_mode & 0o777, 0o640)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.spool_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,9 @@
+#!/bin/bash
+# Unit testing program for the mail_2_client.py program.
+# This will run all the units tests for this program and clean it up.
+# Will need to run this from the base directory where the class file 
+#   is located at.
+
+/usr/bin/python test/unit/mail_2_client/main.py
+/usr/bin/python test/unit/mail_2_client/spool_drop.py
+/usr/bin/python test/unit/mail_2_client/sock_send.py
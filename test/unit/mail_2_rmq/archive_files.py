@@ -0,0 +1,157 @@
+# Classification (U)
+
+"""Program:  archive_files.py
+
+    Description:  Unit testing of archive_files in mail_2_rmq.py.
+
+    Usage:
+        test/unit/mail_2_rmq/archive_files.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mail_2_rmq                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=C0413,E0401
+
+__version__ = version.__version__
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.exchange_name = "EXCHANGE-NAME"
+        self.email_dir = "EMAIL_DIRECTORY"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_queue_name
+        test_order
+        test_other_files
+        test_other_exchange
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+        self.log = mock.Mock()
+
+    @mock.patch("mail_2_rmq.os.listdir")
+    def test_queue_name(self, mock_list):
+
+        """Function:  test_queue_name
+
+        Description:  Test the queue name is taken from the file name.
+
+        Arguments:
+
+        """
+
+        mock_list.return_value = [
+            "EXCHANGE-NAME-Err-Queue-20260101-101010.1234.1.email.txt"]
+
+        self.assertEqual(
+            mail_2_rmq.archive_files(self.cfg, self.log),
+            [(os.path.join(self.cfg.email_dir, mock_list.return_value[0]),
+              "Err-Queue")])
+
+    @mock.patch("mail_2_rmq.os.listdir")
+    def test_order(self, mock_list):
+
+        """Function:  test_order
+
+        Description:  Test the archives are returned oldest first.
+
+        Arguments:
+
+        """
+
+        mock_list.return_value = [
+            "EXCHANGE-NAME-Q1-20260101-101011.email.txt",
+            "EXCHANGE-NAME-Q2-20260101-101010.99.10.email.txt",
+            "EXCHANGE-NAME-Q3-20260101-101010.99.9.email.txt"]
+
+        self.assertEqual(
+            [qname for _, qname in mail_2_rmq.archive_files(
+                self.cfg, self.log)], ["Q3", "Q2", "Q1"])
+
+    @mock.patch("mail_2_rmq.os.listdir")
+    def test_other_files(self, mock_list):
+
+        """Function:  test_other_files
+
+        Description:  Test files which are not archives are skipped.
+
+        Arguments:
+
+        """
+
+        mock_list.return_value = ["replayed", "notes.txt",
+                                  "EXCHANGE-NAME-Q1-2026.email.txt"]
+
+        self.assertEqual(mail_2_rmq.archive_files(self.cfg, self.log), [])
+
+    @mock.patch("mail_2_rmq.os.listdir")
+    def test_other_exchange(self, mock_list):
+
+        """Function:  test_other_exchange
+
+        Description:  Test archives for another exchange are skipped.
+
+        Arguments:
+
+        """
+
+        mock_list.return_value = ["OTHER-Q1-20260101-101010.email.txt"]
+
+        self.assertEqual(
+            (mail_2_rmq.archive_files(self.cfg, self.log),
+             self.log.log_warn.call_count), ([], 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,300 @@
+# Classification (U)
+
+"""Program:  archive_replay.py
+
+    Description:  Unit testing of ArchiveReplay in mail_2_rmq.py.
+
+    Usage:
+        test/unit/mail_2_rmq/archive_replay.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import shutil
+import tempfile
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mail_2_rmq                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=C0413,E0401
+
+__version__ = version.__version__
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.host = "HOSTNAME"
+        self.exchange_name = "EXCHANGE_NAME"
+        self.email_dir = None
+        self.tmp_dir = None
+        self.err_queue = "ERROR_QUEUE"
+        self.valid_queues = ["Queue1"]
+        self.file_queues = ["FileQueue1"]
+        self.queue_dict = {"alice@partner.example": "AliceQueue"}
+        self.err_file_queue = "ERROR_FILE_QUEUE"
+        self.attach_types = ["application/pdf"]
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        archive
+        test_replay_move
+        test_replay_delete
+        test_broker_down
+        test_publish_failed
+        test_attachment
+        test_sender_attachment
+        test_confirm
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+        self.cfg.email_dir = tempfile.mkdtemp()
+        self.cfg.tmp_dir = self.cfg.email_dir
+        self.log = mock.Mock()
+        self.session = mock.Mock()
+        self.session.confirm = None
+        self.session.is_open.return_value = True
+        self.published = []
+        self.session.get_rmq.return_value.publish_msg.side_effect = \
+            lambda body: self.published.append(body) or True
+        self.session.get_rmq.return_value.queue_name = "Queue1"
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.cfg.email_dir)
+
+    def archive(self, qname, body, cnt=1):
+
+        """Function:  archive
+
+        Description:  Write an archived email.
+
+        Arguments:
+
+        """
+
+        fname = os.path.join(
+            self.cfg.email_dir,
+            f"EXCHANGE_NAME-{qname}-20260101-101010.1.{cnt}.email.txt")
+
+        with open(fname, mode="w", encoding="UTF-8") as f_hldr:
+            f_hldr.write(body)
+
+        return fname, qname
+
+    @mock.patch("mail_2_rmq.RmqSession")
+    def test_replay_move(self, mock_session):
+
+        """Function:  test_replay_move
+
+        Description:  Test the emails are published and moved to the
+            replayed directory.
+
+        Arguments:
+
+        """
+
+        mock_session.return_value = self.session
+        archives = [self.archive("Queue1", "Subject: Q1\n\nBody1\n", 1),
+                    self.archive("Queue1", "Subject: Q1\n\nBody2\n", 2)]
+        counts = mail_2_rmq.ArchiveReplay(
+            self.cfg, self.log, workers=1).run(archives)
+
+        self.assertEqual(
+            (counts["replayed"], counts["left"], self.published,
+             sorted(os.listdir(os.path.join(self.cfg.email_dir, "replayed")))),
+            (2, 0, ["Body1\n", "Body2\n"],
+             sorted(os.path.basename(fname) for fname, _ in archives)))
+
+    @mock.patch("mail_2_rmq.RmqSession")
+    def test_replay_delete(self, mock_session):
+
+        """Function:  test_replay_delete
+
+        Description:  Test the replayed emails are deleted.
+
+        Arguments:
+
+        """
+
+        mock_session.return_value = self.session
+        archives = [self.archive("Queue1", "Subject: Q1\n\nBody1\n")]
+        mail_2_rmq.ArchiveReplay(
+            self.cfg, self.log, workers=2, delete=True).run(archives)
+
+        self.assertEqual(os.listdir(self.cfg.email_dir), [])
+
+    @mock.patch("mail_2_rmq.RmqSession")
+    def test_broker_down(self, mock_session):
+
+        """Function:  test_broker_down
+
+        Description:  Test the worker stops when RabbitMQ is not available.
+
+        Arguments:
+
+        """
+
+        self.session.is_open.return_value = False
+        mock_session.return_value = self.session
+        archives = [self.archive("Queue1", "Subject: Q1\n\nBody1\n", 1),
+                    self.archive("Queue1", "Subject: Q1\n\nBody2\n", 2)]
+        counts = mail_2_rmq.ArchiveReplay(
+            self.cfg, self.log, workers=1).run(archives)
+
+        self.assertEqual(
+            (counts["failed"], counts["left"],
+             len(os.listdir(self.cfg.email_dir))), (1, 1, 3))
+
+    @mock.patch("mail_2_rmq.RmqSession")
+    def test_publish_failed(self, mock_session):
+
+        """Function:  test_publish_failed
+
+        Description:  Test a failed publish leaves the email in place.
+
+        Arguments:
+
+        """
+
+        self.session.get_rmq.return_value.publish_msg.side_effect = None
+        self.session.get_rmq.return_value.publish_msg.return_value = False
+        mock_session.return_value = self.session
+        fname, qname = self.archive("Queue1", "Subject: Q1\n\nBody1\n")
+        counts = mail_2_rmq.ArchiveReplay(
+            self.cfg, self.log, workers=1).run([(fname, qname)])
+
+        self.assertEqual(
+            (counts["failed"], os.path.exists(fname)), (1, True))
+
+    @mock.patch("mail_2_rmq.process_attach")
+    @mock.patch("mail_2_rmq.RmqSession")
+    def test_attachment(self, mock_session, mock_attach):
+
+        """Function:  test_attachment
+
+        Description:  Test the attachments are published to a file queue.
+
+        Arguments:
+
+        """
+
+        attach = os.path.join(self.cfg.tmp_dir, "file.pdf.encoded")
+
+        with open(attach, mode="w", encoding="UTF-8") as f_hldr:
+            f_hldr.write("RGF0YQ==")
+
+        mock_attach.return_value = [
+            mail_2_rmq.Attachment("file.pdf", path=attach)]
+        mock_session.return_value = self.session
+        archives = [self.archive("FileQueue1", "Subject: F1\n\nBody1\n")]
+        counts = mail_2_rmq.ArchiveReplay(
+            self.cfg, self.log, workers=1, delete=True).run(archives)
+
+        self.assertEqual(
+            (counts["replayed"], self.published, os.path.exists(attach)),
+            (1, [str({"AFilename": "file.pdf", "File": "RGF0YQ=="})], False))
+
+    @mock.patch("mail_2_rmq.RmqSession")
+    def test_sender_attachment(self, mock_session):
+
+        """Function:  test_sender_attachment
+
+        Description:  Test the attachments are published to a sender queue.
+
+        Arguments:
+
+        """
+
+        mock_session.return_value = self.session
+        archives = [self.archive(
+            "AliceQueue",
+            "From: alice@partner.example\nSubject: Report\n"
+            "MIME-Version: 1.0\n"
+            "Content-Type: multipart/mixed; boundary=BND\n\n"
+            "--BND\nContent-Type: text/plain\n\nhello body\n"
+            "--BND\nContent-Type: application/pdf\n"
+            "Content-Disposition: attachment; filename=file.pdf\n"
+            "Content-Transfer-Encoding: base64\n\nRGF0YQ==\n--BND--\n")]
+        counts = mail_2_rmq.ArchiveReplay(
+            self.cfg, self.log, workers=1, delete=True).run(archives)
+
+        self.assertEqual(
+            (counts["replayed"], self.published),
+            (1, [str({"AFilename": "file.pdf", "File": "RGF0YQ==\n"})]))
+
+    @mock.patch("mail_2_rmq.RmqSession")
+    def test_confirm(self, mock_session):
+
+        """Function:  test_confirm
+
+        Description:  Test the emails are published with publisher confirms.
+
+        Arguments:
+
+        """
+
+        self.session.confirm = mock.Mock()
+        mock_session.return_value = self.session
+        archives = [self.archive("Queue1", "Subject: Q1\n\nBody1\n")]
+        mail_2_rmq.ArchiveReplay(self.cfg, self.log, workers=1).run(archives)
+
+        self.assertEqual(
+            self.session.confirm.publish.call_args[0][0], "Body1\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
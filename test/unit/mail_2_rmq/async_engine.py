@@ -0,0 +1,410 @@
+# Classification (U)
+
+"""Program:  async_engine.py
+
+    Description:  Unit testing of AsyncEngine in mail_2_rmq.py.
+
+    Usage:
+        test/unit/mail_2_rmq/async_engine.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import time
+import shutil
+import asyncio
+import tempfile
+import threading
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mail_2_rmq                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=C0413,E0401
+
+__version__ = version.__version__
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.host = "HOSTNAME"
+        self.exchange_name = "EXCHANGE_NAME"
+        self.async_workers = 2
+        self.spool_interval = 0.01
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        process
+        serve
+        test_files
+        test_file_failed
+        test_bounded
+        test_lane_pools
+        test_spool
+        test_socket
+        test_socket_failed
+        test_socket_stage_timing
+        test_read_chunks
+        test_run_pool
+        test_close
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+        self.log = mock.Mock()
+        self.tmp_dir = tempfile.mkdtemp()
+        self.engine = mail_2_rmq.AsyncEngine(self.cfg, self.log)
+        self.raw_msg = b"From: name@domain\nSubject: Queue1\n\nBody\n"
+        self.busy = [0, 0]
+        self.lock = threading.Lock()
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.engine.close()
+        shutil.rmtree(self.tmp_dir)
+
+    def process(self, cfg, log, **kwargs):               # pylint:disable=W0613
+
+        """Function:  process
+
+        Description:  Stand in for process_message which records the number
+            of emails processed at once.
+
+        Arguments:
+
+        """
+
+        with self.lock:
+            self.busy[0] += 1
+            self.busy[1] = max(self.busy)
+
+        time.sleep(0.02)
+
+        with self.lock:
+            self.busy[0] -= 1
+
+    async def serve(self, data):
+
+        """Function:  serve
+
+        Description:  Start the socket source, send it an email and stop it.
+
+        Arguments:
+
+        """
+
+        self.engine.free = asyncio.Queue()
+        self.engine.stop = asyncio.Event()
+
+        for lane in self.engine.lanes:
+            self.engine.free.put_nowait(lane)
+
+        task = asyncio.ensure_future(self.engine.socket_source())
+
+        while not os.path.exists(self.cfg.sock_file):
+            await asyncio.sleep(0.01)
+
+        reader, writer = await asyncio.open_unix_connection(
+            self.cfg.sock_file)
+        writer.write(data)
+        writer.write_eof()
+        reply = await reader.read()
+        writer.close()
+        self.engine.stop.set()
+        await task
+
+        return reply
+
+    @mock.patch("mail_2_rmq.parse_file", mock.Mock(side_effect=str))
+    @mock.patch("mail_2_rmq.process_message")
+    def test_files(self, mock_process):
+
+        """Function:  test_files
+
+        Description:  Test all files are processed.
+
+        Arguments:
+
+        """
+
+        asyncio.run(self.engine.run(["/path/file1", "/path/file2"]))
+
+        self.assertEqual(
+            sorted(call[1]["msg"] for call in mock_process.call_args_list),
+            ["/path/file1", "/path/file2"])
+
+    @mock.patch("mail_2_rmq.parse_file")
+    @mock.patch("mail_2_rmq.process_message")
+    def test_file_failed(self, mock_process, mock_parse):
+
+        """Function:  test_file_failed
+
+        Description:  Test a failed file does not stop the other files.
+
+        Arguments:
+
+        """
+
+        mock_parse.side_effect = [OSError("Missing"), "Email"]
+        asyncio.run(self.engine.run(["/path/file1", "/path/file2"]))
+
+        self.assertEqual(
+            (mock_process.call_count, self.log.log_err.call_count), (1, 1))
+
+    @mock.patch("mail_2_rmq.parse_file", mock.Mock(side_effect=str))
+    def test_bounded(self):
+
+        """Function:  test_bounded
+
+        Description:  Test no more than async_workers emails are processed
+            at once.
+
+        Arguments:
+
+        """
+
+        with mock.patch("mail_2_rmq.process_message", self.process):
+            asyncio.run(self.engine.run([f"/path/file{cnt}"
+                                         for cnt in range(8)]))
+
+        self.assertEqual(self.busy, [0, 2])
+
+    @mock.patch("mail_2_rmq.parse_file", mock.Mock(side_effect=str))
+    @mock.patch("mail_2_rmq.process_message")
+    def test_lane_pools(self, mock_process):
+
+        """Function:  test_lane_pools
+
+        Description:  Test emails are processed with the lane connection
+            pools.
+
+        Arguments:
+
+        """
+
+        asyncio.run(self.engine.run(["/path/file1", "/path/file2"]))
+
+        self.assertTrue(
+            {call[1]["pool"] for call in mock_process.call_args_list}
+            <= {pool for _, pool in self.engine.lanes})
+
+    @mock.patch("mail_2_rmq.process_spool")
+    def test_spool(self, mock_spool):
+
+        """Function:  test_spool
+
+        Description:  Test spool files are processed once each.
+
+        Arguments:
+
+        """
+
+        self.cfg.spool_dir = self.tmp_dir
+        new_dir = os.path.join(self.tmp_dir, "new")
+        os.mkdir(new_dir)
+
+        for fname in ["1.1.eml", "2.1.eml"]:
+            with open(os.path.join(new_dir, fname), mode="wb") as f_hdlr:
+                f_hdlr.write(self.raw_msg)
+
+        def spool(cfg, log, fname, **kwargs):           # pylint:disable=W0613
+            os.remove(fname)
+
+        async def run():
+            self.engine.stop = asyncio.Event()
+            self.engine.free = asyncio.Queue()
+
+            for lane in self.engine.lanes:
+                self.engine.free.put_nowait(lane)
+
+            task = asyncio.ensure_future(self.engine.spool_source())
+
+            while os.listdir(new_dir):
+                await asyncio.sleep(0.01)
+
+            self.engine.stop.set()
+            await task
+
+        mock_spool.side_effect = spool
+        asyncio.run(run())
+
+        self.assertEqual(
+            sorted(os.path.basename(call[0][2])
+                   for call in mock_spool.call_args_list),
+            ["1.1.eml", "2.1.eml"])
+
+    @mock.patch("mail_2_rmq.process_message")
+    def test_socket(self, mock_process):
+
+        """Function:  test_socket
+
+        Description:  Test an email received on the socket is processed and
+            acknowledged.
+
+        Arguments:
+
+        """
+
+        self.cfg.sock_file = os.path.join(self.tmp_dir, "mail_2_rmq.sock")
+        reply = asyncio.run(self.serve(self.raw_msg))
+
+        self.assertEqual(
+            (reply, mock_process.call_args[1]["msg"]["subject"],
+             os.path.exists(self.cfg.sock_file)), (b"OK\n", "Queue1", False))
+
+    @mock.patch("mail_2_rmq.process_message")
+    def test_socket_failed(self, mock_process):
+
+        """Function:  test_socket_failed
+
+        Description:  Test a failed email is reported back to the client.
+
+        Arguments:
+
+        """
+
+        self.cfg.sock_file = os.path.join(self.tmp_dir, "mail_2_rmq.sock")
+        mock_process.side_effect = ValueError("Error Message")
+
+        self.assertEqual(
+            asyncio.run(self.serve(self.raw_msg)), b"ERR Error Message\n")
+
+    @mock.patch("mail_2_rmq.process_message")
+    def test_socket_stage_timing(self, mock_process):
+
+        """Function:  test_socket_stage_timing
+
+        Description:  Test the stage timer is started before the email is
+            parsed in the lane.
+
+        Arguments:
+
+        """
+
+        self.cfg.sock_file = os.path.join(self.tmp_dir, "mail_2_rmq.sock")
+        self.cfg.stage_timing = True
+        asyncio.run(self.serve(self.raw_msg))
+        timer = mock_process.call_args[1]["timer"]
+
+        self.assertEqual(
+            ("parse" in timer.stages, timer.counts["email_bytes"]),
+            (True, len(self.raw_msg)))
+
+    @mock.patch("mail_2_rmq.CHUNK_SIZE", 8)
+    def test_read_chunks(self):
+
+        """Function:  test_read_chunks
+
+        Description:  Test a socket email is fed to the parser in fixed size
+            chunks.
+
+        Arguments:
+
+        """
+
+        reader = mock.Mock()
+        reader.read = mock.AsyncMock(side_effect=[
+            self.raw_msg[cnt:cnt + 8]
+            for cnt in range(0, len(self.raw_msg), 8)] + [b""])
+        parser, size = asyncio.run(self.engine.read_client(reader))
+
+        self.assertEqual(
+            (parser.close()["subject"], size,
+             {call[0][0] for call in reader.read.call_args_list}),
+            ("Queue1", len(self.raw_msg), {8}))
+
+    def test_run_pool(self):
+
+        """Function:  test_run_pool
+
+        Description:  Test the connection pool of the run is used by the
+            first lane.
+
+        Arguments:
+
+        """
+
+        pool = mock.Mock()
+        engine = mail_2_rmq.AsyncEngine(self.cfg, self.log, pool=pool)
+        lane_pools = [lane_pool for _, lane_pool in engine.lanes]
+        engine.close()
+
+        self.assertEqual(
+            (lane_pools[0], pool.close.call_count,
+             isinstance(lane_pools[1], mail_2_rmq.RmqPool)), (pool, 1, True))
+
+    def test_close(self):
+
+        """Function:  test_close
+
+        Description:  Test the lane connection pools are closed.
+
+        Arguments:
+
+        """
+
+        pools = [mock.Mock(), mock.Mock()]
+        self.engine.lanes = [
+            (executor, pool) for (executor, _), pool
+            in zip(self.engine.lanes, pools)]
+        self.engine.close()
+        self.engine.lanes = []
+
+        self.assertEqual(
+            [pool.close.call_count for pool in pools], [1, 1])
+
+
+if __name__ == "__main__":
+    unittest.main()
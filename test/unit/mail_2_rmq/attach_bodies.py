@@ -0,0 +1,151 @@
+# Classification (U)
+
+"""Program:  attach_bodies.py
+
+    Description:  Unit testing of attach_bodies in mail_2_rmq.py.
+
+    Usage:
+        test/unit/mail_2_rmq/attach_bodies.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import types
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mail_2_rmq                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=C0413,E0401
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_chunk_size
+        test_below_chunk_size
+        test_above_chunk_size
+        test_binary
+        test_binary_chunks
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = types.SimpleNamespace(err_queue="ERROR_QUEUE")
+        self.rmq = types.SimpleNamespace(queue_name="FileQueue1")
+        self.log = mock.Mock()
+        self.attach = mail_2_rmq.Attachment("File.pdf", data="RGF0YQ==\n")
+        self.body = str({"AFilename": "File.pdf", "File": "RGF0YQ==\n"})
+
+    def test_no_chunk_size(self):
+
+        """Function:  test_no_chunk_size
+
+        Description:  Test one body without the chunk_size setting.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mail_2_rmq.attach_bodies(
+                self.rmq, self.log, self.cfg, None, self.attach),
+            [(self.body, {})])
+
+    def test_below_chunk_size(self):
+
+        """Function:  test_below_chunk_size
+
+        Description:  Test one body for an attachment within chunk_size.
+
+        Arguments:
+
+        """
+
+        self.cfg.chunk_size = 9
+
+        self.assertEqual(
+            mail_2_rmq.attach_bodies(
+                self.rmq, self.log, self.cfg, None, self.attach),
+            [(self.body, {})])
+
+    def test_above_chunk_size(self):
+
+        """Function:  test_above_chunk_size
+
+        Description:  Test chunks for an attachment above chunk_size.
+
+        Arguments:
+
+        """
+
+        self.cfg.chunk_size = 8
+
+        self.assertEqual(
+            len(list(mail_2_rmq.attach_bodies(
+                self.rmq, self.log, self.cfg, None, self.attach))), 2)
+
+    def test_binary(self):
+
+        """Function:  test_binary
+
+        Description:  Test one raw body for a binary attachment.
+
+        Arguments:
+
+        """
+
+        attach = mail_2_rmq.Attachment(
+            "File.pdf", data=b"Data", binary=True,
+            content_type="application/pdf")
+        bodies = list(mail_2_rmq.attach_bodies(
+            self.rmq, self.log, self.cfg, {}, attach))
+
+        self.assertEqual(
+            (len(bodies), bodies[0][0], bodies[0][1]["content_type"]),
+            (1, b"Data", "application/pdf"))
+
+    def test_binary_chunks(self):
+
+        """Function:  test_binary_chunks
+
+        Description:  Test raw chunks for a binary attachment above
+            chunk_size.
+
+        Arguments:
+
+        """
+
+        self.cfg.chunk_size = 3
+        attach = mail_2_rmq.Attachment("File.pdf", data=b"Data", binary=True)
+        bodies = list(mail_2_rmq.attach_bodies(
+            self.rmq, self.log, self.cfg, {}, attach))
+
+        self.assertEqual([body for body, _ in bodies], [b"Dat", b"a"])
+
+
+if __name__ == "__main__":
+    unittest.main()
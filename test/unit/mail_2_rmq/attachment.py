@@ -0,0 +1,189 @@
+# Classification (U)
+
+"""Program:  attachment.py
+
+    Description:  Unit testing of Attachment in mail_2_rmq.py.
+
+    Usage:
+        test/unit/mail_2_rmq/attachment.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mail_2_rmq                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=C0413,E0401
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_read_text
+        test_read_path
+        test_size
+        test_chunks_text
+        test_chunks_path
+        test_remove_text
+        test_remove_path
+        test_remove_failed
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.fname = "test/unit/mail_2_rmq/testfiles/fileattachment.txt"
+
+        with open(self.fname, mode="r", encoding="UTF-8") as f_hldr:
+            self.data = f_hldr.read()
+
+    def test_read_text(self):
+
+        """Function:  test_read_text
+
+        Description:  Test reading an attachment held in memory.
+
+        Arguments:
+
+        """
+
+        attach = mail_2_rmq.Attachment("File.pdf", data="RGF0YQ==\n")
+
+        self.assertEqual(attach.read(), "RGF0YQ==\n")
+
+    def test_read_path(self):
+
+        """Function:  test_read_path
+
+        Description:  Test reading an attachment from a spill file.
+
+        Arguments:
+
+        """
+
+        attach = mail_2_rmq.Attachment("File.pdf", path=self.fname)
+
+        self.assertEqual(attach.read(), self.data)
+
+    def test_size(self):
+
+        """Function:  test_size
+
+        Description:  Test the length of the encoded text in memory and in a
+            spill file.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            (mail_2_rmq.Attachment("File.pdf", data="RGF0YQ==\n").size(),
+             mail_2_rmq.Attachment("File.pdf", path=self.fname).size()),
+            (9, len(self.data)))
+
+    def test_chunks_text(self):
+
+        """Function:  test_chunks_text
+
+        Description:  Test pieces of the encoded text in memory.
+
+        Arguments:
+
+        """
+
+        attach = mail_2_rmq.Attachment("File.pdf", data="RGF0YQ==\n")
+
+        self.assertEqual(list(attach.chunks(4)), ["RGF0", "YQ==", "\n"])
+
+    def test_chunks_path(self):
+
+        """Function:  test_chunks_path
+
+        Description:  Test pieces of the encoded text in a spill file.
+
+        Arguments:
+
+        """
+
+        attach = mail_2_rmq.Attachment("File.pdf", path=self.fname)
+
+        self.assertEqual("".join(attach.chunks(7)), self.data)
+
+    @mock.patch("mail_2_rmq.gen_libs.rm_file")
+    def test_remove_text(self, mock_rm):
+
+        """Function:  test_remove_text
+
+        Description:  Test removing an attachment held in memory.
+
+        Arguments:
+
+        """
+
+        attach = mail_2_rmq.Attachment("File.pdf", data="RGF0YQ==\n")
+
+        self.assertEqual(
+            (attach.remove(), attach.data, mock_rm.call_count),
+            ((False, None), None, 0))
+
+    @mock.patch("mail_2_rmq.gen_libs.rm_file")
+    def test_remove_path(self, mock_rm):
+
+        """Function:  test_remove_path
+
+        Description:  Test removing an attachment removes the spill file.
+
+        Arguments:
+
+        """
+
+        mock_rm.return_value = (False, None)
+        attach = mail_2_rmq.Attachment("File.pdf", path=self.fname)
+
+        self.assertEqual(
+            (attach.remove(), attach.path, mock_rm.call_args),
+            ((False, None), None, mock.call(self.fname)))
+
+    @mock.patch("mail_2_rmq.gen_libs.rm_file")
+    def test_remove_failed(self, mock_rm):
+
+        """Function:  test_remove_failed
+
+        Description:  Test with spill file removal failure.
+
+        Arguments:
+
+        """
+
+        mock_rm.return_value = (True, "Error Message")
+        attach = mail_2_rmq.Attachment("File.pdf", path=self.fname)
+
+        self.assertEqual(attach.remove(), (True, "Error Message"))
+
+
+if __name__ == "__main__":
+    unittest.main()
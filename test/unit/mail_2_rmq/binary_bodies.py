@@ -0,0 +1,156 @@
+# Classification (U)
+
+"""Program:  binary_bodies.py
+
+    Description:  Unit testing of binary_bodies in mail_2_rmq.py.
+
+    Usage:
+        test/unit/mail_2_rmq/binary_bodies.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import hashlib
+import email.message
+
+# Local
+sys.path.append(os.getcwd())
+import mail_2_rmq                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=C0413,E0401
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_one_message
+        test_headers
+        test_default_content_type
+        test_chunks
+        test_chunk_headers
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.data = b"Name,Value\n" * 3
+        self.attach = mail_2_rmq.Attachment(
+            "File.csv", data=self.data, binary=True, content_type="text/csv",
+            sha256=hashlib.sha256(self.data).hexdigest())
+        self.msg = email.message.Message()
+        self.msg["From"] = "from@domain"
+        self.msg["Subject"] = "FileQueue1"
+        self.msg["Message-ID"] = "<id@domain>"
+
+    def test_one_message(self):
+
+        """Function:  test_one_message
+
+        Description:  Test the raw bytes are published as one message.
+
+        Arguments:
+
+        """
+
+        bodies = list(mail_2_rmq.binary_bodies(self.attach, self.msg))
+
+        self.assertEqual(
+            (len(bodies), bodies[0][0], bodies[0][1]["content_type"]),
+            (1, self.data, "text/csv"))
+
+    def test_headers(self):
+
+        """Function:  test_headers
+
+        Description:  Test the attachment details are in the headers.
+
+        Arguments:
+
+        """
+
+        _, props = next(mail_2_rmq.binary_bodies(self.attach, self.msg))
+
+        self.assertEqual(
+            props["headers"],
+            {"filename": "File.csv", "content_type": "text/csv",
+             "size": len(self.data),
+             "sha256": hashlib.sha256(self.data).hexdigest(),
+             "from": "from@domain", "subject": "FileQueue1",
+             "message_id": "<id@domain>"})
+
+    def test_default_content_type(self):
+
+        """Function:  test_default_content_type
+
+        Description:  Test the content type without an attachment type.
+
+        Arguments:
+
+        """
+
+        attach = mail_2_rmq.Attachment("File", data=b"Data", binary=True)
+        _, props = next(mail_2_rmq.binary_bodies(attach, self.msg))
+
+        self.assertEqual(props["content_type"], "application/octet-stream")
+
+    def test_chunks(self):
+
+        """Function:  test_chunks
+
+        Description:  Test the raw bytes are split into pieces.
+
+        Arguments:
+
+        """
+
+        bodies = list(mail_2_rmq.binary_bodies(self.attach, self.msg, 12))
+
+        self.assertEqual(
+            [body for body, _ in bodies],
+            [self.data[:12], self.data[12:24], self.data[24:]])
+
+    def test_chunk_headers(self):
+
+        """Function:  test_chunk_headers
+
+        Description:  Test the chunk details are in the headers.
+
+        Arguments:
+
+        """
+
+        bodies = list(mail_2_rmq.binary_bodies(self.attach, self.msg, 12))
+        headers = [props["headers"] for _, props in bodies]
+
+        self.assertEqual(
+            ([(item["seq"], item["total"]) for item in headers],
+             len({item["transfer_id"] for item in headers}),
+             headers[2]["checksum"],
+             headers[2]["size"]),
+            ([(1, 3), (2, 3), (3, 3)], 1,
+             hashlib.sha256(self.data[24:]).hexdigest(), len(self.data)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,135 @@
+# Classification (U)
+
+"""Program:  build_body.py
+
+    Description:  Unit testing of build_body in mail_2_rmq.py.
+
+    Usage:
+        test/unit/mail_2_rmq/build_body.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mail_2_rmq                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=C0413,E0401
+
+__version__ = version.__version__
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.err_queue = "ERROR_QUEUE"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_email_body
+        test_error_queue
+        test_file
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+        self.log = mock.Mock()
+        self.rmq = mock.Mock()
+        self.rmq.queue_name = "Queue1"
+        self.msg = {"from": "From", "to": "To", "subject": "Subject"}
+
+    @mock.patch("mail_2_rmq.get_text", mock.Mock(return_value="Text"))
+    def test_email_body(self):
+
+        """Function:  test_email_body
+
+        Description:  Test the body is the email text.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mail_2_rmq.build_body(self.rmq, self.log, self.cfg, self.msg),
+            "Text")
+
+    @mock.patch("mail_2_rmq.get_text", mock.Mock(return_value="Text"))
+    def test_error_queue(self):
+
+        """Function:  test_error_queue
+
+        Description:  Test the body of an error queue message.
+
+        Arguments:
+
+        """
+
+        self.rmq.queue_name = self.cfg.err_queue
+
+        self.assertEqual(
+            mail_2_rmq.build_body(self.rmq, self.log, self.cfg, self.msg),
+            "From: From To: To Subject: Subject Body: Text")
+
+    def test_file(self):
+
+        """Function:  test_file
+
+        Description:  Test the body of a file/attachment.
+
+        Arguments:
+
+        """
+
+        attach = mail_2_rmq.Attachment("File.pdf", data="RGF0YQ==\n")
+
+        self.assertEqual(
+            mail_2_rmq.build_body(
+                self.rmq, self.log, self.cfg, self.msg, attach=attach),
+            str({"AFilename": "File.pdf", "File": "RGF0YQ==\n"}))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -71,16 +71,17 @@ class CfgTest():                                        # pylint:disable=R0903
         self.debug_address = "debug@debug.domain"
 
 
-class ParserTest():                                     # pylint:disable=R0903
+class ParserTest():
 
     """Class:  ParserTest
 
-    Description:  Class which is a representation of the email.Parser
-        class.
+    Description:  Class which is a representation of the
+        email.parser.BytesFeedParser class.
 
     Methods:
         __init__
-        parsestr
+        feed
+        close
 
     """
 
@@ -88,23 +89,37 @@ class ParserTest():                                     # pylint:disable=R0903
 
         """Method:  __init__
 
-        Description:  Initialization instance of the RQTest class.
+        Description:  Initialization instance of the ParserTest class.
 
         Arguments:
 
         """
 
-    def parsestr(self, msg):
+        self.data = []
 
-        """Method:  parsestr
+    def feed(self, data):
 
-        Description:  Stub holder for parsestr method.
+        """Method:  feed
+
+        Description:  Stub holder for feed method.
+
+        Arguments:
+
+        """
+
+        self.data.append(data)
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Stub holder for close method.
 
         Arguments:
 
         """
 
-        return msg
+        return b"".join(self.data).decode("UTF-8")
 
 
 class UnitTest(unittest.TestCase):
@@ -129,14 +144,14 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        self.raw_msg = ["Raw", "Email", "Message"]
+        self.raw_msg = [b"Raw", b"Email", b"Message"]
         self.part = ParserTest()
         self.cfg = CfgTest()
         self.processed_msg = "RawEmailMessage"
 
     @mock.patch("mail_2_rmq.process_message", mock.Mock(return_value=True))
     @mock.patch("mail_2_rmq.gen_class.Logger")
-    @mock.patch("mail_2_rmq.Parser")
+    @mock.patch("mail_2_rmq.BytesFeedParser")
     @mock.patch("mail_2_rmq.sys.stdin")
     def test_capture_email(self, mock_stdin, mock_parse, mock_log):
 
@@ -149,10 +164,13 @@ class UnitTest(unittest.TestCase):
         """
 
         mock_parse.return_value = self.part
-        mock_stdin.readlines.return_value = self.raw_msg
+        mock_stdin.buffer.read.side_effect = self.raw_msg + [b""]
         mock_log.return_value = True
 
         self.assertFalse(mail_2_rmq.capture_email(self.cfg, mock_log))
+        mail_2_rmq.process_message.assert_called_with(
+            self.cfg, mock_log, msg=self.processed_msg, pool=None,
+            timer=mail_2_rmq.NULL_TIMER)
 
 
 if __name__ == "__main__":
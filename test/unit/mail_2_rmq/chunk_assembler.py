@@ -0,0 +1,174 @@
+# Classification (U)
+
+"""Program:  chunk_assembler.py
+
+    Description:  Unit testing of ChunkAssembler in mail_2_rmq.py.
+
+    Usage:
+        test/unit/mail_2_rmq/chunk_assembler.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import ast
+
+# Local
+sys.path.append(os.getcwd())
+import mail_2_rmq                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=C0413,E0401
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_in_order
+        test_out_of_order
+        test_interleaved
+        test_not_chunked
+        test_checksum_mismatch
+        test_binary
+        test_binary_chunks
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.text = "RGF0YQ==\n"
+        self.attach = mail_2_rmq.Attachment("File.pdf", data=self.text)
+        self.bodies = list(mail_2_rmq.chunk_bodies(self.attach, 4))
+        self.assembler = mail_2_rmq.ChunkAssembler()
+
+    def test_in_order(self):
+
+        """Function:  test_in_order
+
+        Description:  Test the attachment is returned with the last piece.
+
+        Arguments:
+
+        """
+
+        results = [self.assembler.add(body) for body in self.bodies]
+
+        self.assertEqual(
+            (results, self.assembler.transfers),
+            ([None, None, ("File.pdf", self.text)], {}))
+
+    def test_out_of_order(self):
+
+        """Function:  test_out_of_order
+
+        Description:  Test pieces received out of order.
+
+        Arguments:
+
+        """
+
+        results = [self.assembler.add(body) for body in self.bodies[::-1]]
+
+        self.assertEqual(results[-1], ("File.pdf", self.text))
+
+    def test_interleaved(self):
+
+        """Function:  test_interleaved
+
+        Description:  Test two transfers received interleaved.
+
+        Arguments:
+
+        """
+
+        attach = mail_2_rmq.Attachment("File2.pdf", data="RmlsZTI=\n")
+        bodies = list(mail_2_rmq.chunk_bodies(attach, 4))
+        results = [self.assembler.add(body) for pair in zip(
+            self.bodies, bodies) for body in pair]
+
+        self.assertEqual(
+            results[-2:], [("File.pdf", self.text),
+                           ("File2.pdf", "RmlsZTI=\n")])
+
+    def test_not_chunked(self):
+
+        """Function:  test_not_chunked
+
+        Description:  Test a body without chunk details.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            self.assembler.add({"AFilename": "File.pdf", "File": self.text}),
+            ("File.pdf", self.text))
+
+    def test_checksum_mismatch(self):
+
+        """Function:  test_checksum_mismatch
+
+        Description:  Test a piece with a bad checksum.
+
+        Arguments:
+
+        """
+
+        body = ast.literal_eval(self.bodies[0])
+        body["File"] = "XXXX"
+
+        with self.assertRaises(ValueError):
+            self.assembler.add(body)
+
+    def test_binary(self):
+
+        """Function:  test_binary
+
+        Description:  Test a binary body with the details in the headers.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            self.assembler.add(b"Data", {"filename": "File.pdf"}),
+            ("File.pdf", b"Data"))
+
+    def test_binary_chunks(self):
+
+        """Function:  test_binary_chunks
+
+        Description:  Test binary chunks with the details in the headers.
+
+        Arguments:
+
+        """
+
+        attach = mail_2_rmq.Attachment("File.pdf", data=b"Data", binary=True)
+        results = [self.assembler.add(body, props["headers"]) for body, props
+                   in mail_2_rmq.binary_bodies(attach, {}, 3)]
+
+        self.assertEqual(results, [None, ("File.pdf", b"Data")])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+# Classification (U)
+
+"""Program:  chunk_bodies.py
+
+    Description:  Unit testing of chunk_bodies in mail_2_rmq.py.
+
+    Usage:
+        test/unit/mail_2_rmq/chunk_bodies.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import ast
+import hashlib
+
+# Local
+sys.path.append(os.getcwd())
+import mail_2_rmq                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=C0413,E0401
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_chunks
+        test_transfer
+        test_checksum
+        test_exact_size
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.attach = mail_2_rmq.Attachment("File.pdf", data="RGF0YQ==\n")
+
+    def test_chunks(self):
+
+        """Function:  test_chunks
+
+        Description:  Test the encoded text is split into pieces.
+
+        Arguments:
+
+        """
+
+        bodies = [ast.literal_eval(body)
+                  for body in mail_2_rmq.chunk_bodies(self.attach, 4)]
+
+        self.assertEqual(
+            [(body["AFilename"], body["File"], body["Seq"], body["Total"])
+             for body in bodies],
+            [("File.pdf", "RGF0", 1, 3), ("File.pdf", "YQ==", 2, 3),
+             ("File.pdf", "\n", 3, 3)])
+
+    def test_transfer(self):
+
+        """Function:  test_transfer
+
+        Description:  Test all pieces share one transfer id.
+
+        Arguments:
+
+        """
+
+        bodies = [ast.literal_eval(body)
+                  for body in mail_2_rmq.chunk_bodies(self.attach, 4)]
+        bodies2 = [ast.literal_eval(body)
+                   for body in mail_2_rmq.chunk_bodies(self.attach, 4)]
+
+        self.assertEqual(
+            (len({body["TransferId"] for body in bodies}),
+             bodies[0]["TransferId"] == bodies2[0]["TransferId"]),
+            (1, False))
+
+    def test_checksum(self):
+
+        """Function:  test_checksum
+
+        Description:  Test the checksum of each piece.
+
+        Arguments:
+
+        """
+
+        body = ast.literal_eval(
+            next(mail_2_rmq.chunk_bodies(self.attach, 4)))
+
+        self.assertEqual(
+            body["Checksum"], hashlib.sha256(b"RGF0").hexdigest())
+
+    def test_exact_size(self):
+
+        """Function:  test_exact_size
+
+        Description:  Test the count when the text splits evenly.
+
+        Arguments:
+
+        """
+
+        attach = mail_2_rmq.Attachment("File.pdf", data="RGF0YQ==")
+        bodies = [ast.literal_eval(body)
+                  for body in mail_2_rmq.chunk_bodies(attach, 4)]
+
+        self.assertEqual(
+            [body["Total"] for body in bodies], [2, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+# Classification (U)
+
+"""Program:  close_feed.py
+
+    Description:  Unit testing of close_feed in mail_2_rmq.py.
+
+    Usage:
+        test/unit/mail_2_rmq/close_feed.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mail_2_rmq                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=C0413,E0401
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_parse
+        test_email_bytes
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.raw_msg = b"From: name@domain\nSubject: Queue1\n\nEmail Body\n"
+        self.parser = mail_2_rmq.BytesFeedParser(
+            mail_2_rmq.MailMessage, policy=mail_2_rmq.MAIL_POLICY)
+
+        for cnt in range(0, len(self.raw_msg), 8):
+            self.parser.feed(self.raw_msg[cnt:cnt + 8])
+
+    def test_parse(self):
+
+        """Function:  test_parse
+
+        Description:  Test the email fed in chunks is parsed.
+
+        Arguments:
+
+        """
+
+        msg = mail_2_rmq.close_feed((self.parser, len(self.raw_msg)))
+
+        self.assertEqual(
+            (msg["from"], msg["subject"], msg.get_payload()),
+            ("name@domain", "Queue1", "Email Body\n"))
+
+    def test_email_bytes(self):
+
+        """Function:  test_email_bytes
+
+        Description:  Test the bytes fed are counted in the stage timer.
+
+        Arguments:
+
+        """
+
+        timer = mail_2_rmq.StageTimer()
+        mail_2_rmq.STAGE_TIMER.timer = timer
+        mail_2_rmq.close_feed((self.parser, len(self.raw_msg)))
+        mail_2_rmq.STAGE_TIMER.timer = mail_2_rmq.NULL_TIMER
+
+        self.assertEqual(timer.counts["email_bytes"], len(self.raw_msg))
+
+
+if __name__ == "__main__":
+    unittest.main()
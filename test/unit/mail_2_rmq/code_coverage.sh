@@ -33,6 +33,64 @@ coverage run -a --source=mail_2_rmq test/unit/mail_2_rmq/process_file_debug.py
 coverage run -a --source=mail_2_rmq test/unit/mail_2_rmq/process_from_debug.py
 coverage run -a --source=mail_2_rmq test/unit/mail_2_rmq/pub_to_rmq_debug.py
 coverage run -a --source=mail_2_rmq test/unit/mail_2_rmq/read_email.py
+coverage run -a --source=mail_2_rmq test/unit/mail_2_rmq/rmq_session.py
+coverage run -a --source=mail_2_rmq test/unit/mail_2_rmq/open_rmq.py
+coverage run -a --source=mail_2_rmq test/unit/mail_2_rmq/rmq_pool.py
+coverage run -a --source=mail_2_rmq test/unit/mail_2_rmq/parse_file.py
+coverage run -a --source=mail_2_rmq test/unit/mail_2_rmq/process_spool.py
+coverage run -a --source=mail_2_rmq test/unit/mail_2_rmq/spool_daemon.py
+coverage run -a --source=mail_2_rmq test/unit/mail_2_rmq/socket_server.py
+coverage run -a --source=mail_2_rmq test/unit/mail_2_rmq/mail_handler.py
+coverage run -a --source=mail_2_rmq test/unit/mail_2_rmq/pub_confirm.py
+coverage run -a --source=mail_2_rmq test/unit/mail_2_rmq/async_engine.py
+coverage run -a --source=mail_2_rmq test/unit/mail_2_rmq/run_async_engine.py
+coverage run -a --source=mail_2_rmq test/unit/mail_2_rmq/topology_queues.py
+coverage run -a --source=mail_2_rmq test/unit/mail_2_rmq/topology_stamp.py
+coverage run -a --source=mail_2_rmq test/unit/mail_2_rmq/declare_topology.py
+coverage run -a --source=mail_2_rmq test/unit/mail_2_rmq/host_cfg.py
+coverage run -a --source=mail_2_rmq test/unit/mail_2_rmq/host_scores.py
+coverage run -a --source=mail_2_rmq test/unit/mail_2_rmq/select_host.py
+coverage run -a --source=mail_2_rmq test/unit/mail_2_rmq/build_body.py
+coverage run -a --source=mail_2_rmq test/unit/mail_2_rmq/wal_write.py
+coverage run -a --source=mail_2_rmq test/unit/mail_2_rmq/save_failed.py
+coverage run -a --source=mail_2_rmq test/unit/mail_2_rmq/publish_body.py
+coverage run -a --source=mail_2_rmq test/unit/mail_2_rmq/wal_replayer.py
+coverage run -a --source=mail_2_rmq test/unit/mail_2_rmq/rate_limit.py
+coverage run -a --source=mail_2_rmq test/unit/mail_2_rmq/archive_files.py
+coverage run -a --source=mail_2_rmq test/unit/mail_2_rmq/archive_replay.py
+coverage run -a --source=mail_2_rmq test/unit/mail_2_rmq/replay_archive.py
+coverage run -a --source=mail_2_rmq test/unit/mail_2_rmq/read_worker.py
+coverage run -a --source=mail_2_rmq test/unit/mail_2_rmq/read_email_pool.py
+coverage run -a --source=mail_2_rmq test/unit/mail_2_rmq/file_size.py
+coverage run -a --source=mail_2_rmq test/unit/mail_2_rmq/parse_stream.py
+coverage run -a --source=mail_2_rmq test/unit/mail_2_rmq/write_email.py
+coverage run -a --source=mail_2_rmq test/unit/mail_2_rmq/decode_text.py
+coverage run -a --source=mail_2_rmq test/unit/mail_2_rmq/attachment.py
+coverage run -a --source=mail_2_rmq test/unit/mail_2_rmq/encode_attach.py
+coverage run -a --source=mail_2_rmq test/unit/mail_2_rmq/chunk_bodies.py
+coverage run -a --source=mail_2_rmq test/unit/mail_2_rmq/attach_bodies.py
+coverage run -a --source=mail_2_rmq test/unit/mail_2_rmq/chunk_assembler.py
+coverage run -a --source=mail_2_rmq test/unit/mail_2_rmq/compress_body.py
+coverage run -a --source=mail_2_rmq test/unit/mail_2_rmq/register_codec.py
+coverage run -a --source=mail_2_rmq test/unit/mail_2_rmq/binary_bodies.py
+coverage run -a --source=mail_2_rmq test/unit/mail_2_rmq/extract_mime.py
+coverage run -a --source=mail_2_rmq test/unit/mail_2_rmq/route_table.py
+coverage run -a --source=mail_2_rmq test/unit/mail_2_rmq/get_routes.py
+coverage run -a --source=mail_2_rmq test/unit/mail_2_rmq/route_rule.py
+coverage run -a --source=mail_2_rmq test/unit/mail_2_rmq/process_rule.py
+coverage run -a --source=mail_2_rmq test/unit/mail_2_rmq/fanout_rmq.py
+coverage run -a --source=mail_2_rmq test/unit/mail_2_rmq/stage_timer.py
+coverage run -a --source=mail_2_rmq test/unit/mail_2_rmq/null_timer.py
+coverage run -a --source=mail_2_rmq test/unit/mail_2_rmq/start_timer.py
+coverage run -a --source=mail_2_rmq test/unit/mail_2_rmq/get_timer.py
+coverage run -a --source=mail_2_rmq test/unit/mail_2_rmq/metrics_file.py
+coverage run -a --source=mail_2_rmq test/unit/mail_2_rmq/memory_channel.py
+coverage run -a --source=mail_2_rmq test/unit/mail_2_rmq/memory_rmq.py
+coverage run -a --source=mail_2_rmq test/unit/mail_2_rmq/register_backend.py
+coverage run -a --source=mail_2_rmq test/unit/mail_2_rmq/create_rmqpub.py
+coverage run -a --source=mail_2_rmq test/unit/mail_2_rmq/profiler.py
+coverage run -a --source=mail_2_rmq test/unit/mail_2_rmq/close_feed.py
+coverage run -a --source=mail_2_rmq test/unit/mail_2_rmq/exchange_cfg.py
 
 echo ""
 echo "Producing code coverage report"
@@ -0,0 +1,213 @@
+# Classification (U)
+
+"""Program:  compress_body.py
+
+    Description:  Unit testing of compress_body in mail_2_rmq.py.
+
+    Usage:
+        test/unit/mail_2_rmq/compress_body.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import types
+import gzip
+import zlib
+
+# Local
+sys.path.append(os.getcwd())
+import mail_2_rmq                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=C0413,E0401
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_codec
+        test_gzip
+        test_zlib
+        test_bytes
+        test_below_min
+        test_default_min
+        test_queue_listed
+        test_queue_not_listed
+        test_empty_body
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = types.SimpleNamespace(compress_min=10)
+        self.rmq = types.SimpleNamespace(queue_name="FileQueue1")
+        self.body = "Name,Value\n" * 100
+
+    def test_no_codec(self):
+
+        """Function:  test_no_codec
+
+        Description:  Test the body is not compressed without a codec.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mail_2_rmq.compress_body(self.rmq, self.cfg, self.body),
+            (self.body, {}))
+
+    def test_gzip(self):
+
+        """Function:  test_gzip
+
+        Description:  Test the body is compressed with gzip.
+
+        Arguments:
+
+        """
+
+        self.cfg.compress = "gzip"
+        body, props = mail_2_rmq.compress_body(self.rmq, self.cfg, self.body)
+
+        self.assertEqual(
+            (gzip.decompress(body).decode(), props),
+            (self.body, {"content_encoding": "gzip"}))
+
+    def test_zlib(self):
+
+        """Function:  test_zlib
+
+        Description:  Test the body is compressed with zlib.
+
+        Arguments:
+
+        """
+
+        self.cfg.compress = "zlib"
+        body, props = mail_2_rmq.compress_body(self.rmq, self.cfg, self.body)
+
+        self.assertEqual(
+            (zlib.decompress(body).decode(), props),
+            (self.body, {"content_encoding": "zlib"}))
+
+    def test_bytes(self):
+
+        """Function:  test_bytes
+
+        Description:  Test a bytes body is compressed.
+
+        Arguments:
+
+        """
+
+        self.cfg.compress = "zlib"
+        body, _ = mail_2_rmq.compress_body(
+            self.rmq, self.cfg, self.body.encode())
+
+        self.assertEqual(zlib.decompress(body).decode(), self.body)
+
+    def test_below_min(self):
+
+        """Function:  test_below_min
+
+        Description:  Test a body below compress_min is not compressed.
+
+        Arguments:
+
+        """
+
+        self.cfg.compress = "gzip"
+
+        self.assertEqual(
+            mail_2_rmq.compress_body(self.rmq, self.cfg, "Body"),
+            ("Body", {}))
+
+    def test_default_min(self):
+
+        """Function:  test_default_min
+
+        Description:  Test the default compress_min is used if not set.
+
+        Arguments:
+
+        """
+
+        cfg = types.SimpleNamespace(compress="gzip")
+        body = "x" * (mail_2_rmq.COMPRESS_MIN - 1)
+
+        self.assertEqual(
+            mail_2_rmq.compress_body(self.rmq, cfg, body), (body, {}))
+
+    def test_queue_listed(self):
+
+        """Function:  test_queue_listed
+
+        Description:  Test a body to a compress_queues queue is compressed.
+
+        Arguments:
+
+        """
+
+        self.cfg.compress = "gzip"
+        self.cfg.compress_queues = ["FileQueue1"]
+
+        self.assertEqual(
+            mail_2_rmq.compress_body(self.rmq, self.cfg, self.body)[1],
+            {"content_encoding": "gzip"})
+
+    def test_queue_not_listed(self):
+
+        """Function:  test_queue_not_listed
+
+        Description:  Test a body to another queue is not compressed.
+
+        Arguments:
+
+        """
+
+        self.cfg.compress = "gzip"
+        self.cfg.compress_queues = ["FileQueue2"]
+
+        self.assertEqual(
+            mail_2_rmq.compress_body(self.rmq, self.cfg, self.body),
+            (self.body, {}))
+
+    def test_empty_body(self):
+
+        """Function:  test_empty_body
+
+        Description:  Test an empty body is passed through.
+
+        Arguments:
+
+        """
+
+        self.cfg.compress = "gzip"
+
+        self.assertEqual(
+            mail_2_rmq.compress_body(self.rmq, self.cfg, None), (None, {}))
+
+
+if __name__ == "__main__":
+    unittest.main()
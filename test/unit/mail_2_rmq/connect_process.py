@@ -17,6 +17,8 @@
 import sys
 import os
 import unittest
+import ast
+import gzip
 import mock
 
 # Local
@@ -52,6 +54,7 @@ class RQTest():                                         # pylint:disable=R0903
         self.queue_name = "Test_Queue"
         self.pub_status = True
         self.msg = None
+        self.msgs = []
 
     def publish_msg(self, msg):
 
@@ -64,6 +67,7 @@ class RQTest():                                         # pylint:disable=R0903
         """
 
         self.msg = msg
+        self.msgs.append(msg)
 
         return self.pub_status
 
@@ -107,8 +111,15 @@ class UnitTest(unittest.TestCase):
         test_file_publish
         test_false_publish
         test_true_publish
+        test_confirm_publish
         test_error_queue
         test_non_error_queue
+        test_chunks
+        test_chunks_failed
+        test_chunks_failed_wal
+        test_compressed
+        test_binary
+        test_body
 
     """
 
@@ -129,6 +140,10 @@ class UnitTest(unittest.TestCase):
         self.text = "EmailBody"
         self.fname = "test/unit/mail_2_rmq/testfiles/fileattachment.txt"
         self.fname2 = "test/unit/mail_2_rmq/testfiles/fileattachment2.txt"
+        self.attach = mail_2_rmq.Attachment(
+            "fileattachment.txt", path=self.fname)
+        self.attach2 = mail_2_rmq.Attachment(
+            "fileattachment2.txt", path=self.fname2)
 
     @mock.patch("mail_2_rmq.get_text")
     @mock.patch("mail_2_rmq.gen_class.Logger")
@@ -187,7 +202,7 @@ class UnitTest(unittest.TestCase):
 
         self.assertFalse(
             mail_2_rmq.connect_process(
-                self.rmq, mock_log, self.cfg, mock_msg, fname=self.fname2))
+                self.rmq, mock_log, self.cfg, mock_msg, attach=self.attach2))
 
     @mock.patch("mail_2_rmq.get_text")
     @mock.patch("mail_2_rmq.gen_class.Logger")
@@ -206,7 +221,7 @@ class UnitTest(unittest.TestCase):
 
         self.assertFalse(
             mail_2_rmq.connect_process(
-                self.rmq, mock_log, self.cfg, mock_msg, fname=self.fname))
+                self.rmq, mock_log, self.cfg, mock_msg, attach=self.attach))
 
     @mock.patch("mail_2_rmq.get_text")
     @mock.patch("mail_2_rmq.archive_email")
@@ -248,6 +263,28 @@ class UnitTest(unittest.TestCase):
         self.assertFalse(
             mail_2_rmq.connect_process(self.rmq, mock_log, self.cfg, self.msg))
 
+    @mock.patch("mail_2_rmq.archive_email")
+    @mock.patch("mail_2_rmq.get_text")
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_confirm_publish(self, mock_log, mock_msg, mock_archive):
+
+        """Function:  test_confirm_publish
+
+        Description:  Test publish is tracked by the publisher confirms.
+
+        Arguments:
+
+        """
+
+        confirm = mock.Mock()
+        confirm.publish.return_value = True
+        mock_msg.return_value = self.text
+        mail_2_rmq.connect_process(
+            self.rmq, mock_log, self.cfg, self.msg, confirm=confirm)
+
+        confirm.publish.assert_called_once_with(self.text, self.msg)
+        self.assertEqual((self.rmq.msg, mock_archive.call_count), (None, 0))
+
     @mock.patch("mail_2_rmq.get_text")
     @mock.patch("mail_2_rmq.gen_class.Logger")
     def test_error_queue(self, mock_log, mock_msg):
@@ -286,6 +323,139 @@ class UnitTest(unittest.TestCase):
         self.assertFalse(
             mail_2_rmq.connect_process(self.rmq, mock_log, self.cfg, self.msg))
 
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_chunks(self, mock_log):
+
+        """Function:  test_chunks
+
+        Description:  Test an attachment above chunk_size is published in
+            chunks.
+
+        Arguments:
+
+        """
+
+        self.cfg.chunk_size = 4
+        attach = mail_2_rmq.Attachment("File.pdf", data="RGF0YQ==\n")
+        mail_2_rmq.connect_process(
+            self.rmq, mock_log, self.cfg, self.msg, attach=attach)
+
+        self.assertEqual(
+            [ast.literal_eval(body)["File"] for body in self.rmq.msgs],
+            ["RGF0", "YQ==", "\n"])
+
+    @mock.patch("mail_2_rmq.archive_email")
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_chunks_failed(self, mock_log, mock_archive):
+
+        """Function:  test_chunks_failed
+
+        Description:  Test the email is archived once when a chunk fails.
+
+        Arguments:
+
+        """
+
+        self.cfg.chunk_size = 4
+        self.rmq.pub_status = False
+        attach = mail_2_rmq.Attachment("File.pdf", data="RGF0YQ==\n")
+        mail_2_rmq.connect_process(
+            self.rmq, mock_log, self.cfg, self.msg, attach=attach)
+
+        self.assertEqual(
+            (len(self.rmq.msgs), mock_archive.call_count), (1, 1))
+
+    @mock.patch("mail_2_rmq.wal_write")
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_chunks_failed_wal(self, mock_log, mock_wal):
+
+        """Function:  test_chunks_failed_wal
+
+        Description:  Test each failed chunk is saved to the write-ahead
+            spool.
+
+        Arguments:
+
+        """
+
+        self.cfg.chunk_size = 4
+        self.cfg.wal_dir = "WAL_DIR"
+        self.rmq.pub_status = False
+        attach = mail_2_rmq.Attachment("File.pdf", data="RGF0YQ==\n")
+        mail_2_rmq.connect_process(
+            self.rmq, mock_log, self.cfg, self.msg, attach=attach)
+
+        self.assertEqual(
+            [call[0][3] for call in mock_wal.call_args_list], self.rmq.msgs)
+
+    @mock.patch("mail_2_rmq.publish_body")
+    @mock.patch("mail_2_rmq.get_text")
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_compressed(self, mock_log, mock_msg, mock_pub):
+
+        """Function:  test_compressed
+
+        Description:  Test a compressed body is published with the
+            content_encoding property.
+
+        Arguments:
+
+        """
+
+        self.cfg.compress = "gzip"
+        self.cfg.compress_min = 0
+        mock_msg.return_value = self.text
+        mock_pub.return_value = True
+        mail_2_rmq.connect_process(self.rmq, mock_log, self.cfg, self.msg)
+
+        self.assertEqual(
+            (gzip.decompress(mock_pub.call_args[0][1]),
+             mock_pub.call_args[1]),
+            (self.text.encode(), {"content_encoding": "gzip"}))
+
+    @mock.patch("mail_2_rmq.publish_body")
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_binary(self, mock_log, mock_pub):
+
+        """Function:  test_binary
+
+        Description:  Test a binary attachment is published with its
+            headers.
+
+        Arguments:
+
+        """
+
+        mock_pub.return_value = True
+        attach = mail_2_rmq.Attachment(
+            "File.pdf", data=b"Data", binary=True,
+            content_type="application/pdf")
+        mail_2_rmq.connect_process(
+            self.rmq, mock_log, self.cfg, self.msg, attach=attach)
+
+        self.assertEqual(
+            (mock_pub.call_args[0][1], mock_pub.call_args[1]["content_type"],
+             mock_pub.call_args[1]["headers"]["filename"]),
+            (b"Data", "application/pdf", "File.pdf"))
+
+    @mock.patch("mail_2_rmq.get_text")
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_body(self, mock_log, mock_msg):
+
+        """Function:  test_body
+
+        Description:  Test a message body already built is published as is.
+
+        Arguments:
+
+        """
+
+        mail_2_rmq.connect_process(
+            self.rmq, mock_log, self.cfg, self.msg, body="BuiltBody")
+
+        self.assertEqual(
+            (self.rmq.msg, mock_msg.call_count), ("BuiltBody", 0))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -148,6 +148,7 @@ class UnitTest(unittest.TestCase):
         test_false_false_connect
         test_false_true_connect
         test_true_false_connect
+        test_shared_session
 
     """
 
@@ -166,7 +167,7 @@ class UnitTest(unittest.TestCase):
         self.qname = "QueueName"
         self.rkey = "RKey"
         self.msg = "Message Body"
-        self.fname = "AttachementFilename"
+        self.attach = mail_2_rmq.Attachment("AttachementFilename", data="")
 
     @mock.patch("mail_2_rmq.connect_process", mock.Mock(return_value=True))
     @mock.patch("mail_2_rmq.gen_class.Logger")
@@ -187,7 +188,7 @@ class UnitTest(unittest.TestCase):
         self.assertFalse(
             mail_2_rmq.connect_rmq(
                 self.cfg, mock_log, self.qname, self.rkey, self.msg,
-                fname=self.fname))
+                attach=self.attach))
 
     @mock.patch("mail_2_rmq.connect_process", mock.Mock(return_value=True))
     @mock.patch("mail_2_rmq.gen_class.Logger")
@@ -299,6 +300,29 @@ class UnitTest(unittest.TestCase):
             mail_2_rmq.connect_rmq(
                 self.cfg, mock_log, self.qname, self.rkey, self.msg))
 
+    @mock.patch("mail_2_rmq.connect_process", mock.Mock(return_value=True))
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    @mock.patch("mail_2_rmq.rabbitmq_class.create_rmqpub")
+    def test_shared_session(self, mock_rmq, mock_log):
+
+        """Function:  test_shared_session
+
+        Description:  Test with a shared session, connection is left open.
+
+        Arguments:
+
+        """
+
+        mock_rmq.return_value = self.rmq
+        mock_log.return_value = True
+        session = mail_2_rmq.RmqSession(self.cfg, mock_log)
+        session.get_rmq(self.qname, self.rkey)
+        mail_2_rmq.connect_rmq(
+            self.cfg, mock_log, self.qname, self.rkey, self.msg,
+            session=session)
+
+        self.assertTrue(session.is_open())
+
 
 if __name__ == "__main__":
     unittest.main()
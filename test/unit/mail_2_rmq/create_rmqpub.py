@@ -0,0 +1,112 @@
+# Classification (U)
+
+"""Program:  create_rmqpub.py
+
+    Description:  Unit testing of create_rmqpub in mail_2_rmq.py.
+
+    Usage:
+        test/unit/mail_2_rmq/create_rmqpub.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import types
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mail_2_rmq                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=C0413,E0401
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_default
+        test_pika
+        test_memory
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = types.SimpleNamespace(
+            host="HOSTNAME", exchange_name="EXCHANGE_NAME")
+        self.qname = "Queue1"
+
+    @mock.patch("mail_2_rmq.rabbitmq_class.create_rmqpub")
+    def test_default(self, mock_rmq):
+
+        """Function:  test_default
+
+        Description:  Test the rabbitmq_class publisher is the default.
+
+        Arguments:
+
+        """
+
+        mock_rmq.return_value = "RMQ"
+
+        self.assertEqual(
+            mail_2_rmq.create_rmqpub(self.cfg, self.qname, self.qname),
+            "RMQ")
+
+    @mock.patch("mail_2_rmq.rabbitmq_class.create_rmqpub")
+    def test_pika(self, mock_rmq):
+
+        """Function:  test_pika
+
+        Description:  Test with the pika backend.
+
+        Arguments:
+
+        """
+
+        self.cfg.rmq_backend = "pika"
+        mail_2_rmq.create_rmqpub(self.cfg, self.qname, "RKey")
+
+        mock_rmq.assert_called_once_with(self.cfg, self.qname, "RKey")
+
+    @mock.patch("mail_2_rmq.rabbitmq_class.create_rmqpub")
+    def test_memory(self, mock_rmq):
+
+        """Function:  test_memory
+
+        Description:  Test with the memory backend.
+
+        Arguments:
+
+        """
+
+        self.cfg.rmq_backend = "memory"
+        rmq = mail_2_rmq.create_rmqpub(self.cfg, self.qname, "RKey")
+
+        self.assertEqual(
+            (type(rmq).__name__, rmq.queue_name, rmq.routing_key,
+             mock_rmq.call_count), ("MemoryRmq", self.qname, "RKey", 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,195 @@
+# Classification (U)
+
+"""Program:  declare_topology.py
+
+    Description:  Unit testing of declare_topology in mail_2_rmq.py.
+
+    Usage:
+        test/unit/mail_2_rmq/declare_topology.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import pika
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mail_2_rmq                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=C0413,E0401
+
+__version__ = version.__version__
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.host = "HOSTNAME"
+        self.exchange_name = "EXCHANGE_NAME"
+        self.exchange_type = "direct"
+        self.x_durable = True
+        self.q_durable = True
+        self.auto_delete = False
+        self.valid_queues = ["Queue1", "Queue2"]
+        self.file_queues = ["FileQueue1"]
+        self.queue_dict = {"goodname@domain": "AddrQueue"}
+        self.err_queue = "ERROR_QUEUE"
+        self.err_file_queue = "ERROR_FILE_QUEUE"
+        self.err_addr_queue = "ERROR_ADDR_QUEUE"
+        self.tmp_dir = "test/unit/mail_2_rmq/tmp"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_declared
+        test_cached
+        test_connect_failed
+        test_declare_failed
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+        self.rmq = mock.Mock()
+        self.stamp = mail_2_rmq.topology_stamp(self.cfg)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        if os.path.isfile(self.stamp):
+            os.remove(self.stamp)
+
+    @mock.patch("mail_2_rmq.gen_libs.write_file")
+    @mock.patch("mail_2_rmq.open_rmq")
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_declared(self, mock_log, mock_open, mock_write):
+
+        """Function:  test_declared
+
+        Description:  Test every queue is declared and the stamp written.
+
+        Arguments:
+
+        """
+
+        mock_open.return_value = (self.rmq, True, None)
+        queues = mail_2_rmq.declare_topology(self.cfg, mock_log)
+
+        self.assertEqual(
+            (queues, self.rmq.create_queue.call_count,
+             self.rmq.bind_queue.call_count, mock_write.call_args[0][0],
+             self.rmq.close.call_count),
+            (mail_2_rmq.topology_queues(self.cfg), 7, 7, self.stamp, 1))
+
+    @mock.patch("mail_2_rmq.open_rmq")
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_cached(self, mock_log, mock_open):
+
+        """Function:  test_cached
+
+        Description:  Test nothing is declared with a current stamp.
+
+        Arguments:
+
+        """
+
+        with open(self.stamp, mode="w", encoding="UTF-8") as f_hdlr:
+            f_hdlr.write("Stamp")
+
+        self.assertEqual(
+            mail_2_rmq.declare_topology(self.cfg, mock_log),
+            mail_2_rmq.topology_queues(self.cfg))
+        mock_open.assert_not_called()
+
+    @mock.patch("mail_2_rmq.gen_libs.write_file")
+    @mock.patch("mail_2_rmq.open_rmq")
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_connect_failed(self, mock_log, mock_open, mock_write):
+
+        """Function:  test_connect_failed
+
+        Description:  Test no stamp is written if the connection fails.
+
+        Arguments:
+
+        """
+
+        mock_open.return_value = (self.rmq, False, "Error Message")
+
+        self.assertEqual(
+            mail_2_rmq.declare_topology(self.cfg, mock_log), set())
+        mock_write.assert_not_called()
+
+    @mock.patch("mail_2_rmq.gen_libs.write_file")
+    @mock.patch("mail_2_rmq.open_rmq")
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_declare_failed(self, mock_log, mock_open, mock_write):
+
+        """Function:  test_declare_failed
+
+        Description:  Test no stamp is written if a declare fails.
+
+        Arguments:
+
+        """
+
+        self.rmq.create_queue.side_effect = \
+            pika.exceptions.ChannelClosedByBroker(406, "PRECONDITION_FAILED")
+        mock_open.return_value = (self.rmq, True, None)
+
+        self.assertEqual(
+            (mail_2_rmq.declare_topology(self.cfg, mock_log),
+             self.rmq.close.call_count), (set(), 1))
+        mock_write.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+# Classification (U)
+
+"""Program:  decode_text.py
+
+    Description:  Unit testing of decode_text in mail_2_rmq.py.
+
+    Usage:
+        test/unit/mail_2_rmq/decode_text.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mail_2_rmq                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=C0413,E0401
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_no_charset
+        test_charset
+        test_unknown_charset
+        test_invalid_bytes
+
+    """
+
+    def test_no_charset(self):
+
+        """Function:  test_no_charset
+
+        Description:  Test UTF-8 is used without a charset.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mail_2_rmq.decode_text("Caf\xe9".encode("UTF-8"), None),
+            "Caf\xe9")
+
+    def test_charset(self):
+
+        """Function:  test_charset
+
+        Description:  Test the charset of the part is used.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mail_2_rmq.decode_text(b"Caf\xe9", "iso-8859-1"), "Caf\xe9")
+
+    def test_unknown_charset(self):
+
+        """Function:  test_unknown_charset
+
+        Description:  Test UTF-8 is used with an unknown charset.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mail_2_rmq.decode_text(b"Text", "x-no-such-charset"), "Text")
+
+    def test_invalid_bytes(self):
+
+        """Function:  test_invalid_bytes
+
+        Description:  Test invalid bytes are replaced.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mail_2_rmq.decode_text(b"Caf\xe9", "UTF-8"), "Caf�")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,170 @@
+# Classification (U)
+
+"""Program:  encode_attach.py
+
+    Description:  Unit testing of encode_attach in mail_2_rmq.py.
+
+    Usage:
+        test/unit/mail_2_rmq/encode_attach.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import base64
+import hashlib
+import types
+import tempfile
+import shutil
+
+# Local
+sys.path.append(os.getcwd())
+import mail_2_rmq                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=C0413,E0401
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_in_memory
+        test_spill
+        test_spill_default
+        test_binary
+        test_binary_spill
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = types.SimpleNamespace(tmp_dir=tempfile.mkdtemp())
+        self.data = bytes(range(256)) * 1000
+
+    def test_in_memory(self):
+
+        """Function:  test_in_memory
+
+        Description:  Test an attachment is encoded in memory.
+
+        Arguments:
+
+        """
+
+        attach = mail_2_rmq.encode_attach(self.cfg, "File.pdf", self.data)
+
+        self.assertEqual(
+            (attach.name, attach.path, attach.read(), os.listdir(
+                self.cfg.tmp_dir)),
+            ("File.pdf", None, base64.encodebytes(self.data).decode(), []))
+
+    def test_spill(self):
+
+        """Function:  test_spill
+
+        Description:  Test an attachment above attach_spill is encoded into a
+            spill file with the same text as in memory.
+
+        Arguments:
+
+        """
+
+        self.cfg.attach_spill = 1024
+        attach = mail_2_rmq.encode_attach(self.cfg, "File.pdf", self.data)
+
+        self.assertEqual(
+            (attach.data, attach.read()),
+            (None, base64.encodebytes(self.data).decode()))
+
+    def test_spill_default(self):
+
+        """Function:  test_spill_default
+
+        Description:  Test the default spill size is used without the
+            attach_spill setting.
+
+        Arguments:
+
+        """
+
+        attach = mail_2_rmq.encode_attach(
+            self.cfg, "File.pdf", b"x" * (mail_2_rmq.ATTACH_SPILL + 1))
+
+        self.assertEqual(
+            os.path.dirname(attach.path), self.cfg.tmp_dir)
+
+    def test_binary(self):
+
+        """Function:  test_binary
+
+        Description:  Test an attachment is kept as raw bytes with the binary
+            attach_format.
+
+        Arguments:
+
+        """
+
+        self.cfg.attach_format = "binary"
+        attach = mail_2_rmq.encode_attach(
+            self.cfg, "File.pdf", self.data, content_type="application/pdf")
+
+        self.assertEqual(
+            (attach.read(), attach.binary, attach.content_type,
+             attach.sha256),
+            (self.data, True, "application/pdf",
+             hashlib.sha256(self.data).hexdigest()))
+
+    def test_binary_spill(self):
+
+        """Function:  test_binary_spill
+
+        Description:  Test a binary attachment above attach_spill is written
+            to a spill file.
+
+        Arguments:
+
+        """
+
+        self.cfg.attach_format = "binary"
+        self.cfg.attach_spill = 1024
+        attach = mail_2_rmq.encode_attach(self.cfg, "File.pdf", self.data)
+
+        self.assertEqual(
+            (attach.data, attach.read(), b"".join(attach.chunks(1000))),
+            (None, self.data, self.data))
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.cfg.tmp_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
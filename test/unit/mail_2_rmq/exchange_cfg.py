@@ -0,0 +1,115 @@
+# Classification (U)
+
+"""Program:  exchange_cfg.py
+
+    Description:  Unit testing of ExchangeCfg in mail_2_rmq.py.
+
+    Usage:
+        test/unit/mail_2_rmq/exchange_cfg.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mail_2_rmq                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=C0413,E0401
+
+__version__ = version.__version__
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.host = "HOSTNAME"
+        self.port = 5672
+        self.host_list = ["node1:5673", "node2:5674"]
+        self.exchange_name = "EXCHANGE_NAME"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_exchange
+        test_other_settings
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+
+    def test_exchange(self):
+
+        """Function:  test_exchange
+
+        Description:  Test the exchange name is replaced.
+
+        Arguments:
+
+        """
+
+        exch_cfg = mail_2_rmq.ExchangeCfg(self.cfg, "EXCHANGE2")
+
+        self.assertEqual(
+            (exch_cfg.exchange_name, self.cfg.exchange_name),
+            ("EXCHANGE2", "EXCHANGE_NAME"))
+
+    def test_other_settings(self):
+
+        """Function:  test_other_settings
+
+        Description:  Test other settings are read from the configuration.
+
+        Arguments:
+
+        """
+
+        exch_cfg = mail_2_rmq.ExchangeCfg(self.cfg, "EXCHANGE2")
+
+        self.assertEqual(
+            (exch_cfg.host, exch_cfg.port, hasattr(exch_cfg, "wal_dir")),
+            ("HOSTNAME", 5672, False))
+
+
+if __name__ == "__main__":
+    unittest.main()
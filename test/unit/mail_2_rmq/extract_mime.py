@@ -0,0 +1,180 @@
+# Classification (U)
+
+"""Program:  extract_mime.py
+
+    Description:  Unit testing of extract_mime in mail_2_rmq.py.
+
+    Usage:
+        test/unit/mail_2_rmq/extract_mime.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import email.message
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mail_2_rmq                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=C0413,E0401
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_mail_message
+        test_text
+        test_attachments
+        test_rejected
+        test_no_attach_types
+        test_single_walk
+        test_other_message
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        msg = email.message.EmailMessage()
+        msg["From"] = "from@domain"
+        msg["Subject"] = "FileQueue1"
+        msg.set_content("Email Body\n")
+        msg.add_attachment(
+            b"%PDF", maintype="application", subtype="pdf",
+            filename="File.pdf")
+        msg.add_attachment(
+            b"PK", maintype="application", subtype="zip",
+            filename="File.zip")
+        self.raw = msg.as_bytes()
+        self.msg = mail_2_rmq.parse_data(self.raw)
+        self.types = ["application/pdf"]
+
+    def test_mail_message(self):
+
+        """Function:  test_mail_message
+
+        Description:  Test parsed emails are MailMessage instances.
+
+        Arguments:
+
+        """
+
+        self.assertIsInstance(self.msg, mail_2_rmq.MailMessage)
+
+    def test_text(self):
+
+        """Function:  test_text
+
+        Description:  Test the text of the email.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mail_2_rmq.extract_mime(self.msg, self.types).text,
+            "Email Body\n")
+
+    def test_attachments(self):
+
+        """Function:  test_attachments
+
+        Description:  Test the attachments of the wanted types.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mail_2_rmq.extract_mime(self.msg, self.types).attachments,
+            [mail_2_rmq.MimePart("File.pdf", "application/pdf", b"%PDF")])
+
+    def test_rejected(self):
+
+        """Function:  test_rejected
+
+        Description:  Test the attachments of other types.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mail_2_rmq.extract_mime(self.msg, self.types).rejected,
+            [mail_2_rmq.MimePart("File.zip", "application/zip", b"PK")])
+
+    def test_no_attach_types(self):
+
+        """Function:  test_no_attach_types
+
+        Description:  Test all attachments are rejected without types.
+
+        Arguments:
+
+        """
+
+        mime = mail_2_rmq.extract_mime(self.msg)
+
+        self.assertEqual(
+            (mime.attachments, len(mime.rejected)), ([], 2))
+
+    def test_single_walk(self):
+
+        """Function:  test_single_walk
+
+        Description:  Test the tree of a MailMessage is walked once.
+
+        Arguments:
+
+        """
+
+        with mock.patch.object(
+                self.msg, "walk", wraps=self.msg.walk) as mock_walk:
+            mail_2_rmq.get_text(self.msg)
+            mail_2_rmq.extract_mime(self.msg, self.types)
+            mail_2_rmq.get_text(self.msg)
+
+        self.assertEqual(mock_walk.call_count, 1)
+
+    def test_other_message(self):
+
+        """Function:  test_other_message
+
+        Description:  Test other message classes are walked each time.
+
+        Arguments:
+
+        """
+
+        msg = email.message_from_bytes(self.raw)
+
+        with mock.patch.object(msg, "walk", wraps=msg.walk) as mock_walk:
+            mail_2_rmq.get_text(msg)
+            mail_2_rmq.get_text(msg)
+
+        self.assertEqual(mock_walk.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
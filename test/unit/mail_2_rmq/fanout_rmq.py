@@ -0,0 +1,350 @@
+# Classification (U)
+
+"""Program:  fanout_rmq.py
+
+    Description:  Unit testing of fanout_rmq in mail_2_rmq.py.
+
+    Usage:
+        test/unit/mail_2_rmq/fanout_rmq.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import types
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mail_2_rmq                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=C0413,E0401
+
+__version__ = version.__version__
+
+
+class Session():
+
+    """Class:  Session
+
+    Description:  Class which is a representation of the RmqSession class.
+
+    Methods:
+        __init__
+        get_rmq
+        is_open
+        close
+
+    """
+
+    def __init__(self, status=None):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the Session class.
+
+        Arguments:
+
+        """
+
+        self.status = status or {}
+        self.qname = None
+        self.rmq = mock.Mock()
+        self.confirm = "Confirm"
+        self.err_msg = "Error Message"
+        self.queues = []
+        self.closed = 0
+
+    def get_rmq(self, qname, rkey):
+
+        """Method:  get_rmq
+
+        Description:  Stub holder for get_rmq method.
+
+        Arguments:
+
+        """
+
+        self.qname = qname
+        self.queues.append((qname, rkey))
+        self.rmq.queue_name = qname
+
+        return self.rmq
+
+    def is_open(self):
+
+        """Method:  is_open
+
+        Description:  Stub holder for is_open method.
+
+        Arguments:
+
+        """
+
+        return self.status.get(self.qname, True)
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Stub holder for close method.
+
+        Arguments:
+
+        """
+
+        self.closed += 1
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_all_queues
+        test_body_built_once
+        test_confirm
+        test_partial_failure
+        test_session_kept_open
+        test_own_session
+        test_confirm_enabled
+        test_pooled_one_connection
+        test_pooled_confirm_released
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = "Config"
+        self.msg = "Email Message"
+        self.qnames = ["Queue1", "Queue2", "Queue3"]
+        self.session = Session()
+
+    @mock.patch("mail_2_rmq.connect_process")
+    @mock.patch("mail_2_rmq.build_body", mock.Mock(return_value="Body"))
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_all_queues(self, mock_log, mock_process):
+
+        """Function:  test_all_queues
+
+        Description:  Test the email is published to every queue.
+
+        Arguments:
+
+        """
+
+        mail_2_rmq.fanout_rmq(
+            self.cfg, mock_log, self.qnames, self.msg, session=self.session)
+
+        self.assertEqual(
+            (self.session.queues, mock_process.call_count),
+            ([(qname, qname) for qname in self.qnames], 3))
+
+    @mock.patch("mail_2_rmq.connect_process")
+    @mock.patch("mail_2_rmq.build_body")
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_body_built_once(self, mock_log, mock_body, mock_process):
+
+        """Function:  test_body_built_once
+
+        Description:  Test the message body is built once for all queues.
+
+        Arguments:
+
+        """
+
+        mock_body.return_value = "Body"
+        mail_2_rmq.fanout_rmq(
+            self.cfg, mock_log, self.qnames, self.msg, session=self.session)
+
+        self.assertEqual(
+            (mock_body.call_count,
+             [call[1]["body"] for call in mock_process.call_args_list]),
+            (1, ["Body", "Body", "Body"]))
+
+    @mock.patch("mail_2_rmq.connect_process")
+    @mock.patch("mail_2_rmq.build_body", mock.Mock(return_value="Body"))
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_confirm(self, mock_log, mock_process):
+
+        """Function:  test_confirm
+
+        Description:  Test the publishes are tracked by the session confirms.
+
+        Arguments:
+
+        """
+
+        mail_2_rmq.fanout_rmq(
+            self.cfg, mock_log, self.qnames, self.msg, session=self.session)
+
+        self.assertEqual(
+            mock_process.call_args,
+            mock.call(self.session.rmq, mock_log, self.cfg, self.msg,
+                      body="Body", confirm="Confirm"))
+
+    @mock.patch("mail_2_rmq.save_failed")
+    @mock.patch("mail_2_rmq.connect_process")
+    @mock.patch("mail_2_rmq.build_body", mock.Mock(return_value="Body"))
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_partial_failure(self, mock_log, mock_process, mock_save):
+
+        """Function:  test_partial_failure
+
+        Description:  Test a failed queue is saved on its own and the other
+            queues are still published to.
+
+        Arguments:
+
+        """
+
+        self.session.status = {"Queue2": False}
+        mail_2_rmq.fanout_rmq(
+            self.cfg, mock_log, self.qnames, self.msg, session=self.session)
+
+        self.assertEqual(
+            (mock_process.call_count, mock_save.call_count,
+             mock_log.log_err.call_count), (2, 1, 2))
+
+    @mock.patch("mail_2_rmq.connect_process", mock.Mock())
+    @mock.patch("mail_2_rmq.build_body", mock.Mock(return_value="Body"))
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_session_kept_open(self, mock_log):
+
+        """Function:  test_session_kept_open
+
+        Description:  Test a passed session is not closed.
+
+        Arguments:
+
+        """
+
+        mail_2_rmq.fanout_rmq(
+            self.cfg, mock_log, self.qnames, self.msg, session=self.session)
+
+        self.assertEqual(self.session.closed, 0)
+
+    @mock.patch("mail_2_rmq.RmqSession")
+    @mock.patch("mail_2_rmq.connect_process", mock.Mock())
+    @mock.patch("mail_2_rmq.build_body", mock.Mock(return_value="Body"))
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_own_session(self, mock_log, mock_session):
+
+        """Function:  test_own_session
+
+        Description:  Test a session opened for the fan-out is closed.
+
+        Arguments:
+
+        """
+
+        mock_session.return_value = self.session
+        mail_2_rmq.fanout_rmq(self.cfg, mock_log, self.qnames, self.msg)
+
+        self.assertEqual(self.session.closed, 1)
+
+    @mock.patch("mail_2_rmq.get_confirm")
+    @mock.patch("mail_2_rmq.connect_process")
+    @mock.patch("mail_2_rmq.build_body", mock.Mock(return_value="Body"))
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_confirm_enabled(self, mock_log, mock_process, mock_confirm):
+
+        """Function:  test_confirm_enabled
+
+        Description:  Test publisher confirms are turned on without the
+            pub_confirm setting and released once the call is done.
+
+        Arguments:
+
+        """
+
+        self.session.confirm = None
+        confirm = mock.Mock()
+        mock_confirm.return_value = confirm
+        mail_2_rmq.fanout_rmq(
+            self.cfg, mock_log, self.qnames, self.msg, session=self.session)
+
+        self.assertEqual(
+            (mock_confirm.call_count,
+             [call[1]["confirm"] for call in mock_process.call_args_list],
+             confirm.release.call_count, self.session.confirm),
+            (1, [confirm, confirm, confirm], 1, None))
+
+    @mock.patch("mail_2_rmq.MEMORY_PUBLISHED", mail_2_rmq.collections.deque())
+    @mock.patch("mail_2_rmq.MemoryRmq.connect",
+                autospec=True, side_effect=mail_2_rmq.MemoryRmq.connect)
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_pooled_one_connection(self, mock_log, mock_connect):
+
+        """Function:  test_pooled_one_connection
+
+        Description:  Test a pooled session publishes to every queue over
+            one connection.
+
+        Arguments:
+
+        """
+
+        cfg = types.SimpleNamespace(
+            host="HOSTNAME", exchange_name="EXCHANGE_NAME",
+            err_queue="ERROR_QUEUE", rmq_backend="memory")
+        pool = mail_2_rmq.RmqPool(cfg, mock_log)
+        session = mail_2_rmq.RmqSession(cfg, mock_log, pool=pool)
+        mail_2_rmq.fanout_rmq(
+            cfg, mock_log, self.qnames, mail_2_rmq.parse_data(
+                b"Subject: Fanout\n\nBody\n"), session=session)
+        session.close()
+
+        self.assertEqual(
+            (mock_connect.call_count,
+             [item.queue_name for item in mail_2_rmq.MEMORY_PUBLISHED]),
+            (1, self.qnames))
+
+    @mock.patch("mail_2_rmq.MEMORY_PUBLISHED", mail_2_rmq.collections.deque())
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_pooled_confirm_released(self, mock_log):
+
+        """Function:  test_pooled_confirm_released
+
+        Description:  Test a pooled channel is not left in confirm mode
+            after the call without the pub_confirm setting.
+
+        Arguments:
+
+        """
+
+        cfg = types.SimpleNamespace(
+            host="HOSTNAME", exchange_name="EXCHANGE_NAME",
+            err_queue="ERROR_QUEUE", rmq_backend="memory")
+        pool = mail_2_rmq.RmqPool(cfg, mock_log)
+        session = mail_2_rmq.RmqSession(cfg, mock_log, pool=pool)
+        mail_2_rmq.fanout_rmq(
+            cfg, mock_log, self.qnames, mail_2_rmq.parse_data(
+                b"Subject: Fanout\n\nBody\n"), session=session)
+        rmq = session.rmq
+        session.close()
+
+        self.assertEqual(
+            (len(mail_2_rmq.MEMORY_PUBLISHED), rmq.pub_confirm,
+             rmq.channel.is_open, rmq.channel.callback),
+            (3, None, True, None))
+
+
+if __name__ == "__main__":
+    unittest.main()
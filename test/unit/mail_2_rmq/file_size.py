@@ -0,0 +1,72 @@
+# Classification (U)
+
+"""Program:  file_size.py
+
+    Description:  Unit testing of file_size in mail_2_rmq.py.
+
+    Usage:
+        test/unit/mail_2_rmq/file_size.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import tempfile
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mail_2_rmq                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=C0413,E0401
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_file
+        test_no_file
+
+    """
+
+    def test_file(self):
+
+        """Function:  test_file
+
+        Description:  Test the size of a file.
+
+        Arguments:
+
+        """
+
+        with tempfile.NamedTemporaryFile() as f_hldr:
+            f_hldr.write(b"12345")
+            f_hldr.flush()
+
+            self.assertEqual(mail_2_rmq.file_size(f_hldr.name), 5)
+
+    def test_no_file(self):
+
+        """Function:  test_no_file
+
+        Description:  Test a missing file has a size of zero.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mail_2_rmq.file_size("/no/such/file"), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
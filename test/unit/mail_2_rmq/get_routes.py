@@ -0,0 +1,63 @@
+# Classification (U)
+
+"""Program:  get_routes.py
+
+    Description:  Unit testing of get_routes in mail_2_rmq.py.
+
+    Usage:
+        test/unit/mail_2_rmq/get_routes.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import types
+
+# Local
+sys.path.append(os.getcwd())
+import mail_2_rmq                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=C0413,E0401
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_compiled_once
+
+    """
+
+    def test_compiled_once(self):
+
+        """Function:  test_compiled_once
+
+        Description:  Test the routing table is compiled once and kept with
+            the configuration.
+
+        Arguments:
+
+        """
+
+        cfg = types.SimpleNamespace(
+            valid_queues=["Queue1"], queue_dict={"name@domain": "Queue2"},
+            err_file_queue="ErrFileQueue")
+        routes = mail_2_rmq.get_routes(cfg)
+
+        self.assertEqual(
+            (mail_2_rmq.get_routes(cfg) is routes, cfg.route_table is routes,
+             routes.sender_queue("name@domain")), (True, True, "Queue2"))
+
+
+if __name__ == "__main__":
+    unittest.main()
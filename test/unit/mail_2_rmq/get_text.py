@@ -89,6 +89,8 @@ class PartMsgTest2():
         get_content_maintype
         get_payload
         get_content_type
+        get_content_charset
+        get_filename
 
     """
 
@@ -106,6 +108,7 @@ class PartMsgTest2():
         self.payload = b"Email Message"
         self.decode = None
         self.content_type = "text/plain"
+        self.charset = None
 
     def get_content_maintype(self):
 
@@ -146,6 +149,30 @@ class PartMsgTest2():
 
         return self.content_type
 
+    def get_content_charset(self):
+
+        """Method:  get_content_charset
+
+        Description:  Stub holder for get_content_charset method.
+
+        Arguments:
+
+        """
+
+        return self.charset
+
+    def get_filename(self):
+
+        """Method:  get_filename
+
+        Description:  Stub holder for get_filename method.
+
+        Arguments:
+
+        """
+
+        return None
+
 
 class PartMsgTest():
 
@@ -159,6 +186,7 @@ class PartMsgTest():
         get_content_maintype
         get_payload
         get_content_type
+        get_filename
 
     """
 
@@ -216,6 +244,18 @@ class PartMsgTest():
 
         return self.content_type
 
+    def get_filename(self):
+
+        """Method:  get_filename
+
+        Description:  Stub holder for get_filename method.
+
+        Arguments:
+
+        """
+
+        return None
+
 
 class UnitTest(unittest.TestCase):
 
@@ -231,6 +271,8 @@ class UnitTest(unittest.TestCase):
         test_multi_part_msg
         test_two_part_msg
         test_single_part_msg_byte
+        test_single_part_msg_charset
+        test_single_part_msg_bad_charset
         test_single_part_msg
         test_empty_msg
 
@@ -362,6 +404,40 @@ class UnitTest(unittest.TestCase):
 
         self.assertEqual(mail_2_rmq.get_text(self.msg), self.email_msg)
 
+    def test_single_part_msg_charset(self):
+
+        """Function:  test_single_part_msg_charset
+
+        Description:  Test single part byte message is decoded with the
+            charset of the part.
+
+        Arguments:
+
+        """
+
+        self.msg.walk_list = [self.part_msga]
+        self.part_msga.payload = "Caf\xe9".encode("ISO-8859-1")
+        self.part_msga.charset = "iso-8859-1"
+
+        self.assertEqual(mail_2_rmq.get_text(self.msg), "Caf\xe9")
+
+    def test_single_part_msg_bad_charset(self):
+
+        """Function:  test_single_part_msg_bad_charset
+
+        Description:  Test single part byte message with an unknown charset
+            and bytes which are not UTF-8.
+
+        Arguments:
+
+        """
+
+        self.msg.walk_list = [self.part_msga]
+        self.part_msga.payload = b"Caf\xe9"
+        self.part_msga.charset = "unknown-8bit"
+
+        self.assertEqual(mail_2_rmq.get_text(self.msg), "Caf\ufffd")
+
     def test_single_part_msg(self):
 
         """Function:  test_single_part_msg
@@ -90,6 +90,8 @@ class PartMsgTest2():
         get_content_maintype
         get_payload
         get_content_type
+        get_content_charset
+        get_filename
 
     """
 
@@ -107,6 +109,7 @@ class PartMsgTest2():
         self.payload = b"Email Message"
         self.decode = None
         self.content_type = "text/plain"
+        self.charset = None
 
     def get_content_maintype(self):
 
@@ -147,6 +150,30 @@ class PartMsgTest2():
 
         return self.content_type
 
+    def get_content_charset(self):
+
+        """Method:  get_content_charset
+
+        Description:  Stub holder for get_content_charset method.
+
+        Arguments:
+
+        """
+
+        return self.charset
+
+    def get_filename(self):
+
+        """Method:  get_filename
+
+        Description:  Stub holder for get_filename method.
+
+        Arguments:
+
+        """
+
+        return None
+
 
 class PartMsgTest():
 
@@ -160,6 +187,7 @@ class PartMsgTest():
         get_content_maintype
         get_payload
         get_content_type
+        get_filename
 
     """
 
@@ -217,6 +245,18 @@ class PartMsgTest():
 
         return self.content_type
 
+    def get_filename(self):
+
+        """Method:  get_filename
+
+        Description:  Stub holder for get_filename method.
+
+        Arguments:
+
+        """
+
+        return None
+
 
 class UnitTest(unittest.TestCase):
 
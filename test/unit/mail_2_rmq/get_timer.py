@@ -0,0 +1,95 @@
+# Classification (U)
+
+"""Program:  get_timer.py
+
+    Description:  Unit testing of get_timer in mail_2_rmq.py.
+
+    Usage:
+        test/unit/mail_2_rmq/get_timer.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import threading
+import types
+
+# Local
+sys.path.append(os.getcwd())
+import mail_2_rmq                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=C0413,E0401
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        tearDown
+        test_default
+        test_per_thread
+
+    """
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        mail_2_rmq.STAGE_TIMER.timer = mail_2_rmq.NULL_TIMER
+
+    def test_default(self):
+
+        """Function:  test_default
+
+        Description:  Test the NullTimer is returned in a new thread.
+
+        Arguments:
+
+        """
+
+        result = []
+        thread = threading.Thread(
+            target=lambda: result.append(mail_2_rmq.get_timer()))
+        thread.start()
+        thread.join()
+
+        self.assertEqual(result, [mail_2_rmq.NULL_TIMER])
+
+    def test_per_thread(self):
+
+        """Function:  test_per_thread
+
+        Description:  Test a timer started in another thread is not seen.
+
+        Arguments:
+
+        """
+
+        mail_2_rmq.STAGE_TIMER.timer = mail_2_rmq.NULL_TIMER
+        thread = threading.Thread(
+            target=mail_2_rmq.start_timer,
+            args=(types.SimpleNamespace(stage_timing=True),))
+        thread.start()
+        thread.join()
+
+        self.assertIs(mail_2_rmq.get_timer(), mail_2_rmq.NULL_TIMER)
+
+
+if __name__ == "__main__":
+    unittest.main()
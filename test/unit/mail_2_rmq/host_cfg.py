@@ -0,0 +1,130 @@
+# Classification (U)
+
+"""Program:  host_cfg.py
+
+    Description:  Unit testing of HostCfg in mail_2_rmq.py.
+
+    Usage:
+        test/unit/mail_2_rmq/host_cfg.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mail_2_rmq                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=C0413,E0401
+
+__version__ = version.__version__
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.host = "HOSTNAME"
+        self.port = 5672
+        self.host_list = ["node1:5673", "node2:5674"]
+        self.exchange_name = "EXCHANGE_NAME"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_node
+        test_node_no_port
+        test_other_settings
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+
+    def test_node(self):
+
+        """Function:  test_node
+
+        Description:  Test the host settings are narrowed to the node.
+
+        Arguments:
+
+        """
+
+        host_cfg = mail_2_rmq.HostCfg(self.cfg, "node2:5674")
+
+        self.assertEqual(
+            (host_cfg.host, host_cfg.port, host_cfg.host_list),
+            ("node2", 5674, ["node2:5674"]))
+
+    def test_node_no_port(self):
+
+        """Function:  test_node_no_port
+
+        Description:  Test a node without a port uses the port setting.
+
+        Arguments:
+
+        """
+
+        host_cfg = mail_2_rmq.HostCfg(self.cfg, "node3")
+
+        self.assertEqual((host_cfg.host, host_cfg.port), ("node3", 5672))
+
+    def test_other_settings(self):
+
+        """Function:  test_other_settings
+
+        Description:  Test other settings are read from the configuration.
+
+        Arguments:
+
+        """
+
+        host_cfg = mail_2_rmq.HostCfg(self.cfg, "node1:5673")
+
+        self.assertEqual(
+            (host_cfg.exchange_name, hasattr(host_cfg, "host_scoring")),
+            ("EXCHANGE_NAME", False))
+
+
+if __name__ == "__main__":
+    unittest.main()
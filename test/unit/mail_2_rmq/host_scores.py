@@ -0,0 +1,265 @@
+# Classification (U)
+
+"""Program:  host_scores.py
+
+    Description:  Unit testing of HostScores in mail_2_rmq.py.
+
+    Usage:
+        test/unit/mail_2_rmq/host_scores.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import json
+import shutil
+import socket
+import tempfile
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mail_2_rmq                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=C0413,E0401
+
+__version__ = version.__version__
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.host = "HOSTNAME"
+        self.port = 5672
+        self.host_list = ["node1:5672", "node2:5672", "node3:5672"]
+        self.tmp_dir = None
+        self.host_timeout = 0.5
+        self.host_retry = 60
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_no_state
+        test_update_success
+        test_update_failure
+        test_order_latency
+        test_order_failed_last
+        test_order_failed_retry
+        test_bad_state
+        test_probe_up
+        test_probe_down
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+        self.cfg.tmp_dir = tempfile.mkdtemp()
+        self.log = mock.Mock()
+        self.scores = mail_2_rmq.HostScores(self.cfg, self.log)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.cfg.tmp_dir)
+
+    def test_no_state(self):
+
+        """Function:  test_no_state
+
+        Description:  Test nodes keep the host_list order with no state.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            self.scores.order(self.cfg.host_list), self.cfg.host_list)
+
+    def test_update_success(self):
+
+        """Function:  test_update_success
+
+        Description:  Test a successful connect averages the latency and
+            clears the failures.
+
+        Arguments:
+
+        """
+
+        self.scores.update("node1:5672")
+        self.scores.update("node1:5672", 1.0)
+        self.scores.update("node1:5672", 2.0)
+
+        self.assertEqual(
+            self.scores.load()["node1:5672"],
+            {"latency": 1.3, "fails": 0,
+             "last_fail": self.scores.load()["node1:5672"]["last_fail"]})
+
+    def test_update_failure(self):
+
+        """Function:  test_update_failure
+
+        Description:  Test failures are counted.
+
+        Arguments:
+
+        """
+
+        self.scores.update("node2:5672")
+        self.scores.update("node2:5672")
+
+        self.assertEqual(self.scores.load()["node2:5672"]["fails"], 2)
+
+    def test_order_latency(self):
+
+        """Function:  test_order_latency
+
+        Description:  Test nodes are ordered fastest first.
+
+        Arguments:
+
+        """
+
+        self.scores.update("node1:5672", 0.3)
+        self.scores.update("node2:5672", 0.2)
+        self.scores.update("node3:5672", 0.1)
+
+        self.assertEqual(
+            self.scores.order(self.cfg.host_list),
+            ["node3:5672", "node2:5672", "node1:5672"])
+
+    def test_order_failed_last(self):
+
+        """Function:  test_order_failed_last
+
+        Description:  Test a recently failed node is tried last.
+
+        Arguments:
+
+        """
+
+        self.scores.update("node1:5672")
+        self.scores.update("node2:5672", 0.2)
+
+        self.assertEqual(
+            self.scores.order(self.cfg.host_list),
+            ["node3:5672", "node2:5672", "node1:5672"])
+
+    def test_order_failed_retry(self):
+
+        """Function:  test_order_failed_retry
+
+        Description:  Test a failed node is retried after host_retry.
+
+        Arguments:
+
+        """
+
+        self.scores.retry = 0
+        self.scores.update("node1:5672")
+
+        self.assertEqual(
+            self.scores.order(self.cfg.host_list), self.cfg.host_list)
+
+    def test_bad_state(self):
+
+        """Function:  test_bad_state
+
+        Description:  Test a corrupt state file is replaced.
+
+        Arguments:
+
+        """
+
+        with open(self.scores.state_file, mode="w",
+                  encoding="UTF-8") as f_hdlr:
+            f_hdlr.write("{bad json")
+
+        self.scores.update("node1:5672", 0.1)
+
+        with open(self.scores.state_file, mode="r",
+                  encoding="UTF-8") as f_hdlr:
+            self.assertEqual(list(json.load(f_hdlr)), ["node1:5672"])
+
+    def test_probe_up(self):
+
+        """Function:  test_probe_up
+
+        Description:  Test probing a node which is listening.
+
+        Arguments:
+
+        """
+
+        with socket.socket() as server:
+            server.bind(("127.0.0.1", 0))
+            server.listen()
+            node = f"127.0.0.1:{server.getsockname()[1]}"
+
+            self.assertIsNotNone(self.scores.probe(node))
+
+    def test_probe_down(self):
+
+        """Function:  test_probe_down
+
+        Description:  Test probing a node which is down.
+
+        Arguments:
+
+        """
+
+        with socket.socket() as server:
+            server.bind(("127.0.0.1", 0))
+            node = f"127.0.0.1:{server.getsockname()[1]}"
+
+            self.assertIsNone(self.scores.probe(node))
+
+
+if __name__ == "__main__":
+    unittest.main()
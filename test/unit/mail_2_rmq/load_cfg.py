@@ -71,6 +71,10 @@ class UnitTest(unittest.TestCase):
         test_false_true_cfg
         test_true_false_cfg
         test_true_true_cfg
+        test_compress_valid
+        test_compress_invalid
+        test_attach_format_invalid
+        test_routing_rules_invalid
 
     """
 
@@ -267,6 +271,85 @@ class UnitTest(unittest.TestCase):
         self.assertEqual(mail_2_rmq.load_cfg(self.cfg_name, self.cfg_dir),
                          (self.cfg, True, []))
 
+    @mock.patch("mail_2_rmq.gen_libs")
+    def test_compress_valid(self, mock_lib):
+
+        """Function:  test_compress_valid
+
+        Description:  Test with a known compress codec.
+
+        Arguments:
+
+        """
+
+        self.cfg.compress = "gzip"
+        mock_lib.load_module.return_value = self.cfg
+        mock_lib.chk_crt_dir.side_effect = self.results
+
+        self.assertEqual(mail_2_rmq.load_cfg(self.cfg_name, self.cfg_dir),
+                         (self.cfg, True, []))
+
+    @mock.patch("mail_2_rmq.gen_libs")
+    def test_compress_invalid(self, mock_lib):
+
+        """Function:  test_compress_invalid
+
+        Description:  Test with an unknown compress codec.
+
+        Arguments:
+
+        """
+
+        self.cfg.compress = "lzma"
+        mock_lib.load_module.return_value = self.cfg
+        mock_lib.chk_crt_dir.side_effect = self.results
+
+        self.assertEqual(
+            mail_2_rmq.load_cfg(self.cfg_name, self.cfg_dir)[1:],
+            (False, ["Unknown compress codec: lzma, valid codecs: gzip,"
+                     " zlib"]))
+
+    @mock.patch("mail_2_rmq.gen_libs")
+    def test_attach_format_invalid(self, mock_lib):
+
+        """Function:  test_attach_format_invalid
+
+        Description:  Test with an unknown attach_format.
+
+        Arguments:
+
+        """
+
+        self.cfg.attach_format = "json"
+        mock_lib.load_module.return_value = self.cfg
+        mock_lib.chk_crt_dir.side_effect = self.results
+
+        self.assertEqual(
+            mail_2_rmq.load_cfg(self.cfg_name, self.cfg_dir)[1:],
+            (False, ["Unknown attach_format: json, valid formats: dict,"
+                     " binary"]))
+
+    @mock.patch("mail_2_rmq.gen_libs")
+    def test_routing_rules_invalid(self, mock_lib):
+
+        """Function:  test_routing_rules_invalid
+
+        Description:  Test with a routing rule which does not compile.
+
+        Arguments:
+
+        """
+
+        self.cfg.valid_queues = []
+        self.cfg.queue_dict = {}
+        self.cfg.routing_rules = [{"name": "Rule1"}]
+        mock_lib.load_module.return_value = self.cfg
+        mock_lib.chk_crt_dir.side_effect = self.results
+
+        self.assertEqual(
+            mail_2_rmq.load_cfg(self.cfg_name, self.cfg_dir)[1:],
+            (False, ["Routing rule without a queue: {'name': 'Rule1'}"]))
+
 
 if __name__ == "__main__":
     unittest.main()
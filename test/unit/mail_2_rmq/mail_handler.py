@@ -0,0 +1,165 @@
+# Classification (U)
+
+"""Program:  mail_handler.py
+
+    Description:  Unit testing of MailHandler in mail_2_rmq.py.
+
+    Usage:
+        test/unit/mail_2_rmq/mail_handler.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import io
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mail_2_rmq                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=C0413,E0401
+
+__version__ = version.__version__
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.sock_file = "test/unit/mail_2_rmq/tmp/mail_2_rmq.sock"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_processed
+        test_failed
+        test_bad_encoding
+        test_stage_timing
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+        self.raw_msg = b"From: name@domain\nSubject: Queue1\n\nBody\n"
+        self.handler = mail_2_rmq.MailHandler.__new__(mail_2_rmq.MailHandler)
+        self.handler.server = mock.Mock()
+        self.handler.server.cfg = self.cfg
+        self.handler.connection = mock.Mock()
+        self.handler.rfile = io.BytesIO(self.raw_msg)
+        self.handler.wfile = io.BytesIO()
+
+    @mock.patch("mail_2_rmq.process_message")
+    def test_processed(self, mock_process):
+
+        """Function:  test_processed
+
+        Description:  Test email is processed and acknowledged.
+
+        Arguments:
+
+        """
+
+        self.handler.handle()
+
+        self.assertEqual(
+            (mock_process.call_args[1]["msg"]["subject"],
+             mock_process.call_args[1]["pool"],
+             self.handler.wfile.getvalue()),
+            ("Queue1", self.handler.server.pool, b"OK\n"))
+
+    @mock.patch("mail_2_rmq.process_message")
+    def test_failed(self, mock_process):
+
+        """Function:  test_failed
+
+        Description:  Test a failed email is reported back to the client.
+
+        Arguments:
+
+        """
+
+        mock_process.side_effect = ValueError("Error Message")
+        self.handler.handle()
+
+        self.assertEqual(
+            self.handler.wfile.getvalue(), b"ERR Error Message\n")
+
+    @mock.patch("mail_2_rmq.process_message")
+    def test_bad_encoding(self, mock_process):
+
+        """Function:  test_bad_encoding
+
+        Description:  Test an email with invalid UTF-8 is still processed.
+
+        Arguments:
+
+        """
+
+        self.handler.rfile = io.BytesIO(self.raw_msg + b"\xff\n")
+        self.handler.handle()
+
+        self.assertEqual(
+            (mock_process.call_count, self.handler.wfile.getvalue()),
+            (1, b"OK\n"))
+
+    @mock.patch("mail_2_rmq.process_message")
+    def test_stage_timing(self, mock_process):
+
+        """Function:  test_stage_timing
+
+        Description:  Test the stage timer is started before the email is
+            parsed.
+
+        Arguments:
+
+        """
+
+        self.cfg.stage_timing = True
+        self.handler.handle()
+        timer = mock_process.call_args[1]["timer"]
+
+        self.assertEqual(
+            ("parse" in timer.stages, timer.counts["email_bytes"]),
+            (True, len(self.raw_msg)))
+
+
+if __name__ == "__main__":
+    unittest.main()
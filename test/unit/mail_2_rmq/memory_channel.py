@@ -0,0 +1,184 @@
+# Classification (U)
+
+"""Program:  memory_channel.py
+
+    Description:  Unit testing of MemoryChannel in mail_2_rmq.py.
+
+    Usage:
+        test/unit/mail_2_rmq/memory_channel.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import types
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mail_2_rmq                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=C0413,E0401
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_confirm_ack
+        test_confirm_nack
+        test_unroutable
+        test_open
+        test_keep
+        test_latency
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = types.SimpleNamespace()
+        self.rmq = types.SimpleNamespace(queue_name="Queue1")
+        self.frames = []
+
+    @mock.patch("mail_2_rmq.MEMORY_PUBLISHED", mail_2_rmq.collections.deque())
+    def test_confirm_ack(self):
+
+        """Function:  test_confirm_ack
+
+        Description:  Test publishes are acked by delivery tag when events
+            are processed.
+
+        Arguments:
+
+        """
+
+        channel = mail_2_rmq.MemoryChannel(self.rmq, self.cfg)
+        channel._impl.confirm_delivery(           # pylint:disable=W0212
+            ack_nack_callback=self.frames.append)
+        channel.basic_publish("Exchange", "RKey", "Body1")
+        channel.basic_publish("Exchange", "RKey", "Body2")
+        sent = len(self.frames)
+        channel.process_data_events(time_limit=0)
+
+        self.assertEqual(
+            (sent, [(type(frame.method).__name__, frame.method.delivery_tag)
+                    for frame in self.frames]),
+            (0, [("Ack", 1), ("Ack", 2)]))
+
+    @mock.patch("mail_2_rmq.MEMORY_PUBLISHED", mail_2_rmq.collections.deque())
+    def test_confirm_nack(self):
+
+        """Function:  test_confirm_nack
+
+        Description:  Test a failed publish is nacked in confirm mode.
+
+        Arguments:
+
+        """
+
+        self.cfg.memory_fail = 1
+        channel = mail_2_rmq.MemoryChannel(self.rmq, self.cfg)
+        channel.confirm_delivery(ack_nack_callback=self.frames.append)
+        channel.basic_publish("Exchange", "RKey", "Body1")
+        channel.process_data_events()
+
+        self.assertEqual(
+            (type(self.frames[0].method).__name__,
+             len(mail_2_rmq.MEMORY_PUBLISHED)), ("Nack", 0))
+
+    def test_unroutable(self):
+
+        """Function:  test_unroutable
+
+        Description:  Test a failed publish raises UnroutableError without
+            confirm mode.
+
+        Arguments:
+
+        """
+
+        self.cfg.memory_fail = 1
+        channel = mail_2_rmq.MemoryChannel(self.rmq, self.cfg)
+
+        with self.assertRaises(mail_2_rmq.pika.exceptions.UnroutableError):
+            channel.basic_publish("Exchange", "RKey", "Body1")
+
+    def test_open(self):
+
+        """Function:  test_open
+
+        Description:  Test a reopened channel is not in confirm mode.
+
+        Arguments:
+
+        """
+
+        self.cfg.memory_fail = 1
+        channel = mail_2_rmq.MemoryChannel(self.rmq, self.cfg)
+        channel.confirm_delivery(ack_nack_callback=self.frames.append)
+        channel.close()
+        channel.open()
+
+        with self.assertRaises(mail_2_rmq.pika.exceptions.UnroutableError):
+            channel.basic_publish("Exchange", "RKey", "Body1")
+
+    @mock.patch("mail_2_rmq.MEMORY_PUBLISHED", mail_2_rmq.collections.deque())
+    def test_keep(self):
+
+        """Function:  test_keep
+
+        Description:  Test only the last memory_keep messages are kept.
+
+        Arguments:
+
+        """
+
+        self.cfg.memory_keep = 2
+        channel = mail_2_rmq.MemoryChannel(self.rmq, self.cfg)
+
+        for body in ["Body1", "Body2", "Body3"]:
+            channel.basic_publish("Exchange", "RKey", body)
+
+        self.assertEqual(
+            [item.body for item in mail_2_rmq.MEMORY_PUBLISHED],
+            ["Body2", "Body3"])
+
+    @mock.patch("mail_2_rmq.time.sleep")
+    def test_latency(self, mock_sleep):
+
+        """Function:  test_latency
+
+        Description:  Test the simulated publish latency.
+
+        Arguments:
+
+        """
+
+        self.cfg.memory_latency = 0.01
+        channel = mail_2_rmq.MemoryChannel(self.rmq, self.cfg)
+        channel.basic_publish("Exchange", "RKey", "Body1")
+
+        mock_sleep.assert_called_once_with(0.01)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,221 @@
+# Classification (U)
+
+"""Program:  memory_rmq.py
+
+    Description:  Unit testing of MemoryRmq in mail_2_rmq.py.
+
+    Usage:
+        test/unit/mail_2_rmq/memory_rmq.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mail_2_rmq                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=C0413,E0401
+
+__version__ = version.__version__
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.host = "HOSTNAME"
+        self.exchange_name = "EXCHANGE_NAME"
+        self.rmq_backend = "memory"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_create_connection
+        test_connect_fail
+        test_publish
+        test_publish_props
+        test_publish_fail
+        test_publish_closed
+        test_close
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+        self.qname = "Queue1"
+        self.body = "Message Body"
+
+    def test_create_connection(self):
+
+        """Function:  test_create_connection
+
+        Description:  Test the connection and channel are opened and the
+            queue is declared.
+
+        Arguments:
+
+        """
+
+        rmq = mail_2_rmq.MemoryRmq(self.cfg, self.qname, self.qname)
+
+        self.assertEqual(
+            (rmq.create_connection(), rmq.connection.is_open,
+             rmq.channel.is_open, rmq.queues),
+            ((True, None), True, True, {self.qname}))
+
+    def test_connect_fail(self):
+
+        """Function:  test_connect_fail
+
+        Description:  Test with a simulated connection failure.
+
+        Arguments:
+
+        """
+
+        self.cfg.memory_connect_fail = True
+        rmq = mail_2_rmq.MemoryRmq(self.cfg, self.qname, self.qname)
+
+        self.assertEqual(
+            (rmq.create_connection()[0], rmq.channel), (False, None))
+
+    @mock.patch("mail_2_rmq.MEMORY_STATS", mail_2_rmq.collections.Counter())
+    @mock.patch("mail_2_rmq.MEMORY_PUBLISHED", mail_2_rmq.collections.deque())
+    def test_publish(self):
+
+        """Function:  test_publish
+
+        Description:  Test a published message is recorded with its queue
+            and properties.
+
+        Arguments:
+
+        """
+
+        rmq = mail_2_rmq.MemoryRmq(self.cfg, self.qname, "RKey")
+        rmq.create_connection()
+
+        self.assertEqual(
+            (rmq.publish_msg(self.body), list(mail_2_rmq.MEMORY_PUBLISHED),
+             mail_2_rmq.MEMORY_STATS),
+            (True, [mail_2_rmq.MemoryMsg(
+                "EXCHANGE_NAME", self.qname, "RKey", self.body,
+                {"delivery_mode": 2})],
+             {"messages": 1, "bytes": len(self.body)}))
+
+    @mock.patch("mail_2_rmq.MEMORY_PUBLISHED", mail_2_rmq.collections.deque())
+    def test_publish_props(self):
+
+        """Function:  test_publish_props
+
+        Description:  Test a message published with properties by
+            publish_body.
+
+        Arguments:
+
+        """
+
+        rmq = mail_2_rmq.MemoryRmq(self.cfg, self.qname, self.qname)
+        rmq.create_connection()
+
+        self.assertTrue(mail_2_rmq.publish_body(
+            rmq, b"Data", content_encoding="gzip"))
+        self.assertEqual(
+            mail_2_rmq.MEMORY_PUBLISHED[0].properties,
+            {"delivery_mode": 2, "content_encoding": "gzip"})
+
+    @mock.patch("mail_2_rmq.MEMORY_PUBLISHED", mail_2_rmq.collections.deque())
+    def test_publish_fail(self):
+
+        """Function:  test_publish_fail
+
+        Description:  Test with a simulated publish failure.
+
+        Arguments:
+
+        """
+
+        self.cfg.memory_fail = 1
+        rmq = mail_2_rmq.MemoryRmq(self.cfg, self.qname, self.qname)
+        rmq.create_connection()
+
+        self.assertEqual(
+            (rmq.publish_msg(self.body), len(mail_2_rmq.MEMORY_PUBLISHED)),
+            (False, 0))
+
+    def test_publish_closed(self):
+
+        """Function:  test_publish_closed
+
+        Description:  Test publishing on a closed channel.
+
+        Arguments:
+
+        """
+
+        rmq = mail_2_rmq.MemoryRmq(self.cfg, self.qname, self.qname)
+        rmq.create_connection()
+        rmq.close()
+
+        self.assertFalse(rmq.publish_msg(self.body))
+
+    def test_close(self):
+
+        """Function:  test_close
+
+        Description:  Test the channel and connection are closed.
+
+        Arguments:
+
+        """
+
+        rmq = mail_2_rmq.MemoryRmq(self.cfg, self.qname, self.qname)
+        rmq.create_connection()
+        rmq.close()
+
+        self.assertEqual(
+            (rmq.connection.is_open, rmq.channel.is_closed), (False, True))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,279 @@
+# Classification (U)
+
+"""Program:  metrics_file.py
+
+    Description:  Unit testing of MetricsFile in mail_2_rmq.py.
+
+    Usage:
+        test/unit/mail_2_rmq/metrics_file.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import types
+import json
+import shutil
+import tempfile
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mail_2_rmq                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=C0413,E0401
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_merge_routes
+        test_merge_counts
+        test_merge_histogram
+        test_render_routes
+        test_render_histogram
+        test_render_empty
+        test_update
+        test_update_adds
+        test_update_bad_state
+        test_update_failed
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.mkdtemp()
+        self.cfg = types.SimpleNamespace(
+            metrics_file=os.path.join(self.tmp_dir, "mail_2_rmq.prom"))
+        self.log = mock.Mock()
+        self.metrics = mail_2_rmq.MetricsFile(self.cfg, self.log)
+        self.timer = mail_2_rmq.StageTimer()
+        self.timer.set_route("subject:Queue1")
+        self.timer.count("publish_bytes", 100)
+        self.timer.observe("attach_bytes", 2048)
+        self.timer.observe("publish", 0.02)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.tmp_dir)
+
+    def test_merge_routes(self):
+
+        """Function:  test_merge_routes
+
+        Description:  Test emails are counted by the kind of route.
+
+        Arguments:
+
+        """
+
+        state = {}
+        self.metrics.merge(state, self.timer)
+        self.timer.set_route("err_queue")
+        self.metrics.merge(state, self.timer)
+        self.metrics.merge(state, mail_2_rmq.StageTimer())
+
+        self.assertEqual(
+            state["routes"], {"subject": 1, "err_queue": 1, "none": 1})
+
+    def test_merge_counts(self):
+
+        """Function:  test_merge_counts
+
+        Description:  Test the counts are added up.
+
+        Arguments:
+
+        """
+
+        state = {}
+        self.metrics.merge(state, self.timer)
+        self.metrics.merge(state, self.timer)
+
+        self.assertEqual(
+            state["counts"],
+            {"publish_bytes": 200, "attachments": 0, "archived": 0,
+             "spooled": 0})
+
+    def test_merge_histogram(self):
+
+        """Function:  test_merge_histogram
+
+        Description:  Test the samples are added to cumulative buckets.
+
+        Arguments:
+
+        """
+
+        state = {}
+        self.metrics.merge(state, self.timer)
+
+        self.assertEqual(
+            state["histograms"]["attach_bytes"],
+            {"buckets": [0, 1, 1, 1, 1, 1, 1], "sum": 2048, "count": 1})
+
+    def test_render_routes(self):
+
+        """Function:  test_render_routes
+
+        Description:  Test the route counter lines.
+
+        Arguments:
+
+        """
+
+        state = {}
+        self.metrics.merge(state, self.timer)
+        lines = self.metrics.render(state).splitlines()
+
+        self.assertEqual(
+            lines[:3],
+            ["# HELP mail_2_rmq_messages_total Emails processed by route.",
+             "# TYPE mail_2_rmq_messages_total counter",
+             'mail_2_rmq_messages_total{route="subject"} 1'])
+
+    def test_render_histogram(self):
+
+        """Function:  test_render_histogram
+
+        Description:  Test the histogram lines.
+
+        Arguments:
+
+        """
+
+        state = {}
+        self.metrics.merge(state, self.timer)
+        lines = self.metrics.render(state).splitlines()
+
+        self.assertTrue(
+            {'mail_2_rmq_publish_seconds_bucket{le="0.01"} 0',
+             'mail_2_rmq_publish_seconds_bucket{le="0.05"} 1',
+             'mail_2_rmq_publish_seconds_bucket{le="+Inf"} 1',
+             "mail_2_rmq_publish_seconds_sum 0.02",
+             "mail_2_rmq_publish_seconds_count 1",
+             "# TYPE mail_2_rmq_publish_seconds histogram"}
+            <= set(lines))
+
+    def test_render_empty(self):
+
+        """Function:  test_render_empty
+
+        Description:  Test every metric is written with no values.
+
+        Arguments:
+
+        """
+
+        data = self.metrics.render({})
+
+        self.assertEqual(
+            (data.count("# TYPE"), "mail_2_rmq_archived_total 0" in data,
+             data.endswith("\n")), (8, True, True))
+
+    def test_update(self):
+
+        """Function:  test_update
+
+        Description:  Test the state and metrics files are written.
+
+        Arguments:
+
+        """
+
+        self.metrics.update(self.timer)
+
+        with open(self.cfg.metrics_file, encoding="UTF-8") as fhdr:
+            data = fhdr.read()
+
+        self.assertEqual(
+            ("mail_2_rmq_published_bytes_total 100" in data,
+             sorted(os.listdir(self.tmp_dir))),
+            (True, ["mail_2_rmq.prom", "mail_2_rmq.prom.json"]))
+
+    def test_update_adds(self):
+
+        """Function:  test_update_adds
+
+        Description:  Test updates from separate instances are merged.
+
+        Arguments:
+
+        """
+
+        self.metrics.update(self.timer)
+        mail_2_rmq.MetricsFile(self.cfg, self.log).update(self.timer)
+
+        with open(self.metrics.state_file, encoding="UTF-8") as fhdr:
+            state = json.load(fhdr)
+
+        self.assertEqual(
+            (state["routes"], state["counts"]["publish_bytes"]),
+            ({"subject": 2}, 200))
+
+    def test_update_bad_state(self):
+
+        """Function:  test_update_bad_state
+
+        Description:  Test a state file which can not be read is started
+            again.
+
+        Arguments:
+
+        """
+
+        with open(self.metrics.state_file, "w", encoding="UTF-8") as fhdr:
+            fhdr.write("{Not JSON")
+
+        self.metrics.update(self.timer)
+
+        with open(self.metrics.state_file, encoding="UTF-8") as fhdr:
+            self.assertEqual(json.load(fhdr)["routes"], {"subject": 1})
+
+    def test_update_failed(self):
+
+        """Function:  test_update_failed
+
+        Description:  Test a metrics directory which does not exist.
+
+        Arguments:
+
+        """
+
+        self.cfg.metrics_file = os.path.join(self.tmp_dir, "none", "m.prom")
+        mail_2_rmq.MetricsFile(self.cfg, self.log).update(self.timer)
+
+        self.assertEqual(self.log.log_warn.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+# Classification (U)
+
+"""Program:  null_timer.py
+
+    Description:  Unit testing of NullTimer in mail_2_rmq.py.
+
+    Usage:
+        test/unit/mail_2_rmq/null_timer.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mail_2_rmq                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=C0413,E0401
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_disabled
+        test_stage
+        test_no_state
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.timer = mail_2_rmq.NullTimer()
+
+    def test_disabled(self):
+
+        """Function:  test_disabled
+
+        Description:  Test the timer is disabled and has no summary.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            (self.timer.enabled, self.timer.summary()), (False, None))
+
+    def test_stage(self):
+
+        """Function:  test_stage
+
+        Description:  Test the same context manager is returned for every
+            stage.
+
+        Arguments:
+
+        """
+
+        with self.timer.stage("parse"):
+            pass
+
+        self.assertIs(self.timer.stage("parse"), self.timer.stage("publish"))
+
+    def test_no_state(self):
+
+        """Function:  test_no_state
+
+        Description:  Test counts, samples and routes are not kept.
+
+        Arguments:
+
+        """
+
+        self.timer.count("attachments")
+        self.timer.observe("attach_bytes", 1024)
+        self.timer.set_route("file")
+
+        self.assertEqual(vars(self.timer), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,208 @@
+# Classification (U)
+
+"""Program:  open_rmq.py
+
+    Description:  Unit testing of open_rmq in mail_2_rmq.py.
+
+    Usage:
+        test/unit/mail_2_rmq/open_rmq.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mail_2_rmq                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=C0413,E0401
+
+__version__ = version.__version__
+
+
+class Rmq():                                            # pylint:disable=R0903
+
+    """Class:  Rmq
+
+    Description:  Class which is a representation of the
+        rabbitmq_class.RabbitMQPub class.
+
+    Methods:
+        __init__
+        create_connection
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the Rmq class.
+
+        Arguments:
+
+        """
+
+        self.conn_status = True
+        self.err_msg = None
+
+    def create_connection(self):
+
+        """Method:  create_connection
+
+        Description:  Stub holder for create_connection method.
+
+        Arguments:
+
+        """
+
+        return self.conn_status, self.err_msg
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.host = "HOSTNAME"
+        self.exchange_name = "EXCHANGE_NAME"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_connected
+        test_not_connected
+        test_declared
+        test_not_declared
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+        self.rmq = Rmq()
+        self.qname = "Queue1"
+
+    @mock.patch("mail_2_rmq.rabbitmq_class.create_rmqpub")
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_connected(self, mock_log, mock_rmq):
+
+        """Function:  test_connected
+
+        Description:  Test with a successful connection.
+
+        Arguments:
+
+        """
+
+        mock_rmq.return_value = self.rmq
+
+        self.assertEqual(
+            mail_2_rmq.open_rmq(self.cfg, mock_log, self.qname, self.qname),
+            (self.rmq, True, None))
+
+    @mock.patch("mail_2_rmq.rabbitmq_class.create_rmqpub")
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_not_connected(self, mock_log, mock_rmq):
+
+        """Function:  test_not_connected
+
+        Description:  Test with a failed connection.
+
+        Arguments:
+
+        """
+
+        self.rmq.conn_status = False
+        self.rmq.err_msg = "Error Message"
+        mock_rmq.return_value = self.rmq
+
+        self.assertEqual(
+            mail_2_rmq.open_rmq(self.cfg, mock_log, self.qname, self.qname),
+            (self.rmq, False, "Error Message"))
+
+    @mock.patch("mail_2_rmq.rabbitmq_class.create_rmqpub")
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_declared(self, mock_log, mock_rmq):
+
+        """Function:  test_declared
+
+        Description:  Test a queue in the declared topology skips the
+            declares.
+
+        Arguments:
+
+        """
+
+        rmq = mock.Mock()
+        rmq.connect.return_value = (True, None)
+        mock_rmq.return_value = rmq
+        mail_2_rmq.open_rmq(
+            self.cfg, mock_log, self.qname, self.qname,
+            topology={(self.qname, self.qname)})
+
+        rmq.create_connection.assert_not_called()
+        rmq.open_channel.assert_called_once_with()
+
+    @mock.patch("mail_2_rmq.rabbitmq_class.create_rmqpub")
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_not_declared(self, mock_log, mock_rmq):
+
+        """Function:  test_not_declared
+
+        Description:  Test a queue not in the declared topology is declared.
+
+        Arguments:
+
+        """
+
+        rmq = mock.Mock()
+        rmq.create_connection.return_value = (True, None)
+        mock_rmq.return_value = rmq
+        mail_2_rmq.open_rmq(
+            self.cfg, mock_log, "Queue2", "Queue2",
+            topology={(self.qname, self.qname)})
+
+        rmq.create_connection.assert_called_once_with()
+        rmq.connect.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
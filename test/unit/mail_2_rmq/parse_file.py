@@ -0,0 +1,98 @@
+# Classification (U)
+
+"""Program:  parse_file.py
+
+    Description:  Unit testing of parse_file in mail_2_rmq.py.
+
+    Usage:
+        test/unit/mail_2_rmq/parse_file.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mail_2_rmq                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=C0413,E0401
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_parse_file
+        test_parse_file_8bit
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.fname = "/path/file"
+        self.raw_msg = "From: name@domain\nSubject: Queue1\n\nEmail Body\n"
+
+    def test_parse_file(self):
+
+        """Function:  test_parse_file
+
+        Description:  Test parsing an email file.
+
+        Arguments:
+
+        """
+
+        with mock.patch("builtins.open", mock.mock_open(
+                read_data=self.raw_msg.encode("UTF-8"))) as mock_file:
+            msg = mail_2_rmq.parse_file(self.fname)
+
+        self.assertEqual(
+            (msg["subject"], msg.get_payload(), mock_file.call_args),
+            ("Queue1", "Email Body\n", mock.call(self.fname, mode="rb")))
+
+    def test_parse_file_8bit(self):
+
+        """Function:  test_parse_file_8bit
+
+        Description:  Test parsing an email file with raw 8-bit bytes which
+            are not UTF-8.
+
+        Arguments:
+
+        """
+
+        raw_msg = "Subject: Caf\xc3\xa9 Queue1\nContent-Type: text/plain;" \
+            " charset=iso-8859-1\n\nCaf\xe9\n"
+
+        with mock.patch("builtins.open", mock.mock_open(
+                read_data=raw_msg.encode("ISO-8859-1"))):
+            msg = mail_2_rmq.parse_file(self.fname)
+
+        self.assertEqual(
+            (msg["subject"], mail_2_rmq.get_text(msg)),
+            ("Caf\xe9 Queue1", "Caf\xe9\n"))
+
+
+if __name__ == "__main__":
+    unittest.main()
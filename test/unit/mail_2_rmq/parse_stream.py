@@ -0,0 +1,109 @@
+# Classification (U)
+
+"""Program:  parse_stream.py
+
+    Description:  Unit testing of parse_stream in mail_2_rmq.py.
+
+    Usage:
+        test/unit/mail_2_rmq/parse_stream.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import io
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mail_2_rmq                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=C0413,E0401
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_parse
+        test_chunks
+        test_8bit_header
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.raw_msg = b"From: name@domain\nSubject: Queue1\n\nEmail Body\n"
+
+    def test_parse(self):
+
+        """Function:  test_parse
+
+        Description:  Test parsing an email from a binary file handler.
+
+        Arguments:
+
+        """
+
+        msg = mail_2_rmq.parse_stream(io.BytesIO(self.raw_msg))
+
+        self.assertEqual(
+            (msg["from"], msg["subject"], msg.get_payload()),
+            ("name@domain", "Queue1", "Email Body\n"))
+
+    @mock.patch("mail_2_rmq.CHUNK_SIZE", 8)
+    def test_chunks(self):
+
+        """Function:  test_chunks
+
+        Description:  Test the email is read in fixed size chunks.
+
+        Arguments:
+
+        """
+
+        in_file = mock.Mock(wraps=io.BytesIO(self.raw_msg))
+        msg = mail_2_rmq.parse_stream(in_file)
+
+        self.assertEqual(
+            (msg["subject"], in_file.read.call_count,
+             {call[0][0] for call in in_file.read.call_args_list}),
+            ("Queue1", 7, {8}))
+
+    def test_8bit_header(self):
+
+        """Function:  test_8bit_header
+
+        Description:  Test a raw 8-bit header is returned as a string.
+
+        Arguments:
+
+        """
+
+        msg = mail_2_rmq.parse_stream(io.BytesIO(
+            b"Subject: \xff Queue1\n\nBody\n"))
+
+        self.assertEqual(msg["subject"], "� Queue1")
+
+
+if __name__ == "__main__":
+    unittest.main()
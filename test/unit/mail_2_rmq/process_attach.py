@@ -35,7 +35,9 @@ class MultiPart():
 
     Methods:
         __init__
+        get_content_maintype
         get_content_type
+        get_content_charset
         get_filename
         get_payload
 
@@ -59,6 +61,18 @@ class MultiPart():
         self.filename = filename
         self.payload = data
 
+    def get_content_maintype(self):
+
+        """Method:  get_content_maintype
+
+        Description:  Stub holder for get_content_maintype method.
+
+        Arguments:
+
+        """
+
+        return self.content_type.split("/")[0]
+
     def get_content_type(self):
 
         """Method:  get_content_type
@@ -71,6 +85,18 @@ class MultiPart():
 
         return self.content_type
 
+    def get_content_charset(self):
+
+        """Method:  get_content_charset
+
+        Description:  Stub holder for get_content_charset method.
+
+        Arguments:
+
+        """
+
+        return None
+
     def get_filename(self):
 
         """Method:  get_filename
@@ -263,7 +289,7 @@ class UnitTest(unittest.TestCase):
         test_multiple_attach_no_invalid
         test_multiple_attach_one_invalid
         test_multiple_valid_attach
-        test_remove_fail
+        test_spill
         test_one_valid_attach
         tearDown
 
@@ -279,20 +305,17 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        self.fname_encode = "Filename.pdf.encoded"
-        self.fname_encode2 = "Filename.txt.encoded"
+        self.encoded = "TWVzc2FnZV9Cb2R5\n"
         self.app_pdf = "application/pdf"
         self.app_zip = "application/zip"
         self.text_plain = "text/plain"
         self.cfg = CfgTest()
-        self.results = [os.path.join(self.cfg.tmp_dir, self.fname_encode)]
+        self.results = [("Filename.pdf", self.encoded)]
         self.results2 = [
-            os.path.join(self.cfg.tmp_dir, self.fname_encode),
-            os.path.join(self.cfg.tmp_dir, "Filename2.pdf.encoded")]
+            ("Filename.pdf", self.encoded), ("Filename2.pdf", self.encoded)]
         self.results3 = [
-            os.path.join(self.cfg.tmp_dir, self.fname_encode),
-            os.path.join(self.cfg.tmp_dir, "Filename.zip.encoded")]
-        self.results4 = [os.path.join(self.cfg.tmp_dir, self.fname_encode2)]
+            ("Filename.pdf", self.encoded), ("Filename.zip", self.encoded)]
+        self.results4 = [("Filename.txt", self.encoded)]
         self.fname = "Filename.pdf"
         self.fname2 = "Filename2.pdf"
         self.fname3 = "Filename.zip"
@@ -301,6 +324,7 @@ class UnitTest(unittest.TestCase):
         self.data = "Message_Body"
         self.data2 = b"Message_Body"
         self.data3 = 12345
+        self.spill = None
 
     @mock.patch("mail_2_rmq.gen_class.Logger")
     def test_is_not_mulitpart(self, mock_log):
@@ -363,7 +387,8 @@ class UnitTest(unittest.TestCase):
 
         fname = mail_2_rmq.process_attach(msg, mock_log, self.cfg)
 
-        self.assertEqual(fname, self.results4)
+        self.assertEqual(
+            [(item.name, item.read()) for item in fname], self.results4)
 
     @mock.patch("mail_2_rmq.gen_class.Logger")
     def test_email_body_string(self, mock_log):
@@ -383,7 +408,8 @@ class UnitTest(unittest.TestCase):
 
         fname = mail_2_rmq.process_attach(msg, mock_log, self.cfg)
 
-        self.assertEqual(fname, self.results4)
+        self.assertEqual(
+            [(item.name, item.read()) for item in fname], self.results4)
 
     @mock.patch("mail_2_rmq.gen_class.Logger")
     def test_valid_text_attach(self, mock_log):
@@ -403,7 +429,8 @@ class UnitTest(unittest.TestCase):
 
         fname = mail_2_rmq.process_attach(msg, mock_log, self.cfg)
 
-        self.assertEqual(fname, self.results4)
+        self.assertEqual(
+            [(item.name, item.read()) for item in fname], self.results4)
 
     @mock.patch("mail_2_rmq.gen_class.Logger")
     def test_multiple_attach_multiple_types(self, mock_log):
@@ -425,7 +452,8 @@ class UnitTest(unittest.TestCase):
 
         fname = mail_2_rmq.process_attach(msg, mock_log, self.cfg)
 
-        self.assertEqual(fname, self.results3)
+        self.assertEqual(
+            [(item.name, item.read()) for item in fname], self.results3)
 
     @mock.patch("mail_2_rmq.gen_class.Logger")
     def test_multiple_attach_no_invalid(self, mock_log):
@@ -468,7 +496,8 @@ class UnitTest(unittest.TestCase):
 
         fname = mail_2_rmq.process_attach(msg, mock_log, self.cfg)
 
-        self.assertEqual(fname, self.results)
+        self.assertEqual(
+            [(item.name, item.read()) for item in fname], self.results)
 
     @mock.patch("mail_2_rmq.gen_class.Logger")
     def test_multiple_valid_attach(self, mock_log):
@@ -489,29 +518,34 @@ class UnitTest(unittest.TestCase):
 
         fname = mail_2_rmq.process_attach(msg, mock_log, self.cfg)
 
-        self.assertEqual(fname, self.results2)
+        self.assertEqual(
+            [(item.name, item.read()) for item in fname], self.results2)
 
-    @mock.patch("mail_2_rmq.gen_libs.rm_file")
     @mock.patch("mail_2_rmq.gen_class.Logger")
-    def test_remove_fail(self, mock_log, mock_rm):
+    def test_spill(self, mock_log):
 
-        """Function:  test_remove_fail
+        """Function:  test_spill
 
-        Description:  Test with file removal failure.
+        Description:  Test an attachment above attach_spill is encoded into a
+            spill file.
 
         Arguments:
 
         """
 
         mock_log.return_value = True
-        mock_rm.return_value = (True, "Error Message")
+        self.cfg.attach_spill = 4
 
         msg = Email(
             content_type=self.app_pdf, filename=self.fname, data=self.data)
 
         fname = mail_2_rmq.process_attach(msg, mock_log, self.cfg)
+        self.spill = fname[0].path
 
-        self.assertEqual(fname, self.results)
+        self.assertEqual(
+            (fname[0].data, os.path.dirname(fname[0].path),
+             [(item.name, item.read()) for item in fname]),
+            (None, self.cfg.tmp_dir, self.results))
 
     @mock.patch("mail_2_rmq.gen_class.Logger")
     def test_one_valid_attach(self, mock_log):
@@ -531,7 +565,8 @@ class UnitTest(unittest.TestCase):
 
         fname = mail_2_rmq.process_attach(msg, mock_log, self.cfg)
 
-        self.assertEqual(fname, self.results)
+        self.assertEqual(
+            [(item.name, item.read()) for item in fname], self.results)
 
     def tearDown(self):
 
@@ -543,33 +578,8 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        for item in self.results:
-            if os.path.isfile(item):
-                os.remove(item)
-
-        for item in self.results2:
-            if os.path.isfile(item):
-                os.remove(item)
-
-        for item in self.results3:
-            if os.path.isfile(item):
-                os.remove(item)
-
-        for item in self.results4:
-            if os.path.isfile(item):
-                os.remove(item)
-
-        if os.path.isfile(os.path.join(self.cfg.tmp_dir, self.fname)):
-            os.remove(os.path.join(self.cfg.tmp_dir, self.fname))
-
-        if os.path.isfile(os.path.join(self.cfg.tmp_dir, self.fname2)):
-            os.remove(os.path.join(self.cfg.tmp_dir, self.fname2))
-
-        if os.path.isfile(os.path.join(self.cfg.tmp_dir, self.fname3)):
-            os.remove(os.path.join(self.cfg.tmp_dir, self.fname3))
-
-        if os.path.isfile(os.path.join(self.cfg.tmp_dir, self.fname5)):
-            os.remove(os.path.join(self.cfg.tmp_dir, self.fname5))
+        if self.spill and os.path.isfile(self.spill):
+            os.remove(self.spill)
 
 
 if __name__ == "__main__":
@@ -35,7 +35,9 @@ class MultiPart():
 
     Methods:
         __init__
+        get_content_maintype
         get_content_type
+        get_content_charset
         get_filename
         get_payload
 
@@ -59,6 +61,18 @@ class MultiPart():
         self.filename = filename
         self.payload = data
 
+    def get_content_maintype(self):
+
+        """Method:  get_content_maintype
+
+        Description:  Stub holder for get_content_maintype method.
+
+        Arguments:
+
+        """
+
+        return self.content_type.split("/")[0]
+
     def get_content_type(self):
 
         """Method:  get_content_type
@@ -71,6 +85,18 @@ class MultiPart():
 
         return self.content_type
 
+    def get_content_charset(self):
+
+        """Method:  get_content_charset
+
+        Description:  Stub holder for get_content_charset method.
+
+        Arguments:
+
+        """
+
+        return None
+
     def get_filename(self):
 
         """Method:  get_filename
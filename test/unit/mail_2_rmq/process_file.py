@@ -182,8 +182,9 @@ class UnitTest(unittest.TestCase):
         self.subj2 = "InvalidSubject"
         self.msg = "Message Body"
         self.from_addr = "From Line"
-        self.fname_list = ["Fname"]
-        self.fname_list2 = ["Fname", "Fname2"]
+        self.fname_list = [mail_2_rmq.Attachment("Fname", data="")]
+        self.fname_list2 = [mail_2_rmq.Attachment("Fname", data=""),
+                            mail_2_rmq.Attachment("Fname2", data="")]
 
     @mock.patch("mail_2_rmq.connect_process", mock.Mock(return_value=True))
     @mock.patch("mail_2_rmq.process_attach")
@@ -147,6 +147,7 @@ class UnitTest(unittest.TestCase):
         test_no_file
         test_rm_fail
         test_valid_from
+        test_qname
         test_true_true_connect2
         test_true_true_connect
         test_false_false_connect2
@@ -173,8 +174,9 @@ class UnitTest(unittest.TestCase):
         self.subj = "SubjectLine"
         self.msg = "Message Body"
         self.from_addr = "From Line"
-        self.fname_list = ["Fname"]
-        self.fname_list2 = ["Fname", "Fname2"]
+        self.fname_list = [mail_2_rmq.Attachment("Fname", data="")]
+        self.fname_list2 = [mail_2_rmq.Attachment("Fname", data=""),
+                            mail_2_rmq.Attachment("Fname2", data="")]
 
     @mock.patch("mail_2_rmq.connect_process", mock.Mock(return_value=True))
     @mock.patch("mail_2_rmq.process_attach")
@@ -478,6 +480,27 @@ class UnitTest(unittest.TestCase):
             mail_2_rmq.process_from(
                 self.cfg, mock_log, self.msg, self.from_addr))
 
+    @mock.patch("mail_2_rmq.pub_to_rmq")
+    @mock.patch("mail_2_rmq.process_attach")
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_qname(self, mock_log, mock_attch, mock_pub):
+
+        """Function:  test_qname
+
+        Description:  Test the passed queue name is used.
+
+        Arguments:
+
+        """
+
+        mock_attch.return_value = self.fname_list
+        mail_2_rmq.process_from(
+            self.cfg, mock_log, self.msg, "name@partner.domain",
+            qname="PartnerQueue")
+
+        self.assertEqual(
+            mock_pub.call_args[0][2:4], ("PartnerQueue", "PartnerQueue"))
+
 
 if __name__ == "__main__":
     unittest.main()
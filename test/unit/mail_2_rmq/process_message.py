@@ -87,6 +87,13 @@ class UnitTest(unittest.TestCase):
         test_fname_miss
         test_invalid_subj
         test_valid_subj
+        test_from_domain
+        test_routing_rule
+        test_fanout_subj
+        test_stage_timing
+        test_metrics_file
+        test_profile
+        test_failed_cleanup
 
     """
 
@@ -304,6 +311,188 @@ class UnitTest(unittest.TestCase):
         self.assertFalse(
             mail_2_rmq.process_message(self.cfg, mock_log, msg=self.email_msg))
 
+    @mock.patch("mail_2_rmq.RmqSession", mock.Mock())
+    @mock.patch("mail_2_rmq.process_from")
+    @mock.patch("mail_2_rmq.filter_subject",
+                mock.Mock(return_value="invalid"))
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_from_domain(self, mock_log, mock_from):
+
+        """Function:  test_from_domain
+
+        Description:  Test with a from address matching a domain wildcard.
+
+        Arguments:
+
+        """
+
+        self.cfg.queue_dict["*@partner.domain"] = "PartnerQueue"
+        mail_2_rmq.process_message(
+            self.cfg, mock_log, msg={"subject": "invalid",
+                                     "from": "name@partner.domain"})
+
+        self.assertEqual(
+            (mock_from.call_args[0][3], mock_from.call_args[1]["qname"]),
+            ("name@partner.domain", "PartnerQueue"))
+
+    @mock.patch("mail_2_rmq.RmqSession", mock.Mock())
+    @mock.patch("mail_2_rmq.process_from")
+    @mock.patch("mail_2_rmq.process_rule")
+    @mock.patch("mail_2_rmq.filter_subject",
+                mock.Mock(return_value="invalid"))
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_routing_rule(self, mock_log, mock_rule, mock_from):
+
+        """Function:  test_routing_rule
+
+        Description:  Test a routing rule is used before the sender routing.
+
+        Arguments:
+
+        """
+
+        msg = mail_2_rmq.parse_data(
+            b"From: goodname@domain\nSubject: invalid\nX-Priority: 1\n\n")
+        self.cfg.routing_rules = [
+            {"queue": "Urgent", "headers": {"X-Priority": "^1"}}]
+        mail_2_rmq.process_message(self.cfg, mock_log, msg=msg)
+
+        self.assertEqual(
+            (mock_rule.call_args[0][3].queue, mock_from.call_count),
+            ("Urgent", 0))
+
+    @mock.patch("mail_2_rmq.RmqSession", mock.Mock())
+    @mock.patch("mail_2_rmq.process_file")
+    @mock.patch("mail_2_rmq.fanout_rmq")
+    @mock.patch("mail_2_rmq.gen_libs.pascalize",
+                mock.Mock(return_value="FanSubj"))
+    @mock.patch("mail_2_rmq.filter_subject",
+                mock.Mock(return_value="FanSubj"))
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_fanout_subj(self, mock_log, mock_fanout, mock_file):
+
+        """Function:  test_fanout_subj
+
+        Description:  Test a subject bound to several queues.
+
+        Arguments:
+
+        """
+
+        self.cfg.valid_queues2 = {"FanSubj": ["Queue3", "Queue4"]}
+        mail_2_rmq.process_message(
+            self.cfg, mock_log, msg={"subject": "FanSubj", "from": None})
+
+        self.assertEqual(
+            (mock_fanout.call_args[0][2], mock_file.call_count),
+            (["Queue3", "Queue4"], 0))
+
+    @mock.patch("mail_2_rmq.RmqSession", mock.Mock())
+    @mock.patch("mail_2_rmq.connect_rmq", mock.Mock())
+    @mock.patch("mail_2_rmq.gen_libs.pascalize",
+                mock.Mock(return_value="Queue1"))
+    @mock.patch("mail_2_rmq.filter_subject",
+                mock.Mock(return_value="Queue1"))
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_stage_timing(self, mock_log):
+
+        """Function:  test_stage_timing
+
+        Description:  Test a stage timing summary is logged for the email.
+
+        Arguments:
+
+        """
+
+        self.cfg.stage_timing = True
+        mail_2_rmq.process_message(
+            self.cfg, mock_log, msg={"subject": "Queue1", "from": None})
+        summary = mock_log.log_info.call_args[0][0]
+
+        self.assertEqual(
+            ("Stage timing:" in summary,
+             '"route": "subject:Queue1"' in summary,
+             mail_2_rmq.get_timer()), (True, True, mail_2_rmq.NULL_TIMER))
+
+    @mock.patch("mail_2_rmq.RmqSession", mock.Mock())
+    @mock.patch("mail_2_rmq.MetricsFile")
+    @mock.patch("mail_2_rmq.connect_rmq", mock.Mock())
+    @mock.patch("mail_2_rmq.gen_libs.pascalize",
+                mock.Mock(return_value="Queue1"))
+    @mock.patch("mail_2_rmq.filter_subject",
+                mock.Mock(return_value="Queue1"))
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_metrics_file(self, mock_log, mock_metrics):
+
+        """Function:  test_metrics_file
+
+        Description:  Test the metrics file is updated with the email timer.
+
+        Arguments:
+
+        """
+
+        self.cfg.metrics_file = "/path/mail_2_rmq.prom"
+        mail_2_rmq.process_message(
+            self.cfg, mock_log, msg={"subject": "Queue1", "from": None})
+        timer = mock_metrics.return_value.update.call_args[0][0]
+
+        self.assertEqual(
+            (timer.route, mock_log.log_info.call_count),
+            ("subject:Queue1", 3))
+
+    @mock.patch("mail_2_rmq.Profiler.active")
+    @mock.patch("mail_2_rmq.RmqSession", mock.Mock())
+    @mock.patch("mail_2_rmq.connect_rmq", mock.Mock())
+    @mock.patch("mail_2_rmq.gen_libs.pascalize",
+                mock.Mock(return_value="Queue1"))
+    @mock.patch("mail_2_rmq.filter_subject",
+                mock.Mock(return_value="Queue1"))
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_profile(self, mock_log, mock_profiler):
+
+        """Function:  test_profile
+
+        Description:  Test the email is added to the profile in progress.
+
+        Arguments:
+
+        """
+
+        msg = {"subject": "Queue1", "from": None}
+        mail_2_rmq.process_message(self.cfg, mock_log, msg=msg)
+
+        mock_profiler.add_msg.assert_called_once_with(msg)
+
+    @mock.patch("mail_2_rmq.RmqSession")
+    @mock.patch("mail_2_rmq.connect_rmq")
+    @mock.patch("mail_2_rmq.gen_libs.pascalize",
+                mock.Mock(return_value="Queue1"))
+    @mock.patch("mail_2_rmq.filter_subject",
+                mock.Mock(return_value="Queue1"))
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_failed_cleanup(self, mock_log, mock_connect, mock_session):
+
+        """Function:  test_failed_cleanup
+
+        Description:  Test the session is closed and the stage timer reset
+            when processing the email fails.
+
+        Arguments:
+
+        """
+
+        self.cfg.stage_timing = True
+        mock_connect.side_effect = ValueError("Error Message")
+
+        with self.assertRaises(ValueError):
+            mail_2_rmq.process_message(
+                self.cfg, mock_log, msg={"subject": "Queue1", "from": None})
+
+        self.assertEqual(
+            (mock_session.return_value.close.call_count,
+             mail_2_rmq.get_timer()), (1, mail_2_rmq.NULL_TIMER))
+
 
 if __name__ == "__main__":
     unittest.main()
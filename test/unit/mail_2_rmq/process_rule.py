@@ -0,0 +1,156 @@
+# Classification (U)
+
+"""Program:  process_rule.py
+
+    Description:  Unit testing of process_rule in mail_2_rmq.py.
+
+    Usage:
+        test/unit/mail_2_rmq/process_rule.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mail_2_rmq                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=C0413,E0401
+
+__version__ = version.__version__
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.err_file_queue = "ERROR_FILE_QUEUE"
+        self.attach_types = ["application/pdf"]
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_publish_email
+        test_publish_attach
+        test_missing_attach
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+        self.msg = "Email Message"
+        self.session = "Session"
+        self.attach = [mock.Mock(), mock.Mock()]
+
+    @mock.patch("mail_2_rmq.process_attach")
+    @mock.patch("mail_2_rmq.connect_rmq")
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_publish_email(self, mock_log, mock_rmq, mock_attach):
+
+        """Function:  test_publish_email
+
+        Description:  Test the email is published to the rule queue.
+
+        Arguments:
+
+        """
+
+        rule = mail_2_rmq.RouteRule({"queue": "RuleQueue"})
+        mail_2_rmq.process_rule(
+            self.cfg, mock_log, self.msg, rule, session=self.session)
+
+        self.assertEqual(
+            (mock_rmq.call_args, mock_attach.call_count),
+            (mock.call(self.cfg, mock_log, "RuleQueue", "RuleQueue",
+                       self.msg, session=self.session), 0))
+
+    @mock.patch("mail_2_rmq.pub_to_rmq")
+    @mock.patch("mail_2_rmq.process_attach")
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_publish_attach(self, mock_log, mock_attach, mock_pub):
+
+        """Function:  test_publish_attach
+
+        Description:  Test each attachment is published to the rule queue.
+
+        Arguments:
+
+        """
+
+        mock_attach.return_value = self.attach
+        rule = mail_2_rmq.RouteRule(
+            {"queue": "RuleQueue", "publish": "attach"})
+        mail_2_rmq.process_rule(
+            self.cfg, mock_log, self.msg, rule, session=self.session)
+
+        self.assertEqual(
+            mock_pub.call_args_list,
+            [mock.call(self.cfg, mock_log, "RuleQueue", "RuleQueue",
+                       self.msg, attach=attach, session=self.session)
+             for attach in self.attach])
+
+    @mock.patch("mail_2_rmq.connect_rmq")
+    @mock.patch("mail_2_rmq.process_attach", mock.Mock(return_value=[]))
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_missing_attach(self, mock_log, mock_rmq):
+
+        """Function:  test_missing_attach
+
+        Description:  Test an email without attachments is published to the
+            error file queue.
+
+        Arguments:
+
+        """
+
+        rule = mail_2_rmq.RouteRule(
+            {"queue": "RuleQueue", "publish": "attach"})
+        mail_2_rmq.process_rule(
+            self.cfg, mock_log, self.msg, rule, session=self.session)
+
+        self.assertEqual(
+            (mock_rmq.call_args[0][2], mock_log.log_warn.call_count),
+            ("ERROR_FILE_QUEUE", 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
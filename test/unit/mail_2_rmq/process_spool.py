@@ -0,0 +1,149 @@
+# Classification (U)
+
+"""Program:  process_spool.py
+
+    Description:  Unit testing of process_spool in mail_2_rmq.py.
+
+    Usage:
+        test/unit/mail_2_rmq/process_spool.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mail_2_rmq                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=C0413,E0401
+
+__version__ = version.__version__
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.spool_dir = "SPOOL_DIRECTORY"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_processed
+        test_remove_failed
+        test_parse_failed
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+        self.fname = "SPOOL_DIRECTORY/new/123.456.eml"
+        self.failed = "SPOOL_DIRECTORY/failed/123.456.eml"
+
+    @mock.patch("mail_2_rmq.os.replace")
+    @mock.patch("mail_2_rmq.gen_libs.rm_file")
+    @mock.patch("mail_2_rmq.process_message")
+    @mock.patch("mail_2_rmq.parse_file", mock.Mock(return_value="Msg"))
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_processed(self, mock_log, mock_process, mock_rm, mock_replace):
+
+        """Function:  test_processed
+
+        Description:  Test with file processed and removed.
+
+        Arguments:
+
+        """
+
+        mock_rm.return_value = (False, None)
+        mail_2_rmq.process_spool(self.cfg, mock_log, self.fname, pool=None)
+
+        mock_process.assert_called_once_with(
+            self.cfg, mock_log, msg="Msg", pool=None,
+            timer=mail_2_rmq.NULL_TIMER)
+        mock_rm.assert_called_once_with(self.fname)
+        mock_replace.assert_not_called()
+
+    @mock.patch("mail_2_rmq.gen_libs.rm_file")
+    @mock.patch("mail_2_rmq.process_message", mock.Mock(return_value=True))
+    @mock.patch("mail_2_rmq.parse_file", mock.Mock(return_value="Msg"))
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_remove_failed(self, mock_log, mock_rm):
+
+        """Function:  test_remove_failed
+
+        Description:  Test with file processed, but file removal failed.
+
+        Arguments:
+
+        """
+
+        mock_rm.return_value = (True, "Error Message")
+
+        self.assertFalse(
+            mail_2_rmq.process_spool(self.cfg, mock_log, self.fname))
+
+    @mock.patch("mail_2_rmq.os.replace")
+    @mock.patch("mail_2_rmq.process_message")
+    @mock.patch("mail_2_rmq.parse_file")
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_parse_failed(self, mock_log, mock_parse, mock_process,
+                          mock_replace):
+
+        """Function:  test_parse_failed
+
+        Description:  Test with file which fails to parse.
+
+        Arguments:
+
+        """
+
+        mock_parse.side_effect = UnicodeDecodeError(
+            "utf-8", b"\xff", 0, 1, "invalid start byte")
+        mail_2_rmq.process_spool(self.cfg, mock_log, self.fname)
+
+        mock_process.assert_not_called()
+        mock_replace.assert_called_once_with(self.fname, self.failed)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,247 @@
+# Classification (U)
+
+"""Program:  profiler.py
+
+    Description:  Unit testing of Profiler in mail_2_rmq.py.
+
+    Usage:
+        test/unit/mail_2_rmq/profiler.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import shutil
+import pstats
+import tracemalloc
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mail_2_rmq                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=C0413,E0401
+
+__version__ = version.__version__
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = "test/unit/mail_2_rmq/tmp"
+        self.profile_dir = "test/unit/mail_2_rmq/tmp/profile"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_default_dir
+        test_tag_msg_id
+        test_tag_multiple
+        test_tag_no_msg_id
+        test_pstats
+        test_memory
+        test_write_error
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+        os.makedirs(self.cfg.profile_dir)
+        self.base = os.path.join(
+            self.cfg.profile_dir, f"mail_2_rmq.{os.getpid()}.")
+        self.msg = {"Message-ID": "<abc/123@mail.domain>"}
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(CfgTest().profile_dir, ignore_errors=True)
+
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_default_dir(self, mock_log):
+
+        """Function:  test_default_dir
+
+        Description:  Test the profile files default to the tmp_dir
+            directory.
+
+        Arguments:
+
+        """
+
+        self.cfg.profile_dir = None
+
+        self.assertEqual(
+            mail_2_rmq.Profiler(self.cfg, mock_log).profile_dir,
+            self.cfg.tmp_dir)
+
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_tag_msg_id(self, mock_log):
+
+        """Function:  test_tag_msg_id
+
+        Description:  Test the tag is the cleaned up Message-ID.
+
+        Arguments:
+
+        """
+
+        profiler = mail_2_rmq.Profiler(self.cfg, mock_log)
+        profiler.add_msg(self.msg)
+
+        self.assertEqual(profiler.tag(), "abc_123@mail.domain")
+
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_tag_multiple(self, mock_log):
+
+        """Function:  test_tag_multiple
+
+        Description:  Test the tag holds the count of the other emails.
+
+        Arguments:
+
+        """
+
+        profiler = mail_2_rmq.Profiler(self.cfg, mock_log)
+        profiler.add_msg(self.msg)
+        profiler.add_msg({})
+        profiler.add_msg(self.msg)
+
+        self.assertEqual(profiler.tag(), "abc_123@mail.domain+2")
+
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_tag_no_msg_id(self, mock_log):
+
+        """Function:  test_tag_no_msg_id
+
+        Description:  Test the tag is the start time without a Message-ID.
+
+        Arguments:
+
+        """
+
+        profiler = mail_2_rmq.Profiler(self.cfg, mock_log)
+        profiler.add_msg({})
+
+        self.assertRegex(profiler.tag(), r"^\d{8}-\d{6}$")
+
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_pstats(self, mock_log):
+
+        """Function:  test_pstats
+
+        Description:  Test the .pstats file is written for the run.
+
+        Arguments:
+
+        """
+
+        profiler = mail_2_rmq.Profiler(self.cfg, mock_log)
+        profiler.start()
+        active = mail_2_rmq.Profiler.active
+        profiler.add_msg(self.msg)
+        profiler.stop()
+        fname = self.base + "abc_123@mail.domain.pstats"
+
+        self.assertEqual(
+            (active, mail_2_rmq.Profiler.active,
+             pstats.Stats(fname).total_calls > 0,
+             os.path.exists(self.base + "abc_123@mail.domain.mem.txt")),
+            (profiler, None, True, False))
+
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_memory(self, mock_log):
+
+        """Function:  test_memory
+
+        Description:  Test the allocation report is written with the
+            profile_memory setting.
+
+        Arguments:
+
+        """
+
+        self.cfg.profile_memory = True
+        self.cfg.profile_top = 5
+        profiler = mail_2_rmq.Profiler(self.cfg, mock_log)
+        profiler.start()
+        profiler.add_msg(self.msg)
+        data = [bytearray(1024) for _ in range(100)]
+        profiler.stop()
+
+        with open(self.base + "abc_123@mail.domain.mem.txt",
+                  encoding="UTF-8") as f_hldr:
+            lines = f_hldr.read().splitlines()
+
+        self.assertEqual(
+            (lines[1].startswith("Peak: "), len(lines) <= 8, bool(data),
+             tracemalloc.is_tracing()), (True, True, True, False))
+
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_write_error(self, mock_log):
+
+        """Function:  test_write_error
+
+        Description:  Test a profile which cannot be written is logged.
+
+        Arguments:
+
+        """
+
+        self.cfg.profile_dir = "/path/does/not/exist"
+        profiler = mail_2_rmq.Profiler(self.cfg, mock_log)
+        profiler.start()
+        profiler.stop()
+
+        self.assertEqual(
+            (mock_log.log_err.call_count, mock_log.log_info.call_count),
+            (1, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
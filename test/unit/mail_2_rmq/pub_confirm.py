@@ -0,0 +1,444 @@
+# Classification (U)
+
+"""Program:  pub_confirm.py
+
+    Description:  Unit testing of PubConfirm in mail_2_rmq.py.
+
+    Usage:
+        test/unit/mail_2_rmq/pub_confirm.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+import pika
+
+# Local
+sys.path.append(os.getcwd())
+import mail_2_rmq                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=C0413,E0401
+
+__version__ = version.__version__
+
+
+def channel_test():
+
+    """Function:  channel_test
+
+    Description:  Return a mock with the interface of a pika BlockingChannel
+        and the pika.channel.Channel under it.
+
+    Arguments:
+        (output) Mock of a pika BlockingChannel
+
+    """
+
+    channel = mock.create_autospec(
+        pika.adapters.blocking_connection.BlockingChannel, instance=True)
+    channel._impl = mock.create_autospec(        # pylint:disable=W0212
+        pika.channel.Channel, instance=True)
+
+    return channel
+
+
+def frame_test(method, tag, multiple=False):
+
+    """Function:  frame_test
+
+    Description:  Return a broker Basic.Ack or Basic.Nack frame.
+
+    Arguments:
+        (input) method -> pika.spec.Basic.Ack or pika.spec.Basic.Nack
+        (input) tag -> Delivery tag
+        (input) multiple -> Frame confirms all lower delivery tags
+        (output) pika.frame.Method instance
+
+    """
+
+    return pika.frame.Method(1, method(delivery_tag=tag, multiple=multiple))
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.email_dir = "EMAIL_DIRECTORY"
+        self.pub_confirm = True
+        self.confirm_window = 3
+        self.confirm_timeout = 30
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_select
+        test_publish
+        test_publish_failed
+        test_ack_multiple
+        test_nack
+        test_done_ack
+        test_done_nack
+        test_window_full
+        test_flush_timeout
+        test_flush_closed
+        test_expire
+        test_channel_reopened
+        test_release
+        test_memory_backend
+        test_get_confirm
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+        self.rmq = mock.Mock()
+        self.rmq.exchange = "EXCHANGE_NAME"
+        self.rmq.queue_name = "Queue1"
+        self.rmq.routing_key = "Queue1"
+        self.rmq.channel = channel_test()
+        self.rmq.publish_msg.return_value = True
+        self.log = mock.Mock()
+        self.confirm = mail_2_rmq.PubConfirm(self.rmq, self.cfg, self.log)
+        self.msg = {"subject": "Queue1"}
+
+    def test_select(self):
+
+        """Function:  test_select
+
+        Description:  Test the ack and nack callback is registered on the
+            pika.channel.Channel.
+
+        Arguments:
+
+        """
+
+        self.rmq.channel._impl.confirm_delivery.assert_called_once_with(
+            ack_nack_callback=self.confirm.on_confirm)
+
+    def test_publish(self):
+
+        """Function:  test_publish
+
+        Description:  Test published messages are pending by delivery tag.
+
+        Arguments:
+
+        """
+
+        self.confirm.publish("Body1", self.msg)
+        self.confirm.publish("Body2", self.msg)
+
+        self.assertEqual(list(self.confirm.pending), [1, 2])
+
+    def test_publish_failed(self):
+
+        """Function:  test_publish_failed
+
+        Description:  Test a failed publish is not tracked.
+
+        Arguments:
+
+        """
+
+        self.rmq.publish_msg.return_value = False
+
+        self.assertEqual(
+            (self.confirm.publish("Body1", self.msg), self.confirm.pending),
+            (False, {}))
+
+    @mock.patch("mail_2_rmq.archive_email")
+    def test_ack_multiple(self, mock_archive):
+
+        """Function:  test_ack_multiple
+
+        Description:  Test a multiple ack confirms all lower delivery tags.
+
+        Arguments:
+
+        """
+
+        for body in ["Body1", "Body2"]:
+            self.confirm.publish(body, self.msg)
+
+        self.confirm.on_confirm(
+            frame_test(pika.spec.Basic.Ack, 1, multiple=True))
+
+        self.assertEqual(list(self.confirm.pending), [2])
+        mock_archive.assert_not_called()
+
+    @mock.patch("mail_2_rmq.archive_email")
+    def test_nack(self, mock_archive):
+
+        """Function:  test_nack
+
+        Description:  Test only the nacked message is archived.
+
+        Arguments:
+
+        """
+
+        msg2 = {"subject": "Queue2"}
+        self.confirm.publish("Body1", self.msg)
+        self.confirm.publish("Body2", msg2)
+        self.confirm.on_confirm(frame_test(pika.spec.Basic.Nack, 2))
+
+        self.assertEqual(
+            (list(self.confirm.pending), mock_archive.call_args[0][3],
+             mock_archive.call_args[0][0]),
+            ([1], msg2, mail_2_rmq.ArchiveInfo(
+                "EXCHANGE_NAME", "Queue1", "Queue1")))
+
+    def test_done_ack(self):
+
+        """Function:  test_done_ack
+
+        Description:  Test the done callback is called once the message is
+            acked.
+
+        Arguments:
+
+        """
+
+        done = mock.Mock()
+        self.confirm.publish("Body1", None, done=done)
+        self.confirm.on_confirm(frame_test(pika.spec.Basic.Ack, 1))
+
+        done.assert_called_once_with(True)
+
+    @mock.patch("mail_2_rmq.archive_email")
+    def test_done_nack(self, mock_archive):
+
+        """Function:  test_done_nack
+
+        Description:  Test a nacked message with a done callback is passed
+            back to the callback and not archived.
+
+        Arguments:
+
+        """
+
+        done = mock.Mock()
+        self.confirm.publish("Body1", None, done=done)
+        self.confirm.on_confirm(frame_test(pika.spec.Basic.Nack, 1))
+
+        done.assert_called_once_with(False)
+        mock_archive.assert_not_called()
+
+    @mock.patch("mail_2_rmq.archive_email")
+    def test_window_full(self, mock_archive):
+
+        """Function:  test_window_full
+
+        Description:  Test the confirms are waited on once the window is
+            full.
+
+        Arguments:
+
+        """
+
+        def ack(time_limit):
+            self.confirm.on_confirm(
+                frame_test(pika.spec.Basic.Ack, 3, multiple=True))
+
+            return time_limit
+
+        self.rmq.connection.process_data_events.side_effect = ack
+
+        for body in ["Body1", "Body2", "Body3"]:
+            self.confirm.publish(body, self.msg)
+
+        self.assertEqual(
+            (self.rmq.connection.process_data_events.call_count,
+             self.confirm.pending), (1, {}))
+        mock_archive.assert_not_called()
+
+    @mock.patch("mail_2_rmq.archive_email")
+    def test_flush_timeout(self, mock_archive):
+
+        """Function:  test_flush_timeout
+
+        Description:  Test unconfirmed messages are archived at the timeout.
+
+        Arguments:
+
+        """
+
+        self.confirm.timeout = 0
+        self.confirm.publish("Body1", self.msg)
+        self.confirm.flush()
+
+        self.assertEqual(
+            (mock_archive.call_count, self.confirm.pending), (1, {}))
+
+    @mock.patch("mail_2_rmq.archive_email")
+    def test_flush_closed(self, mock_archive):
+
+        """Function:  test_flush_closed
+
+        Description:  Test unconfirmed messages are archived if the
+            connection fails.
+
+        Arguments:
+
+        """
+
+        self.rmq.connection.process_data_events.side_effect = \
+            pika.exceptions.AMQPConnectionError("Connection lost")
+        self.confirm.publish("Body1", self.msg)
+        self.confirm.flush()
+
+        self.assertEqual(
+            (mock_archive.call_count, self.confirm.pending), (1, {}))
+
+    @mock.patch("mail_2_rmq.archive_email")
+    def test_expire(self, mock_archive):
+
+        """Function:  test_expire
+
+        Description:  Test only messages past the timeout are archived.
+
+        Arguments:
+
+        """
+
+        self.confirm.publish("Body1", self.msg)
+        self.confirm.publish("Body2", self.msg)
+        self.confirm.pending[1] = self.confirm.pending[1][:2] + (0,) \
+            + self.confirm.pending[1][3:]
+        self.confirm.expire()
+
+        self.assertEqual(
+            (mock_archive.call_count, list(self.confirm.pending)), (1, [2]))
+
+    @mock.patch("mail_2_rmq.archive_email")
+    def test_channel_reopened(self, mock_archive):
+
+        """Function:  test_channel_reopened
+
+        Description:  Test pending messages are archived and confirm mode
+            restarted on a new channel.
+
+        Arguments:
+
+        """
+
+        self.confirm.publish("Body1", self.msg)
+        self.rmq.channel = channel_test()
+        self.confirm.publish("Body2", self.msg)
+
+        self.assertEqual(
+            (mock_archive.call_count, list(self.confirm.pending)), (1, [1]))
+        self.rmq.channel._impl.confirm_delivery.assert_called_once_with(
+            ack_nack_callback=self.confirm.on_confirm)
+
+    @mock.patch("mail_2_rmq.archive_email")
+    def test_release(self, mock_archive):
+
+        """Function:  test_release
+
+        Description:  Test the confirms are waited on and the channel is
+            replaced by one which is not in confirm mode.
+
+        Arguments:
+
+        """
+
+        self.rmq.pub_confirm = self.confirm
+        self.rmq.connection.process_data_events.side_effect = \
+            lambda time_limit: self.confirm.on_confirm(
+                frame_test(pika.spec.Basic.Ack, 1))
+        channel = self.rmq.channel
+        self.confirm.publish("Body1", self.msg)
+        self.confirm.release()
+
+        self.assertEqual(
+            (self.confirm.pending, self.rmq.pub_confirm,
+             channel.close.call_count, self.rmq.open_channel.call_count),
+            ({}, None, 1, 1))
+        mock_archive.assert_not_called()
+
+    @mock.patch("mail_2_rmq.MEMORY_PUBLISHED", mail_2_rmq.collections.deque())
+    @mock.patch("mail_2_rmq.archive_email")
+    def test_memory_backend(self, mock_archive):
+
+        """Function:  test_memory_backend
+
+        Description:  Test the acks and nacks of the memory backend are
+            matched to the messages when the confirms are flushed.
+
+        Arguments:
+
+        """
+
+        self.cfg.host = "HOSTNAME"
+        self.cfg.exchange_name = "EXCHANGE_NAME"
+        rmq = mail_2_rmq.MemoryRmq(self.cfg, "Queue1", "Queue1")
+        rmq.create_connection()
+        confirm = mail_2_rmq.PubConfirm(rmq, self.cfg, self.log)
+        confirm.publish("Body1", self.msg)
+        rmq.connection.fail_rate = 1
+        confirm.publish("Body2", self.msg)
+        confirm.flush()
+
+        self.assertEqual(
+            (confirm.pending, mock_archive.call_count,
+             [item.body for item in mail_2_rmq.MEMORY_PUBLISHED]),
+            ({}, 1, ["Body1"]))
+
+    def test_get_confirm(self):
+
+        """Function:  test_get_confirm
+
+        Description:  Test the PubConfirm is kept with the connection.
+
+        Arguments:
+
+        """
+
+        rmq = mock.Mock()
+        rmq.pub_confirm = None
+        confirm = mail_2_rmq.get_confirm(rmq, self.cfg, self.log)
+
+        self.assertIs(mail_2_rmq.get_confirm(rmq, self.cfg, self.log), confirm)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -162,6 +162,9 @@ class UnitTest(unittest.TestCase):
         self.rmq = Rmq()
         self.fname = "Filename.txt"
         self.fname2 = "test/unit/mail_2_rmq/testfiles/fileattachment.txt"
+        self.attach = mail_2_rmq.Attachment(self.fname, path=self.fname)
+        self.attach2 = mail_2_rmq.Attachment(
+            "fileattachment.txt", path=self.fname2)
         self.qname = "FileQueue1"
         self.rkey = "FileQueue1"
         self.msg = "Message Body"
@@ -189,7 +192,7 @@ class UnitTest(unittest.TestCase):
         self.assertFalse(
             mail_2_rmq.pub_to_rmq(
                 self.cfg, mock_log, self.qname, self.rkey, self.msg,
-                fname=self.fname2))
+                attach=self.attach2))
 
     @mock.patch("mail_2_rmq.gen_libs.rm_file",
                 mock.Mock(return_value=(False, None)))
@@ -214,7 +217,7 @@ class UnitTest(unittest.TestCase):
         self.assertFalse(
             mail_2_rmq.pub_to_rmq(
                 self.cfg, mock_log, self.qname, self.rkey, self.msg,
-                fname=self.fname))
+                attach=self.attach))
 
 
 if __name__ == "__main__":
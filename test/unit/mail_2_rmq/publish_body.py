@@ -0,0 +1,111 @@
+# Classification (U)
+
+"""Program:  publish_body.py
+
+    Description:  Unit testing of publish_body in mail_2_rmq.py.
+
+    Usage:
+        test/unit/mail_2_rmq/publish_body.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+import pika
+
+# Local
+sys.path.append(os.getcwd())
+import mail_2_rmq                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=C0413,E0401
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_props
+        test_props
+        test_props_failed
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.rmq = mock.Mock()
+        self.rmq.exchange = "EXCHANGE_NAME"
+        self.rmq.routing_key = "Queue1"
+        self.rmq.publish_msg.return_value = True
+
+    def test_no_props(self):
+
+        """Function:  test_no_props
+
+        Description:  Test the RabbitMQ class publishes without properties.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            (mail_2_rmq.publish_body(self.rmq, "Body"),
+             self.rmq.channel.basic_publish.call_count), (True, 0))
+
+    def test_props(self):
+
+        """Function:  test_props
+
+        Description:  Test the message is published with the properties.
+
+        Arguments:
+
+        """
+
+        status = mail_2_rmq.publish_body(
+            self.rmq, b"Body", content_type="text/plain")
+        props = self.rmq.channel.basic_publish.call_args[1]["properties"]
+
+        self.assertEqual(
+            (status, props.content_type, props.delivery_mode,
+             self.rmq.publish_msg.call_count),
+            (True, "text/plain", 2, 0))
+
+    def test_props_failed(self):
+
+        """Function:  test_props_failed
+
+        Description:  Test a failed publish with properties.
+
+        Arguments:
+
+        """
+
+        self.rmq.channel.basic_publish.side_effect = \
+            pika.exceptions.ChannelClosed(406, "Closed")
+
+        self.assertFalse(
+            mail_2_rmq.publish_body(self.rmq, b"Body", priority=1))
+
+
+if __name__ == "__main__":
+    unittest.main()
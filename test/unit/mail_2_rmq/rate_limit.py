@@ -0,0 +1,82 @@
+# Classification (U)
+
+"""Program:  rate_limit.py
+
+    Description:  Unit testing of RateLimit in mail_2_rmq.py.
+
+    Usage:
+        test/unit/mail_2_rmq/rate_limit.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mail_2_rmq                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=C0413,E0401
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_no_limit
+        test_limit
+
+    """
+
+    @mock.patch("mail_2_rmq.time.sleep")
+    def test_no_limit(self, mock_sleep):
+
+        """Function:  test_no_limit
+
+        Description:  Test no wait without a rate.
+
+        Arguments:
+
+        """
+
+        limit = mail_2_rmq.RateLimit(0)
+        limit.wait()
+        limit.wait()
+
+        self.assertEqual(mock_sleep.call_count, 0)
+
+    @mock.patch("mail_2_rmq.time.sleep")
+    @mock.patch("mail_2_rmq.time.monotonic", mock.Mock(return_value=100.0))
+    def test_limit(self, mock_sleep):
+
+        """Function:  test_limit
+
+        Description:  Test each wait takes the next time slot.
+
+        Arguments:
+
+        """
+
+        limit = mail_2_rmq.RateLimit(10)
+
+        for _ in range(3):
+            limit.wait()
+
+        self.assertEqual(
+            [round(call[0][0], 6) for call in mock_sleep.call_args_list],
+            [0, 0.1, 0.2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -17,6 +17,7 @@
 import sys
 import os
 import unittest
+import tempfile
 import mock
 
 # Local
@@ -109,16 +110,17 @@ class CfgTest():                                        # pylint:disable=R0903
         self.debug_address = "debug@debug.domain"
 
 
-class ParserTest():                                     # pylint:disable=R0903
+class ParserTest():
 
     """Class:  ParserTest
 
-    Description:  Class which is a representation of the email.Parser
-        class.
+    Description:  Class which is a representation of the
+        email.parser.BytesFeedParser class.
 
     Methods:
         __init__
-        parsestr
+        feed
+        close
 
     """
 
@@ -126,23 +128,37 @@ class ParserTest():                                     # pylint:disable=R0903
 
         """Method:  __init__
 
-        Description:  Initialization instance of the RQTest class.
+        Description:  Initialization instance of the ParserTest class.
 
         Arguments:
 
         """
 
-    def parsestr(self, msg):
+        self.data = []
 
-        """Method:  parsestr
+    def feed(self, data):
 
-        Description:  Stub holder for parsestr method.
+        """Method:  feed
+
+        Description:  Stub holder for feed method.
 
         Arguments:
 
         """
 
-        return msg
+        self.data.append(data)
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Stub holder for close method.
+
+        Arguments:
+
+        """
+
+        return b"".join(self.data).decode("UTF-8")
 
 
 class UnitTest(unittest.TestCase):
@@ -156,6 +172,10 @@ class UnitTest(unittest.TestCase):
         test_read_email_multi
         test_read_email_one
         test_read_email_none
+        test_read_email_jobs
+        test_read_email_jobs_one_file
+        test_read_email_jobs_invalid
+        test_read_email_stage_timing
 
     """
 
@@ -177,9 +197,9 @@ class UnitTest(unittest.TestCase):
 
     @mock.patch("mail_2_rmq.process_message", mock.Mock(return_value=True))
     @mock.patch("builtins.open", new_callable=mock.mock_open,
-                read_data="RawEmailMessage")
+                read_data=b"RawEmailMessage")
     @mock.patch("mail_2_rmq.gen_class.Logger")
-    @mock.patch("mail_2_rmq.Parser")
+    @mock.patch("mail_2_rmq.BytesFeedParser")
     @mock.patch("mail_2_rmq.sys.stdin")
     def test_read_email_multi(
             self, mock_stdin, mock_parse, mock_log, mock_file):
@@ -195,7 +215,7 @@ class UnitTest(unittest.TestCase):
         self.args.args_array = {"-C": ["/path/file1", "/path/file2"]}
 
         assert open(                            # pylint:disable=R1732,W1514
-            self.outfile).read() == "RawEmailMessage"
+            self.outfile).read() == b"RawEmailMessage"
         mock_file.assert_called_with(self.outfile)
         mock_parse.return_value = self.part
         mock_stdin.readlines.return_value = self.raw_msg
@@ -206,9 +226,9 @@ class UnitTest(unittest.TestCase):
 
     @mock.patch("mail_2_rmq.process_message", mock.Mock(return_value=True))
     @mock.patch("builtins.open", new_callable=mock.mock_open,
-                read_data="RawEmailMessage")
+                read_data=b"RawEmailMessage")
     @mock.patch("mail_2_rmq.gen_class.Logger")
-    @mock.patch("mail_2_rmq.Parser")
+    @mock.patch("mail_2_rmq.BytesFeedParser")
     @mock.patch("mail_2_rmq.sys.stdin")
     def test_read_email_one(self, mock_stdin, mock_parse, mock_log, mock_file):
 
@@ -223,7 +243,7 @@ class UnitTest(unittest.TestCase):
         self.args.args_array = {"-C": ["/path/file1"]}
 
         assert open(                            # pylint:disable=R1732,W1514
-            self.outfile).read() == "RawEmailMessage"
+            self.outfile).read() == b"RawEmailMessage"
         mock_file.assert_called_with(self.outfile)
         mock_parse.return_value = self.part
         mock_stdin.readlines.return_value = self.raw_msg
@@ -234,9 +254,9 @@ class UnitTest(unittest.TestCase):
 
     @mock.patch("mail_2_rmq.process_message", mock.Mock(return_value=True))
     @mock.patch("builtins.open", new_callable=mock.mock_open,
-                read_data="RawEmailMessage")
+                read_data=b"RawEmailMessage")
     @mock.patch("mail_2_rmq.gen_class.Logger")
-    @mock.patch("mail_2_rmq.Parser")
+    @mock.patch("mail_2_rmq.BytesFeedParser")
     @mock.patch("mail_2_rmq.sys.stdin")
     def test_read_email_none(
             self, mock_stdin, mock_parse, mock_log, mock_file):
@@ -252,7 +272,7 @@ class UnitTest(unittest.TestCase):
         self.args.args_array = {"-C": []}
 
         assert open(                            # pylint:disable=R1732,W1514
-            self.outfile).read() == "RawEmailMessage"
+            self.outfile).read() == b"RawEmailMessage"
         mock_file.assert_called_with(self.outfile)
         mock_parse.return_value = self.part
         mock_stdin.readlines.return_value = self.raw_msg
@@ -261,6 +281,98 @@ class UnitTest(unittest.TestCase):
         self.assertFalse(
             mail_2_rmq.read_email(self.cfg, mock_log, args=self.args))
 
+    @mock.patch("mail_2_rmq.process_message")
+    @mock.patch("mail_2_rmq.read_email_pool")
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_read_email_jobs(self, mock_log, mock_pool, mock_process):
+
+        """Function:  test_read_email_jobs
+
+        Description:  Test reading email files with worker processes.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-C": ["/path/file1", "/path/file2"],
+                                "-j": "4"}
+        mail_2_rmq.read_email(self.cfg, mock_log, args=self.args)
+
+        self.assertEqual(
+            (mock_pool.call_args, mock_process.call_count),
+            (mock.call(self.cfg, mock_log, self.args,
+                       ["/path/file1", "/path/file2"], 4), 0))
+
+    @mock.patch("mail_2_rmq.parse_file", mock.Mock(return_value={}))
+    @mock.patch("mail_2_rmq.process_message")
+    @mock.patch("mail_2_rmq.read_email_pool")
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_read_email_jobs_one_file(self, mock_log, mock_pool,
+                                      mock_process):
+
+        """Function:  test_read_email_jobs_one_file
+
+        Description:  Test a single file is read without worker processes.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-C": ["/path/file1"], "-j": "4"}
+        mail_2_rmq.read_email(self.cfg, mock_log, args=self.args)
+
+        self.assertEqual(
+            (mock_pool.call_count, mock_process.call_count), (0, 1))
+
+    @mock.patch("mail_2_rmq.process_message")
+    @mock.patch("mail_2_rmq.read_email_pool")
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_read_email_jobs_invalid(self, mock_log, mock_pool,
+                                     mock_process):
+
+        """Function:  test_read_email_jobs_invalid
+
+        Description:  Test with an invalid -j value.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-C": ["/path/file1"], "-j": "many"}
+        mail_2_rmq.read_email(self.cfg, mock_log, args=self.args)
+
+        self.assertEqual(
+            (mock_pool.call_count, mock_process.call_count,
+             mock_log.log_err.call_count), (0, 0, 1))
+
+    @mock.patch("mail_2_rmq.process_message")
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_read_email_stage_timing(self, mock_log, mock_process):
+
+        """Function:  test_read_email_stage_timing
+
+        Description:  Test the stage timer is started before the email file
+            is parsed.
+
+        Arguments:
+
+        """
+
+        raw_msg = b"From: name@domain\nSubject: Queue1\n\nBody\n"
+
+        with tempfile.NamedTemporaryFile(suffix=".eml") as f_hldr:
+            f_hldr.write(raw_msg)
+            f_hldr.flush()
+            self.cfg.stage_timing = True
+            self.args.args_array = {"-C": [f_hldr.name]}
+            mail_2_rmq.read_email(self.cfg, mock_log, args=self.args)
+
+        timer = mock_process.call_args[1]["timer"]
+
+        self.assertEqual(
+            ("parse" in timer.stages, timer.counts["email_bytes"]),
+            (True, len(raw_msg)))
+
 
 if __name__ == "__main__":
     unittest.main()
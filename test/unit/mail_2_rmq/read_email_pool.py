@@ -0,0 +1,271 @@
+# Classification (U)
+
+"""Program:  read_email_pool.py
+
+    Description:  Unit testing of read_email_pool in mail_2_rmq.py.
+
+    Usage:
+        test/unit/mail_2_rmq/read_email_pool.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import queue
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mail_2_rmq                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=C0413,E0401
+
+__version__ = version.__version__
+
+
+class ProcessTest():
+
+    """Class:  ProcessTest
+
+    Description:  Class which is a representation of a multiprocessing
+        Process class which runs the target in the same process.
+
+    Methods:
+        __init__
+        start
+        is_alive
+        join
+
+    """
+
+    def __init__(self, target, args):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the ProcessTest class.
+
+        Arguments:
+
+        """
+
+        self.target = target
+        self.args = args
+
+    def start(self):
+
+        """Method:  start
+
+        Description:  Stub holder for start method.
+
+        Arguments:
+
+        """
+
+        self.target(*self.args)
+
+    def is_alive(self):
+
+        """Method:  is_alive
+
+        Description:  Stub holder for is_alive method.
+
+        Arguments:
+
+        """
+
+        return False
+
+    def join(self):
+
+        """Method:  join
+
+        Description:  Stub holder for join method.
+
+        Arguments:
+
+        """
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {"-c": "CFG", "-d": "DIR"}
+
+    def get_val(self, skey):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        worker
+        test_largest_first
+        test_workers
+        test_summary
+        test_no_summary
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = mock.Mock()
+        self.log = mock.Mock()
+        self.args = ArgParser()
+        self.fnames = ["SMALL", "LARGE", "MEDIUM"]
+        self.sizes = {"SMALL": 1, "LARGE": 100, "MEDIUM": 10}
+        self.taken = []
+        self.ctx = mock.Mock()
+        self.ctx.Queue = queue.Queue
+        self.ctx.Process = ProcessTest
+
+    def worker(self, cfg_name, cfg_dir, tasks, results):
+
+        """Function:  worker
+
+        Description:  Stub for read_worker which takes one file.
+
+        Arguments:
+
+        """
+
+        self.taken.append((cfg_name, cfg_dir, tasks.get()))
+        results.put((len(self.taken), {"files": 1, "secs": 1.0}))
+
+    @mock.patch("mail_2_rmq.read_worker")
+    @mock.patch("mail_2_rmq.file_size")
+    @mock.patch("mail_2_rmq.multiprocessing.get_context")
+    def test_largest_first(self, mock_ctx, mock_size, mock_worker):
+
+        """Function:  test_largest_first
+
+        Description:  Test the largest files are handed out first.
+
+        Arguments:
+
+        """
+
+        mock_ctx.return_value = self.ctx
+        mock_size.side_effect = self.sizes.get
+        mock_worker.side_effect = self.worker
+        mail_2_rmq.read_email_pool(
+            self.cfg, self.log, self.args, self.fnames, 3)
+
+        self.assertEqual(
+            (mock_ctx.call_args, self.taken),
+            (mock.call("spawn"), [("CFG", "DIR", "LARGE"),
+                                  ("CFG", "DIR", "MEDIUM"),
+                                  ("CFG", "DIR", "SMALL")]))
+
+    @mock.patch("mail_2_rmq.read_worker")
+    @mock.patch("mail_2_rmq.file_size", mock.Mock(return_value=0))
+    @mock.patch("mail_2_rmq.multiprocessing.get_context")
+    def test_workers(self, mock_ctx, mock_worker):
+
+        """Function:  test_workers
+
+        Description:  Test no more workers than files are started.
+
+        Arguments:
+
+        """
+
+        mock_ctx.return_value = self.ctx
+        mock_worker.side_effect = self.worker
+        mail_2_rmq.read_email_pool(
+            self.cfg, self.log, self.args, self.fnames[:2], 8)
+
+        self.assertEqual(mock_worker.call_count, 2)
+
+    @mock.patch("mail_2_rmq.read_worker")
+    @mock.patch("mail_2_rmq.file_size", mock.Mock(return_value=0))
+    @mock.patch("mail_2_rmq.multiprocessing.get_context")
+    def test_summary(self, mock_ctx, mock_worker):
+
+        """Function:  test_summary
+
+        Description:  Test a summary is logged for each worker.
+
+        Arguments:
+
+        """
+
+        mock_ctx.return_value = self.ctx
+        mock_worker.side_effect = self.worker
+        mail_2_rmq.read_email_pool(
+            self.cfg, self.log, self.args, self.fnames, 2)
+
+        self.assertEqual(
+            (len([call for call in self.log.log_info.call_args_list
+                  if "Worker" in call[0][0]]), self.log.log_err.call_count),
+            (2, 0))
+
+    @mock.patch("mail_2_rmq.read_worker", mock.Mock())
+    @mock.patch("mail_2_rmq.file_size", mock.Mock(return_value=0))
+    @mock.patch("mail_2_rmq.multiprocessing.get_context")
+    def test_no_summary(self, mock_ctx):
+
+        """Function:  test_no_summary
+
+        Description:  Test workers which exit without a summary.
+
+        Arguments:
+
+        """
+
+        self.ctx.Queue = mock.Mock(
+            return_value=mock.Mock(**{"get.side_effect": queue.Empty}))
+        mock_ctx.return_value = self.ctx
+        mail_2_rmq.read_email_pool(
+            self.cfg, self.log, self.args, self.fnames, 2)
+
+        self.assertEqual(self.log.log_err.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,160 @@
+# Classification (U)
+
+"""Program:  read_worker.py
+
+    Description:  Unit testing of read_worker in mail_2_rmq.py.
+
+    Usage:
+        test/unit/mail_2_rmq/read_worker.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import queue
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mail_2_rmq                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=C0413,E0401
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_files
+        test_error
+        test_not_published
+        test_stage_timing
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tasks = queue.Queue()
+        self.results = queue.Queue()
+
+        for fname in ["FILE1", "FILE2", None]:
+            self.tasks.put(fname)
+
+    @mock.patch("mail_2_rmq.file_size", mock.Mock(return_value=100))
+    @mock.patch("mail_2_rmq.parse_file", mock.Mock(return_value={}))
+    @mock.patch("mail_2_rmq.process_message")
+    @mock.patch("mail_2_rmq.RmqPool")
+    @mock.patch("mail_2_rmq.open_log")
+    @mock.patch("mail_2_rmq.gen_libs.load_module")
+    def test_files(self, mock_cfg, mock_log, mock_pool, mock_process):
+
+        """Function:  test_files
+
+        Description:  Test the files are processed over the worker's pool.
+
+        Arguments:
+
+        """
+
+        mail_2_rmq.read_worker("CFG", "DIR", self.tasks, self.results)
+        pid, totals = self.results.get_nowait()
+
+        self.assertEqual(
+            (mock_cfg.call_args, pid, totals["files"], totals["bytes"],
+             totals.get("errors", 0), mock_process.call_args[1]["pool"],
+             mock_pool.return_value.close.call_count,
+             mock_log.return_value.log_close.call_count),
+            (mock.call("CFG", "DIR"), os.getpid(), 2, 200, 0,
+             mock_pool.return_value, 1, 1))
+
+    @mock.patch("mail_2_rmq.file_size", mock.Mock(return_value=0))
+    @mock.patch("mail_2_rmq.parse_file", mock.Mock(side_effect=OSError))
+    @mock.patch("mail_2_rmq.RmqPool", mock.Mock())
+    @mock.patch("mail_2_rmq.open_log", mock.Mock())
+    @mock.patch("mail_2_rmq.gen_libs.load_module", mock.Mock())
+    def test_error(self):
+
+        """Function:  test_error
+
+        Description:  Test a file which can not be processed is counted.
+
+        Arguments:
+
+        """
+
+        mail_2_rmq.read_worker("CFG", "DIR", self.tasks, self.results)
+        _, totals = self.results.get_nowait()
+
+        self.assertEqual((totals["files"], totals["errors"]), (2, 2))
+
+    @mock.patch("mail_2_rmq.file_size", mock.Mock(return_value=0))
+    @mock.patch("mail_2_rmq.parse_file", mock.Mock(return_value={}))
+    @mock.patch("mail_2_rmq.process_message")
+    @mock.patch("mail_2_rmq.RmqPool", mock.Mock())
+    @mock.patch("mail_2_rmq.open_log", mock.Mock())
+    @mock.patch("mail_2_rmq.gen_libs.load_module", mock.Mock())
+    def test_not_published(self, mock_process):
+
+        """Function:  test_not_published
+
+        Description:  Test messages saved by save_failed are counted.
+
+        Arguments:
+
+        """
+
+        def process(*args, **kwargs):           # pylint:disable=W0613
+            mail_2_rmq.PUBLISH_STATS["saved"] += 1
+
+        mock_process.side_effect = process
+        mail_2_rmq.read_worker("CFG", "DIR", self.tasks, self.results)
+        _, totals = self.results.get_nowait()
+
+        self.assertEqual(totals["saved"], 2)
+
+    @mock.patch("mail_2_rmq.file_size", mock.Mock(return_value=0))
+    @mock.patch("mail_2_rmq.parse_file", mock.Mock(return_value={}))
+    @mock.patch("mail_2_rmq.process_message")
+    @mock.patch("mail_2_rmq.RmqPool", mock.Mock())
+    @mock.patch("mail_2_rmq.open_log", mock.Mock())
+    @mock.patch("mail_2_rmq.gen_libs.load_module")
+    def test_stage_timing(self, mock_cfg, mock_process):
+
+        """Function:  test_stage_timing
+
+        Description:  Test the stage timer is started before each file is
+            parsed.
+
+        Arguments:
+
+        """
+
+        mock_cfg.return_value = mock.Mock(stage_timing=True)
+        mail_2_rmq.read_worker("CFG", "DIR", self.tasks, self.results)
+
+        self.assertEqual(
+            ["parse" in call[1]["timer"].stages
+             for call in mock_process.call_args_list], [True, True])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+# Classification (U)
+
+"""Program:  register_backend.py
+
+    Description:  Unit testing of register_backend in mail_2_rmq.py.
+
+    Usage:
+        test/unit/mail_2_rmq/register_backend.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import types
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mail_2_rmq                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=C0413,E0401
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_register
+
+    """
+
+    @mock.patch.dict("mail_2_rmq.BACKENDS")
+    def test_register(self):
+
+        """Function:  test_register
+
+        Description:  Test a registered backend is used by create_rmqpub.
+
+        Arguments:
+
+        """
+
+        mail_2_rmq.register_backend(
+            "tuple", lambda cfg, qname, rkey: (qname, rkey))
+        cfg = types.SimpleNamespace(rmq_backend="tuple")
+
+        self.assertEqual(
+            mail_2_rmq.create_rmqpub(cfg, "Queue1", "RKey"),
+            ("Queue1", "RKey"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+# Classification (U)
+
+"""Program:  register_codec.py
+
+    Description:  Unit testing of register_codec in mail_2_rmq.py.
+
+    Usage:
+        test/unit/mail_2_rmq/register_codec.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import types
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mail_2_rmq                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=C0413,E0401
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_register
+
+    """
+
+    @mock.patch.dict("mail_2_rmq.CODECS")
+    def test_register(self):
+
+        """Function:  test_register
+
+        Description:  Test a registered codec is used by compress_body.
+
+        Arguments:
+
+        """
+
+        mail_2_rmq.register_codec("reverse", lambda data: data[::-1])
+        cfg = types.SimpleNamespace(compress="reverse", compress_min=0)
+        rmq = types.SimpleNamespace(queue_name="FileQueue1")
+
+        self.assertEqual(
+            mail_2_rmq.compress_body(rmq, cfg, "Body"),
+            (b"ydoB", {"content_encoding": "reverse"}))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,188 @@
+# Classification (U)
+
+"""Program:  replay_archive.py
+
+    Description:  Unit testing of replay_archive in mail_2_rmq.py.
+
+    Usage:
+        test/unit/mail_2_rmq/replay_archive.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mail_2_rmq                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=C0413,E0401
+
+__version__ = version.__version__
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+        arg_exist
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {"-R": True}
+
+    def get_val(self, skey):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey)
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_defaults
+        test_options
+        test_invalid_value
+        test_no_archives
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = mock.Mock()
+        self.log = mock.Mock()
+        self.args = ArgParser()
+        self.archives = [("FILE1", "Queue1")]
+
+    @mock.patch("mail_2_rmq.archive_files")
+    @mock.patch("mail_2_rmq.ArchiveReplay")
+    def test_defaults(self, mock_replay, mock_files):
+
+        """Function:  test_defaults
+
+        Description:  Test the replay with the default options.
+
+        Arguments:
+
+        """
+
+        mock_files.return_value = self.archives
+        mail_2_rmq.replay_archive(self.cfg, self.log, args=self.args)
+
+        self.assertEqual(
+            (mock_replay.call_args[1],
+             mock_replay.return_value.run.call_args),
+            ({"workers": 4, "rate": 0, "delete": False},
+             mock.call(self.archives)))
+
+    @mock.patch("mail_2_rmq.archive_files")
+    @mock.patch("mail_2_rmq.ArchiveReplay")
+    def test_options(self, mock_replay, mock_files):
+
+        """Function:  test_options
+
+        Description:  Test the replay with the -j, -r and -x options.
+
+        Arguments:
+
+        """
+
+        self.args.args_array.update({"-j": "8", "-r": "50", "-x": True})
+        mock_files.return_value = self.archives
+        mail_2_rmq.replay_archive(self.cfg, self.log, args=self.args)
+
+        self.assertEqual(
+            mock_replay.call_args[1],
+            {"workers": 8, "rate": 50.0, "delete": True})
+
+    @mock.patch("mail_2_rmq.archive_files")
+    @mock.patch("mail_2_rmq.ArchiveReplay")
+    def test_invalid_value(self, mock_replay, mock_files):
+
+        """Function:  test_invalid_value
+
+        Description:  Test with an invalid -j value.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-j"] = "many"
+        mail_2_rmq.replay_archive(self.cfg, self.log, args=self.args)
+
+        self.assertEqual(
+            (mock_files.call_count, mock_replay.call_count,
+             self.log.log_err.call_count), (0, 0, 1))
+
+    @mock.patch("mail_2_rmq.archive_files", mock.Mock(return_value=[]))
+    @mock.patch("mail_2_rmq.ArchiveReplay")
+    def test_no_archives(self, mock_replay):
+
+        """Function:  test_no_archives
+
+        Description:  Test with no archived emails.
+
+        Arguments:
+
+        """
+
+        mail_2_rmq.replay_archive(self.cfg, self.log, args=self.args)
+
+        self.assertEqual(mock_replay.call_count, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,373 @@
+# Classification (U)
+
+"""Program:  rmq_pool.py
+
+    Description:  Unit testing of RmqPool in mail_2_rmq.py.
+
+    Usage:
+        test/unit/mail_2_rmq/rmq_pool.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import collections
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mail_2_rmq                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=C0413,E0401
+
+__version__ = version.__version__
+
+
+class Conn():                                           # pylint:disable=R0903
+
+    """Class:  Conn
+
+    Description:  Class which is a representation of a pika connection.
+
+    Methods:
+        __init__
+        process_data_events
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the Conn class.
+
+        Arguments:
+
+        """
+
+        self.is_open = True
+
+    def process_data_events(self, time_limit=None):
+
+        """Method:  process_data_events
+
+        Description:  Stub holder for process_data_events method.
+
+        Arguments:
+
+        """
+
+        return time_limit
+
+
+class Rmq():
+
+    """Class:  Rmq
+
+    Description:  Class which is a representation of the
+        rabbitmq_class.RabbitMQPub class.
+
+    Methods:
+        __init__
+        close
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the Rmq class.
+
+        Arguments:
+
+        """
+
+        self.status = collections.namedtuple("RQ", "is_open")
+        self.channel = self.status(True)
+        self.connection = Conn()
+        self.routing_key = None
+        self.closed = 0
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Stub holder for close method.
+
+        Arguments:
+
+        """
+
+        self.closed += 1
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.host = "HOSTNAME"
+        self.exchange_name = "EXCHANGE_NAME"
+        self.pool_idle = 300
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_reuse
+        test_connect_timed
+        test_shared_queues
+        test_unhealthy_reconnect
+        test_connect_failed
+        test_idle_eviction
+        test_close
+        test_close_confirms
+        test_topology
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+        self.rmq = Rmq()
+        self.rmq2 = Rmq()
+        self.qname = "Queue1"
+        self.qname2 = "Queue2"
+
+    @mock.patch("mail_2_rmq.open_rmq")
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_reuse(self, mock_log, mock_open):
+
+        """Function:  test_reuse
+
+        Description:  Test a pooled connection is reused for the same queue.
+
+        Arguments:
+
+        """
+
+        mock_open.return_value = (self.rmq, True, None)
+        pool = mail_2_rmq.RmqPool(self.cfg, mock_log)
+        pool.acquire(self.qname, self.qname)
+        rmq, status, _ = pool.acquire(self.qname, self.qname)
+
+        self.assertEqual(
+            (rmq, status, mock_open.call_count), (self.rmq, True, 1))
+
+    @mock.patch("mail_2_rmq.open_rmq")
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_connect_timed(self, mock_log, mock_open):
+
+        """Function:  test_connect_timed
+
+        Description:  Test only the new connection is timed as a connect,
+            not the reuse of the pooled connection.
+
+        Arguments:
+
+        """
+
+        mock_open.return_value = (self.rmq, True, None)
+        pool = mail_2_rmq.RmqPool(self.cfg, mock_log)
+        timer = mail_2_rmq.StageTimer()
+        mail_2_rmq.STAGE_TIMER.timer = timer
+        pool.acquire(self.qname, self.qname)
+        pool.acquire(self.qname2, self.qname2)
+        mail_2_rmq.STAGE_TIMER.timer = mail_2_rmq.NULL_TIMER
+
+        self.assertEqual(len(timer.samples["connect"]), 1)
+
+    @mock.patch("mail_2_rmq.open_rmq")
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_shared_queues(self, mock_log, mock_open):
+
+        """Function:  test_shared_queues
+
+        Description:  Test the queues share one pooled connection, set to
+            the queue of each acquire.
+
+        Arguments:
+
+        """
+
+        mock_open.side_effect = [(self.rmq, True, None),
+                                 (self.rmq2, True, None)]
+        pool = mail_2_rmq.RmqPool(self.cfg, mock_log)
+        pool.acquire(self.qname, self.qname)
+        rmq, _, _ = pool.acquire(self.qname2, self.qname2)
+
+        self.assertEqual(
+            (len(pool.conns), mock_open.call_count, rmq, rmq.queue_name,
+             rmq.routing_key, rmq.declared_queues),
+            (1, 1, self.rmq, self.qname2, self.qname2,
+             {(self.qname, self.qname)}))
+
+    @mock.patch("mail_2_rmq.open_rmq")
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_unhealthy_reconnect(self, mock_log, mock_open):
+
+        """Function:  test_unhealthy_reconnect
+
+        Description:  Test an unhealthy connection is replaced.
+
+        Arguments:
+
+        """
+
+        mock_open.side_effect = [(self.rmq, True, None),
+                                 (self.rmq2, True, None)]
+        pool = mail_2_rmq.RmqPool(self.cfg, mock_log)
+        pool.acquire(self.qname, self.qname)
+        self.rmq.connection.is_open = False
+        rmq, _, _ = pool.acquire(self.qname, self.qname)
+
+        self.assertEqual((rmq, self.rmq.closed), (self.rmq2, 1))
+
+    @mock.patch("mail_2_rmq.open_rmq")
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_connect_failed(self, mock_log, mock_open):
+
+        """Function:  test_connect_failed
+
+        Description:  Test a failed connection is not pooled.
+
+        Arguments:
+
+        """
+
+        mock_open.return_value = (self.rmq, False, "Error Message")
+        pool = mail_2_rmq.RmqPool(self.cfg, mock_log)
+        _, status, err_msg = pool.acquire(self.qname, self.qname)
+
+        self.assertEqual(
+            (status, err_msg, pool.conns), (False, "Error Message", {}))
+
+    @mock.patch("mail_2_rmq.open_rmq")
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_idle_eviction(self, mock_log, mock_open):
+
+        """Function:  test_idle_eviction
+
+        Description:  Test idle connections are closed and removed.
+
+        Arguments:
+
+        """
+
+        self.cfg.pool_idle = -1
+        mock_open.return_value = (self.rmq, True, None)
+        pool = mail_2_rmq.RmqPool(self.cfg, mock_log)
+        pool.acquire(self.qname, self.qname)
+        pool.sweep()
+
+        self.assertEqual((pool.conns, self.rmq.closed), ({}, 1))
+
+    @mock.patch("mail_2_rmq.open_rmq")
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_close(self, mock_log, mock_open):
+
+        """Function:  test_close
+
+        Description:  Test closing all pooled connections.
+
+        Arguments:
+
+        """
+
+        mock_open.side_effect = [(self.rmq, True, None),
+                                 (self.rmq2, True, None)]
+        pool = mail_2_rmq.RmqPool(self.cfg, mock_log)
+        pool.acquire(self.qname, self.qname)
+        pool.acquire(self.qname2, self.qname2)
+        pool.close()
+
+        self.assertEqual(
+            (pool.conns, self.rmq.closed, self.rmq2.closed), ({}, 1, 0))
+
+    @mock.patch("mail_2_rmq.open_rmq")
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_close_confirms(self, mock_log, mock_open):
+
+        """Function:  test_close_confirms
+
+        Description:  Test outstanding confirms are waited on before a
+            pooled connection is closed.
+
+        Arguments:
+
+        """
+
+        self.rmq.pub_confirm = mock.Mock()
+        mock_open.return_value = (self.rmq, True, None)
+        pool = mail_2_rmq.RmqPool(self.cfg, mock_log)
+        pool.acquire(self.qname, self.qname)
+        pool.sweep()
+        pool.close()
+
+        self.assertEqual(
+            (self.rmq.pub_confirm.expire.call_count,
+             self.rmq.pub_confirm.flush.call_count, self.rmq.closed),
+            (1, 1, 1))
+
+    @mock.patch("mail_2_rmq.declare_topology")
+    @mock.patch("mail_2_rmq.open_rmq")
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_topology(self, mock_log, mock_open, mock_declare):
+
+        """Function:  test_topology
+
+        Description:  Test the declared topology is passed to new
+            connections.
+
+        Arguments:
+
+        """
+
+        self.cfg.topology_cache = True
+        mock_declare.return_value = {(self.qname, self.qname)}
+        mock_open.return_value = (self.rmq, True, None)
+        pool = mail_2_rmq.RmqPool(self.cfg, mock_log)
+        pool.acquire(self.qname, self.qname)
+
+        mock_open.assert_called_once_with(
+            self.cfg, mock_log, self.qname, self.qname,
+            topology={(self.qname, self.qname)})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,484 @@
+# Classification (U)
+
+"""Program:  rmq_session.py
+
+    Description:  Unit testing of RmqSession in mail_2_rmq.py.
+
+    Usage:
+        test/unit/mail_2_rmq/rmq_session.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import collections
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mail_2_rmq                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=C0413,E0401
+
+__version__ = version.__version__
+
+
+class Rmq():
+
+    """Class:  Rmq
+
+    Description:  Class which is a representation of the
+        rabbitmq_class.RabbitMQPub class.
+
+    Methods:
+        __init__
+        create_connection
+        create_queue
+        bind_queue
+        close
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the Rmq class.
+
+        Arguments:
+
+        """
+
+        self.status = collections.namedtuple("RQ", "is_open")
+        self.channel = self.status(True)
+        self.conn_status = True
+        self.err_msg = ""
+        self.queue_name = None
+        self.routing_key = None
+        self.declared = []
+        self.connects = 0
+        self.closed = 0
+
+    def create_connection(self):
+
+        """Method:  create_connection
+
+        Description:  Stub holder for create_connection method.
+
+        Arguments:
+
+        """
+
+        self.connects += 1
+
+        return self.conn_status, self.err_msg
+
+    def create_queue(self):
+
+        """Method:  create_queue
+
+        Description:  Stub holder for create_queue method.
+
+        Arguments:
+
+        """
+
+        self.declared.append(self.queue_name)
+
+    def bind_queue(self):
+
+        """Method:  bind_queue
+
+        Description:  Stub holder for bind_queue method.
+
+        Arguments:
+
+        """
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Stub holder for close method.
+
+        Arguments:
+
+        """
+
+        self.closed += 1
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.host = "HOSTNAME"
+        self.exchange_name = "EXCHANGE_NAME"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_lazy_connect
+        test_single_connect
+        test_connect_timed
+        test_new_queue_declared
+        test_same_queue_not_declared
+        test_connect_failed
+        test_close
+        test_close_not_connected
+        test_pooled
+        test_pooled_failed
+        test_pooled_queues
+        test_pooled_not_timed
+        test_confirm
+        test_confirm_not_set
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+        self.rmq = Rmq()
+        self.qname = "Queue1"
+        self.qname2 = "Queue2"
+
+    @mock.patch("mail_2_rmq.rabbitmq_class.create_rmqpub")
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_lazy_connect(self, mock_log, mock_rmq):
+
+        """Function:  test_lazy_connect
+
+        Description:  Test no connection is made until first use.
+
+        Arguments:
+
+        """
+
+        mock_rmq.return_value = self.rmq
+        session = mail_2_rmq.RmqSession(self.cfg, mock_log)
+
+        self.assertFalse(session.is_open())
+        mock_rmq.assert_not_called()
+
+    @mock.patch("mail_2_rmq.rabbitmq_class.create_rmqpub")
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_single_connect(self, mock_log, mock_rmq):
+
+        """Function:  test_single_connect
+
+        Description:  Test one connection shared across multiple queues.
+
+        Arguments:
+
+        """
+
+        mock_rmq.return_value = self.rmq
+        session = mail_2_rmq.RmqSession(self.cfg, mock_log)
+        session.get_rmq(self.qname, self.qname)
+        session.get_rmq(self.qname2, self.qname2)
+        session.get_rmq(self.qname, self.qname)
+
+        self.assertEqual(
+            (mock_rmq.call_count, self.rmq.connects), (1, 1))
+
+    @mock.patch("mail_2_rmq.rabbitmq_class.create_rmqpub")
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_connect_timed(self, mock_log, mock_rmq):
+
+        """Function:  test_connect_timed
+
+        Description:  Test the connection is timed once as a connect.
+
+        Arguments:
+
+        """
+
+        mock_rmq.return_value = self.rmq
+        timer = mail_2_rmq.StageTimer()
+        mail_2_rmq.STAGE_TIMER.timer = timer
+        session = mail_2_rmq.RmqSession(self.cfg, mock_log)
+        session.get_rmq(self.qname, self.qname)
+        session.get_rmq(self.qname2, self.qname2)
+        mail_2_rmq.STAGE_TIMER.timer = mail_2_rmq.NULL_TIMER
+
+        self.assertEqual(len(timer.samples["connect"]), 1)
+
+    @mock.patch("mail_2_rmq.rabbitmq_class.create_rmqpub")
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_new_queue_declared(self, mock_log, mock_rmq):
+
+        """Function:  test_new_queue_declared
+
+        Description:  Test a new queue is declared on the shared connection.
+
+        Arguments:
+
+        """
+
+        mock_rmq.return_value = self.rmq
+        session = mail_2_rmq.RmqSession(self.cfg, mock_log)
+        session.get_rmq(self.qname, self.qname)
+        rmq = session.get_rmq(self.qname2, self.qname2)
+
+        self.assertEqual(
+            (rmq.queue_name, rmq.routing_key, self.rmq.declared),
+            (self.qname2, self.qname2, [self.qname2]))
+
+    @mock.patch("mail_2_rmq.rabbitmq_class.create_rmqpub")
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_same_queue_not_declared(self, mock_log, mock_rmq):
+
+        """Function:  test_same_queue_not_declared
+
+        Description:  Test a queue already used is not declared again.
+
+        Arguments:
+
+        """
+
+        mock_rmq.return_value = self.rmq
+        session = mail_2_rmq.RmqSession(self.cfg, mock_log)
+        session.get_rmq(self.qname, self.qname)
+        session.get_rmq(self.qname, self.qname)
+
+        self.assertEqual(self.rmq.declared, [])
+
+    @mock.patch("mail_2_rmq.rabbitmq_class.create_rmqpub")
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_connect_failed(self, mock_log, mock_rmq):
+
+        """Function:  test_connect_failed
+
+        Description:  Test with failed connection, no reconnect attempted.
+
+        Arguments:
+
+        """
+
+        self.rmq.conn_status = False
+        self.rmq.err_msg = "Error Message"
+        mock_rmq.return_value = self.rmq
+        session = mail_2_rmq.RmqSession(self.cfg, mock_log)
+        session.get_rmq(self.qname, self.qname)
+        rmq = session.get_rmq(self.qname2, self.qname2)
+
+        self.assertEqual(
+            (session.is_open(), session.err_msg, rmq.queue_name,
+             self.rmq.connects), (False, "Error Message", self.qname2, 1))
+
+    @mock.patch("mail_2_rmq.rabbitmq_class.create_rmqpub")
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_close(self, mock_log, mock_rmq):
+
+        """Function:  test_close
+
+        Description:  Test closing an open session.
+
+        Arguments:
+
+        """
+
+        mock_rmq.return_value = self.rmq
+        session = mail_2_rmq.RmqSession(self.cfg, mock_log)
+        session.get_rmq(self.qname, self.qname)
+        session.close()
+
+        self.assertEqual(
+            (self.rmq.closed, session.is_open()), (1, False))
+
+    @mock.patch("mail_2_rmq.rabbitmq_class.create_rmqpub")
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_close_not_connected(self, mock_log, mock_rmq):
+
+        """Function:  test_close_not_connected
+
+        Description:  Test closing a session that never connected.
+
+        Arguments:
+
+        """
+
+        self.rmq.conn_status = False
+        mock_rmq.return_value = self.rmq
+        session = mail_2_rmq.RmqSession(self.cfg, mock_log)
+        session.get_rmq(self.qname, self.qname)
+        session.close()
+
+        self.assertEqual(self.rmq.closed, 0)
+
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_pooled(self, mock_log):
+
+        """Function:  test_pooled
+
+        Description:  Test pooled connections are not closed with the session.
+
+        Arguments:
+
+        """
+
+        pool = mock.Mock()
+        pool.acquire.return_value = (self.rmq, True, None)
+        session = mail_2_rmq.RmqSession(self.cfg, mock_log, pool=pool)
+        session.get_rmq(self.qname, self.qname)
+        session.close()
+
+        self.assertEqual(
+            (pool.acquire.call_count, self.rmq.closed), (1, 0))
+
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_pooled_failed(self, mock_log):
+
+        """Function:  test_pooled_failed
+
+        Description:  Test a failed pool connection is not retried in the
+            same session.
+
+        Arguments:
+
+        """
+
+        pool = mock.Mock()
+        pool.acquire.return_value = (self.rmq, False, "Error Message")
+        session = mail_2_rmq.RmqSession(self.cfg, mock_log, pool=pool)
+        session.get_rmq(self.qname, self.qname)
+        rmq = session.get_rmq(self.qname2, self.qname2)
+
+        self.assertEqual(
+            (pool.acquire.call_count, rmq.queue_name), (1, self.qname2))
+
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_pooled_queues(self, mock_log):
+
+        """Function:  test_pooled_queues
+
+        Description:  Test one pooled connection is used for every queue and
+            a queue is declared once on the connection across sessions.
+
+        Arguments:
+
+        """
+
+        self.rmq.declared_queues = {(self.qname, self.qname)}
+        pool = mock.Mock()
+        pool.acquire.return_value = (self.rmq, True, None)
+
+        for _ in range(2):
+            session = mail_2_rmq.RmqSession(self.cfg, mock_log, pool=pool)
+            session.get_rmq(self.qname, self.qname)
+            rmq = session.get_rmq(self.qname2, self.qname2)
+            session.close()
+
+        self.assertEqual(
+            (pool.acquire.call_count, rmq.queue_name, self.rmq.declared,
+             self.rmq.declared_queues),
+            (2, self.qname2, [self.qname2],
+             {(self.qname, self.qname), (self.qname2, self.qname2)}))
+
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_pooled_not_timed(self, mock_log):
+
+        """Function:  test_pooled_not_timed
+
+        Description:  Test the session does not time a pooled connection as
+            a connect, the pool times the connections it opens.
+
+        Arguments:
+
+        """
+
+        pool = mock.Mock()
+        pool.acquire.return_value = (self.rmq, True, None)
+        timer = mail_2_rmq.StageTimer()
+        mail_2_rmq.STAGE_TIMER.timer = timer
+        session = mail_2_rmq.RmqSession(self.cfg, mock_log, pool=pool)
+        session.get_rmq(self.qname, self.qname)
+        mail_2_rmq.STAGE_TIMER.timer = mail_2_rmq.NULL_TIMER
+
+        self.assertNotIn("connect", timer.stages)
+
+    @mock.patch("mail_2_rmq.PubConfirm")
+    @mock.patch("mail_2_rmq.rabbitmq_class.create_rmqpub")
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_confirm(self, mock_log, mock_rmq, mock_confirm):
+
+        """Function:  test_confirm
+
+        Description:  Test publisher confirms are enabled once and waited on
+            when the session is closed.
+
+        Arguments:
+
+        """
+
+        self.cfg.pub_confirm = True
+        mock_rmq.return_value = self.rmq
+        session = mail_2_rmq.RmqSession(self.cfg, mock_log)
+        session.get_rmq(self.qname, self.qname)
+        session.get_rmq(self.qname2, self.qname2)
+        confirm = session.confirm
+        session.close()
+
+        self.assertEqual(
+            (mock_confirm.call_count, confirm.flush.call_count,
+             session.confirm, self.rmq.closed), (1, 1, None, 1))
+
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_confirm_not_set(self, mock_log):
+
+        """Function:  test_confirm_not_set
+
+        Description:  Test publisher confirms are not used without the
+            pub_confirm setting, even when the pooled connection has them.
+
+        Arguments:
+
+        """
+
+        self.rmq.pub_confirm = mock.Mock()
+        pool = mock.Mock()
+        pool.acquire.return_value = (self.rmq, True, None)
+        session = mail_2_rmq.RmqSession(self.cfg, mock_log, pool=pool)
+        session.get_rmq(self.qname, self.qname)
+
+        self.assertIsNone(session.confirm)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,261 @@
+# Classification (U)
+
+"""Program:  route_rule.py
+
+    Description:  Unit testing of RouteRule in mail_2_rmq.py.
+
+    Usage:
+        test/unit/mail_2_rmq/route_rule.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mail_2_rmq                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=C0413,E0401
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_defaults
+        test_no_queue
+        test_unknown_key
+        test_unknown_publish
+        test_invalid_pattern
+        test_catch_all
+        test_header_match
+        test_header_case
+        test_header_no_match
+        test_attach_types
+        test_attach_size
+        test_attach_size_no_match
+        test_combined
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.fields = {"to": "Ops <ops@partner.example>",
+                       "x-priority": "1 (Highest)",
+                       "attach_types": {"application/pdf"},
+                       "attach_size": 2048}
+
+    def test_defaults(self):
+
+        """Function:  test_defaults
+
+        Description:  Test the rule defaults.
+
+        Arguments:
+
+        """
+
+        rule = mail_2_rmq.RouteRule({"queue": "Queue1"})
+
+        self.assertEqual(
+            (rule.name, rule.publish, rule.hits, rule.headers, rule.attach),
+            ("Queue1", "email", 0, set(), False))
+
+    def test_no_queue(self):
+
+        """Function:  test_no_queue
+
+        Description:  Test a rule without a queue.
+
+        Arguments:
+
+        """
+
+        with self.assertRaises(ValueError):
+            mail_2_rmq.RouteRule({"name": "Rule1"})
+
+    def test_unknown_key(self):
+
+        """Function:  test_unknown_key
+
+        Description:  Test a rule with an unknown key.
+
+        Arguments:
+
+        """
+
+        with self.assertRaises(ValueError):
+            mail_2_rmq.RouteRule({"queue": "Queue1", "subject": "Test"})
+
+    def test_unknown_publish(self):
+
+        """Function:  test_unknown_publish
+
+        Description:  Test a rule with an unknown publish value.
+
+        Arguments:
+
+        """
+
+        with self.assertRaises(ValueError):
+            mail_2_rmq.RouteRule({"queue": "Queue1", "publish": "body"})
+
+    def test_invalid_pattern(self):
+
+        """Function:  test_invalid_pattern
+
+        Description:  Test a rule with a header pattern which does not
+            compile.
+
+        Arguments:
+
+        """
+
+        with self.assertRaises(ValueError):
+            mail_2_rmq.RouteRule({"queue": "Queue1", "headers": {"To": "("}})
+
+    def test_catch_all(self):
+
+        """Function:  test_catch_all
+
+        Description:  Test a rule without conditions matches every email.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(
+            mail_2_rmq.RouteRule({"queue": "Queue1"}).matches({}))
+
+    def test_header_match(self):
+
+        """Function:  test_header_match
+
+        Description:  Test a header condition which matches.
+
+        Arguments:
+
+        """
+
+        rule = mail_2_rmq.RouteRule(
+            {"queue": "Queue1", "headers": {"X-Priority": "^[12]"}})
+
+        self.assertEqual(
+            (rule.matches(self.fields), rule.headers),
+            (True, {"x-priority"}))
+
+    def test_header_case(self):
+
+        """Function:  test_header_case
+
+        Description:  Test a header condition is matched without case.
+
+        Arguments:
+
+        """
+
+        rule = mail_2_rmq.RouteRule(
+            {"queue": "Queue1", "headers": {"To": "OPS@PARTNER"}})
+
+        self.assertTrue(rule.matches(self.fields))
+
+    def test_header_no_match(self):
+
+        """Function:  test_header_no_match
+
+        Description:  Test a header condition which does not match.
+
+        Arguments:
+
+        """
+
+        rule = mail_2_rmq.RouteRule(
+            {"queue": "Queue1", "headers": {"X-Priority": "^5"}})
+
+        self.assertFalse(rule.matches(self.fields))
+
+    def test_attach_types(self):
+
+        """Function:  test_attach_types
+
+        Description:  Test an attachment type condition.
+
+        Arguments:
+
+        """
+
+        rule = mail_2_rmq.RouteRule(
+            {"queue": "Queue1",
+             "attach_types": ["application/pdf", "text/csv"]})
+
+        self.assertEqual(
+            (rule.matches(self.fields), rule.attach), (True, True))
+
+    def test_attach_size(self):
+
+        """Function:  test_attach_size
+
+        Description:  Test attachment size conditions.
+
+        Arguments:
+
+        """
+
+        rule = mail_2_rmq.RouteRule(
+            {"queue": "Queue1", "attach_min": 1024, "attach_max": 4096})
+
+        self.assertTrue(rule.matches(self.fields))
+
+    def test_attach_size_no_match(self):
+
+        """Function:  test_attach_size_no_match
+
+        Description:  Test attachment size conditions which do not match.
+
+        Arguments:
+
+        """
+
+        rule = mail_2_rmq.RouteRule({"queue": "Queue1", "attach_max": 1024})
+
+        self.assertFalse(rule.matches(self.fields))
+
+    def test_combined(self):
+
+        """Function:  test_combined
+
+        Description:  Test every condition of the rule must match.
+
+        Arguments:
+
+        """
+
+        rule = mail_2_rmq.RouteRule(
+            {"queue": "Queue1", "headers": {"To": "ops@"},
+             "attach_types": ["text/csv"]})
+
+        self.assertFalse(rule.matches(self.fields))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,402 @@
+# Classification (U)
+
+"""Program:  route_table.py
+
+    Description:  Unit testing of RouteTable in mail_2_rmq.py.
+
+    Usage:
+        test/unit/mail_2_rmq/route_table.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import types
+import email.message
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mail_2_rmq                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=C0413,E0401
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_subject_sets
+        test_no_file_queues
+        test_exact_address
+        test_exact_before_domain
+        test_domain
+        test_domain_case
+        test_domain_not_sub_domain
+        test_sub_domain
+        test_sub_domain_not_domain
+        test_most_specific
+        test_no_match
+        test_not_address
+        test_no_rules
+        test_rule_order
+        test_rule_no_match
+        test_rule_hits
+        test_fields_headers
+        test_fields_attach
+        test_fanout
+        test_attach_queues
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = types.SimpleNamespace(
+            valid_queues=["Queue1", "Queue2"],
+            file_queues=["FileQueue1"],
+            err_file_queue="ErrFileQueue",
+            queue_dict={"name@partner.example": "NameQueue",
+                        "*@partner.example": "PartnerQueue",
+                        "*@*.partner.example": "SubQueue",
+                        "*@*.eu.partner.example": "EuQueue"})
+        self.routes = mail_2_rmq.RouteTable(self.cfg)
+        self.msg = mail_2_rmq.parse_data(
+            b"To: ops@partner.example\nX-Priority: 1 (Highest)\n"
+            b"Subject: Test\n\nBody\n")
+
+    def test_subject_sets(self):
+
+        """Function:  test_subject_sets
+
+        Description:  Test the valid and file queues are sets.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            (self.routes.valid_queues, self.routes.file_queues),
+            ({"Queue1", "Queue2"}, {"FileQueue1"}))
+
+    def test_no_file_queues(self):
+
+        """Function:  test_no_file_queues
+
+        Description:  Test without the file_queues setting.
+
+        Arguments:
+
+        """
+
+        del self.cfg.file_queues
+
+        self.assertEqual(
+            mail_2_rmq.RouteTable(self.cfg).file_queues, set())
+
+    def test_exact_address(self):
+
+        """Function:  test_exact_address
+
+        Description:  Test an exact address lookup.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            self.routes.sender_queue("name@partner.example"), "NameQueue")
+
+    def test_exact_before_domain(self):
+
+        """Function:  test_exact_before_domain
+
+        Description:  Test an exact address wins over a domain wildcard.
+
+        Arguments:
+
+        """
+
+        self.assertNotEqual(
+            self.routes.sender_queue("name@partner.example"), "PartnerQueue")
+
+    def test_domain(self):
+
+        """Function:  test_domain
+
+        Description:  Test a domain wildcard lookup.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            self.routes.sender_queue("other@partner.example"),
+            "PartnerQueue")
+
+    def test_domain_case(self):
+
+        """Function:  test_domain_case
+
+        Description:  Test the domain is matched without case.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            self.routes.sender_queue("other@Partner.Example"),
+            "PartnerQueue")
+
+    def test_domain_not_sub_domain(self):
+
+        """Function:  test_domain_not_sub_domain
+
+        Description:  Test a domain wildcard does not match sub-domains.
+
+        Arguments:
+
+        """
+
+        del self.cfg.queue_dict["*@*.partner.example"]
+        del self.cfg.queue_dict["*@*.eu.partner.example"]
+        routes = mail_2_rmq.RouteTable(self.cfg)
+
+        self.assertIsNone(routes.sender_queue("other@mail.partner.example"))
+
+    def test_sub_domain(self):
+
+        """Function:  test_sub_domain
+
+        Description:  Test a sub-domain wildcard lookup.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            self.routes.sender_queue("other@a.b.partner.example"),
+            "SubQueue")
+
+    def test_sub_domain_not_domain(self):
+
+        """Function:  test_sub_domain_not_domain
+
+        Description:  Test a sub-domain wildcard does not match the domain.
+
+        Arguments:
+
+        """
+
+        del self.cfg.queue_dict["*@partner.example"]
+        routes = mail_2_rmq.RouteTable(self.cfg)
+
+        self.assertIsNone(routes.sender_queue("other@partner.example"))
+
+    def test_most_specific(self):
+
+        """Function:  test_most_specific
+
+        Description:  Test the most specific domain wildcard wins.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            self.routes.sender_queue("other@mail.eu.partner.example"),
+            "EuQueue")
+
+    def test_no_match(self):
+
+        """Function:  test_no_match
+
+        Description:  Test an address without a route.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(self.routes.sender_queue("other@example"))
+
+    def test_not_address(self):
+
+        """Function:  test_not_address
+
+        Description:  Test a value which is not an address.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(self.routes.sender_queue("partner.example"))
+
+    def test_no_rules(self):
+
+        """Function:  test_no_rules
+
+        Description:  Test no fields are extracted without routing rules.
+
+        Arguments:
+
+        """
+
+        msg = mock.Mock()
+
+        self.assertEqual(
+            (self.routes.match_rule(msg), msg.get_all.call_count), (None, 0))
+
+    def test_rule_order(self):
+
+        """Function:  test_rule_order
+
+        Description:  Test the first matching rule wins.
+
+        Arguments:
+
+        """
+
+        self.cfg.routing_rules = [
+            {"queue": "ListQueue", "headers": {"List-Id": "ops"}},
+            {"queue": "UrgentQueue", "headers": {"X-Priority": "^1"}},
+            {"queue": "AllQueue"}]
+        routes = mail_2_rmq.RouteTable(self.cfg)
+
+        self.assertEqual(
+            routes.match_rule(self.msg).queue, "UrgentQueue")
+
+    def test_rule_no_match(self):
+
+        """Function:  test_rule_no_match
+
+        Description:  Test with no matching rule.
+
+        Arguments:
+
+        """
+
+        self.cfg.routing_rules = [
+            {"queue": "ListQueue", "headers": {"List-Id": "ops"}}]
+        routes = mail_2_rmq.RouteTable(self.cfg)
+
+        self.assertIsNone(routes.match_rule(self.msg))
+
+    def test_rule_hits(self):
+
+        """Function:  test_rule_hits
+
+        Description:  Test the hits are counted against each rule.
+
+        Arguments:
+
+        """
+
+        self.cfg.routing_rules = [
+            {"name": "Urgent", "queue": "UrgentQueue",
+             "headers": {"X-Priority": "^1"}},
+            {"name": "All", "queue": "AllQueue"}]
+        routes = mail_2_rmq.RouteTable(self.cfg)
+        routes.match_rule(self.msg)
+        routes.match_rule(self.msg)
+        routes.match_rule(mail_2_rmq.parse_data(b"Subject: Test\n\n"))
+
+        self.assertEqual(routes.rule_hits(), {"Urgent": 2, "All": 1})
+
+    def test_fields_headers(self):
+
+        """Function:  test_fields_headers
+
+        Description:  Test only the headers named in the rules are extracted.
+
+        Arguments:
+
+        """
+
+        self.cfg.routing_rules = [
+            {"queue": "ToQueue", "headers": {"To": "ops@"}}]
+        routes = mail_2_rmq.RouteTable(self.cfg)
+
+        self.assertEqual(
+            routes.fields(self.msg), {"to": "ops@partner.example"})
+
+    def test_fields_attach(self):
+
+        """Function:  test_fields_attach
+
+        Description:  Test the attachment fields are extracted when a rule
+            tests the attachments.
+
+        Arguments:
+
+        """
+
+        self.cfg.routing_rules = [
+            {"queue": "PdfQueue", "attach_types": ["application/pdf"]}]
+        routes = mail_2_rmq.RouteTable(self.cfg)
+        msg = email.message.EmailMessage()
+        msg.set_content("Body")
+        msg.add_attachment(
+            b"12345", maintype="application", subtype="pdf",
+            filename="file.pdf")
+
+        self.assertEqual(
+            routes.fields(msg),
+            {"attach_types": {"application/pdf"}, "attach_size": 5})
+
+    def test_fanout(self):
+
+        """Function:  test_fanout
+
+        Description:  Test the valid_queues2 subjects and queues.
+
+        Arguments:
+
+        """
+
+        self.cfg.valid_queues2 = {"Subj": ("Queue3", "Queue4")}
+
+        self.assertEqual(
+            (self.routes.fanout, mail_2_rmq.RouteTable(self.cfg).fanout),
+            ({}, {"Subj": ["Queue3", "Queue4"]}))
+
+    def test_attach_queues(self):
+
+        """Function:  test_attach_queues
+
+        Description:  Test the queues attachments are published to.
+
+        Arguments:
+
+        """
+
+        self.cfg.routing_rules = [
+            {"queue": "RuleAttach", "publish": "attach",
+             "attach_types": ["application/pdf"]},
+            {"queue": "RuleEmail", "headers": {"To": "ops@"}}]
+
+        self.assertEqual(
+            mail_2_rmq.RouteTable(self.cfg).attach_queues,
+            {"FileQueue1", "ErrFileQueue", "NameQueue", "PartnerQueue",
+             "SubQueue", "EuQueue", "RuleAttach"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,188 @@
+# Classification (U)
+
+"""Program:  run_async_engine.py
+
+    Description:  Unit testing of run_async_engine in mail_2_rmq.py.
+
+    Usage:
+        test/unit/mail_2_rmq/run_async_engine.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mail_2_rmq                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=C0413,E0401
+
+__version__ = version.__version__
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {}
+
+    def arg_exist(self, skey):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return skey in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_files
+        test_resident
+        test_closed_on_error
+        test_pool
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = mock.Mock()
+        self.args = ArgParser()
+
+    @mock.patch("mail_2_rmq.asyncio.run", mock.Mock(return_value=None))
+    @mock.patch("mail_2_rmq.AsyncEngine")
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_files(self, mock_log, mock_engine):
+
+        """Function:  test_files
+
+        Description:  Test the -C files are passed to the engine.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-C": ["/path/file1"]}
+        mail_2_rmq.run_async_engine(self.cfg, mock_log, args=self.args)
+
+        mock_engine.return_value.run.assert_called_once_with(["/path/file1"])
+
+    @mock.patch("mail_2_rmq.asyncio.run", mock.Mock(return_value=None))
+    @mock.patch("mail_2_rmq.AsyncEngine")
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_resident(self, mock_log, mock_engine):
+
+        """Function:  test_resident
+
+        Description:  Test the engine is run as a resident server.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-D": True}
+        mail_2_rmq.run_async_engine(self.cfg, mock_log, args=self.args)
+
+        mock_engine.return_value.run.assert_called_once_with(None)
+
+    @mock.patch("mail_2_rmq.asyncio.run")
+    @mock.patch("mail_2_rmq.AsyncEngine")
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_closed_on_error(self, mock_log, mock_engine, mock_run):
+
+        """Function:  test_closed_on_error
+
+        Description:  Test the engine is closed if the run fails.
+
+        Arguments:
+
+        """
+
+        mock_run.side_effect = OSError("Address in use")
+        self.args.args_array = {"-S": True}
+
+        with self.assertRaises(OSError):
+            mail_2_rmq.run_async_engine(self.cfg, mock_log, args=self.args)
+
+        self.assertEqual(mock_engine.return_value.close.call_count, 1)
+
+    @mock.patch("mail_2_rmq.asyncio.run", mock.Mock(return_value=None))
+    @mock.patch("mail_2_rmq.AsyncEngine")
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_pool(self, mock_log, mock_engine):
+
+        """Function:  test_pool
+
+        Description:  Test the connection pool of the run is passed to the
+            engine.
+
+        Arguments:
+
+        """
+
+        pool = mock.Mock()
+        self.args.args_array = {"-D": True}
+        mail_2_rmq.run_async_engine(
+            self.cfg, mock_log, args=self.args, pool=pool)
+
+        mock_engine.assert_called_once_with(self.cfg, mock_log, pool=pool)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -229,6 +229,14 @@ class UnitTest(unittest.TestCase):
         test_true_func
         test_true_status
         test_false_status
+        test_async_engine
+        test_profile
+        test_profile_error
+        test_profile_async
+        test_profile_workers
+        test_wal_resident
+        test_wal_not_resident
+        test_wal_left
 
     """
 
@@ -320,6 +328,212 @@ class UnitTest(unittest.TestCase):
             self.assertFalse(
                 mail_2_rmq.run_program(self.args, self.func_names))
 
+    @mock.patch("mail_2_rmq.run_async_engine")
+    @mock.patch("mail_2_rmq.gen_class")
+    @mock.patch("mail_2_rmq.load_cfg")
+    def test_async_engine(self, mock_cfg, mock_class, mock_async):
+
+        """Function:  test_async_engine
+
+        Description:  Test with the asyncio engine turned on.
+
+        Arguments:
+
+        """
+
+        self.cfg.async_engine = True
+        mock_cfg.return_value = (self.cfg, True, [])
+        mock_class.Logger.return_value = self.log
+
+        self.args.args_array["-C"] = True
+        mail_2_rmq.run_program(self.args, self.func_names)
+
+        self.assertEqual(mock_async.call_count, 1)
+
+    @mock.patch("mail_2_rmq.Profiler")
+    @mock.patch("mail_2_rmq.gen_class")
+    @mock.patch("mail_2_rmq.load_cfg")
+    def test_profile(self, mock_cfg, mock_class, mock_profiler):
+
+        """Function:  test_profile
+
+        Description:  Test the run is profiled with the -P option.
+
+        Arguments:
+
+        """
+
+        mock_cfg.return_value = (self.cfg, True, [])
+        mock_class.Logger.return_value = self.log
+
+        self.args.args_array["-M"] = True
+        self.args.args_array["-P"] = True
+        mail_2_rmq.run_program(self.args, self.func_names)
+
+        self.assertEqual(
+            (mock_profiler.return_value.start.call_count,
+             mock_profiler.return_value.stop.call_count), (1, 1))
+
+    @mock.patch("mail_2_rmq.Profiler")
+    @mock.patch("mail_2_rmq.gen_class")
+    @mock.patch("mail_2_rmq.load_cfg")
+    def test_profile_error(self, mock_cfg, mock_class, mock_profiler):
+
+        """Function:  test_profile_error
+
+        Description:  Test the profile is written when the run fails.
+
+        Arguments:
+
+        """
+
+        mock_cfg.return_value = (self.cfg, True, [])
+        mock_class.Logger.return_value = self.log
+
+        self.args.args_array["-M"] = True
+        self.args.args_array["-P"] = True
+
+        with self.assertRaises(ValueError):
+            mail_2_rmq.run_program(
+                self.args, {"-M": mock.Mock(side_effect=ValueError)})
+
+        self.assertEqual(mock_profiler.return_value.stop.call_count, 1)
+
+    @mock.patch("mail_2_rmq.run_async_engine")
+    @mock.patch("mail_2_rmq.Profiler")
+    @mock.patch("mail_2_rmq.gen_class")
+    @mock.patch("mail_2_rmq.load_cfg")
+    def test_profile_async(self, mock_cfg, mock_class, mock_profiler,
+                           mock_async):
+
+        """Function:  test_profile_async
+
+        Description:  Test the -P option is rejected on the asyncio engine.
+
+        Arguments:
+
+        """
+
+        self.cfg.async_engine = True
+        mock_cfg.return_value = (self.cfg, True, [])
+        mock_class.Logger.return_value = self.log
+
+        self.args.args_array["-C"] = True
+        self.args.args_array["-P"] = True
+
+        with gen_libs.no_std_out():
+            mail_2_rmq.run_program(self.args, self.func_names)
+
+        self.assertEqual(
+            (mock_profiler.call_count, mock_async.call_count), (0, 0))
+
+    @mock.patch("mail_2_rmq.Profiler")
+    @mock.patch("mail_2_rmq.gen_class")
+    @mock.patch("mail_2_rmq.load_cfg")
+    def test_profile_workers(self, mock_cfg, mock_class, mock_profiler):
+
+        """Function:  test_profile_workers
+
+        Description:  Test the -P option is rejected with -j workers.
+
+        Arguments:
+
+        """
+
+        mock_cfg.return_value = (self.cfg, True, [])
+        mock_class.Logger.return_value = self.log
+        func = mock.Mock()
+
+        self.args.args_array["-C"] = True
+        self.args.args_array["-P"] = True
+        self.args.args["-j"] = "4"
+
+        with gen_libs.no_std_out():
+            mail_2_rmq.run_program(self.args, {"-C": func})
+
+        self.assertEqual(
+            (mock_profiler.call_count, func.call_count), (0, 0))
+
+    @mock.patch("mail_2_rmq.WalReplayer")
+    @mock.patch("mail_2_rmq.gen_class")
+    @mock.patch("mail_2_rmq.load_cfg")
+    def test_wal_resident(self, mock_cfg, mock_class, mock_replayer):
+
+        """Function:  test_wal_resident
+
+        Description:  Test the write-ahead spool is replayed while a resident
+            option runs.
+
+        Arguments:
+
+        """
+
+        self.cfg.wal_dir = "WAL_DIRECTORY"
+        mock_cfg.return_value = (self.cfg, True, [])
+        mock_class.Logger.return_value = self.log
+
+        self.args.args_array["-D"] = True
+        mail_2_rmq.run_program(self.args, {"-D": capture_email})
+
+        self.assertEqual(
+            (mock_replayer.return_value.run_once.call_count,
+             mock_replayer.return_value.start.call_count,
+             mock_replayer.return_value.stop.call_count), (1, 1, 1))
+
+    @mock.patch("mail_2_rmq.WalReplayer")
+    @mock.patch("mail_2_rmq.gen_class")
+    @mock.patch("mail_2_rmq.load_cfg")
+    def test_wal_not_resident(self, mock_cfg, mock_class, mock_replayer):
+
+        """Function:  test_wal_not_resident
+
+        Description:  Test the write-ahead spool is replayed once before the
+            -M option runs, without the background thread.
+
+        Arguments:
+
+        """
+
+        self.cfg.wal_dir = "WAL_DIRECTORY"
+        mock_cfg.return_value = (self.cfg, True, [])
+        mock_class.Logger.return_value = self.log
+        mock_replayer.return_value.run_once.return_value = 0
+        func = mock.Mock(
+            side_effect=lambda *args, **kwargs: self.assertEqual(
+                mock_replayer.return_value.run_once.call_count, 1))
+
+        self.args.args_array["-M"] = True
+        mail_2_rmq.run_program(self.args, {"-M": func})
+
+        self.assertEqual(
+            (func.call_count, mock_replayer.return_value.start.call_count),
+            (1, 0))
+
+    @mock.patch("mail_2_rmq.WalReplayer")
+    @mock.patch("mail_2_rmq.gen_class")
+    @mock.patch("mail_2_rmq.load_cfg")
+    def test_wal_left(self, mock_cfg, mock_class, mock_replayer):
+
+        """Function:  test_wal_left
+
+        Description:  Test a warning is logged when records are left in the
+            write-ahead spool and no resident option runs.
+
+        Arguments:
+
+        """
+
+        self.cfg.wal_dir = "WAL_DIRECTORY"
+        mock_cfg.return_value = (self.cfg, True, [])
+        mock_class.Logger.return_value = self.log
+        mock_replayer.return_value.run_once.return_value = 2
+        self.log.log_warn = mock.Mock()
+
+        self.args.args_array["-M"] = True
+        mail_2_rmq.run_program(self.args, self.func_names)
+
+        self.assertIn("2 records left", self.log.log_warn.call_args.args[0])
+
 
 if __name__ == "__main__":
     unittest.main()
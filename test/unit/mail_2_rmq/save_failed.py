@@ -0,0 +1,243 @@
+# Classification (U)
+
+"""Program:  save_failed.py
+
+    Description:  Unit testing of save_failed in mail_2_rmq.py.
+
+    Usage:
+        test/unit/mail_2_rmq/save_failed.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mail_2_rmq                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=C0413,E0401
+
+__version__ = version.__version__
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.err_queue = "ERROR_QUEUE"
+        self.email_dir = "EMAIL_DIRECTORY"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_wal
+        test_wal_body
+        test_wal_build_body
+        test_wal_no_body
+        test_wal_failed
+        test_wal_binary_chunks
+        test_wal_compressed
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+        self.log = mock.Mock()
+        self.rmq = mock.Mock()
+        self.msg = {"subject": "Queue1"}
+
+    @mock.patch("mail_2_rmq.wal_write")
+    @mock.patch("mail_2_rmq.archive_email")
+    def test_no_wal(self, mock_archive, mock_wal):
+
+        """Function:  test_no_wal
+
+        Description:  Test the email is archived without the wal_dir setting.
+
+        Arguments:
+
+        """
+
+        mail_2_rmq.save_failed(
+            self.rmq, self.log, self.cfg, self.msg, body="Body")
+
+        self.assertEqual(
+            (mock_archive.call_count, mock_wal.call_count), (1, 0))
+
+    @mock.patch("mail_2_rmq.wal_write")
+    @mock.patch("mail_2_rmq.archive_email")
+    def test_wal_body(self, mock_archive, mock_wal):
+
+        """Function:  test_wal_body
+
+        Description:  Test the message body is written to the write-ahead
+            spool.
+
+        Arguments:
+
+        """
+
+        self.cfg.wal_dir = "WAL_DIRECTORY"
+        mail_2_rmq.save_failed(
+            self.rmq, self.log, self.cfg, self.msg, body="Body",
+            props={"priority": 1})
+
+        self.assertEqual(
+            (mock_archive.call_count, mock_wal.call_args),
+            (0, mock.call(self.cfg, self.log, self.rmq, "Body", priority=1)))
+
+    @mock.patch("mail_2_rmq.build_body", mock.Mock(return_value="Built"))
+    @mock.patch("mail_2_rmq.wal_write")
+    @mock.patch("mail_2_rmq.archive_email")
+    def test_wal_build_body(self, mock_archive, mock_wal):
+
+        """Function:  test_wal_build_body
+
+        Description:  Test the message body is built when not passed.
+
+        Arguments:
+
+        """
+
+        self.cfg.wal_dir = "WAL_DIRECTORY"
+        mail_2_rmq.save_failed(self.rmq, self.log, self.cfg, self.msg)
+
+        self.assertEqual(
+            (mock_archive.call_count, mock_wal.call_args[0][3]), (0, "Built"))
+
+    @mock.patch("mail_2_rmq.build_body", mock.Mock(return_value=None))
+    @mock.patch("mail_2_rmq.wal_write")
+    @mock.patch("mail_2_rmq.archive_email")
+    def test_wal_no_body(self, mock_archive, mock_wal):
+
+        """Function:  test_wal_no_body
+
+        Description:  Test the email is archived when it has no body.
+
+        Arguments:
+
+        """
+
+        self.cfg.wal_dir = "WAL_DIRECTORY"
+        mail_2_rmq.save_failed(self.rmq, self.log, self.cfg, self.msg)
+
+        self.assertEqual(
+            (mock_archive.call_count, mock_wal.call_count), (1, 0))
+
+    @mock.patch("mail_2_rmq.wal_write", mock.Mock(side_effect=OSError))
+    @mock.patch("mail_2_rmq.archive_email")
+    def test_wal_failed(self, mock_archive):
+
+        """Function:  test_wal_failed
+
+        Description:  Test the email is archived when the write-ahead spool
+            can not be written.
+
+        Arguments:
+
+        """
+
+        self.cfg.wal_dir = "WAL_DIRECTORY"
+        mail_2_rmq.save_failed(
+            self.rmq, self.log, self.cfg, self.msg, body="Body")
+
+        self.assertEqual(
+            (mock_archive.call_count, self.log.log_err.call_count), (1, 1))
+
+    @mock.patch("mail_2_rmq.wal_write")
+    @mock.patch("mail_2_rmq.archive_email")
+    def test_wal_binary_chunks(self, mock_archive, mock_wal):
+
+        """Function:  test_wal_binary_chunks
+
+        Description:  Test a binary attachment is spooled as the chunked
+            messages with their headers.
+
+        Arguments:
+
+        """
+
+        self.cfg.wal_dir = "WAL_DIRECTORY"
+        self.cfg.chunk_size = 4
+        attach = mail_2_rmq.Attachment(
+            "File.pdf", data=b"0123456789", binary=True,
+            content_type="application/pdf")
+        mail_2_rmq.save_failed(
+            self.rmq, self.log, self.cfg, self.msg, attach=attach)
+        calls = mock_wal.call_args_list
+
+        self.assertEqual(
+            (mock_archive.call_count,
+             [call[0][3] for call in calls],
+             [(call[1]["content_type"], call[1]["headers"]["seq"],
+               call[1]["headers"]["total"]) for call in calls]),
+            (0, [b"0123", b"4567", b"89"],
+             [("application/pdf", 1, 3), ("application/pdf", 2, 3),
+              ("application/pdf", 3, 3)]))
+
+    @mock.patch("mail_2_rmq.build_body", mock.Mock(return_value="Body" * 500))
+    @mock.patch("mail_2_rmq.wal_write")
+    @mock.patch("mail_2_rmq.archive_email")
+    def test_wal_compressed(self, mock_archive, mock_wal):
+
+        """Function:  test_wal_compressed
+
+        Description:  Test a built message body is spooled compressed.
+
+        Arguments:
+
+        """
+
+        self.cfg.wal_dir = "WAL_DIRECTORY"
+        self.cfg.compress = "gzip"
+        self.rmq.queue_name = "Queue1"
+        mail_2_rmq.save_failed(self.rmq, self.log, self.cfg, self.msg)
+
+        self.assertEqual(
+            (mock_archive.call_count,
+             mail_2_rmq.gzip.decompress(mock_wal.call_args[0][3]),
+             mock_wal.call_args[1]), (0, b"Body" * 500,
+                                      {"content_encoding": "gzip"}))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,235 @@
+# Classification (U)
+
+"""Program:  select_host.py
+
+    Description:  Unit testing of select_host in mail_2_rmq.py.
+
+    Usage:
+        test/unit/mail_2_rmq/select_host.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mail_2_rmq                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=C0413,E0401
+
+__version__ = version.__version__
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.host = "HOSTNAME"
+        self.port = 5672
+        self.host_list = ["node1:5672", "node2:5672"]
+        self.exchange_name = "EXCHANGE_NAME"
+        self.tmp_dir = "test/unit/mail_2_rmq/tmp"
+        self.host_scoring = True
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_first_node
+        test_node_down
+        test_connect_failed
+        test_all_down
+        test_from_open_rmq
+        test_memory_backend
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+        self.rmq = mock.Mock()
+        self.qname = "Queue1"
+
+    @mock.patch("mail_2_rmq.HostScores")
+    @mock.patch("mail_2_rmq.rabbitmq_class.create_rmqpub")
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_first_node(self, mock_log, mock_rmq, mock_scores):
+
+        """Function:  test_first_node
+
+        Description:  Test connecting to the healthiest node.
+
+        Arguments:
+
+        """
+
+        scores = mock_scores.return_value
+        scores.order.return_value = ["node2:5672", "node1:5672"]
+        scores.probe.return_value = 0.1
+        self.rmq.create_connection.return_value = (True, None)
+        mock_rmq.return_value = self.rmq
+
+        self.assertEqual(
+            (mail_2_rmq.select_host(
+                self.cfg, mock_log, self.qname, self.qname)[1:],
+             mock_rmq.call_args[0][0].host_list),
+            ((True, None), ["node2:5672"]))
+        scores.update.assert_called_once_with("node2:5672", 0.1)
+
+    @mock.patch("mail_2_rmq.HostScores")
+    @mock.patch("mail_2_rmq.rabbitmq_class.create_rmqpub")
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_node_down(self, mock_log, mock_rmq, mock_scores):
+
+        """Function:  test_node_down
+
+        Description:  Test a node failing the probe is skipped.
+
+        Arguments:
+
+        """
+
+        scores = mock_scores.return_value
+        scores.order.return_value = ["node1:5672", "node2:5672"]
+        scores.probe.side_effect = [None, 0.1]
+        self.rmq.create_connection.return_value = (True, None)
+        mock_rmq.return_value = self.rmq
+        mail_2_rmq.select_host(self.cfg, mock_log, self.qname, self.qname)
+
+        self.assertEqual(
+            (mock_rmq.call_count, mock_rmq.call_args[0][0].host_list,
+             scores.update.call_args_list),
+            (1, ["node2:5672"],
+             [mock.call("node1:5672"), mock.call("node2:5672", 0.1)]))
+
+    @mock.patch("mail_2_rmq.HostScores")
+    @mock.patch("mail_2_rmq.rabbitmq_class.create_rmqpub")
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_connect_failed(self, mock_log, mock_rmq, mock_scores):
+
+        """Function:  test_connect_failed
+
+        Description:  Test a node failing the RabbitMQ connection falls back
+            to the next node.
+
+        Arguments:
+
+        """
+
+        scores = mock_scores.return_value
+        scores.order.return_value = ["node1:5672", "node2:5672"]
+        scores.probe.return_value = 0.1
+        self.rmq.create_connection.side_effect = [
+            (False, "Error Message"), (True, None)]
+        mock_rmq.return_value = self.rmq
+
+        self.assertEqual(
+            mail_2_rmq.select_host(
+                self.cfg, mock_log, self.qname, self.qname)[1:],
+            (True, None))
+        self.assertEqual(
+            scores.update.call_args_list,
+            [mock.call("node1:5672"), mock.call("node2:5672", 0.1)])
+
+    @mock.patch("mail_2_rmq.HostScores")
+    @mock.patch("mail_2_rmq.rabbitmq_class.create_rmqpub")
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_all_down(self, mock_log, mock_rmq, mock_scores):
+
+        """Function:  test_all_down
+
+        Description:  Test all nodes down returns a failed connection.
+
+        Arguments:
+
+        """
+
+        scores = mock_scores.return_value
+        scores.order.return_value = ["node1:5672", "node2:5672"]
+        scores.probe.return_value = None
+        mock_rmq.return_value = self.rmq
+
+        self.assertEqual(
+            mail_2_rmq.select_host(self.cfg, mock_log, self.qname, self.qname),
+            (self.rmq, False, "No RabbitMQ node reachable"))
+        mock_rmq.assert_called_once_with(self.cfg, self.qname, self.qname)
+
+    @mock.patch("mail_2_rmq.select_host")
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_from_open_rmq(self, mock_log, mock_select):
+
+        """Function:  test_from_open_rmq
+
+        Description:  Test open_rmq uses host selection with host_scoring.
+
+        Arguments:
+
+        """
+
+        mock_select.return_value = (self.rmq, True, None)
+        mail_2_rmq.open_rmq(self.cfg, mock_log, self.qname, self.qname)
+
+        mock_select.assert_called_once_with(
+            self.cfg, mock_log, self.qname, self.qname)
+
+    @mock.patch("mail_2_rmq.select_host")
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_memory_backend(self, mock_log, mock_select):
+
+        """Function:  test_memory_backend
+
+        Description:  Test the memory backend does not probe the host_list
+            nodes.
+
+        Arguments:
+
+        """
+
+        self.cfg.rmq_backend = "memory"
+        rmq, connect_status, _ = mail_2_rmq.open_rmq(
+            self.cfg, mock_log, self.qname, self.qname)
+
+        self.assertEqual(
+            (type(rmq).__name__, connect_status, mock_select.call_count),
+            ("MemoryRmq", True, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,294 @@
+# Classification (U)
+
+"""Program:  socket_server.py
+
+    Description:  Unit testing of socket_server in mail_2_rmq.py.
+
+    Usage:
+        test/unit/mail_2_rmq/socket_server.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mail_2_rmq                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=C0413,E0401
+
+__version__ = version.__version__
+
+
+class EventTest():
+
+    """Class:  EventTest
+
+    Description:  Class which is a representation of a threading.Event class.
+        Reports as set after a number of checks.
+
+    Methods:
+        __init__
+        is_set
+        set
+        wait
+
+    """
+
+    def __init__(self, loops):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the EventTest class.
+
+        Arguments:
+
+        """
+
+        self.loops = loops
+        self.waits = 0
+
+    def is_set(self):
+
+        """Method:  is_set
+
+        Description:  Stub holder for is_set method.
+
+        Arguments:
+
+        """
+
+        self.loops -= 1
+
+        return self.loops < 0
+
+    def set(self):
+
+        """Method:  set
+
+        Description:  Stub holder for set method.
+
+        Arguments:
+
+        """
+
+        self.loops = 0
+
+    def wait(self, timeout=None):
+
+        """Method:  wait
+
+        Description:  Stub holder for wait method.
+
+        Arguments:
+
+        """
+
+        self.waits += 1
+
+        return timeout
+
+
+class ServerTest():
+
+    """Class:  ServerTest
+
+    Description:  Class which is a representation of a
+        socketserver.UnixStreamServer class.
+
+    Methods:
+        __init__
+        __enter__
+        __exit__
+        handle_request
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the ServerTest class.
+
+        Arguments:
+
+        """
+
+        self.requests = 0
+        self.pool = None
+
+    def __enter__(self):
+
+        """Method:  __enter__
+
+        Description:  Stub holder for __enter__ method.
+
+        Arguments:
+
+        """
+
+        return self
+
+    def __exit__(self, *args):
+
+        """Method:  __exit__
+
+        Description:  Stub holder for __exit__ method.
+
+        Arguments:
+
+        """
+
+        return False
+
+    def handle_request(self):
+
+        """Method:  handle_request
+
+        Description:  Stub holder for handle_request method.
+
+        Arguments:
+
+        """
+
+        self.requests += 1
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.sock_file = "test/unit/mail_2_rmq/tmp/mail_2_rmq.sock"
+        self.spool_interval = 0
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_serve
+        test_stale_socket
+        test_socket_mode
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+        self.pool = mock.Mock()
+        self.server = ServerTest()
+
+    @mock.patch("mail_2_rmq.signal.signal", mock.Mock(return_value=True))
+    @mock.patch("mail_2_rmq.os.remove", mock.Mock(return_value=True))
+    @mock.patch("mail_2_rmq.os.chmod", mock.Mock(return_value=True))
+    @mock.patch("mail_2_rmq.socketserver.UnixStreamServer")
+    @mock.patch("mail_2_rmq.threading.Event")
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_serve(self, mock_log, mock_event, mock_server):
+
+        """Function:  test_serve
+
+        Description:  Test requests are handled and the pool swept until
+            stopped.
+
+        Arguments:
+
+        """
+
+        mock_event.return_value = EventTest(2)
+        mock_server.return_value = self.server
+        mail_2_rmq.socket_server(self.cfg, mock_log, pool=self.pool)
+
+        self.assertEqual(
+            (self.server.requests, self.pool.sweep.call_count,
+             self.server.pool), (2, 2, self.pool))
+
+    @mock.patch("mail_2_rmq.signal.signal", mock.Mock(return_value=True))
+    @mock.patch("mail_2_rmq.os.chmod", mock.Mock(return_value=True))
+    @mock.patch("mail_2_rmq.os.path.exists", mock.Mock(return_value=True))
+    @mock.patch("mail_2_rmq.os.remove")
+    @mock.patch("mail_2_rmq.socketserver.UnixStreamServer")
+    @mock.patch("mail_2_rmq.threading.Event")
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_stale_socket(self, mock_log, mock_event, mock_server,
+                          mock_rm):
+
+        """Function:  test_stale_socket
+
+        Description:  Test a stale socket file is removed before starting.
+
+        Arguments:
+
+        """
+
+        mock_event.return_value = EventTest(0)
+        mock_server.return_value = self.server
+        mail_2_rmq.socket_server(self.cfg, mock_log, pool=self.pool)
+
+        self.assertEqual(
+            mock_rm.call_args_list,
+            [mock.call(self.cfg.sock_file), mock.call(self.cfg.sock_file)])
+
+    @mock.patch("mail_2_rmq.signal.signal", mock.Mock(return_value=True))
+    @mock.patch("mail_2_rmq.os.remove", mock.Mock(return_value=True))
+    @mock.patch("mail_2_rmq.os.chmod")
+    @mock.patch("mail_2_rmq.socketserver.UnixStreamServer")
+    @mock.patch("mail_2_rmq.threading.Event")
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_socket_mode(self, mock_log, mock_event, mock_server,
+                         mock_chmod):
+
+        """Function:  test_socket_mode
+
+        Description:  Test the socket file permissions are set.
+
+        Arguments:
+
+        """
+
+        self.cfg.sock_mode = 0o600
+        mock_event.return_value = EventTest(0)
+        mock_server.return_value = self.server
+        mail_2_rmq.socket_server(self.cfg, mock_log, pool=self.pool)
+
+        mock_chmod.assert_called_once_with(self.cfg.sock_file, 0o600)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,237 @@
+# Classification (U)
+
+"""Program:  spool_daemon.py
+
+    Description:  Unit testing of spool_daemon in mail_2_rmq.py.
+
+    Usage:
+        test/unit/mail_2_rmq/spool_daemon.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mail_2_rmq                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=C0413,E0401
+
+__version__ = version.__version__
+
+
+class EventTest():
+
+    """Class:  EventTest
+
+    Description:  Class which is a representation of a threading.Event class.
+        Reports as set after a number of checks.
+
+    Methods:
+        __init__
+        is_set
+        set
+        wait
+
+    """
+
+    def __init__(self, loops):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the EventTest class.
+
+        Arguments:
+
+        """
+
+        self.loops = loops
+        self.waits = 0
+
+    def is_set(self):
+
+        """Method:  is_set
+
+        Description:  Stub holder for is_set method.
+
+        Arguments:
+
+        """
+
+        self.loops -= 1
+
+        return self.loops < 0
+
+    def set(self):
+
+        """Method:  set
+
+        Description:  Stub holder for set method.
+
+        Arguments:
+
+        """
+
+        self.loops = 0
+
+    def wait(self, timeout=None):
+
+        """Method:  wait
+
+        Description:  Stub holder for wait method.
+
+        Arguments:
+
+        """
+
+        self.waits += 1
+
+        return timeout
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.spool_dir = "test/unit/mail_2_rmq/tmp"
+        self.spool_interval = 0
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_drain_in_order
+        test_idle
+        test_already_running
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+        self.pool = mock.Mock()
+        self.lock_file = os.path.join(self.cfg.spool_dir, ".lock")
+        self.new_dir = os.path.join(self.cfg.spool_dir, "new")
+
+    @mock.patch("mail_2_rmq.signal.signal", mock.Mock(return_value=True))
+    @mock.patch("mail_2_rmq.process_spool")
+    @mock.patch("mail_2_rmq.os.listdir")
+    @mock.patch("mail_2_rmq.threading.Event")
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_drain_in_order(self, mock_log, mock_event, mock_list,
+                            mock_spool):
+
+        """Function:  test_drain_in_order
+
+        Description:  Test spool files are processed in arrival order.
+
+        Arguments:
+
+        """
+
+        mock_event.return_value = EventTest(3)
+        mock_list.return_value = ["2.1.eml", "1.1.eml"]
+        mail_2_rmq.spool_daemon(self.cfg, mock_log, pool=self.pool)
+
+        self.assertEqual(
+            mock_spool.call_args_list,
+            [mock.call(self.cfg, mock_log,
+                       os.path.join(self.new_dir, "1.1.eml"), pool=self.pool),
+             mock.call(self.cfg, mock_log,
+                       os.path.join(self.new_dir, "2.1.eml"), pool=self.pool)])
+
+    @mock.patch("mail_2_rmq.signal.signal", mock.Mock(return_value=True))
+    @mock.patch("mail_2_rmq.process_spool")
+    @mock.patch("mail_2_rmq.os.listdir")
+    @mock.patch("mail_2_rmq.threading.Event")
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_idle(self, mock_log, mock_event, mock_list, mock_spool):
+
+        """Function:  test_idle
+
+        Description:  Test an empty spool sweeps the pool and waits.
+
+        Arguments:
+
+        """
+
+        event = EventTest(1)
+        mock_event.return_value = event
+        mock_list.return_value = []
+        mail_2_rmq.spool_daemon(self.cfg, mock_log, pool=self.pool)
+
+        mock_spool.assert_not_called()
+        self.assertEqual((self.pool.sweep.call_count, event.waits), (1, 1))
+
+    @mock.patch("mail_2_rmq.fcntl.flock")
+    @mock.patch("mail_2_rmq.process_spool")
+    @mock.patch("mail_2_rmq.gen_class.Logger")
+    def test_already_running(self, mock_log, mock_spool, mock_flock):
+
+        """Function:  test_already_running
+
+        Description:  Test daemon exits if the spool is already locked.
+
+        Arguments:
+
+        """
+
+        mock_flock.side_effect = OSError("Locked")
+        mail_2_rmq.spool_daemon(self.cfg, mock_log, pool=self.pool)
+
+        mock_spool.assert_not_called()
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        if os.path.isfile(self.lock_file):
+            os.remove(self.lock_file)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,189 @@
+# Classification (U)
+
+"""Program:  stage_timer.py
+
+    Description:  Unit testing of StageTimer in mail_2_rmq.py.
+
+    Usage:
+        test/unit/mail_2_rmq/stage_timer.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import json
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mail_2_rmq                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=C0413,E0401
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_enabled
+        test_stage
+        test_stage_adds
+        test_stage_exception
+        test_count
+        test_summary
+        test_observe
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.timer = mail_2_rmq.StageTimer()
+
+    def test_enabled(self):
+
+        """Function:  test_enabled
+
+        Description:  Test the timer is enabled.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(self.timer.enabled)
+
+    @mock.patch("mail_2_rmq.time.monotonic")
+    def test_stage(self, mock_time):
+
+        """Function:  test_stage
+
+        Description:  Test the time spent in a stage is recorded.
+
+        Arguments:
+
+        """
+
+        mock_time.side_effect = [10.0, 12.5]
+
+        with self.timer.stage("parse"):
+            pass
+
+        self.assertEqual(self.timer.stages, {"parse": 2.5})
+
+    @mock.patch("mail_2_rmq.time.monotonic")
+    def test_stage_adds(self, mock_time):
+
+        """Function:  test_stage_adds
+
+        Description:  Test the time spent in a stage entered more than once
+            is added up.
+
+        Arguments:
+
+        """
+
+        mock_time.side_effect = [10.0, 11.0, 20.0, 22.0]
+
+        for _ in range(2):
+            with self.timer.stage("publish"):
+                pass
+
+        self.assertEqual(self.timer.stages, {"publish": 3.0})
+
+    def test_stage_exception(self):
+
+        """Function:  test_stage_exception
+
+        Description:  Test the stage is recorded when the block raises.
+
+        Arguments:
+
+        """
+
+        with self.assertRaises(ValueError):
+            with self.timer.stage("encode"):
+                raise ValueError("Error")
+
+        self.assertIn("encode", self.timer.stages)
+
+    def test_count(self):
+
+        """Function:  test_count
+
+        Description:  Test the counts are added up.
+
+        Arguments:
+
+        """
+
+        self.timer.count("attachments")
+        self.timer.count("attachments")
+        self.timer.count("attach_bytes", 1024)
+
+        self.assertEqual(
+            self.timer.counts, {"attachments": 2, "attach_bytes": 1024})
+
+    def test_summary(self):
+
+        """Function:  test_summary
+
+        Description:  Test the summary holds the route, stages and counts.
+
+        Arguments:
+
+        """
+
+        self.timer.stages = {"parse": 0.0000014, "publish": 0.25}
+        self.timer.count("publish_bytes", 100)
+        self.timer.set_route("subject:Queue1")
+        data = json.loads(self.timer.summary())
+
+        self.assertEqual(
+            (data["route"], data["stages"], data["counts"],
+             data["total"] >= 0),
+            ("subject:Queue1", {"parse": 0.000001, "publish": 0.25},
+             {"publish_bytes": 100}, True))
+
+    @mock.patch("mail_2_rmq.time.monotonic")
+    def test_observe(self, mock_time):
+
+        """Function:  test_observe
+
+        Description:  Test observed values and stage times are kept as
+            samples.
+
+        Arguments:
+
+        """
+
+        mock_time.side_effect = [10.0, 10.5]
+
+        with self.timer.stage("connect"):
+            pass
+
+        self.timer.observe("attach_bytes", 1024)
+
+        self.assertEqual(
+            self.timer.samples, {"connect": [0.5], "attach_bytes": [1024]})
+
+
+if __name__ == "__main__":
+    unittest.main()
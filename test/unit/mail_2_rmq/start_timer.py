@@ -0,0 +1,106 @@
+# Classification (U)
+
+"""Program:  start_timer.py
+
+    Description:  Unit testing of start_timer in mail_2_rmq.py.
+
+    Usage:
+        test/unit/mail_2_rmq/start_timer.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import types
+
+# Local
+sys.path.append(os.getcwd())
+import mail_2_rmq                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=C0413,E0401
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        tearDown
+        test_disabled
+        test_enabled
+        test_metrics_file
+
+    """
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        mail_2_rmq.STAGE_TIMER.timer = mail_2_rmq.NULL_TIMER
+
+    def test_disabled(self):
+
+        """Function:  test_disabled
+
+        Description:  Test the NullTimer is used without stage_timing.
+
+        Arguments:
+
+        """
+
+        timer = mail_2_rmq.start_timer(types.SimpleNamespace())
+
+        self.assertEqual(
+            (timer, mail_2_rmq.get_timer()),
+            (mail_2_rmq.NULL_TIMER, mail_2_rmq.NULL_TIMER))
+
+    def test_enabled(self):
+
+        """Function:  test_enabled
+
+        Description:  Test a new StageTimer is started with stage_timing.
+
+        Arguments:
+
+        """
+
+        timer = mail_2_rmq.start_timer(
+            types.SimpleNamespace(stage_timing=True))
+
+        self.assertEqual(
+            (isinstance(timer, mail_2_rmq.StageTimer),
+             mail_2_rmq.get_timer() is timer), (True, True))
+
+    def test_metrics_file(self):
+
+        """Function:  test_metrics_file
+
+        Description:  Test a StageTimer is started with metrics_file.
+
+        Arguments:
+
+        """
+
+        timer = mail_2_rmq.start_timer(
+            types.SimpleNamespace(metrics_file="/path/mail_2_rmq.prom"))
+
+        self.assertIsInstance(timer, mail_2_rmq.StageTimer)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,162 @@
+# Classification (U)
+
+"""Program:  topology_queues.py
+
+    Description:  Unit testing of topology_queues in mail_2_rmq.py.
+
+    Usage:
+        test/unit/mail_2_rmq/topology_queues.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mail_2_rmq                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=C0413,E0401
+
+__version__ = version.__version__
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.host = "HOSTNAME"
+        self.exchange_name = "EXCHANGE_NAME"
+        self.exchange_type = "direct"
+        self.x_durable = True
+        self.q_durable = True
+        self.auto_delete = False
+        self.valid_queues = ["Queue1", "Queue2"]
+        self.file_queues = ["FileQueue1"]
+        self.queue_dict = {"goodname@domain": "AddrQueue"}
+        self.err_queue = "ERROR_QUEUE"
+        self.err_file_queue = "ERROR_FILE_QUEUE"
+        self.err_addr_queue = "ERROR_ADDR_QUEUE"
+        self.tmp_dir = "test/unit/mail_2_rmq/tmp"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_queues
+        test_debug_queues
+        test_rule_queues
+        test_fanout_queues
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+        self.qnames = ["Queue1", "Queue2", "FileQueue1", "AddrQueue",
+                       "ERROR_QUEUE", "ERROR_FILE_QUEUE", "ERROR_ADDR_QUEUE"]
+
+    def test_queues(self):
+
+        """Function:  test_queues
+
+        Description:  Test all publish queues are returned.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mail_2_rmq.topology_queues(self.cfg),
+            {(qname, qname) for qname in self.qnames})
+
+    def test_debug_queues(self):
+
+        """Function:  test_debug_queues
+
+        Description:  Test the debug queues are included.
+
+        Arguments:
+
+        """
+
+        self.cfg.debug_valid_queues = ["DebugQueue"]
+        self.cfg.debug_queue_dict = {"debug@domain": "DebugQueue2"}
+        self.cfg.debug_valid_queues2 = {"Subj": ["DebugQueue3"]}
+
+        self.assertEqual(
+            mail_2_rmq.topology_queues(self.cfg),
+            {(qname, qname) for qname in self.qnames
+             + ["DebugQueue", "DebugQueue2", "DebugQueue3"]})
+
+    def test_rule_queues(self):
+
+        """Function:  test_rule_queues
+
+        Description:  Test the routing rule queues are included.
+
+        Arguments:
+
+        """
+
+        self.cfg.routing_rules = [{"queue": "RuleQueue"}]
+
+        self.assertEqual(
+            mail_2_rmq.topology_queues(self.cfg),
+            {(qname, qname) for qname in self.qnames + ["RuleQueue"]})
+
+    def test_fanout_queues(self):
+
+        """Function:  test_fanout_queues
+
+        Description:  Test the valid_queues2 queues are included.
+
+        Arguments:
+
+        """
+
+        self.cfg.valid_queues2 = {"Subj": ["FanQueue1", "FanQueue2"]}
+
+        self.assertEqual(
+            mail_2_rmq.topology_queues(self.cfg),
+            {(qname, qname) for qname in self.qnames
+             + ["FanQueue1", "FanQueue2"]})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+# Classification (U)
+
+"""Program:  topology_stamp.py
+
+    Description:  Unit testing of topology_stamp in mail_2_rmq.py.
+
+    Usage:
+        test/unit/mail_2_rmq/topology_stamp.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mail_2_rmq                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=C0413,E0401
+
+__version__ = version.__version__
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.host = "HOSTNAME"
+        self.exchange_name = "EXCHANGE_NAME"
+        self.exchange_type = "direct"
+        self.x_durable = True
+        self.q_durable = True
+        self.auto_delete = False
+        self.valid_queues = ["Queue1", "Queue2"]
+        self.file_queues = ["FileQueue1"]
+        self.queue_dict = {"goodname@domain": "AddrQueue"}
+        self.err_queue = "ERROR_QUEUE"
+        self.err_file_queue = "ERROR_FILE_QUEUE"
+        self.err_addr_queue = "ERROR_ADDR_QUEUE"
+        self.tmp_dir = "test/unit/mail_2_rmq/tmp"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_same_config
+        test_queue_changed
+        test_host_changed
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+        self.stamp = mail_2_rmq.topology_stamp(self.cfg)
+
+    def test_same_config(self):
+
+        """Function:  test_same_config
+
+        Description:  Test the same configuration gives the same stamp.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            (mail_2_rmq.topology_stamp(CfgTest()),
+             os.path.dirname(self.stamp)),
+            (self.stamp, self.cfg.tmp_dir))
+
+    def test_queue_changed(self):
+
+        """Function:  test_queue_changed
+
+        Description:  Test a new queue gives a new stamp.
+
+        Arguments:
+
+        """
+
+        self.cfg.valid_queues.append("Queue3")
+
+        self.assertNotEqual(mail_2_rmq.topology_stamp(self.cfg), self.stamp)
+
+    def test_host_changed(self):
+
+        """Function:  test_host_changed
+
+        Description:  Test a new RabbitMQ host gives a new stamp.
+
+        Arguments:
+
+        """
+
+        self.cfg.host_list = ["HOST1", "HOST2"]
+
+        self.assertNotEqual(mail_2_rmq.topology_stamp(self.cfg), self.stamp)
+
+
+if __name__ == "__main__":
+    unittest.main()
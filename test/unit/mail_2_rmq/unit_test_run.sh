@@ -30,3 +30,61 @@
 /usr/bin/python test/unit/mail_2_rmq/process_file_debug.py
 /usr/bin/python test/unit/mail_2_rmq/process_from_debug.py
 /usr/bin/python test/unit/mail_2_rmq/pub_to_rmq_debug.py
+/usr/bin/python test/unit/mail_2_rmq/rmq_session.py
+/usr/bin/python test/unit/mail_2_rmq/open_rmq.py
+/usr/bin/python test/unit/mail_2_rmq/rmq_pool.py
+/usr/bin/python test/unit/mail_2_rmq/parse_file.py
+/usr/bin/python test/unit/mail_2_rmq/process_spool.py
+/usr/bin/python test/unit/mail_2_rmq/spool_daemon.py
+/usr/bin/python test/unit/mail_2_rmq/socket_server.py
+/usr/bin/python test/unit/mail_2_rmq/mail_handler.py
+/usr/bin/python test/unit/mail_2_rmq/pub_confirm.py
+/usr/bin/python test/unit/mail_2_rmq/async_engine.py
+/usr/bin/python test/unit/mail_2_rmq/run_async_engine.py
+/usr/bin/python test/unit/mail_2_rmq/topology_queues.py
+/usr/bin/python test/unit/mail_2_rmq/topology_stamp.py
+/usr/bin/python test/unit/mail_2_rmq/declare_topology.py
+/usr/bin/python test/unit/mail_2_rmq/host_cfg.py
+/usr/bin/python test/unit/mail_2_rmq/host_scores.py
+/usr/bin/python test/unit/mail_2_rmq/select_host.py
+/usr/bin/python test/unit/mail_2_rmq/build_body.py
+/usr/bin/python test/unit/mail_2_rmq/wal_write.py
+/usr/bin/python test/unit/mail_2_rmq/save_failed.py
+/usr/bin/python test/unit/mail_2_rmq/publish_body.py
+/usr/bin/python test/unit/mail_2_rmq/wal_replayer.py
+/usr/bin/python test/unit/mail_2_rmq/rate_limit.py
+/usr/bin/python test/unit/mail_2_rmq/archive_files.py
+/usr/bin/python test/unit/mail_2_rmq/archive_replay.py
+/usr/bin/python test/unit/mail_2_rmq/replay_archive.py
+/usr/bin/python test/unit/mail_2_rmq/read_worker.py
+/usr/bin/python test/unit/mail_2_rmq/read_email_pool.py
+/usr/bin/python test/unit/mail_2_rmq/file_size.py
+/usr/bin/python test/unit/mail_2_rmq/parse_stream.py
+/usr/bin/python test/unit/mail_2_rmq/write_email.py
+/usr/bin/python test/unit/mail_2_rmq/decode_text.py
+/usr/bin/python test/unit/mail_2_rmq/attachment.py
+/usr/bin/python test/unit/mail_2_rmq/encode_attach.py
+/usr/bin/python test/unit/mail_2_rmq/chunk_bodies.py
+/usr/bin/python test/unit/mail_2_rmq/attach_bodies.py
+/usr/bin/python test/unit/mail_2_rmq/chunk_assembler.py
+/usr/bin/python test/unit/mail_2_rmq/compress_body.py
+/usr/bin/python test/unit/mail_2_rmq/register_codec.py
+/usr/bin/python test/unit/mail_2_rmq/binary_bodies.py
+/usr/bin/python test/unit/mail_2_rmq/extract_mime.py
+/usr/bin/python test/unit/mail_2_rmq/route_table.py
+/usr/bin/python test/unit/mail_2_rmq/get_routes.py
+/usr/bin/python test/unit/mail_2_rmq/route_rule.py
+/usr/bin/python test/unit/mail_2_rmq/process_rule.py
+/usr/bin/python test/unit/mail_2_rmq/fanout_rmq.py
+/usr/bin/python test/unit/mail_2_rmq/stage_timer.py
+/usr/bin/python test/unit/mail_2_rmq/null_timer.py
+/usr/bin/python test/unit/mail_2_rmq/start_timer.py
+/usr/bin/python test/unit/mail_2_rmq/get_timer.py
+/usr/bin/python test/unit/mail_2_rmq/metrics_file.py
+/usr/bin/python test/unit/mail_2_rmq/memory_channel.py
+/usr/bin/python test/unit/mail_2_rmq/memory_rmq.py
+/usr/bin/python test/unit/mail_2_rmq/register_backend.py
+/usr/bin/python test/unit/mail_2_rmq/create_rmqpub.py
+/usr/bin/python test/unit/mail_2_rmq/profiler.py
+/usr/bin/python test/unit/mail_2_rmq/close_feed.py
+/usr/bin/python test/unit/mail_2_rmq/exchange_cfg.py
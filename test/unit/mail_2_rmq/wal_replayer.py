@@ -0,0 +1,412 @@
+# Classification (U)
+
+"""Program:  wal_replayer.py
+
+    Description:  Unit testing of WalReplayer in mail_2_rmq.py.
+
+    Usage:
+        test/unit/mail_2_rmq/wal_replayer.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import fcntl
+import shutil
+import tempfile
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mail_2_rmq                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=C0413,E0401
+
+__version__ = version.__version__
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.host = "HOSTNAME"
+        self.exchange_name = "EXCHANGE_NAME"
+        self.wal_dir = None
+        self.wal_interval = 0.01
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        write
+        test_empty
+        test_replay_order
+        test_props
+        test_broker_down
+        test_publish_failed
+        test_bad_record
+        test_locked
+        test_confirm
+        test_confirm_nack
+        test_exchange
+        test_run_once
+        test_run_once_error
+        test_start_stop
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+        self.cfg.wal_dir = tempfile.mkdtemp()
+
+        for sub_dir in ["tmp", "new", "failed"]:
+            os.mkdir(os.path.join(self.cfg.wal_dir, sub_dir))
+
+        self.log = mock.Mock()
+        self.new_dir = os.path.join(self.cfg.wal_dir, "new")
+        self.session = mock.Mock()
+        self.session.confirm = None
+        self.session.is_open.return_value = True
+        self.published = []
+        self.session.get_rmq.return_value.publish_msg.side_effect = \
+            lambda body: self.published.append(body) or True
+        self.replayer = mail_2_rmq.WalReplayer(self.cfg, self.log)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.cfg.wal_dir)
+
+    def write(self, body, qname="Queue1", exchange="EXCHANGE_NAME",
+              **props):
+
+        """Function:  write
+
+        Description:  Write a record into the write-ahead spool.
+
+        Arguments:
+
+        """
+
+        mail_2_rmq.wal_write(
+            self.cfg, self.log,
+            mock.Mock(exchange=exchange, queue_name=qname,
+                      routing_key=qname), body, **props)
+
+    @mock.patch("mail_2_rmq.RmqSession")
+    def test_empty(self, mock_session):
+
+        """Function:  test_empty
+
+        Description:  Test no connection is made with an empty spool.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            (self.replayer.replay(), mock_session.call_count), (0, 0))
+
+    @mock.patch("mail_2_rmq.RmqSession")
+    def test_replay_order(self, mock_session):
+
+        """Function:  test_replay_order
+
+        Description:  Test records are published in order and removed.
+
+        Arguments:
+
+        """
+
+        mock_session.return_value = self.session
+        self.write("Body1")
+        self.write("Body2", qname="Queue2")
+        self.write("Body3")
+
+        self.assertEqual(
+            (self.replayer.replay(), self.published,
+             os.listdir(self.new_dir), self.session.get_rmq.call_args_list,
+             self.session.close.call_count),
+            (3, [b"Body1", b"Body2", b"Body3"], [],
+             [mock.call("Queue1", "Queue1"), mock.call("Queue2", "Queue2"),
+              mock.call("Queue1", "Queue1")], 1))
+
+    @mock.patch("mail_2_rmq.publish_body", mock.Mock(return_value=True))
+    @mock.patch("mail_2_rmq.RmqSession")
+    def test_props(self, mock_session):
+
+        """Function:  test_props
+
+        Description:  Test records are published with their properties.
+
+        Arguments:
+
+        """
+
+        mock_session.return_value = self.session
+        self.write("Body1", content_type="text/plain")
+        self.replayer.replay()
+
+        self.assertEqual(
+            mail_2_rmq.publish_body.call_args,
+            mock.call(self.session.get_rmq.return_value, b"Body1",
+                      content_type="text/plain"))
+
+    @mock.patch("mail_2_rmq.RmqSession")
+    def test_broker_down(self, mock_session):
+
+        """Function:  test_broker_down
+
+        Description:  Test the records are kept when RabbitMQ is down.
+
+        Arguments:
+
+        """
+
+        self.session.is_open.return_value = False
+        mock_session.return_value = self.session
+        self.write("Body1")
+        self.write("Body2")
+
+        self.assertEqual(
+            (self.replayer.replay(), len(os.listdir(self.new_dir))), (0, 2))
+
+    @mock.patch("mail_2_rmq.RmqSession")
+    def test_publish_failed(self, mock_session):
+
+        """Function:  test_publish_failed
+
+        Description:  Test replay stops at the first failed publish.
+
+        Arguments:
+
+        """
+
+        mock_session.return_value = self.session
+        self.session.get_rmq.return_value.publish_msg.side_effect = \
+            [True, False, True]
+        self.write("Body1")
+        self.write("Body2")
+        self.write("Body3")
+
+        self.assertEqual(
+            (self.replayer.replay(), len(os.listdir(self.new_dir)),
+             self.session.get_rmq.return_value.publish_msg.call_count),
+            (1, 2, 2))
+
+    @mock.patch("mail_2_rmq.RmqSession")
+    def test_bad_record(self, mock_session):
+
+        """Function:  test_bad_record
+
+        Description:  Test a record which can not be read is moved to the
+            failed directory.
+
+        Arguments:
+
+        """
+
+        mock_session.return_value = self.session
+        self.write("Body1")
+
+        with open(os.path.join(self.new_dir, "0.bad.json"), mode="w",
+                  encoding="UTF-8") as f_hldr:
+            f_hldr.write("{Bad")
+
+        self.assertEqual(
+            (self.replayer.replay(), os.listdir(self.new_dir),
+             os.listdir(os.path.join(self.cfg.wal_dir, "failed"))),
+            (1, [], ["0.bad.json"]))
+
+    @mock.patch("mail_2_rmq.RmqSession")
+    def test_locked(self, mock_session):
+
+        """Function:  test_locked
+
+        Description:  Test the spool is skipped while another process
+            replays it.
+
+        Arguments:
+
+        """
+
+        self.write("Body1")
+
+        with open(os.path.join(self.cfg.wal_dir, ".lock"), mode="a",
+                  encoding="UTF-8") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            count = self.replayer.replay()
+
+        self.assertEqual(
+            (count, mock_session.call_count, len(os.listdir(self.new_dir))),
+            (0, 0, 1))
+
+    @mock.patch("mail_2_rmq.RmqSession")
+    def test_confirm(self, mock_session):
+
+        """Function:  test_confirm
+
+        Description:  Test a record published with publisher confirms is
+            removed once the broker acks it.
+
+        Arguments:
+
+        """
+
+        self.session.confirm = mock.Mock()
+        self.session.confirm.publish.side_effect = \
+            lambda body, msg, done: done(True) or True
+        mock_session.return_value = self.session
+        self.write("Body1")
+
+        self.assertEqual(
+            (self.replayer.replay(),
+             self.session.confirm.publish.call_args[0],
+             os.listdir(self.new_dir)), (1, (b"Body1", None), []))
+
+    @mock.patch("mail_2_rmq.RmqSession")
+    def test_confirm_nack(self, mock_session):
+
+        """Function:  test_confirm_nack
+
+        Description:  Test a record the broker nacks is kept in the spool.
+
+        Arguments:
+
+        """
+
+        self.session.confirm = mock.Mock()
+        self.session.confirm.publish.side_effect = \
+            lambda body, msg, done: done(body == b"Body2") or True
+        mock_session.return_value = self.session
+        self.write("Body1")
+        self.write("Body2")
+
+        self.assertEqual(
+            (self.replayer.replay(), len(os.listdir(self.new_dir))), (1, 1))
+
+    @mock.patch("mail_2_rmq.RmqSession")
+    def test_exchange(self, mock_session):
+
+        """Function:  test_exchange
+
+        Description:  Test each record is published to the exchange it was
+            written for, with one session per exchange.
+
+        Arguments:
+
+        """
+
+        mock_session.return_value = self.session
+        self.write("Body1")
+        self.write("Body2", exchange="EXCHANGE2")
+        self.write("Body3", exchange="EXCHANGE2")
+        self.replayer.replay()
+        cfgs = [call.args[0] for call in mock_session.call_args_list]
+
+        self.assertEqual(
+            (self.published, cfgs[0], cfgs[1].exchange_name,
+             self.session.close.call_count),
+            ([b"Body1", b"Body2", b"Body3"], self.cfg, "EXCHANGE2", 2))
+
+    @mock.patch("mail_2_rmq.RmqSession")
+    def test_run_once(self, mock_session):
+
+        """Function:  test_run_once
+
+        Description:  Test the number of records left after a replay pass.
+
+        Arguments:
+
+        """
+
+        self.session.is_open.return_value = False
+        mock_session.return_value = self.session
+        self.write("Body1")
+        self.write("Body2")
+
+        self.assertEqual(self.replayer.run_once(), 2)
+
+    @mock.patch("mail_2_rmq.RmqSession")
+    def test_run_once_error(self, mock_session):
+
+        """Function:  test_run_once_error
+
+        Description:  Test an error during the replay pass is logged.
+
+        Arguments:
+
+        """
+
+        mock_session.side_effect = OSError("Error Message")
+        self.write("Body1")
+
+        self.assertEqual(
+            (self.replayer.run_once(), self.log.log_err.call_count), (0, 1))
+
+    @mock.patch("mail_2_rmq.RmqSession")
+    def test_start_stop(self, mock_session):
+
+        """Function:  test_start_stop
+
+        Description:  Test the background thread replays the spool.
+
+        Arguments:
+
+        """
+
+        mock_session.return_value = self.session
+        self.write("Body1")
+        self.replayer.start()
+        self.replayer.stop()
+
+        self.assertEqual(
+            (self.published, self.replayer.thread), ([b"Body1"], None))
+
+
+if __name__ == "__main__":
+    unittest.main()
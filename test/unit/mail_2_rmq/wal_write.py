@@ -0,0 +1,164 @@
+# Classification (U)
+
+"""Program:  wal_write.py
+
+    Description:  Unit testing of wal_write in mail_2_rmq.py.
+
+    Usage:
+        test/unit/mail_2_rmq/wal_write.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import json
+import base64
+import shutil
+import tempfile
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mail_2_rmq                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=C0413,E0401
+
+__version__ = version.__version__
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.wal_dir = None
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_record
+        test_bytes_body
+        test_order
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+        self.cfg.wal_dir = tempfile.mkdtemp()
+
+        for sub_dir in ["tmp", "new", "failed"]:
+            os.mkdir(os.path.join(self.cfg.wal_dir, sub_dir))
+
+        self.log = mock.Mock()
+        self.rmq = mock.Mock(
+            exchange="EXCHANGE_NAME", queue_name="Queue1", routing_key="Rkey1")
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.cfg.wal_dir)
+
+    def test_record(self):
+
+        """Function:  test_record
+
+        Description:  Test the record is written into the wal new directory.
+
+        Arguments:
+
+        """
+
+        f_name = mail_2_rmq.wal_write(
+            self.cfg, self.log, self.rmq, "Body", content_type="text/plain")
+
+        with open(f_name, mode="r", encoding="UTF-8") as f_hldr:
+            record = json.load(f_hldr)
+
+        self.assertEqual(
+            (os.path.dirname(f_name), os.listdir(
+                os.path.join(self.cfg.wal_dir, "tmp")), record),
+            (os.path.join(self.cfg.wal_dir, "new"), [],
+             {"exchange": "EXCHANGE_NAME", "queue": "Queue1",
+              "rkey": "Rkey1", "props": {"content_type": "text/plain"},
+              "body": base64.b64encode(b"Body").decode("ascii")}))
+
+    def test_bytes_body(self):
+
+        """Function:  test_bytes_body
+
+        Description:  Test a binary body is kept as is.
+
+        Arguments:
+
+        """
+
+        f_name = mail_2_rmq.wal_write(
+            self.cfg, self.log, self.rmq, b"\x00\xff")
+
+        with open(f_name, mode="r", encoding="UTF-8") as f_hldr:
+            record = json.load(f_hldr)
+
+        self.assertEqual(base64.b64decode(record["body"]), b"\x00\xff")
+
+    def test_order(self):
+
+        """Function:  test_order
+
+        Description:  Test record file names sort in the order written.
+
+        Arguments:
+
+        """
+
+        f_names = [os.path.basename(mail_2_rmq.wal_write(
+            self.cfg, self.log, self.rmq, f"Body{cnt}")) for cnt in range(5)]
+
+        self.assertEqual(sorted(f_names), f_names)
+
+
+if __name__ == "__main__":
+    unittest.main()
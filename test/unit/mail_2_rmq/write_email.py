@@ -0,0 +1,79 @@
+# Classification (U)
+
+"""Program:  write_email.py
+
+    Description:  Unit testing of write_email in mail_2_rmq.py.
+
+    Usage:
+        test/unit/mail_2_rmq/write_email.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import io
+import tempfile
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mail_2_rmq                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=C0413,E0401
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_message
+        test_string
+
+    """
+
+    def test_message(self):
+
+        """Function:  test_message
+
+        Description:  Test an email message is written with its raw bytes.
+
+        Arguments:
+
+        """
+
+        raw_msg = b"Subject: Queue1\n\nCaf\xe9\n"
+        msg = mail_2_rmq.parse_stream(io.BytesIO(raw_msg))
+
+        with tempfile.NamedTemporaryFile() as f_hldr:
+            mail_2_rmq.write_email(f_hldr.name, msg)
+
+            self.assertEqual(f_hldr.read(), raw_msg)
+
+    @mock.patch("mail_2_rmq.gen_libs.write_file")
+    def test_string(self, mock_write):
+
+        """Function:  test_string
+
+        Description:  Test a string is written with gen_libs.write_file.
+
+        Arguments:
+
+        """
+
+        mail_2_rmq.write_email("/path/file", "Email Message")
+
+        mock_write.assert_called_with("/path/file", "w", "Email Message")
+
+
+if __name__ == "__main__":
+    unittest.main()